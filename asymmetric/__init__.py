@@ -1,23 +1,39 @@
-from .rsa                   import RSAWindow
-from .diffie_hellman        import DHKeyExchangeWindow
-from .rsa_wiener_attack     import RSAWienerAttackWindow
-from .cert_signing_request  import CSRWindow
-from .x509_self_signed      import X509SelfSignedWindow
-from .elgamal               import ElGamalWindow 
-from .ds_algorithm          import DSAWindow
-from .cramer_shoup          import CramerShoupDecryptWindow, CramerShoupEncryptWindow
-from .paillier              import PaillierEncWindow, PaillierDecWindow
-from .yak                   import YAKWindow
-from .ecdsa                 import ECDSAWindow
-from .ecdh                  import ECDHWindow
-from .eddsa                 import EdDSAWindow
-from .ntru_encrypt          import NTRUEncryptWindow
-from .kyber_kem             import KyberKEMWindow
-from .kyber_kem             import KyberKEMDecWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "RSAWindow":                ".rsa",
+    "DHKeyExchangeWindow":      ".diffie_hellman",
+    "RSAWienerAttackWindow":    ".rsa_wiener_attack",
+    "RSAKeyAuditWindow":        ".rsa_key_audit",
+    "CSRWindow":                ".cert_signing_request",
+    "X509SelfSignedWindow":     ".x509_self_signed",
+    "ElGamalWindow":            ".elgamal",
+    "DSAWindow":                ".ds_algorithm",
+    "CramerShoupDecryptWindow": ".cramer_shoup",
+    "CramerShoupEncryptWindow": ".cramer_shoup",
+    "PaillierEncWindow":        ".paillier",
+    "PaillierDecWindow":        ".paillier",
+    "YAKWindow":                ".yak",
+    "ECDSAWindow":              ".ecdsa",
+    "ECDHWindow":               ".ecdh",
+    "EdDSAWindow":              ".eddsa",
+    "NTRUEncryptWindow":        ".ntru_encrypt",
+    "KyberKEMWindow":           ".kyber_kem",
+    "KyberKEMDecWindow":        ".kyber_kem",
+}
 
 __all__ = [
-    "RSAWindow", "DHKeyExchangeWindow", "RSAWienerAttackWindow",
+    "RSAWindow", "DHKeyExchangeWindow", "RSAWienerAttackWindow", "RSAKeyAuditWindow",
     "CSRWindow", "X509SelfSignedWindow", "ElGamalWindow", "DSAWindow",
     "CramerShoupEncryptWindow", "CramerShoupDecryptWindow", "PaillierEncWindow",
     "PaillierDecWindow","YAKWindow", "ECDSAWindow", "ECDHWindow",
-    "EdDSAWindow", "NTRUEncryptWindow", "KyberKEMWindow", "KyberKEMDecWindow"]
\ No newline at end of file
+    "EdDSAWindow", "NTRUEncryptWindow", "KyberKEMWindow", "KyberKEMDecWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
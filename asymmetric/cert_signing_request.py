@@ -8,6 +8,7 @@ from PyQt6.QtWidgets                            import QWidget, QLabel, QMessage
 from DefaultStyles.button_style                 import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style             import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style             import DefaultQLineEditStyle
+from jobs                                       import job_runner, show_job_error
 from pathlib                                    import Path
 
 class CSRGenerator:
@@ -142,8 +143,8 @@ class CSRWindow(QWidget):
         self.passphrase_input = DefaultQLineEditStyle(parent=self, placeholder_text="Optional - e.g: mysecurepass")
         self.passphrase_input.setGeometry(250, 280, 250, 50)
 
-        generate_button = DefaultButtonStyle("Generate", parent=self, bold=True, command=self.csr)
-        generate_button.setGeometry(550, 280, 100, 50)
+        self.generate_button = DefaultButtonStyle("Generate", parent=self, bold=True, command=self.csr)
+        self.generate_button.setGeometry(550, 280, 100, 50)
 
         self.private_key_textedit = QTextEdit(parent=self)
         self.private_key_textedit.setGeometry(10, 380, 680, 120)
@@ -189,41 +190,51 @@ class CSRWindow(QWidget):
                 organization_name = organization,
                 common_name = common_name)
 
-            # generate private key and self-signed certificate
-            generator.generate_csr()
-
-            try:
-                # serialize and save the private key
-                private_key_pem = generator.serialize_private_key(passphrase if passphrase else None)
-                private_key_path = Path(self.downloads_path) / "private_key.pem"
-                with open(private_key_path, "wb") as key_file:
-                    key_file.write(private_key_pem)
-
-                # serialize and save the CSR
-                csr_pem = generator.serialize_csr()
-                csr_path = Path(self.downloads_path) / "csr.pem"
-                with open(csr_path, "wb") as csr_file:
-                    csr_file.write(csr_pem)
-
-                escaped_key = private_key_pem.decode().replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                self.private_key_textedit.clear()
-                self.private_key_textedit.setHtml(f"<b>Private Key (PEM Format):</b><br><pre>{escaped_key}</pre>")
-                self.private_key_textedit.show()
-
-                escaped_csr = csr_pem.decode().replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-                self.csr_textedit.clear()
-                self.csr_textedit.setHtml(f"<b>Certificate Signing Request (PEM Format):</b><br><pre>{escaped_csr}</pre>")
-                self.csr_textedit.show()
-
-                QMessageBox.information(self, 'Success', 'Files generated and saved at downloads folder.')
-                self.file_location_textedit.clear()
-                self.file_location_textedit.setHtml(f"<b>Files successfully generated and saved at:</b><br> {self.downloads_path}")
-                self.file_location_textedit.show()
-
-            except Exception as e:
-                QMessageBox.critical(self, 'Unexpected Error', str(e))
+            self.generate_button.setEnabled(False)
+            job_runner().submit(
+                self.generate_and_save, generator, passphrase, self.downloads_path,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.generate_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def generate_and_save(generator, passphrase, downloads_path):
+        # generate private key and self-signed certificate
+        generator.generate_csr()
+
+        # serialize and save the private key
+        private_key_pem = generator.serialize_private_key(passphrase if passphrase else None)
+        private_key_path = Path(downloads_path) / "private_key.pem"
+        with open(private_key_path, "wb") as key_file:
+            key_file.write(private_key_pem)
+
+        # serialize and save the CSR
+        csr_pem = generator.serialize_csr()
+        csr_path = Path(downloads_path) / "csr.pem"
+        with open(csr_path, "wb") as csr_file:
+            csr_file.write(csr_pem)
+
+        return private_key_pem, csr_pem
+
+    def show_result(self, result):
+        private_key_pem, csr_pem = result
+        escaped_key = private_key_pem.decode().replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        self.private_key_textedit.clear()
+        self.private_key_textedit.setHtml(f"<b>Private Key (PEM Format):</b><br><pre>{escaped_key}</pre>")
+        self.private_key_textedit.show()
+
+        escaped_csr = csr_pem.decode().replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        self.csr_textedit.clear()
+        self.csr_textedit.setHtml(f"<b>Certificate Signing Request (PEM Format):</b><br><pre>{escaped_csr}</pre>")
+        self.csr_textedit.show()
+
+        QMessageBox.information(self, 'Success', 'Files generated and saved at downloads folder.')
+        self.file_location_textedit.clear()
+        self.file_location_textedit.setHtml(f"<b>Files successfully generated and saved at:</b><br> {self.downloads_path}")
+        self.file_location_textedit.show()
@@ -3,6 +3,7 @@ from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButto
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qtextedit_style  import DefaultQTextEditStyle
+from jobs                           import job_runner, show_job_error
 from Crypto.Util.number             import getPrime, isPrime, inverse
 from base64                         import b64encode, b64decode
 from binascii                       import hexlify, unhexlify
@@ -221,8 +222,8 @@ class CramerShoupEncryptWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=['Base64', 'Hex', 'Raw'])
         self.output_format_options.setGeometry(500, 170, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_cs_encryption)
-        submit_button.setGeometry(300, 230, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_cs_encryption)
+        self.submit_button.setGeometry(300, 230, 100, 50)
 
         self.private_key_label = QTextEdit(parent=self)
         self.private_key_label.setGeometry(10, 310, 680, 100)
@@ -251,36 +252,16 @@ class CramerShoupEncryptWindow(QWidget):
                 bits = int(self.select_bits_options.currentText())
                 output_format = self.output_format_options.currentText()
 
-                cs = CramerShoup(bits=bits, hashalgo='sha256')
-
-                public_key, private_key, hashalgo = cs.generate_keypair()
                 message = int.from_bytes(plaintext.encode(), byteorder="big")
-                ciphertext, alpha = cs.encrypt(message, public_key)
-
-                serialized_ciphertext = pickle.dumps(ciphertext)
-
-                if output_format == "Base64":
-                    formatted_ciphertext = b64encode(serialized_ciphertext).decode('utf-8')
-                    self.ciphertext_label.clear()
-                    self.ciphertext_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{str(formatted_ciphertext)}")
-                    self.ciphertext_label.show()
-                elif output_format == "Hex":
-                    formatted_ciphertext = hexlify(serialized_ciphertext).decode('utf-8')
-                    self.ciphertext_label.clear()
-                    self.ciphertext_label.setHtml(f"<b>Ciphertext (Hex):</b><br>{str(formatted_ciphertext)}")
-                    self.ciphertext_label.show()
-                else:
-                    self.ciphertext_label.clear()
-                    self.ciphertext_label.setHtml(f"<b>Ciphertext (Raw):</b><br>{str(ciphertext)}")
-                    self.ciphertext_label.show()
-
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{str(private_key)}")
-                self.private_key_label.show()
-
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{str(public_key)}")
-                self.public_key_label.show()
+
+                # safe prime search for the key pair, keep it off the GUI thread
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    self.generate_and_encrypt, message, bits,
+                    owner=self,
+                    on_result=lambda result: self.show_encryption(*result, output_format),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
             else:
                 raise ValueError('Please enter a plaintext.')
             
@@ -288,3 +269,36 @@ class CramerShoupEncryptWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def generate_and_encrypt(message, bits):
+        cs = CramerShoup(bits=bits, hashalgo='sha256')
+        public_key, private_key, hashalgo = cs.generate_keypair()
+        ciphertext, alpha = cs.encrypt(message, public_key)
+        return public_key, private_key, ciphertext
+
+    def show_encryption(self, public_key, private_key, ciphertext, output_format):
+        serialized_ciphertext = pickle.dumps(ciphertext)
+
+        if output_format == "Base64":
+            formatted_ciphertext = b64encode(serialized_ciphertext).decode('utf-8')
+            self.ciphertext_label.clear()
+            self.ciphertext_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{str(formatted_ciphertext)}")
+            self.ciphertext_label.show()
+        elif output_format == "Hex":
+            formatted_ciphertext = hexlify(serialized_ciphertext).decode('utf-8')
+            self.ciphertext_label.clear()
+            self.ciphertext_label.setHtml(f"<b>Ciphertext (Hex):</b><br>{str(formatted_ciphertext)}")
+            self.ciphertext_label.show()
+        else:
+            self.ciphertext_label.clear()
+            self.ciphertext_label.setHtml(f"<b>Ciphertext (Raw):</b><br>{str(ciphertext)}")
+            self.ciphertext_label.show()
+
+        self.private_key_label.clear()
+        self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{str(private_key)}")
+        self.private_key_label.show()
+
+        self.public_key_label.clear()
+        self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{str(public_key)}")
+        self.public_key_label.show()
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 
 # Implementation
 class DiffieHellmanKeyExchangeImp:
@@ -79,8 +80,8 @@ class DHKeyExchangeWindow(QWidget):
         self.expB_line_edit.setGeometry(300, 360, 100, 50)
 
         # SUBMIT BUTTON
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold = True, command=self.call_diffie_hellman)
-        submit_button.setGeometry(300, 420, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold = True, command=self.call_diffie_hellman)
+        self.submit_button.setGeometry(300, 420, 100, 50)
 
         self.result_label = QLabel("", parent=self)
         self.result_label.setGeometry(300, 480, 300, 50)
@@ -101,23 +102,13 @@ class DHKeyExchangeWindow(QWidget):
                         if self.expB_line_edit.text():
                             exponentB = int(self.expB_line_edit.text())
 
-                            Alice = DiffieHellmanKeyExchangeImp(base=base, mod=modulus, exponent=exponentA)
-                            Bob = DiffieHellmanKeyExchangeImp(base=base, mod=modulus, exponent=exponentB)
-
-                            # Calculate public keys:
-                            alice_public = Alice.fme(base, modulus, exponentA)
-                            bob_public = Bob.fme(base, modulus, exponentB)
-
-                            # Calculate shared secret keys
-                            shared_key_A = Alice.fme(bob_public, modulus, exponentA)  # Alice's shared key using Bob's public key
-                            shared_key_B = Bob.fme(alice_public, modulus, exponentB)  # Bob's shared key using Alice's public key
-
-                            self.result_label.clear()
-                            if shared_key_A == shared_key_B:
-                                self.result_label.setText(f"Shared key: {shared_key_A}")
-                            else:
-                                self.result_label.setText("False key: Keys do not match")
-                            self.result_label.show()
+                            self.submit_button.setEnabled(False)
+                            job_runner().submit(
+                                self.key_exchange, base, modulus, exponentA, exponentB,
+                                owner=self,
+                                on_result=self.show_result,
+                                on_error=lambda e: show_job_error(self, e),
+                                on_finished=lambda: self.submit_button.setEnabled(True))
                         else:
                             raise ValueError('Please enter exponentB value')
                     else:
@@ -131,3 +122,26 @@ class DHKeyExchangeWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Errr', str(e))
+
+    @staticmethod
+    def key_exchange(base, modulus, exponentA, exponentB):
+        Alice = DiffieHellmanKeyExchangeImp(base=base, mod=modulus, exponent=exponentA)
+        Bob = DiffieHellmanKeyExchangeImp(base=base, mod=modulus, exponent=exponentB)
+
+        # Calculate public keys:
+        alice_public = Alice.fme(base, modulus, exponentA)
+        bob_public = Bob.fme(base, modulus, exponentB)
+
+        # Calculate shared secret keys
+        shared_key_A = Alice.fme(bob_public, modulus, exponentA)  # Alice's shared key using Bob's public key
+        shared_key_B = Bob.fme(alice_public, modulus, exponentB)  # Bob's shared key using Alice's public key
+        return shared_key_A, shared_key_B
+
+    def show_result(self, shared_keys):
+        shared_key_A, shared_key_B = shared_keys
+        self.result_label.clear()
+        if shared_key_A == shared_key_B:
+            self.result_label.setText(f"Shared key: {shared_key_A}")
+        else:
+            self.result_label.setText("False key: Keys do not match")
+        self.result_label.show()
@@ -6,6 +6,7 @@ from cryptography.hazmat.backends                   import default_backend
 from DefaultStyles.button_style                     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style                 import DefaultQLineEditStyle
 from DefaultStyles.qcombo_box_style                 import DefaultQComboBoxStyle
+from jobs                                           import job_runner, show_job_error
 from binascii                                       import hexlify
 from datetime                                       import datetime
 from pathlib                                        import Path
@@ -159,8 +160,8 @@ class DSAWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(450, 160, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_dsa)
-        submit_button.setGeometry(300, 220, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_dsa)
+        self.submit_button.setGeometry(300, 220, 100, 50)
 
         self.signature_label = QTextEdit(parent=self)
         self.signature_label.setGeometry(10, 300, 680, 100)
@@ -193,56 +194,13 @@ class DSAWindow(QWidget):
                 hashalgo = self.hashalgo_options.currentText()
                 output_format = self.output_format_options.currentText()
 
-                dsa_object = DSAImp()
-                signature = dsa_object.sign(message=message_bytes, hashalgo=hashalgo)
-                is_valid = dsa_object.verify(message=message_bytes, signature=signature, hashalgo=hashalgo)
-                public_key = dsa_object.get_public_key()
-                private_key = dsa_object.get_private_key()
-
-                if output_format == "Base64":
-                    signature = base64.b64encode(signature).decode('utf-8')
-                    public_key = base64.b64encode(public_key).decode('utf-8')
-                    private_key = base64.b64encode(private_key).decode('utf-8')
-                elif output_format == "Hex":
-                    signature = hexlify(signature).decode('utf-8')
-                    public_key = hexlify(public_key).decode('utf-8')
-                    private_key = hexlify(private_key).decode('utf-8')
-
-                # timestamp for filenames
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                
-                # save signature
-                with open(os.path.join(self.downloads_path, f"signature_{timestamp}.txt"), "w", encoding="utf-8") as f:
-                    f.write(signature)
-
-                # save private key
-                with open(os.path.join(self.downloads_path, f"private_key_{timestamp}.txt"), "w", encoding="utf-8") as f:
-                    f.write(private_key)
-
-                # save public key
-                with open(os.path.join(self.downloads_path, f"public_key_{timestamp}.txt"), "w", encoding="utf-8") as f:
-                    f.write(public_key)
-
-                QMessageBox.information(
-                    self, 
-                    'Files Successfully generated',
-                    f'Files saved at: {self.downloads_path}')
-
-                self.signature_label.clear()
-                self.signature_label.setHtml(f"<b>Signature:</b><br>{str(signature)}")
-                self.signature_label.show()
-
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private key:</b><br>{str(private_key)}")
-                self.private_key_label.show()
-
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public key:</b><br>{str(public_key)}")
-                self.public_key_label.show()
-
-                self.is_valid.clear()
-                self.is_valid.setText(f"Is signature valid?: {str(is_valid)}")
-                self.is_valid.show()
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    self.sign_and_save, message_bytes, hashalgo, output_format, self.downloads_path,
+                    owner=self,
+                    on_result=self.show_result,
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
             else:
                 raise ValueError('Please enter a message.')
             
@@ -250,3 +208,60 @@ class DSAWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def sign_and_save(message_bytes, hashalgo, output_format, downloads_path):
+        dsa_object = DSAImp()
+        signature = dsa_object.sign(message=message_bytes, hashalgo=hashalgo)
+        is_valid = dsa_object.verify(message=message_bytes, signature=signature, hashalgo=hashalgo)
+        public_key = dsa_object.get_public_key()
+        private_key = dsa_object.get_private_key()
+
+        if output_format == "Base64":
+            signature = base64.b64encode(signature).decode('utf-8')
+            public_key = base64.b64encode(public_key).decode('utf-8')
+            private_key = base64.b64encode(private_key).decode('utf-8')
+        elif output_format == "Hex":
+            signature = hexlify(signature).decode('utf-8')
+            public_key = hexlify(public_key).decode('utf-8')
+            private_key = hexlify(private_key).decode('utf-8')
+
+        # timestamp for filenames
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        # save signature
+        with open(os.path.join(downloads_path, f"signature_{timestamp}.txt"), "w", encoding="utf-8") as f:
+            f.write(signature)
+
+        # save private key
+        with open(os.path.join(downloads_path, f"private_key_{timestamp}.txt"), "w", encoding="utf-8") as f:
+            f.write(private_key)
+
+        # save public key
+        with open(os.path.join(downloads_path, f"public_key_{timestamp}.txt"), "w", encoding="utf-8") as f:
+            f.write(public_key)
+
+        return signature, private_key, public_key, is_valid
+
+    def show_result(self, result):
+        signature, private_key, public_key, is_valid = result
+        QMessageBox.information(
+            self, 
+            'Files Successfully generated',
+            f'Files saved at: {self.downloads_path}')
+
+        self.signature_label.clear()
+        self.signature_label.setHtml(f"<b>Signature:</b><br>{str(signature)}")
+        self.signature_label.show()
+
+        self.private_key_label.clear()
+        self.private_key_label.setHtml(f"<b>Private key:</b><br>{str(private_key)}")
+        self.private_key_label.show()
+
+        self.public_key_label.clear()
+        self.public_key_label.setHtml(f"<b>Public key:</b><br>{str(public_key)}")
+        self.public_key_label.show()
+
+        self.is_valid.clear()
+        self.is_valid.setText(f"Is signature valid?: {str(is_valid)}")
+        self.is_valid.show()
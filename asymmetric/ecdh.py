@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                            import QWidget, QLabel, QTextEdi
 from DefaultStyles.button_style                 import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style             import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style             import DefaultQLineEditStyle
+from jobs                                       import job_runner, show_job_error
 from cryptography.hazmat.primitives.asymmetric  import ec
 from cryptography.hazmat.primitives             import hashes, serialization
 from cryptography.hazmat.backends               import default_backend
@@ -175,8 +176,8 @@ class ECDHWindow(QWidget):
             items=["Yes", "No"])
         self.export_keys_options.setGeometry(380, 120, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_ecdh)
-        submit_button.setGeometry(540, 120, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_ecdh)
+        self.submit_button.setGeometry(540, 120, 100, 50)
 
         self.alice_private_key_label = QTextEdit(parent=self)
         self.alice_private_key_label.setGeometry(10, 190, 680, 100)
@@ -239,67 +240,79 @@ class ECDHWindow(QWidget):
             else:
                 salt = salt.encode('utf-8')[:16]  # truncate or pad to 16 bytes
 
-            alice = ECDH(curve=curve, hashalgo=hashalgo, salt=salt)
-            bob = ECDH(curve=curve, hashalgo=hashalgo, salt=salt)
-
-            # Alice's private key
-            alice_prv_key = alice.get_private_key_bytes()
-            self.alice_private_key_label.clear()
-            self.alice_private_key_label.setHtml(f"<b>Alice's Private key:</b><br>{str(alice_prv_key.decode('utf-8'))}")
-            self.alice_private_key_label.show()
-
-            # Bob's private key
-            bob_prv_key = bob.get_private_key_bytes()
-            self.bob_private_key_label.clear()
-            self.bob_private_key_label.setHtml(f"<b>Bob's Private key:</b><br>{str(bob_prv_key.decode('utf-8'))}")
-            self.bob_private_key_label.show()
-
-            # Alice's public key
-            alice_pbl_key = alice.get_public_key_bytes()
-            self.alice_public_key_label.clear()
-            self.alice_public_key_label.setHtml(f"<b>Alice's Public key:</b><br>{str(alice_pbl_key.decode('utf-8'))}")
-            self.alice_public_key_label.show()
-
-            # Bob's public key
-            bob_pbl_key = bob.get_public_key_bytes()
-            self.bob_public_key_label.clear()
-            self.bob_public_key_label.setHtml(f"<b>Bob's Public key:</b><br>{str(bob_pbl_key.decode('utf-8'))}")
-            self.bob_public_key_label.show()
-
-            # Exchange public keys
-            alice_symmetric_key = alice.derive_key(bob_pbl_key)
-            self.alice_derived_key_label.clear()
-            self.alice_derived_key_label.setHtml(f"<b>Alices's derived symmetric key:</b><br>{str(alice_symmetric_key)}")
-            self.alice_derived_key_label.show()
-            bob_symmetric_key = bob.derive_key(alice_pbl_key)
-            self.bob_derived_key_label.clear()
-            self.bob_derived_key_label.setHtml(f"<b>Bob's derived symmetric key:</b><br>{str(bob_symmetric_key)}")
-            self.bob_derived_key_label.show()
-
-            # Salt label
-            self.salt_label.clear()
-            self.salt_label.setHtml(f"<b>Salt:</b>{str(alice.get_salt())}")
-            self.salt_label.show()
-
-            # Do the keys match?
-            self.keys_match_label.clear()
-            self.keys_match_label.setHtml(f"<b>Do the keys match?</b><br>{str(alice_symmetric_key == bob_symmetric_key)}")
-            self.keys_match_label.show()
-
-            if self.export_keys_options.currentText() == "Yes":
-                alice.export_keys("alice", target_dir=self.downloads_path)
-                bob.export_keys("bob", target_dir=self.downloads_path)
-                # export keys successfully - label and messagebox
-                QMessageBox.information(self, 'Success', 'Keys exported and saved successfully')
-                self.export_keys_label.clear()
-                self.export_keys_label.setHtml(f"Keys successfully exported and saved at: {self.downloads_path}")
-                self.export_keys_label.show()
-            else:
-                self.export_keys_label.clear()
-                self.export_keys_label.hide()
+            export_dir = self.downloads_path if self.export_keys_options.currentText() == "Yes" else None
+            self.submit_button.setEnabled(False)
+            job_runner().submit(
+                self.key_agreement, curve, hashalgo, salt, export_dir,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.submit_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def key_agreement(curve, hashalgo, salt, export_dir):
+        alice = ECDH(curve=curve, hashalgo=hashalgo, salt=salt)
+        bob = ECDH(curve=curve, hashalgo=hashalgo, salt=salt)
+        alice_pbl_key = alice.get_public_key_bytes()
+        bob_pbl_key = bob.get_public_key_bytes()
+        if export_dir:
+            alice.export_keys("alice", target_dir=export_dir)
+            bob.export_keys("bob", target_dir=export_dir)
+        # Exchange public keys
+        return (alice.get_private_key_bytes(), bob.get_private_key_bytes(), alice_pbl_key, bob_pbl_key,
+                alice.derive_key(bob_pbl_key), bob.derive_key(alice_pbl_key), alice.get_salt(), export_dir)
+
+    def show_result(self, result):
+        alice_prv_key, bob_prv_key, alice_pbl_key, bob_pbl_key, alice_symmetric_key, bob_symmetric_key, salt, export_dir = result
+
+        # Alice's private key
+        self.alice_private_key_label.clear()
+        self.alice_private_key_label.setHtml(f"<b>Alice's Private key:</b><br>{str(alice_prv_key.decode('utf-8'))}")
+        self.alice_private_key_label.show()
+
+        # Bob's private key
+        self.bob_private_key_label.clear()
+        self.bob_private_key_label.setHtml(f"<b>Bob's Private key:</b><br>{str(bob_prv_key.decode('utf-8'))}")
+        self.bob_private_key_label.show()
+
+        # Alice's public key
+        self.alice_public_key_label.clear()
+        self.alice_public_key_label.setHtml(f"<b>Alice's Public key:</b><br>{str(alice_pbl_key.decode('utf-8'))}")
+        self.alice_public_key_label.show()
+
+        # Bob's public key
+        self.bob_public_key_label.clear()
+        self.bob_public_key_label.setHtml(f"<b>Bob's Public key:</b><br>{str(bob_pbl_key.decode('utf-8'))}")
+        self.bob_public_key_label.show()
+
+        self.alice_derived_key_label.clear()
+        self.alice_derived_key_label.setHtml(f"<b>Alices's derived symmetric key:</b><br>{str(alice_symmetric_key)}")
+        self.alice_derived_key_label.show()
+        self.bob_derived_key_label.clear()
+        self.bob_derived_key_label.setHtml(f"<b>Bob's derived symmetric key:</b><br>{str(bob_symmetric_key)}")
+        self.bob_derived_key_label.show()
+
+        # Salt label
+        self.salt_label.clear()
+        self.salt_label.setHtml(f"<b>Salt:</b>{str(salt)}")
+        self.salt_label.show()
+
+        # Do the keys match?
+        self.keys_match_label.clear()
+        self.keys_match_label.setHtml(f"<b>Do the keys match?</b><br>{str(alice_symmetric_key == bob_symmetric_key)}")
+        self.keys_match_label.show()
+
+        if export_dir:
+            # export keys successfully - label and messagebox
+            QMessageBox.information(self, 'Success', 'Keys exported and saved successfully')
+            self.export_keys_label.clear()
+            self.export_keys_label.setHtml(f"Keys successfully exported and saved at: {export_dir}")
+            self.export_keys_label.show()
+        else:
+            self.export_keys_label.clear()
+            self.export_keys_label.hide()
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                            import QWidget, QLabel, QTextEdi
 from DefaultStyles.button_style                 import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style             import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style             import DefaultQLineEditStyle
+from jobs                                       import job_runner, show_job_error
 from cryptography.hazmat.primitives.asymmetric  import ec
 from cryptography.hazmat.primitives             import hashes, serialization
 from cryptography.hazmat.backends               import default_backend
@@ -120,8 +121,8 @@ class ECDSAWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=['Base64', 'Hex', 'Raw'])
         self.output_format_options.setGeometry(130, 220, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_ecc)
-        submit_button.setGeometry(330, 220, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_ecc)
+        self.submit_button.setGeometry(330, 220, 100, 50)
 
         self.private_key_label = QTextEdit(parent=self)
         self.private_key_label.setGeometry(10, 300, 680, 100)
@@ -158,60 +159,72 @@ class ECDSAWindow(QWidget):
                 hashalgo = self.hashalgo_options.currentText()
                 output_format = self.output_format_options.currentText()
 
-                obj = ECDSA(curve=curve, hashalgo=hashalgo)
-                obj.generate_keys()
-                signature = obj.sign_message(msg_bytes)
-                is_valid = obj.verify_signature(msg_bytes, signature)
-
-                if output_format == 'Base64':
-                    private_key = b64encode(obj.get_private_key_bytes()).decode('utf-8')
-                    self.private_key_label.clear()
-                    self.private_key_label.setHtml(f"<b>Private key (Base64):</b><br>{str(private_key)}")
-                    self.private_key_label.show()
-
-                    public_key = b64encode(obj.get_public_key_bytes()).decode('utf-8')
-                    self.public_key_label.clear()
-                    self.public_key_label.setHtml(f"<b>Public key (Base64):</b><br>{str(public_key)}")
-                    self.public_key_label.show()
-
-                    signature_label = b64encode(signature).decode('utf-8')
-                    self.signature_label.clear()
-                    self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature_label)}")
-                    self.signature_label.show()
-
-                elif output_format == 'Hex':
-                    private_key = hexlify(obj.get_private_key_bytes()).decode('utf-8')
-                    self.private_key_label.clear()
-                    self.private_key_label.setHtml(f"<b>Private key (Hex):</b><br>{str(private_key)}")
-                    self.private_key_label.show()
-
-                    public_key = hexlify(obj.get_public_key_bytes()).decode('utf-8')
-                    self.public_key_label.clear()
-                    self.public_key_label.setHtml(f"<b>Public key (Hex):</b><br>{str(public_key)}")
-                    self.public_key_label.show()
-
-                    signature_label = hexlify(signature).decode('utf-8')
-                    self.signature_label.clear()
-                    self.signature_label.setHtml(f"<b>Signature (Hex):</b><br>{str(signature_label)}")
-                    self.signature_label.show()
-                else:
-                    self.private_key_label.clear()
-                    self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{str(obj.get_private_key_bytes().decode('utf-8'))}")
-                    self.private_key_label.show()
-
-                    self.public_key_label.clear()
-                    self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{str(obj.get_public_key_bytes().decode('utf-8'))}")
-                    self.public_key_label.show()
-
-                    self.signature_label.clear()
-                    self.signature_label.setHtml(f"<b>Signature (Raw):</b><br>{str(signature)}")
-                    self.signature_label.show()
-
-                self.is_valid_label.clear()
-                self.is_valid_label.setHtml(f"<b>Is signature valid:</b><br>{str(is_valid)}")
-                self.is_valid_label.show()
-
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    self.sign_message, msg_bytes, curve, hashalgo,
+                    owner=self,
+                    on_result=lambda result: self.show_result(result, output_format),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def sign_message(msg_bytes, curve, hashalgo):
+        obj = ECDSA(curve=curve, hashalgo=hashalgo)
+        obj.generate_keys()
+        signature = obj.sign_message(msg_bytes)
+        is_valid = obj.verify_signature(msg_bytes, signature)
+        return obj, signature, is_valid
+
+    def show_result(self, result, output_format):
+        obj, signature, is_valid = result
+        if output_format == 'Base64':
+            private_key = b64encode(obj.get_private_key_bytes()).decode('utf-8')
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Base64):</b><br>{str(private_key)}")
+            self.private_key_label.show()
+
+            public_key = b64encode(obj.get_public_key_bytes()).decode('utf-8')
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Base64):</b><br>{str(public_key)}")
+            self.public_key_label.show()
+
+            signature_label = b64encode(signature).decode('utf-8')
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature_label)}")
+            self.signature_label.show()
+
+        elif output_format == 'Hex':
+            private_key = hexlify(obj.get_private_key_bytes()).decode('utf-8')
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Hex):</b><br>{str(private_key)}")
+            self.private_key_label.show()
+
+            public_key = hexlify(obj.get_public_key_bytes()).decode('utf-8')
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Hex):</b><br>{str(public_key)}")
+            self.public_key_label.show()
+
+            signature_label = hexlify(signature).decode('utf-8')
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Hex):</b><br>{str(signature_label)}")
+            self.signature_label.show()
+        else:
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{str(obj.get_private_key_bytes().decode('utf-8'))}")
+            self.private_key_label.show()
+
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{str(obj.get_public_key_bytes().decode('utf-8'))}")
+            self.public_key_label.show()
+
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Raw):</b><br>{str(signature)}")
+            self.signature_label.show()
+
+        self.is_valid_label.clear()
+        self.is_valid_label.setHtml(f"<b>Is signature valid:</b><br>{str(is_valid)}")
+        self.is_valid_label.show()
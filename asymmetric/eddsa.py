@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                            import QWidget, QLabel, QTextEdi
 from DefaultStyles.button_style                 import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style             import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style             import DefaultQLineEditStyle
+from jobs                                       import job_runner, show_job_error
 from cryptography.hazmat.primitives             import serialization
 from cryptography.exceptions                    import InvalidSignature
 from base64                                     import b64encode
@@ -143,8 +144,8 @@ class EdDSAWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=['Base64', 'Hex', 'Raw'])
         self.output_format_options.setGeometry(130, 130, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_eddsa)
-        submit_button.setGeometry(330, 130, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_eddsa)
+        self.submit_button.setGeometry(330, 130, 100, 50)
 
         self.private_key_label = QTextEdit(parent=self)
         self.private_key_label.setGeometry(10, 240, 680, 100)
@@ -178,60 +179,70 @@ class EdDSAWindow(QWidget):
             msg_bytes = msg.encode('utf-8')
             output_format = self.output_format_options.currentText()
 
-            eddsa = EdDSA()
-            signature = eddsa.sign(msg_bytes)
-            is_valid = eddsa.verify(msg_bytes, signature)
-
-            if output_format == 'Base64':
-                private_key = eddsa.get_private_key().decode('utf-8')
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private key (Base64):</b><br>{str(private_key)}")
-                self.private_key_label.show()
-
-                public_key = eddsa.get_public_key().decode('utf-8')
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public key (Base64):</b><br>{str(public_key)}")
-                self.public_key_label.show()
-
-                signature_label = b64encode(signature).decode('utf-8')
-                self.signature_label.clear()
-                self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature_label)}")
-                self.signature_label.show()
-            elif output_format == 'Hex':
-                private_key = hexlify(eddsa.get_private_key()).decode('utf-8')
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private key (Hex):</b><br>{str(private_key)}")
-                self.private_key_label.show()
-
-                public_key = hexlify(eddsa.get_public_key()).decode('utf-8')
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public key (Hex):</b><br>{str(public_key)}")
-                self.public_key_label.show()
-
-                signature_label = hexlify(signature).decode('utf-8')
-                self.signature_label.clear()
-                self.signature_label.setHtml(f"<b>Signature (Hex):</b><br>{str(signature_label)}")
-                self.signature_label.show()
-            else:
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{eddsa.get_private_key().decode()}")
-                self.private_key_label.show()
-
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{eddsa.get_public_key().decode()}")
-                self.public_key_label.show()
-
-                self.signature_label.clear()
-                self.signature_label.setHtml(f"<b>Signature (Raw):</b><br>{str(signature)}")
-                self.signature_label.show()
-
-            # Verify the signature
-            is_valid = eddsa.verify(msg_bytes, signature)
-            self.is_valid_label.clear()
-            self.is_valid_label.setHtml(f"<b>Is signature valid?</b><br>{str(is_valid)}")
-            self.is_valid_label.show()
-            
+            self.submit_button.setEnabled(False)
+            job_runner().submit(
+                self.sign_message, msg_bytes,
+                owner=self,
+                on_result=lambda result: self.show_result(result, output_format),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.submit_button.setEnabled(True))
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def sign_message(msg_bytes):
+        eddsa = EdDSA()
+        signature = eddsa.sign(msg_bytes)
+        is_valid = eddsa.verify(msg_bytes, signature)
+        return eddsa, signature, is_valid
+
+    def show_result(self, result, output_format):
+        eddsa, signature, is_valid = result
+        if output_format == 'Base64':
+            private_key = eddsa.get_private_key().decode('utf-8')
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Base64):</b><br>{str(private_key)}")
+            self.private_key_label.show()
+
+            public_key = eddsa.get_public_key().decode('utf-8')
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Base64):</b><br>{str(public_key)}")
+            self.public_key_label.show()
+
+            signature_label = b64encode(signature).decode('utf-8')
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature_label)}")
+            self.signature_label.show()
+        elif output_format == 'Hex':
+            private_key = hexlify(eddsa.get_private_key()).decode('utf-8')
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Hex):</b><br>{str(private_key)}")
+            self.private_key_label.show()
+
+            public_key = hexlify(eddsa.get_public_key()).decode('utf-8')
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Hex):</b><br>{str(public_key)}")
+            self.public_key_label.show()
+
+            signature_label = hexlify(signature).decode('utf-8')
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Hex):</b><br>{str(signature_label)}")
+            self.signature_label.show()
+        else:
+            self.private_key_label.clear()
+            self.private_key_label.setHtml(f"<b>Private key (Raw):</b><br>{eddsa.get_private_key().decode()}")
+            self.private_key_label.show()
+
+            self.public_key_label.clear()
+            self.public_key_label.setHtml(f"<b>Public key (Raw):</b><br>{eddsa.get_public_key().decode()}")
+            self.public_key_label.show()
+
+            self.signature_label.clear()
+            self.signature_label.setHtml(f"<b>Signature (Raw):</b><br>{str(signature)}")
+            self.signature_label.show()
+
+        self.is_valid_label.clear()
+        self.is_valid_label.setHtml(f"<b>Is signature valid?</b><br>{str(is_valid)}")
+        self.is_valid_label.show()
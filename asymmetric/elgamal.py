@@ -2,105 +2,10 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from binascii                       import hexlify
-import base64, secrets, hashlib
-
-# Implementation
-class ElGamalImp:
-    def __init__(self, bit_length=2048):
-        """Initialize ElGamal instance, generate prime and generator."""
-        self.bit_length = bit_length
-        self.p = self.generate_large_prime()
-        self.g = secrets.randbelow(self.p - 2) + 2  # Generator in range [2, p-2]
-
-    def generate_large_prime(self):
-        """Generate a large prime number of a specific bit length."""
-        while True:
-            prime_candidate = secrets.randbits(self.bit_length) | (1 << self.bit_length - 1) | 1
-            if self.is_prime(prime_candidate):
-                return prime_candidate
-
-    def is_prime(self, num, k=128):
-        """Miller-Rabin primality test for checking if a number is prime."""
-        if num <= 1:
-            return False
-        if num == 2 or num == 3:
-            return True
-        if num % 2 == 0:
-            return False
-        
-        r, d = 0, num - 1
-        while d % 2 == 0:
-            d //= 2
-            r += 1
-
-        for _ in range(k):
-            a = secrets.randbelow(num - 3) + 2  # Random integer in [2, num-2]
-            x = pow(a, d, num)
-            if x == 1 or x == num - 1:
-                continue
-            for _ in range(r - 1):
-                x = pow(x, 2, num)
-                if x == num - 1:
-                    break
-            else:
-                return False
-        return True
-
-    def generate_keys(self):
-        """Generate public and private keys for the user."""
-        x = secrets.randbelow(self.p - 2) + 1  # Private key
-        y = pow(self.g, x, self.p)  # Public key y = g^x mod p
-        return {'private_key': x, 'public_key': (self.p, self.g, y)}
-    
-    def encrypt(self, plaintext, public_key):
-        """Encrypt the plaintext message using the receiver's public key."""
-        p, g, y = public_key
-
-        # Convert plaintext to integer
-        plaintext_int = self.text_to_int(plaintext)
-        if plaintext_int >= p:
-            raise ValueError("Plaintext too large to encrypt. Use a larger key size or split message.")
-
-        # Generate random session key k
-        k = secrets.randbelow(p - 2) + 1
-
-        # ElGamal encryption steps
-        c1 = pow(g, k, p)
-        s = pow(y, k, p)
-        c2 = (plaintext_int * s) % p
-        return c1, c2
-
-    def decrypt(self, ciphertext, private_key):
-        """Decrypt the ciphertext and return the plaintext string."""
-        c1, c2 = ciphertext
-        p = self.p
-        x = private_key
-
-        s = pow(c1, x, p)
-        s_inv = pow(s, p - 2, p)  # modular inverse of s mod p
-        plaintext_int = (c2 * s_inv) % p
-
-        try:
-            plaintext = self.int_to_text(plaintext_int)
-        except UnicodeDecodeError:
-            raise ValueError("Decryption failed: result is not valid UTF-8 text.")
-        return plaintext
-
-    def hash_message(self, message):
-        """Hash the plaintext message using SHA-256."""
-        sha256 = hashlib.sha256()
-        sha256.update(message.encode('utf-8'))
-        return sha256.hexdigest()
-
-    def text_to_int(self, text):
-        """Convert text (string) to an integer."""
-        return int.from_bytes(text.encode('utf-8'), 'big')
-
-    def int_to_text(self, number):
-        """Convert an integer back to the original text (string)."""
-        byte_length = (number.bit_length() + 7) // 8
-        return number.to_bytes(byte_length, 'big').decode('utf-8')
+from .elgamal_core                  import ElGamalImp
+import base64
 
 # UI/WINDOW
 class ElGamalWindow(QWidget):
@@ -144,8 +49,8 @@ class ElGamalWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(70, 160, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_elgamal_encryption)
-        encrypt_button.setGeometry(250, 160, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_elgamal_encryption)
+        self.encrypt_button.setGeometry(250, 160, 100, 50)
 
         self.ciphertext_label = QTextEdit(parent=self)
         self.ciphertext_label.setGeometry(10, 270, 480, 100)
@@ -223,13 +128,34 @@ class ElGamalWindow(QWidget):
             plaintext = self.plaintext_input.text()
             if not plaintext:
                 raise ValueError('Please enter a plaintext.')
-            output_format = self.output_format_options.currentText()
 
-            self.elgamal = ElGamalImp(bit_length=2048)
-            self.keys = self.elgamal.generate_keys()
+            # 2048-bit prime generation with 128 Miller-Rabin rounds, keep it off the GUI thread
+            self.encrypt_button.setEnabled(False)
+            job_runner().submit(
+                self.generate_and_encrypt, plaintext,
+                owner=self,
+                on_result=self.show_encryption,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def generate_and_encrypt(plaintext):
+        elgamal = ElGamalImp(bit_length=2048)
+        keys = elgamal.generate_keys()
+        ciphertext = elgamal.encrypt(plaintext=plaintext, public_key=keys['public_key'])
+        return elgamal, keys, ciphertext
+
+    def show_encryption(self, result):
+        try:
+            self.elgamal, self.keys, ciphertext = result
+            output_format = self.output_format_options.currentText()
             public_key = self.keys['public_key']
             private_key = self.keys['private_key']
-            ciphertext = self.elgamal.encrypt(plaintext=plaintext, public_key=self.keys['public_key'])
 
             c1, c2 = ciphertext
 
@@ -0,0 +1,97 @@
+import secrets, hashlib
+
+class ElGamalImp:
+    def __init__(self, bit_length=2048, p=None, g=None):
+        """Initialize ElGamal instance, generate prime and generator unless given (e.g. from an existing public key)."""
+        self.bit_length = bit_length
+        self.p = p if p is not None else self.generate_large_prime()
+        self.g = g if g is not None else secrets.randbelow(self.p - 2) + 2  # Generator in range [2, p-2]
+
+    def generate_large_prime(self):
+        """Generate a large prime number of a specific bit length."""
+        while True:
+            prime_candidate = secrets.randbits(self.bit_length) | (1 << self.bit_length - 1) | 1
+            if self.is_prime(prime_candidate):
+                return prime_candidate
+
+    def is_prime(self, num, k=128):
+        """Miller-Rabin primality test for checking if a number is prime."""
+        if num <= 1:
+            return False
+        if num == 2 or num == 3:
+            return True
+        if num % 2 == 0:
+            return False
+        
+        r, d = 0, num - 1
+        while d % 2 == 0:
+            d //= 2
+            r += 1
+
+        for _ in range(k):
+            a = secrets.randbelow(num - 3) + 2  # Random integer in [2, num-2]
+            x = pow(a, d, num)
+            if x == 1 or x == num - 1:
+                continue
+            for _ in range(r - 1):
+                x = pow(x, 2, num)
+                if x == num - 1:
+                    break
+            else:
+                return False
+        return True
+
+    def generate_keys(self):
+        """Generate public and private keys for the user."""
+        x = secrets.randbelow(self.p - 2) + 1  # Private key
+        y = pow(self.g, x, self.p)  # Public key y = g^x mod p
+        return {'private_key': x, 'public_key': (self.p, self.g, y)}
+    
+    def encrypt(self, plaintext, public_key):
+        """Encrypt the plaintext message using the receiver's public key."""
+        p, g, y = public_key
+
+        # Convert plaintext to integer
+        plaintext_int = self.text_to_int(plaintext)
+        if plaintext_int >= p:
+            raise ValueError("Plaintext too large to encrypt. Use a larger key size or split message.")
+
+        # Generate random session key k
+        k = secrets.randbelow(p - 2) + 1
+
+        # ElGamal encryption steps
+        c1 = pow(g, k, p)
+        s = pow(y, k, p)
+        c2 = (plaintext_int * s) % p
+        return c1, c2
+
+    def decrypt(self, ciphertext, private_key):
+        """Decrypt the ciphertext and return the plaintext string."""
+        c1, c2 = ciphertext
+        p = self.p
+        x = private_key
+
+        s = pow(c1, x, p)
+        s_inv = pow(s, p - 2, p)  # modular inverse of s mod p
+        plaintext_int = (c2 * s_inv) % p
+
+        try:
+            plaintext = self.int_to_text(plaintext_int)
+        except UnicodeDecodeError:
+            raise ValueError("Decryption failed: result is not valid UTF-8 text.")
+        return plaintext
+
+    def hash_message(self, message):
+        """Hash the plaintext message using SHA-256."""
+        sha256 = hashlib.sha256()
+        sha256.update(message.encode('utf-8'))
+        return sha256.hexdigest()
+
+    def text_to_int(self, text):
+        """Convert text (string) to an integer."""
+        return int.from_bytes(text.encode('utf-8'), 'big')
+
+    def int_to_text(self, number):
+        """Convert an integer back to the original text (string)."""
+        byte_length = (number.bit_length() + 7) // 8
+        return number.to_bytes(byte_length, 'big').decode('utf-8')
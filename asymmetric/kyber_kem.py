@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
+from jobs                           import job_runner, show_job_error
 from kyber_py.kyber                 import Kyber1024, Kyber768, Kyber512
 from pathlib                        import Path
 import base64, os, binascii
@@ -50,8 +51,8 @@ class KyberKEMWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=['Base64', 'Hex', 'Raw'])
         self.output_format_options.setGeometry(200, 70, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.kem_encapsulate)
-        submit_button.setGeometry(400, 70, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.kem_encapsulate)
+        self.submit_button.setGeometry(400, 70, 100, 50)
 
         self.private_key_label = QTextEdit(parent=self)
         self.private_key_label.setGeometry(10, 150, 680, 100)
@@ -86,52 +87,64 @@ class KyberKEMWindow(QWidget):
         try:
             variant = self.variant_options.currentText()
             output_format = self.output_format_options.currentText()
-            kyber_kem = KyberKEM()
-
-            if variant == 'Kyber512':    
-                public_key, private_key = Kyber512.keygen()
-                shared_secret, ciphertext = Kyber512.encaps(public_key)
-            elif variant == 'Kyber768':
-                public_key, private_key = Kyber512.keygen()
-                shared_secret, ciphertext = Kyber768.encaps(public_key)
-            else:
-                public_key, private_key = Kyber1024.keygen()
-                shared_secret, ciphertext = Kyber1024.encaps(public_key)
-
-            print(f"Ciphertext Length when encapsulating: {len(ciphertext)}")
-            print(f"Private key when encapsulating: {len(private_key)}")
-
-            kyber_kem.save_files(public_key, private_key, ciphertext)
-            QMessageBox.information(self, 'Success', f'Keys successfully generated and saved at: {downloads_path}')
-            QMessageBox.information(self, 'Success', f'Ciphertext successfully generated and saved at: {downloads_path}')
-
-            def format_options(data):
-                if output_format == "Base64":
-                    return base64.b64encode(data).decode()
-                elif output_format == "Hex":
-                    return binascii.hexlify(data).decode()
-                else: # raw
-                    return data
-
-            self.private_key_label.setHtml(f"<b>Private key ({output_format}):</b><br>{format_options(private_key)}")
-            self.public_key_label.setHtml(f"<b>Public key ({output_format}):</b><br>{format_options(public_key)}")
-            self.ciphertext_label.setHtml(f"<b>Ciphertext ({output_format}):</b><br>{format_options(ciphertext)}")
-            self.shared_secret_label.setHtml(f"<b>Encapsulated Shared Secret ({output_format}):</b><br>{format_options(shared_secret)}")
-            self.saved_keys_label.setHtml(f"<b>Keys and ciphertext saved at:</b> {downloads_path}")
-
-            # show all fields
-            for widget in [
-                self.private_key_label,
-                self.public_key_label,
-                self.ciphertext_label,
-                self.shared_secret_label,
-                self.saved_keys_label]:widget.show()
+            self.submit_button.setEnabled(False)
+            job_runner().submit(
+                self.encapsulate, variant,
+                owner=self,
+                on_result=lambda result: self.show_result(result, output_format),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.submit_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encapsulate(variant):
+        if variant == 'Kyber512':    
+            public_key, private_key = Kyber512.keygen()
+            shared_secret, ciphertext = Kyber512.encaps(public_key)
+        elif variant == 'Kyber768':
+            public_key, private_key = Kyber512.keygen()
+            shared_secret, ciphertext = Kyber768.encaps(public_key)
+        else:
+            public_key, private_key = Kyber1024.keygen()
+            shared_secret, ciphertext = Kyber1024.encaps(public_key)
+
+        print(f"Ciphertext Length when encapsulating: {len(ciphertext)}")
+        print(f"Private key when encapsulating: {len(private_key)}")
+
+        KyberKEM().save_files(public_key, private_key, ciphertext)
+        return public_key, private_key, shared_secret, ciphertext
+
+    def show_result(self, result, output_format):
+        public_key, private_key, shared_secret, ciphertext = result
+        QMessageBox.information(self, 'Success', f'Keys successfully generated and saved at: {downloads_path}')
+        QMessageBox.information(self, 'Success', f'Ciphertext successfully generated and saved at: {downloads_path}')
+
+        def format_options(data):
+            if output_format == "Base64":
+                return base64.b64encode(data).decode()
+            elif output_format == "Hex":
+                return binascii.hexlify(data).decode()
+            else: # raw
+                return data
+
+        self.private_key_label.setHtml(f"<b>Private key ({output_format}):</b><br>{format_options(private_key)}")
+        self.public_key_label.setHtml(f"<b>Public key ({output_format}):</b><br>{format_options(public_key)}")
+        self.ciphertext_label.setHtml(f"<b>Ciphertext ({output_format}):</b><br>{format_options(ciphertext)}")
+        self.shared_secret_label.setHtml(f"<b>Encapsulated Shared Secret ({output_format}):</b><br>{format_options(shared_secret)}")
+        self.saved_keys_label.setHtml(f"<b>Keys and ciphertext saved at:</b> {downloads_path}")
+
+        # show all fields
+        for widget in [
+            self.private_key_label,
+            self.public_key_label,
+            self.ciphertext_label,
+            self.shared_secret_label,
+            self.saved_keys_label]:widget.show()
+
 # =========================================================================================================================================================
 
 class KyberKEMDecWindow(QWidget):
@@ -158,8 +171,8 @@ class KyberKEMDecWindow(QWidget):
             command=self.select_prv_key_file)
         select_prv_key_button.setGeometry(250, 50, 200, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.kem_decapsulate)
-        submit_button.setGeometry(500, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.kem_decapsulate)
+        self.submit_button.setGeometry(500, 50, 100, 50)
 
         self.selected_key_label = QTextEdit(parent=self)
         self.selected_key_label.setGeometry(10, 150, 270, 70)
@@ -235,28 +248,40 @@ class KyberKEMDecWindow(QWidget):
                     with open(self.private_key_file, "rb") as f:
                         private_key = f.read()
 
-                    if len(ciphertext) == 1568:
-                        shared_secret = Kyber1024.decaps(private_key, ciphertext)
-                    elif len(ciphertext) == 768:
-                        shared_secret = Kyber512.decaps(private_key, ciphertext)
-                    else:
-                        shared_secret = Kyber768.decaps(private_key, ciphertext)
-
-                    self.shared_secret_b64_label.clear()
-                    self.shared_secret_b64_label.setHtml(f"<b>Shared Secret (Base64):</b>\n{str(base64.b64encode(shared_secret).decode())}")
-                    self.shared_secret_b64_label.show()
-
-                    self.shared_secret_hex_label.clear()
-                    self.shared_secret_hex_label.setHtml(f"<b>Shared Secret (Hex):</b>\n{str(binascii.hexlify(shared_secret).decode())}")
-                    self.shared_secret_hex_label.show()
-
-                    self.shared_secret_raw_label.clear()
-                    self.shared_secret_raw_label.setHtml(f"<b>Shared Secret (Raw):</b>\n{str(shared_secret)}")
-                    self.shared_secret_raw_label.show()
-                
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decapsulate, private_key, ciphertext,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: QMessageBox.critical(self, "Error", f"Failed to decapsulate: {str(e)}"),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
+
                 else:
                     QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
             except ValueError as ve:
                 QMessageBox.warning(self, 'Error', str(ve))
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to decapsulate: {str(e)}")
+
+    @staticmethod
+    def decapsulate(private_key, ciphertext):
+        if len(ciphertext) == 1568:
+            shared_secret = Kyber1024.decaps(private_key, ciphertext)
+        elif len(ciphertext) == 768:
+            shared_secret = Kyber512.decaps(private_key, ciphertext)
+        else:
+            shared_secret = Kyber768.decaps(private_key, ciphertext)
+        return shared_secret
+
+    def show_result(self, shared_secret):
+        self.shared_secret_b64_label.clear()
+        self.shared_secret_b64_label.setHtml(f"<b>Shared Secret (Base64):</b>\n{str(base64.b64encode(shared_secret).decode())}")
+        self.shared_secret_b64_label.show()
+
+        self.shared_secret_hex_label.clear()
+        self.shared_secret_hex_label.setHtml(f"<b>Shared Secret (Hex):</b>\n{str(binascii.hexlify(shared_secret).decode())}")
+        self.shared_secret_hex_label.show()
+
+        self.shared_secret_raw_label.clear()
+        self.shared_secret_raw_label.setHtml(f"<b>Shared Secret (Raw):</b>\n{str(shared_secret)}")
+        self.shared_secret_raw_label.show()
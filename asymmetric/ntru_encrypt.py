@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 from base64                         import b64encode
 from binascii                       import hexlify
 import numpy                        as np
@@ -168,8 +169,8 @@ class NTRUEncryptWindow(QWidget):
         self.q_input = DefaultQLineEditStyle(parent=self, int_validator=True)
         self.q_input.setGeometry(240, 130, 50, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_ntru)
-        encrypt_button.setGeometry(400, 130, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_ntru)
+        self.encrypt_button.setGeometry(400, 130, 100, 50)
 
         self.private_keyf_label = QTextEdit(parent=self)
         self.private_keyf_label.setGeometry(10, 200, 680, 100)
@@ -206,6 +207,16 @@ class NTRUEncryptWindow(QWidget):
         p = int(self.p_input.text())
         q = int(self.q_input.text())
         
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.encrypt, msg, N, p, q,
+            owner=self,
+            on_result=self.show_result,
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    @staticmethod
+    def encrypt(msg, N, p, q):
         ntru = NTRU(N, p, q)
         ntru.generate_keys()
 
@@ -213,14 +224,17 @@ class NTRUEncryptWindow(QWidget):
 
         # Generate random polynomial r
         r = ntru.generate_random_polynomial(ones=(N // 3), neg_ones=(N // 3))
+        ciphertext = ntru.encrypt(msg_poly, r)
+        f, f_inv_p = ntru.get_private_key()
+        h = ntru.get_public_key()
+        return r, f, f_inv_p, h, ciphertext.coeffs
+
+    def show_result(self, result):
+        r, f, f_inv_p, h, pol_coeff = result
         self.random_r_label.clear()
         self.random_r_label.setHtml(f"<b>Random r generated:</b><br>{str(r.coeffs)}")
         self.random_r_label.show()
-        
-        ciphertext = ntru.encrypt(msg_poly, r)
-        pol_coeff = ciphertext.coeffs
 
-        f, f_inv_p = ntru.get_private_key()
         self.private_keyf_label.clear()
         self.private_keyf_label.setHtml(f"<b>Private key (f):</b><br>{str(f.coeffs)}")
         self.private_keyf_label.show()
@@ -228,7 +242,6 @@ class NTRUEncryptWindow(QWidget):
         self.private_keyfinvp_label.setHtml(f"<b>Private key (f_inv_p):</b><br>{str(f_inv_p.coeffs)}")
         self.private_keyfinvp_label.show()
 
-        h = ntru.get_public_key()
         self.public_key_label.clear()
         self.public_key_label.setHtml(f"<b>Public key (h):</b><br>{str(h.coeffs)}")
         self.public_key_label.show()
@@ -4,6 +4,7 @@ from DefaultStyles.button_style         import DefaultButtonStyle, DefaultAboutB
 from DefaultStyles.qcombo_box_style     import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style     import DefaultQLineEditStyle
 from DefaultStyles.qtextedit_style      import DefaultQTextEditStyle
+from jobs                               import job_runner, show_job_error
 from math                               import gcd
 from Crypto.Util                        import number
 import random
@@ -101,8 +102,8 @@ class PaillierEncWindow(QWidget):
         self.key_options = DefaultQComboBoxStyle(parent=self, items=["1024", "2048", "3072", "4096"])
         self.key_options.setGeometry(175, 130, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_paillier_encryption)
-        encrypt_button.setGeometry(400, 130, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_paillier_encryption)
+        self.encrypt_button.setGeometry(400, 130, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 230, 680, 130)
@@ -131,22 +132,14 @@ class PaillierEncWindow(QWidget):
                 plaintext_int = int.from_bytes(plaintext_bytes, byteorder='big')
                 key = int(self.key_options.currentText())
 
-                paillier = PaillierEncryption(key_size=key)
-                ciphertext = paillier.encrypt(plaintext_int)
-
-                public_key = paillier.get_public_key()
-                private_key = paillier.get_private_key()
-
-                self.public_key_label.clear()
-                self.public_key_label.setHtml(f"<b>Public Key (n, g):</b><br>{str(public_key)}")
-                self.public_key_label.show()
-                self.private_key_label.clear()
-                self.private_key_label.setHtml(f"<b>Private Key (λ, μ):</b><br>{str(private_key)}")
-                self.private_key_label.show()
-
-                self.encrypted_text_label.clear()
-                self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(ciphertext)}")
-                self.encrypted_text_label.show()
+                # key generation at 3072/4096 bits takes seconds, keep it off the GUI thread
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.generate_and_encrypt, plaintext_int, key,
+                    owner=self,
+                    on_result=self.show_encryption,
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 QMessageBox.warning(self, 'No plaintext entered.', 'Please enter a plaintext.')
                 raise ValueError('No plaintext provided.')
@@ -155,6 +148,26 @@ class PaillierEncWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def generate_and_encrypt(plaintext_int, key):
+        paillier = PaillierEncryption(key_size=key)
+        ciphertext = paillier.encrypt(plaintext_int)
+        return ciphertext, paillier.get_public_key(), paillier.get_private_key()
+
+    def show_encryption(self, result):
+        ciphertext, public_key, private_key = result
+
+        self.public_key_label.clear()
+        self.public_key_label.setHtml(f"<b>Public Key (n, g):</b><br>{str(public_key)}")
+        self.public_key_label.show()
+        self.private_key_label.clear()
+        self.private_key_label.setHtml(f"<b>Private Key (λ, μ):</b><br>{str(private_key)}")
+        self.private_key_label.show()
+
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(ciphertext)}")
+        self.encrypted_text_label.show()
+
 # ==========================================================================================================================
 
 class PaillierDecWindow(QWidget):
@@ -1,70 +1,9 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-from Crypto.PublicKey               import RSA
-from Crypto.Cipher                  import PKCS1_OAEP
-from Crypto.Signature               import pkcs1_15
-from Crypto.Hash                    import SHA256
-from base64                         import b64encode, b64decode
+from jobs                           import job_runner, show_job_error
+from .rsa_core                      import RSAImp
  
-# Implementation
-class RSAImp:
-    def __init__(self, public_key=None, private_key=None):
-        self.public_key = None
-        self.private_key = None
-
-        if public_key:
-            if isinstance(public_key, str) and public_key.endswith(".pem"):
-                with open(public_key, "rb") as f:
-                    self.public_key = RSA.import_key(f.read())
-            elif isinstance(public_key, bytes):
-                self.public_key = RSA.import_key(public_key)
-
-        if private_key:
-            if isinstance(private_key, str) and private_key.endswith(".pem"):
-                with open(private_key, "rb") as f:
-                    self.private_key = RSA.import_key(f.read())
-            elif isinstance(private_key, bytes):
-                self.private_key = RSA.import_key(private_key)
-
-    def encrypt(self, message):
-        """Encrypt a message using the public key with PKCS#1 OAEP."""
-        if not self.public_key:
-            raise ValueError("Public key not loaded.")
-        
-        cipher = PKCS1_OAEP.new(self.public_key)
-        encrypted_message = cipher.encrypt(message.encode('utf-8'))
-        return b64encode(encrypted_message).decode('utf-8')
-
-    def decrypt(self, encrypted_message):
-        """Decrypt a message using the private key with PKCS#1 OAEP."""
-        if not self.private_key:
-            raise ValueError("Private key not loaded.")
-        cipher = PKCS1_OAEP.new(self.private_key)
-        decrypted_message = cipher.decrypt(b64decode(encrypted_message))
-        
-        return decrypted_message.decode('utf-8')
-    
-    def sign(self, message):
-        """Sign a message using the private key and SHA-256."""
-        if not self.private_key:
-            raise ValueError("Private key not loaded.")
-        
-        message_hash = SHA256.new(message.encode('utf-8'))
-        signature = pkcs1_15.new(self.private_key).sign(message_hash)
-        return b64encode(signature).decode('utf-8')
-
-    def verify(self, message, signature):
-        """Verify a message's signature using the public key."""
-        if not self.public_key:
-            raise ValueError("Public key not loaded.")
-
-        message_hash = SHA256.new(message.encode('utf-8'))
-        try:
-            pkcs1_15.new(self.public_key).verify(message_hash, b64decode(signature))
-            return True
-        except (ValueError, TypeError):
-            return False
 
 class RSAWindow(QWidget):
 
@@ -109,8 +48,8 @@ class RSAWindow(QWidget):
             command=self.load_senders_prvkey_file)
         load_senders_prvkey_button.setGeometry(10, 200, 300, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt\nand\nSign", parent=self, bold=True, command=self.call_rsa_encrypt_and_sign)
-        encrypt_button.setGeometry(370, 140, 100, 90)
+        self.encrypt_button = DefaultButtonStyle("Encrypt\nand\nSign", parent=self, bold=True, command=self.call_rsa_encrypt_and_sign)
+        self.encrypt_button.setGeometry(370, 140, 100, 90)
 
         self.ciphertext_label = QTextEdit(parent=self)
         self.ciphertext_label.setGeometry(10, 310, 500, 100)
@@ -161,8 +100,8 @@ class RSAWindow(QWidget):
             command=self.load_senders_pblkey_file)
         load_senders_pblkey_button.setGeometry(580, 330, 330, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt\nand\nVerify", parent=self, bold=True, command=self.call_rsa_decrypt_and_verify)
-        decrypt_button.setGeometry(950, 270, 100, 90)
+        self.decrypt_button = DefaultButtonStyle("Decrypt\nand\nVerify", parent=self, bold=True, command=self.call_rsa_decrypt_and_verify)
+        self.decrypt_button.setGeometry(950, 270, 100, 90)
 
         self.decrypted_text_label = QTextEdit(parent=self)
         self.decrypted_text_label.setGeometry(580, 410, 500, 100)
@@ -227,25 +166,37 @@ class RSAWindow(QWidget):
             if not hasattr(self, 'sender_public_key_file'):
                 raise ValueError("Sender's public key not loaded.")
 
-            rsa = RSAImp(self.sender_public_key_file, self.receiver_private_key_file)
-            decrypted_message = rsa.decrypt(ciphertext)
-            verified = rsa.verify(decrypted_message, signature)
-
-            QMessageBox.information(self, "Original plaintext/message:", str(decrypted_message))
-            self.decrypted_text_label.clear()
-            self.decrypted_text_label.setHtml(f"<b>Encrypted Text:</b><br>{str(decrypted_message)}")
-            self.decrypted_text_label.show()
-
-            QMessageBox.information(self, "Signature verification:", str(verified))
-            self.verified_signature_label.clear()
-            self.verified_signature_label.setHtml(f"<b>Is Signature VALID?:</b><br>{str(verified)}")
-            self.verified_signature_label.show()
+            self.decrypt_button.setEnabled(False)
+            job_runner().submit(
+                self.decrypt_and_verify, self.sender_public_key_file, self.receiver_private_key_file, ciphertext, signature,
+                owner=self,
+                on_result=self.show_decryption,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.decrypt_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def decrypt_and_verify(public_key_file, private_key_file, ciphertext, signature):
+        rsa = RSAImp(public_key_file, private_key_file)
+        decrypted_message = rsa.decrypt(ciphertext)
+        return decrypted_message, rsa.verify(decrypted_message, signature)
+
+    def show_decryption(self, result):
+        decrypted_message, verified = result
+        QMessageBox.information(self, "Original plaintext/message:", str(decrypted_message))
+        self.decrypted_text_label.clear()
+        self.decrypted_text_label.setHtml(f"<b>Encrypted Text:</b><br>{str(decrypted_message)}")
+        self.decrypted_text_label.show()
+
+        QMessageBox.information(self, "Signature verification:", str(verified))
+        self.verified_signature_label.clear()
+        self.verified_signature_label.setHtml(f"<b>Is Signature VALID?:</b><br>{str(verified)}")
+        self.verified_signature_label.show()
+
     # for encrypting
     def load_receivers_pubkey_file(self):
         try:
@@ -287,17 +238,13 @@ class RSAWindow(QWidget):
                     if self.private_key_file:
                         plaintext = self.plaintext_input.text()
 
-                        rsa = RSAImp(self.public_key_file, self.private_key_file)
-
-                        ciphertext = rsa.encrypt(plaintext)
-                        self.ciphertext_label.clear()
-                        self.ciphertext_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{str(ciphertext)}")
-                        self.ciphertext_label.show()
-
-                        signature = rsa.sign(plaintext)
-                        self.signature_label.clear()
-                        self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature)}")
-                        self.signature_label.show()
+                        self.encrypt_button.setEnabled(False)
+                        job_runner().submit(
+                            self.encrypt_and_sign, self.public_key_file, self.private_key_file, plaintext,
+                            owner=self,
+                            on_result=self.show_encryption,
+                            on_error=lambda e: show_job_error(self, e),
+                            on_finished=lambda: self.encrypt_button.setEnabled(True))
 
                     else:
                         raise ValueError('No private key loaded.')
@@ -310,3 +257,18 @@ class RSAWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def encrypt_and_sign(public_key_file, private_key_file, plaintext):
+        rsa = RSAImp(public_key_file, private_key_file)
+        return rsa.encrypt(plaintext), rsa.sign(plaintext)
+
+    def show_encryption(self, result):
+        ciphertext, signature = result
+        self.ciphertext_label.clear()
+        self.ciphertext_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{str(ciphertext)}")
+        self.ciphertext_label.show()
+
+        self.signature_label.clear()
+        self.signature_label.setHtml(f"<b>Signature (Base64):</b><br>{str(signature)}")
+        self.signature_label.show()
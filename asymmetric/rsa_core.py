@@ -0,0 +1,63 @@
+from Crypto.PublicKey               import RSA
+from Crypto.Cipher                  import PKCS1_OAEP
+from Crypto.Signature               import pkcs1_15
+from Crypto.Hash                    import SHA256
+from base64                         import b64encode, b64decode
+
+class RSAImp:
+    def __init__(self, public_key=None, private_key=None):
+        self.public_key = None
+        self.private_key = None
+
+        if public_key:
+            if isinstance(public_key, str) and public_key.endswith(".pem"):
+                with open(public_key, "rb") as f:
+                    self.public_key = RSA.import_key(f.read())
+            elif isinstance(public_key, bytes):
+                self.public_key = RSA.import_key(public_key)
+
+        if private_key:
+            if isinstance(private_key, str) and private_key.endswith(".pem"):
+                with open(private_key, "rb") as f:
+                    self.private_key = RSA.import_key(f.read())
+            elif isinstance(private_key, bytes):
+                self.private_key = RSA.import_key(private_key)
+
+    def encrypt(self, message):
+        """Encrypt a message using the public key with PKCS#1 OAEP."""
+        if not self.public_key:
+            raise ValueError("Public key not loaded.")
+        
+        cipher = PKCS1_OAEP.new(self.public_key)
+        encrypted_message = cipher.encrypt(message.encode('utf-8'))
+        return b64encode(encrypted_message).decode('utf-8')
+
+    def decrypt(self, encrypted_message):
+        """Decrypt a message using the private key with PKCS#1 OAEP."""
+        if not self.private_key:
+            raise ValueError("Private key not loaded.")
+        cipher = PKCS1_OAEP.new(self.private_key)
+        decrypted_message = cipher.decrypt(b64decode(encrypted_message))
+        
+        return decrypted_message.decode('utf-8')
+    
+    def sign(self, message):
+        """Sign a message using the private key and SHA-256."""
+        if not self.private_key:
+            raise ValueError("Private key not loaded.")
+        
+        message_hash = SHA256.new(message.encode('utf-8'))
+        signature = pkcs1_15.new(self.private_key).sign(message_hash)
+        return b64encode(signature).decode('utf-8')
+
+    def verify(self, message, signature):
+        """Verify a message's signature using the public key."""
+        if not self.public_key:
+            raise ValueError("Public key not loaded.")
+
+        message_hash = SHA256.new(message.encode('utf-8'))
+        try:
+            pkcs1_15.new(self.public_key).verify(message_hash, b64decode(signature))
+            return True
+        except (ValueError, TypeError):
+            return False
@@ -0,0 +1,131 @@
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
+from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from jobs                           import job_runner, show_job_error
+from .rsa_key_audit_core            import audit_paths
+import json
+
+class RSAKeyAuditWindow(QWidget):
+
+    def __init__(self, theme_mode):
+        super().__init__()
+        self.theme_mode = theme_mode
+        self.paths = []
+        self.report = None
+
+        msgbox_title = "About RSA Key Auditor"
+        msgbox_txt = (
+            "The RSA Key Auditor checks large collections of RSA public keys and certificates for known weaknesses:<br>"
+            "<ul>"
+            "<li><b>Shared prime factors:</b> keys generated with too little randomness often share a prime with another key. "
+            "Bernstein's batch GCD (a product tree followed by a remainder tree) finds them for all keys at once, "
+            "instead of computing a GCD for every pair.</li>"
+            "<li><b>Duplicate moduli</b> used by several keys or certificates.</li>"
+            "<li><b>Small private exponents:</b> Wiener's continued fraction attack.</li>"
+            "<li><b>Close prime factors:</b> Fermat's factorization method.</li>"
+            "<li><b>Small prime factors</b> and <b>short moduli</b> below 1024 bits.</li>"
+            "</ul>"
+            "PEM files with any number of keys or certificates, OpenSSH public keys, DER keys and text files with one "
+            "modulus per line (n or n,e) are accepted. The per key checks run on all CPU cores.<br><br>"
+            "Useful links: <br>"
+            "<a href=https://factorable.net/weakkeys12.extended.pdf>Mining Your Ps and Qs (Heninger et al.)</a><br>"
+            "<a href=https://cr.yp.to/factorization/smoothparts-20040510.pdf>How to find smooth parts of integers (Bernstein)</a>")
+
+        self.setWindowTitle("RSA Key Auditor")
+        self.setFixedSize(700, 700)
+
+        info_label = QLabel("Select key files, certificates or folders to audit:", parent=self)
+        info_label.setGeometry(10, 10, 400, 50)
+
+        add_files_button = DefaultButtonStyle("Add Files", parent=self, command=self.add_files)
+        add_files_button.setGeometry(10, 60, 130, 50)
+
+        add_folder_button = DefaultButtonStyle("Add Folder", parent=self, command=self.add_folder)
+        add_folder_button.setGeometry(150, 60, 130, 50)
+
+        clear_button = DefaultButtonStyle("Clear", parent=self, command=self.clear_paths)
+        clear_button.setGeometry(290, 60, 100, 50)
+
+        self.audit_button = DefaultButtonStyle("Run Audit", parent=self, bold=True, command=self.call_audit)
+        self.audit_button.setGeometry(440, 60, 120, 50)
+
+        self.save_button = DefaultButtonStyle("Save Report", parent=self, command=self.save_report)
+        self.save_button.setGeometry(570, 60, 120, 50)
+        self.save_button.setEnabled(False)
+
+        self.paths_label = QTextEdit(parent=self)
+        self.paths_label.setGeometry(10, 130, 680, 100)
+        self.paths_label.setReadOnly(True)
+        self.paths_label.hide()
+
+        self.report_label = QTextEdit(parent=self)
+        self.report_label.setGeometry(10, 240, 680, 400)
+        self.report_label.setReadOnly(True)
+        self.report_label.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self.report_label.hide()
+
+        # About button setup
+        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 650, 50, 50))
+        self.aboutButton.update_theme(self.theme_mode)
+
+    def add_files(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, 'Select Keys or Certificates')
+        self.add_paths(paths)
+
+    def add_folder(self):
+        path = QFileDialog.getExistingDirectory(self, 'Select a Folder of Keys')
+        self.add_paths([path] if path else [])
+
+    def add_paths(self, paths):
+        self.paths += [path for path in paths if path not in self.paths]
+        self.paths_label.clear()
+        self.paths_label.setHtml(f"<b>Selected ({len(self.paths)}):</b><br>{'<br>'.join(self.paths)}")
+        self.paths_label.setVisible(bool(self.paths))
+
+    def clear_paths(self):
+        self.paths = []
+        self.paths_label.hide()
+
+    def call_audit(self):
+        try:
+            if not self.paths:
+                raise ValueError("Please select key files or a folder first.")
+            self.report_label.clear()
+            self.report_label.setPlainText("Loading keys...")
+            self.report_label.show()
+
+            self.audit_button.setEnabled(False)
+            job_runner().submit(
+                self.run_audit, list(self.paths), pass_job=True,
+                owner=self,
+                on_progress=lambda progress: self.report_label.setPlainText("{}: {}/{}".format(*progress)),
+                on_result=self.show_report,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.audit_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_audit(paths, job):
+        def progress(stage, done, total):
+            job.check_cancelled()
+            job.report_progress((stage, done, total))
+        return audit_paths(paths, progress_callback=progress)
+
+    def show_report(self, report):
+        self.report = report
+        self.report_label.setPlainText(report.format())
+        self.report_label.show()
+        self.save_button.setEnabled(True)
+
+    def save_report(self):
+        try:
+            path, _ = QFileDialog.getSaveFileName(self, 'Save Report', 'rsa_audit.json', 'JSON (*.json);;Text (*.txt)')
+            if not path:
+                return
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.report.to_dict(), indent=2) if path.endswith('.json') else self.report.format())
+            QMessageBox.information(self, 'Report Saved', f'Report saved at:\n{path}')
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
@@ -0,0 +1,358 @@
+from concurrent.futures        import ProcessPoolExecutor
+from collections               import namedtuple
+from functools                 import lru_cache
+from .rsa_core                 import RSAImp
+from .rsa_wiener_attack_core   import RSA_Wiener_AttackImp
+import argparse, json, math, os, pickle, random, re, sys, tempfile
+
+AuditKey = namedtuple("AuditKey", "source n e")
+Finding = namedtuple("Finding", "source bits issue p q d")
+
+PEM_BLOCK = re.compile(rb"-----BEGIN ([A-Z0-9 ]+)-----.+?-----END \1-----", re.S)
+DIVISION_LIMIT = 4000     # bits; below this CPython's long division beats the recursive one
+SPILL_THRESHOLD = 4096    # moduli above which the product tree levels are kept on disk
+FERMAT_ROUNDS = 4096
+MIN_BITS = 1024
+SQUARES_MOD_64 = frozenset(i * i % 64 for i in range(64))
+
+# Key loading
+
+def _parse_int(text):
+    return int(text, 16) if text.lower().startswith("0x") else int(text)
+
+def _import(source, data):
+    key = RSAImp(public_key=data).public_key
+    return AuditKey(source, key.n, key.e)
+
+def load_key_file(path):
+    """RSA keys of one file: (keys, errors). Understands PEM files with any number of keys or
+    certificates, OpenSSH public keys (one per line), DER and text files with one modulus per
+    line as "n" or "n,e" (decimal or 0x hex)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    keys, errors = [], []
+    blocks = [match.group(0) for match in PEM_BLOCK.finditer(data)]
+    if blocks:
+        for i, block in enumerate(blocks, 1):
+            source = f"{path}#{i}" if len(blocks) > 1 else path
+            try:
+                keys.append(_import(source, block))
+            except (ValueError, IndexError, TypeError) as e:
+                errors.append((source, f"not an RSA key or certificate ({e})"))
+        return keys, errors
+
+    lines = [line.strip() for line in data.splitlines()]
+    if any(line.startswith(b"ssh-rsa ") for line in lines):
+        for number, line in enumerate(lines, 1):
+            if line.startswith(b"ssh-rsa "):
+                try:
+                    keys.append(_import(f"{path}:{number}", line))
+                except (ValueError, IndexError, TypeError) as e:
+                    errors.append((f"{path}:{number}", str(e)))
+        return keys, errors
+
+    try:
+        return [_import(path, data)], errors
+    except (ValueError, IndexError, TypeError):
+        pass
+    for number, line in enumerate(lines, 1):
+        if not line or line.startswith(b"#"):
+            continue
+        fields = re.split(r"[\s,;]+", line.decode("ascii", "replace"))
+        try:
+            n = _parse_int(fields[0])
+            e = _parse_int(fields[1]) if len(fields) > 1 else 65537
+            keys.append(AuditKey(f"{path}:{number}", n, e))
+        except ValueError:
+            errors.append((path, "no RSA key found"))
+            return [], errors
+    if not keys:
+        errors.append((path, "no RSA key found"))
+    return keys, errors
+
+def load_keys(paths):
+    """Keys of all files, directories (walked recursively) and their errors."""
+    keys, errors = [], []
+    for path in paths:
+        files = [os.path.join(root, name) for root, _, names in os.walk(path) for name in sorted(names)] \
+            if os.path.isdir(path) else [path]
+        for file_path in files:
+            try:
+                file_keys, file_errors = load_key_file(file_path)
+            except OSError as e:
+                file_keys, file_errors = [], [(file_path, str(e))]
+            keys += file_keys
+            errors += file_errors
+    return keys, errors
+
+# Batch GCD
+
+def _divmod_2n_1n(a, b, n):
+    """divmod(a, b) for b of n bits and a < 2^n * b (Burnikel-Ziegler)."""
+    if n <= DIVISION_LIMIT:
+        return divmod(a, b)
+    pad = n & 1
+    if pad:
+        a, b, n = a << 1, b << 1, n + 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b1, b2 = b >> half, b & mask
+    q1, r = _divmod_3n_2n(a >> n, (a >> half) & mask, b, b1, b2, half)
+    q2, r = _divmod_3n_2n(r, a & mask, b, b1, b2, half)
+    return q1 << half | q2, r >> pad
+
+def _divmod_3n_2n(a12, a3, b, b1, b2, n):
+    if a12 >> n == b1:
+        q, r = (1 << n) - 1, a12 - (b1 << n) + b1
+    else:
+        q, r = _divmod_2n_1n(a12, b1, n)
+    r = (r << n | a3) - q * b2
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+def fast_mod(a, b):
+    """a % b. CPython's long division is quadratic, so large divisors go through a recursive
+    division that only needs (Karatsuba) multiplications."""
+    n = b.bit_length()
+    if n <= DIVISION_LIMIT or a < b:
+        return a % b
+    r, mask = 0, (1 << n) - 1
+    for shift in range((a.bit_length() - 1) // n * n, -1, -n):
+        r = _divmod_2n_1n(r << n | (a >> shift) & mask, b, n)[1]
+    return r
+
+class _LevelStore:
+    """Stack of product tree levels, pickled to a temporary directory when spill is set so that
+    only the level being built or descended stays in memory."""
+
+    def __init__(self, spill):
+        self.levels = []
+        self.directory = tempfile.TemporaryDirectory(prefix="batch-gcd-") if spill else None
+
+    def push(self, level):
+        if self.directory is None:
+            self.levels.append(level)
+            return
+        path = os.path.join(self.directory.name, f"{len(self.levels)}.level")
+        with open(path, "wb") as f:
+            pickle.dump(level, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.levels.append(path)
+
+    def pop(self):
+        level = self.levels.pop()
+        if self.directory is None:
+            return level
+        with open(level, "rb") as f:
+            values = pickle.load(f)
+        os.remove(level)
+        return values
+
+    def close(self):
+        if self.directory is not None:
+            self.directory.cleanup()
+
+def batch_gcd(moduli, progress_callback=None, spill=None):
+    """Bernstein's batch GCD: gcd(n_i, product of all other moduli) for every modulus, through a
+    product tree and a remainder tree. progress_callback(stage, done, total) is called per level."""
+    moduli = list(moduli)
+    if len(moduli) < 2:
+        return [1] * len(moduli)
+    store = _LevelStore(len(moduli) > SPILL_THRESHOLD if spill is None else spill)
+    try:
+        level = moduli
+        depth = max(1, (len(moduli) - 1).bit_length()) + 1
+        store.push(level)
+        while len(level) > 1:
+            level = [level[i] * level[i + 1] if i + 1 < len(level) else level[i] for i in range(0, len(level), 2)]
+            store.push(level)
+            if progress_callback:
+                progress_callback("Product tree", len(store.levels), depth)
+
+        remainders = store.pop()
+        for done in range(1, depth):
+            level = store.pop()
+            remainders = [fast_mod(remainders[i >> 1], x * x) for i, x in enumerate(level)]
+            if progress_callback:
+                progress_callback("Remainder tree", done, depth - 1)
+    finally:
+        store.close()
+    return [math.gcd(r // n, n) for r, n in zip(remainders, moduli)]
+
+# Per key checks
+
+@lru_cache(maxsize=1)
+def small_primorial(limit=1 << 16):
+    """Product of all primes below limit, so one gcd finds every small factor of a modulus."""
+    flags = bytearray([1]) * limit
+    flags[:2] = b"\0\0"
+    for p in range(2, math.isqrt(limit) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return math.prod(p for p in range(limit) if flags[p])
+
+def factor_from_private_exponent(n, e, d):
+    """(p, q) from a private exponent, by the randomized square root of 1 method."""
+    k = e * d - 1
+    t = (k & -k).bit_length() - 1
+    for _ in range(100):
+        g = random.randrange(2, n - 1)
+        x = pow(g, k >> t, n)
+        for _ in range(t):
+            y = x * x % n
+            if y == 1 and x not in (1, n - 1):
+                p = math.gcd(x - 1, n)
+                return min(p, n // p), max(p, n // p)
+            x = y
+    return None
+
+def wiener_check(n, e):
+    """Private exponent d if Wiener's continued fraction attack recovers it, else None."""
+    wa = RSA_Wiener_AttackImp(n=n, e=e)
+    d = wa.wiener_attack(wa.convergent_values(wa.continued_fraction(e, n)), e, n)
+    return None if d == "FAIL" else d
+
+def fermat_check(n, rounds=FERMAT_ROUNDS):
+    """(p, q) if n = a^2 - b^2 for one of the first `rounds` values of a above sqrt(n)."""
+    a = math.isqrt(n)
+    if a * a == n:
+        return a, a
+    a += 1
+    b2 = a * a - n
+    for _ in range(rounds):
+        if b2 & 63 in SQUARES_MOD_64:
+            b = math.isqrt(b2)
+            if b * b == b2:
+                return a - b, a + b
+        b2 += 2 * a + 1
+        a += 1
+    return None
+
+def check_key(n, e, fermat_rounds=FERMAT_ROUNDS):
+    """Process pool worker: (issue, p, q, d) tuples of the single key checks."""
+    issues = []
+    if n.bit_length() < MIN_BITS:
+        issues.append(("short modulus", None, None, None))
+    small = math.gcd(n, small_primorial())
+    if small > 1:
+        issues.append(("small prime factor", small, n // small, None))
+        return issues
+    d = wiener_check(n, e)
+    if d is not None:
+        p, q = factor_from_private_exponent(n, e, d) or (None, None)
+        issues.append(("small private exponent (Wiener)", p, q, d))
+    pq = fermat_check(n, fermat_rounds)
+    if pq:
+        issues.append(("close prime factors (Fermat)", pq[0], pq[1], None))
+    return issues
+
+def _check_keys(batch, fermat_rounds):
+    return [check_key(n, e, fermat_rounds) for n, e in batch]
+
+class AuditReport:
+
+    def __init__(self, keys, findings, errors):
+        self.keys = keys
+        self.findings = findings
+        self.errors = errors
+
+    @property
+    def broken_sources(self):
+        return sorted({finding.source for finding in self.findings if finding.issue != "short modulus"})
+
+    def to_dict(self):
+        return {"keys": len(self.keys), "broken": len(self.broken_sources),
+                # factors and exponents as strings, JSON readers often lose precision on big numbers
+                "findings": [{field: (str(value) if field in ("p", "q", "d") else value)
+                              for field, value in finding._asdict().items() if value is not None}
+                             for finding in self.findings],
+                "errors": [{"source": source, "error": error} for source, error in self.errors]}
+
+    def format(self):
+        lines = [f"{len(self.keys):,} keys audited, {len(self.broken_sources):,} broken, "
+                 f"{len(self.errors):,} file errors", ""]
+        for finding in self.findings:
+            lines.append(f"{finding.source} ({finding.bits} bits): {finding.issue}")
+            if finding.p:
+                lines.append(f"    p = {finding.p}\n    q = {finding.q}")
+            if finding.d:
+                lines.append(f"    d = {finding.d}")
+        if self.errors:
+            lines += ["", "Skipped:"] + [f"  {source}: {error}" for source, error in self.errors]
+        return "\n".join(lines)
+
+def audit_keys(keys, errors=(), workers=None, fermat_rounds=FERMAT_ROUNDS, progress_callback=None):
+    """Runs the batch GCD over all distinct moduli and the per key checks (short modulus, small
+    factors, Wiener, Fermat) on a process pool. Returns an AuditReport."""
+    findings = []
+    by_modulus = {}
+    for key in keys:
+        by_modulus.setdefault(key.n, []).append(key)
+    for n, same in by_modulus.items():
+        if len(same) > 1:
+            findings += [Finding(key.source, n.bit_length(), "duplicate modulus", None, None, None) for key in same]
+
+    moduli = list(by_modulus)
+    for n, g in zip(moduli, batch_gcd(moduli, progress_callback)):
+        if g == n:
+            # both primes are shared with other keys: find them one modulus at a time
+            g = next((h for h in (math.gcd(n, m) for m in moduli if m != n) if 1 < h < n), 1)
+        if 1 < g < n:
+            findings += [Finding(key.source, n.bit_length(), "shared prime factor", min(g, n // g), max(g, n // g), None)
+                         for key in by_modulus[n]]
+
+    distinct = [(n, same[0].e) for n, same in by_modulus.items()]
+    workers = min(workers or os.cpu_count() or 1, max(len(distinct), 1))
+    batch = max(1, min(256, len(distinct) // (workers * 8) or 1))
+    batches = [distinct[i:i + batch] for i in range(0, len(distinct), batch)]
+    results = []
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        outputs = pool.map(_check_keys, batches, [fermat_rounds] * len(batches)) if pool else \
+            (_check_keys(b, fermat_rounds) for b in batches)
+        for output in outputs:
+            results += output
+            if progress_callback:
+                progress_callback("Key checks", len(results), len(distinct))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    for (n, _), issues in zip(distinct, results):
+        for issue, p, q, d in issues:
+            findings += [Finding(key.source, n.bit_length(), issue, p, q, d) for key in by_modulus[n]]
+    findings.sort(key=lambda finding: (finding.source, finding.issue))
+    return AuditReport(keys, findings, list(errors))
+
+def audit_paths(paths, workers=None, fermat_rounds=FERMAT_ROUNDS, progress_callback=None):
+    keys, errors = load_keys(paths)
+    if not keys:
+        raise ValueError("No RSA keys found.")
+    return audit_keys(keys, errors, workers, fermat_rounds, progress_callback)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m asymmetric.rsa_key_audit_core",
+                                     description="Audits RSA public keys and certificates for shared prime "
+                                                 "factors, small private exponents and close primes.")
+    parser.add_argument("paths", nargs="+", help="key files or directories")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--fermat-rounds", type=int, default=FERMAT_ROUNDS)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    def progress(stage, done, total):
+        sys.stderr.write(f"\r{stage}: {done}/{total}   ")
+        sys.stderr.flush()
+
+    try:
+        report = audit_paths(args.paths, args.jobs, args.fermat_rounds, progress if sys.stderr.isatty() else None)
+    except ValueError as ve:
+        parser.error(str(ve))
+    if sys.stderr.isatty():
+        sys.stderr.write("\r\033[K")
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 1 if report.broken_sources else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,73 +1,8 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-import math
-
-class RSA_Wiener_AttackImp:
-
-    def __init__(self, n, e) -> None:
-        self.n = n
-        self.e = e
-
-    def trial_division(self, n):
-        L = []
-        while n % 2 == 0:
-            L.append(2)
-            n //= 2
-        f = 3
-        while f ** 2 <= n:
-            if n % f == 0:
-                L.append(f)
-                n //= f
-            else:
-                f += 2
-        if n != 1:
-            L.append(n)
-        return L
-    
-    def fn_function(self, p, q):
-        return (p - 1) * (q - 1) # φ(Ν)
-    
-    def continued_fraction(self, e, n):
-        a = []
-        while n > 0:
-            q = e // n
-            r = e % n
-            a.append(q)
-            e, n = n, r
-        return a
-    
-    def convergent_values(self, cf):
-        convergents = []
-        h1, h2 = 1, 0
-        k1, k2 = 0, 1
-        for i in range(len(cf)):
-            a = cf[i]
-            h = a * h1 + h2
-            k = a * k1 + k2
-            convergents.append((h, k))
-            h2, h1 = h1, h
-            k2, k1 = k1, k
-        return convergents
-
-    # function to find the secret exponent d:
-    def wiener_attack(self, convergents, e, n):
-        fn = 0
-        # φ(Ν) = ed-1 / k
-        for k, d in convergents:
-            if k > 0:
-                fni = (e * d - 1)
-                if fni % k == 0:
-                    fn = fni // k
-
-                    # quadratic equation x**2-(Ν-φ(Ν) + 1)x + N = 0
-                    x = -((n - fn) + 1)
-                    x1 = x * x - 4 * n
-                    if x1 >= 0:
-                        root = math.isqrt(x1)
-                        if root * root == x1:
-                            return d
-        return "FAIL"
+from jobs                           import job_runner, show_job_error
+from .rsa_wiener_attack_core        import RSA_Wiener_AttackImp
 
 class RSAWienerAttackWindow(QWidget):
 
@@ -107,8 +42,8 @@ class RSAWienerAttackWindow(QWidget):
         self.n_input = DefaultQLineEditStyle(parent=self, int_validator=True)
         self.n_input.setGeometry(250, 60, 200, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_wa)
-        submit_button.setGeometry(500, 60, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_wa)
+        self.submit_button.setGeometry(500, 60, 100, 50)
 
         self.pq_label = QTextEdit(parent=self)
         self.pq_label.setGeometry(10, 130, 680, 100)
@@ -143,31 +78,42 @@ class RSAWienerAttackWindow(QWidget):
         e = int(self.e_input.text())
         n = int(self.n_input.text())
 
+        self.submit_button.setEnabled(False)
+        job_runner().submit(
+            self.attack, n, e,
+            owner=self,
+            on_result=self.show_result,
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.submit_button.setEnabled(True))
+
+    @staticmethod
+    def attack(n, e):
         wa = RSA_Wiener_AttackImp(n=n, e=e)
+        p, q = wa.trial_division(n)
+        phi_n = wa.fn_function(p, q)
+        cf = wa.continued_fraction(e, n)
+        convergents = wa.convergent_values(cf)
+        d = wa.wiener_attack(convergents, e, n)
+        return p, q, phi_n, cf, convergents, d
 
-        pq = wa.trial_division(n)
-        p = pq[0]
-        q = pq[1]
+    def show_result(self, result):
+        p, q, phi_n, cf, convergents, d = result
         self.pq_label.clear()
         self.pq_label.setHtml(f"<b>p: </b>{str(p)} <br> <br> <b>q: </b>{str(q)}")
         self.pq_label.show()
 
-        phi_n = wa.fn_function(p, q)
         self.phi_n_label.clear()
         self.phi_n_label.setHtml(f"<b>φ(N):</b><br>{str(phi_n)}")
         self.phi_n_label.show()
 
-        cf = wa.continued_fraction(e, n)
         self.cf_label.clear()
         self.cf_label.setHtml(f"<b>Continued fraction:</b><br>{str(cf)}")
         self.cf_label.show()
 
-        convergents = wa.convergent_values(cf)
         self.convergents_label.clear()
         self.convergents_label.setHtml(f"<b>Convergents:</b><br>{str(convergents)}")
         self.convergents_label.show()
 
-        d = wa.wiener_attack(convergents, e, n)
         self.secret_d_label.clear()
         self.secret_d_label.setHtml(f"<b>Secret key d:</b><br>{str(d)}")
         self.secret_d_label.show()
@@ -0,0 +1,67 @@
+import math
+
+class RSA_Wiener_AttackImp:
+
+    def __init__(self, n, e) -> None:
+        self.n = n
+        self.e = e
+
+    def trial_division(self, n):
+        L = []
+        while n % 2 == 0:
+            L.append(2)
+            n //= 2
+        f = 3
+        while f ** 2 <= n:
+            if n % f == 0:
+                L.append(f)
+                n //= f
+            else:
+                f += 2
+        if n != 1:
+            L.append(n)
+        return L
+    
+    def fn_function(self, p, q):
+        return (p - 1) * (q - 1) # φ(Ν)
+    
+    def continued_fraction(self, e, n):
+        a = []
+        while n > 0:
+            q = e // n
+            r = e % n
+            a.append(q)
+            e, n = n, r
+        return a
+    
+    def convergent_values(self, cf):
+        convergents = []
+        h1, h2 = 1, 0
+        k1, k2 = 0, 1
+        for i in range(len(cf)):
+            a = cf[i]
+            h = a * h1 + h2
+            k = a * k1 + k2
+            convergents.append((h, k))
+            h2, h1 = h1, h
+            k2, k1 = k1, k
+        return convergents
+
+    # function to find the secret exponent d:
+    def wiener_attack(self, convergents, e, n):
+        fn = 0
+        # φ(Ν) = ed-1 / k
+        for k, d in convergents:
+            if k > 0:
+                fni = (e * d - 1)
+                if fni % k == 0:
+                    fn = fni // k
+
+                    # quadratic equation x**2-(Ν-φ(Ν) + 1)x + N = 0
+                    x = -((n - fn) + 1)
+                    x1 = x * x - 4 * n
+                    if x1 >= 0:
+                        root = math.isqrt(x1)
+                        if root * root == x1:
+                            return d
+        return "FAIL"
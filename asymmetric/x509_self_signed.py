@@ -9,6 +9,7 @@ from cryptography.hazmat.backends               import default_backend
 from DefaultStyles.button_style                 import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style             import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style             import DefaultQLineEditStyle
+from jobs                                       import job_runner, show_job_error
 from pathlib                                    import Path
 import datetime, sys, os
 
@@ -207,8 +208,8 @@ class X509SelfSignedWindow(QWidget):
         self.passphrase_input = DefaultQLineEditStyle(parent=self, placeholder_text="Optional - e.g: mysecurepass")
         self.passphrase_input.setGeometry(100, 400, 250, 50)
 
-        generate_button = DefaultButtonStyle("Generate", parent=self, bold=True, command=self.call_x509)
-        generate_button.setGeometry(400, 400, 100, 50)
+        self.generate_button = DefaultButtonStyle("Generate", parent=self, bold=True, command=self.call_x509)
+        self.generate_button.setGeometry(400, 400, 100, 50)
 
         self.saved_files_path = QTextEdit(parent=self)
         self.saved_files_path.setGeometry(100, 540, 500, 100)
@@ -249,38 +250,51 @@ class X509SelfSignedWindow(QWidget):
                 san_names = san_names if san_names else [],
                 valid_days = int(valid_days))
 
-            # Generate private key and self-signed certificate
-            generator.generate_self_signed_cert()
-
-            # Serialize and save private key, public key and certificate to files
-            with open(downloads_path / "private_key.pem", "wb") as key_file:
-                key_file.write(generator.serialize_private_key(passphrase=passphrase))
-
-            with open(downloads_path / "certificate.pem", "wb") as cert_file:
-                cert_file.write(generator.serialize_certificate())
-            
-            with open(downloads_path / "public_key.pem", "wb") as pub_file:
-                pub_file.write(generator.serialize_public_key())
-            
-            # Show a message box with option to open Downloads folder
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle('Success')
-            msg_box.setText(f'Certificate and keys successfully generated and saved at:\n{downloads_path}')
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-            open_folder_btn = msg_box.addButton('Open Folder', QMessageBox.ButtonRole.ActionRole)
-            msg_box.exec()
-            if msg_box.clickedButton() == open_folder_btn:
-                self.open_downloads_folder(downloads_path)
-            
-            self.saved_files_path.clear()
-            self.saved_files_path.setHtml(f"<b>Private key, Public key and Certificate path:</b><br>{downloads_path}")
-            self.saved_files_path.show()    
+            self.generate_button.setEnabled(False)
+            job_runner().submit(
+                self.generate_and_save, generator, passphrase, downloads_path,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.generate_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def generate_and_save(generator, passphrase, downloads_path):
+        # Generate private key and self-signed certificate
+        generator.generate_self_signed_cert()
+
+        # Serialize and save private key, public key and certificate to files
+        with open(downloads_path / "private_key.pem", "wb") as key_file:
+            key_file.write(generator.serialize_private_key(passphrase=passphrase))
+
+        with open(downloads_path / "certificate.pem", "wb") as cert_file:
+            cert_file.write(generator.serialize_certificate())
+
+        with open(downloads_path / "public_key.pem", "wb") as pub_file:
+            pub_file.write(generator.serialize_public_key())
+
+        return downloads_path
+
+    def show_result(self, downloads_path):
+        # Show a message box with option to open Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Success')
+        msg_box.setText(f'Certificate and keys successfully generated and saved at:\n{downloads_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Folder', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder(downloads_path)
+
+        self.saved_files_path.clear()
+        self.saved_files_path.setHtml(f"<b>Private key, Public key and Certificate path:</b><br>{downloads_path}")
+        self.saved_files_path.show()
+
     def open_downloads_folder(self, downloads_path):
         # Open the Downloads folder using the appropriate command for the OS
         if sys.platform == 'win32':
@@ -4,209 +4,10 @@ from binascii                       import hexlify
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
+from .GOST_magma_core               import GOSTMagmaImp
 import base64, os
 
-# Implementaition
-class GOSTMagmaImp:
-    def __init__(self, key: bytes):
-        """Initialize with a 256-bit (32 bytes) key."""
-        if len(key) != 32:
-            raise ValueError("Key must be 256 bits (32 bytes) long.")
-        self.key = key
-        self.subkeys = self._generate_subkeys(key)
-        self.S_BOX = self._default_sbox()
-
-    def _generate_subkeys(self, key: bytes):
-        """Generate 8 subkeys of 32 bits each from the 256-bit key."""
-        subkeys = []
-        for i in range(8):
-            subkey = int.from_bytes(key[i * 4:(i + 1) * 4], byteorder='big')
-            subkeys.append(subkey)
-        return subkeys
-
-    def _default_sbox(self):
-        """Default GOST S-box."""
-        return [
-            [4, 10, 9, 2, 13, 8, 0, 14, 6, 11, 1, 12, 7, 15, 5, 3],
-            [14, 11, 4, 12, 6, 13, 15, 10, 2, 3, 8, 1, 0, 7, 5, 9],
-            [5, 8, 1, 13, 10, 3, 4, 2, 14, 15, 12, 7, 6, 0, 9, 11],
-            [7, 13, 10, 1, 0, 8, 9, 15, 14, 4, 6, 12, 11, 2, 5, 3],
-            [6, 12, 7, 1, 5, 15, 13, 8, 4, 10, 9, 14, 0, 3, 11, 2],
-            [4, 11, 10, 0, 7, 2, 1, 13, 3, 6, 8, 5, 9, 12, 15, 14],
-            [13, 11, 4, 1, 3, 15, 5, 9, 0, 10, 14, 7, 6, 8, 2, 12],
-            [1, 15, 13, 0, 5, 7, 10, 4, 9, 2, 3, 14, 6, 11, 8, 12]
-        ]
-
-    def _feistel_function(self, half_block: int, round_key: int):
-        """Feistel function involving key addition, S-box substitution, and rotation."""
-        result = (half_block + round_key) % (1 << 32)
-        substituted = 0
-        for i in range(8):
-            sbox_value = self.S_BOX[i][(result >> (4 * i)) & 0xF]
-            substituted |= sbox_value << (4 * i)
-        result = ((substituted << 11) | (substituted >> (32 - 11))) & 0xFFFFFFFF
-        return result
-
-    def _encrypt_block(self, block: bytes):
-        """Encrypt a 64-bit block."""
-        left = int.from_bytes(block[:4], byteorder='big')
-        right = int.from_bytes(block[4:], byteorder='big')
-
-        for i in range(24):
-            round_key = self.subkeys[i % 8]
-            new_right = left ^ self._feistel_function(right, round_key)
-            left = right
-            right = new_right
-
-        for i in range(8):
-            round_key = self.subkeys[7 - (i % 8)]
-            new_right = left ^ self._feistel_function(right, round_key)
-            left = right
-            right = new_right
-
-        encrypted_block = right.to_bytes(4, byteorder='big') + left.to_bytes(4, byteorder='big')
-        return encrypted_block
-
-    def _decrypt_block(self, block: bytes):
-        """Decrypt a 64-bit block."""
-        left = int.from_bytes(block[:4], byteorder='big')
-        right = int.from_bytes(block[4:], byteorder='big')
-
-        for i in range(8):
-            round_key = self.subkeys[7 - (i % 8)]
-            new_right = left ^ self._feistel_function(right, round_key)
-            left = right
-            right = new_right
-
-        for i in range(24):
-            round_key = self.subkeys[i % 8]
-            new_right = left ^ self._feistel_function(right, round_key)
-            left = right
-            right = new_right
-
-        decrypted_block = right.to_bytes(4, byteorder='big') + left.to_bytes(4, byteorder='big')
-        return decrypted_block
-
-    def encrypt_ecb(self, plaintext: bytes):
-        """Encrypt in ECB mode (Electronic Codebook)."""
-        if len(plaintext) % 8 != 0:
-            raise ValueError("Plaintext must be a multiple of 8 bytes.")
-        plaintext = bytes(plaintext, 'utf-8')
-        ciphertext = b''
-        for i in range(0, len(plaintext), 8):
-            ciphertext += self._encrypt_block(plaintext[i:i + 8])
-        return ciphertext
-
-    def decrypt_ecb(self, ciphertext: bytes):
-        """Decrypt in ECB mode."""
-        if len(ciphertext) % 8 != 0:
-            raise ValueError("Ciphertext must be a multiple of 8 bytes.")
-        plaintext = b''
-        for i in range(0, len(ciphertext), 8):
-            plaintext += self._decrypt_block(ciphertext[i:i + 8])
-        return plaintext
-
-    def encrypt_cbc(self, plaintext: bytes, iv: bytes):
-        """Encrypt in CBC mode (Cipher Block Chaining)."""
-        if len(plaintext) % 8 != 0:
-            raise ValueError("Plaintext must be a multiple of 8 bytes.")
-        if len(iv) != 8:
-            raise ValueError("IV must be 64 bits (8 bytes).")
-        
-        plaintext = bytes(plaintext, 'utf-8')
-        ciphertext = b''
-        previous_block = iv
-        for i in range(0, len(plaintext), 8):
-            block = plaintext[i:i + 8]
-            block_to_encrypt = bytes(a ^ b for a, b in zip(block, previous_block))
-            encrypted_block = self._encrypt_block(block_to_encrypt)
-            ciphertext += encrypted_block
-            previous_block = encrypted_block
-        return ciphertext
-
-    def decrypt_cbc(self, ciphertext: bytes, iv: bytes):
-        """Decrypt in CBC mode."""
-        if len(ciphertext) % 8 != 0:
-            raise ValueError("Ciphertext must be a multiple of 8 bytes.")
-        if len(iv) != 8:
-            raise ValueError("IV must be 64 bits (8 bytes).")
-        
-        plaintext = b''
-        previous_block = iv
-        for i in range(0, len(ciphertext), 8):
-            encrypted_block = ciphertext[i:i + 8]
-            decrypted_block = self._decrypt_block(encrypted_block)
-            plaintext_block = bytes(a ^ b for a, b in zip(decrypted_block, previous_block))
-            plaintext += plaintext_block
-            previous_block = encrypted_block
-        return plaintext
-
-    def encrypt_cfb(self, plaintext: bytes, iv: bytes):
-        """Encrypt in CFB mode (Cipher Feedback)."""
-        if len(iv) != 8:
-            raise ValueError("IV must be 64 bits (8 bytes).")
-        
-        plaintext = bytes(plaintext, 'utf-8')
-        ciphertext = b''
-        previous_block = iv
-        for i in range(0, len(plaintext), 8):
-            encrypted_iv = self._encrypt_block(previous_block)
-            block = plaintext[i:i + 8]
-            ciphertext_block = bytes(a ^ b for a, b in zip(encrypted_iv, block))
-            ciphertext += ciphertext_block
-            previous_block = ciphertext_block
-        return ciphertext
-
-    def decrypt_cfb(self, ciphertext: bytes, iv: bytes):
-        """Decrypt in CFB mode."""
-        if len(iv) != 8:
-            raise ValueError("IV must be 64 bits (8 bytes).")
-        
-        plaintext = b''
-        previous_block = iv
-        for i in range(0, len(ciphertext), 8):
-            encrypted_iv = self._encrypt_block(previous_block)
-            block = ciphertext[i:i + 8]
-            plaintext_block = bytes(a ^ b for a, b in zip(encrypted_iv, block))
-            plaintext += plaintext_block
-            previous_block = block
-        return plaintext
-
-    def encrypt_ctr(self, plaintext: bytes, nonce: bytes):
-        """Encrypt in CTR mode (Counter Mode)."""
-        # Ensure that plaintext is bytes
-        if isinstance(plaintext, str):
-            plaintext = plaintext.encode()
-        if len(plaintext) % 8 != 0:
-            raise ValueError("Plaintext must be a multiple of 8 bytes.")
-
-        if len(nonce) != 8:
-            raise ValueError("Nonce must be 64 bits (8 bytes).")
-
-        ciphertext = b''
-        counter = 0
-        for i in range(0, len(plaintext), 8):
-            # Generate the counter block (nonce + counter)
-            counter_block = nonce + counter.to_bytes(8, byteorder='big')
-
-            # Encrypt the counter block (which is 64 bits = 8 bytes)
-            encrypted_counter = self._encrypt_block(counter_block[:8])
-
-            # Take the next block of plaintext and XOR it with the encrypted counter
-            block = plaintext[i:i + 8]
-
-            # XOR plaintext block with the encrypted counter block
-            ciphertext_block = bytes([a ^ b for a, b in zip(encrypted_counter, block)])
-            ciphertext += ciphertext_block
-
-            # Increment the counter
-            counter += 1
-        return ciphertext
-
-    def decrypt_ctr(self, ciphertext: bytes, nonce: bytes):
-        """Decrypt in CTR mode (Counter Mode)."""
-        return self.encrypt_ctr(ciphertext, nonce)  # CTR decryption is the same as encryption
-
 class GOSTMagmaWindow(QWidget):
 
     def __init__(self, theme_mode):
@@ -290,8 +91,8 @@ class GOSTMagmaWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_gost)
-        encrypt_button.setGeometry(300, 260, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_gost)
+        self.encrypt_button.setGeometry(300, 260, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 360, 680, 100)
@@ -335,17 +136,28 @@ class GOSTMagmaWindow(QWidget):
         else:
             iv_bytes = os.urandom(8)
 
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.encrypt, key_bytes, plaintext, mode, iv_bytes, nonce_bytes,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_bytes, mode, output_format, iv_bytes, nonce_bytes),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    @staticmethod
+    def encrypt(key_bytes, plaintext, mode, iv_bytes, nonce_bytes):
         gost = GOSTMagmaImp(key=key_bytes)
         if mode == "ECB":
-            ciphertext = gost.encrypt_ecb(input)
+            return gost.encrypt_ecb(plaintext)
         elif mode == "CBC":
-            ciphertext = gost.encrypt_cbc(plaintext=plaintext, iv=iv_bytes)
+            return gost.encrypt_cbc(plaintext=plaintext, iv=iv_bytes)
         elif mode == "CTR":
-            ciphertext = gost.encrypt_ctr(plaintext=plaintext, nonce=nonce_bytes)
+            return gost.encrypt_ctr(plaintext=plaintext, nonce=nonce_bytes)
         elif mode == "CFB":
-            ciphertext = gost.encrypt_cfb(plaintext=plaintext, iv=iv_bytes)
-        
-        formatted_ciphertext = ciphertext
+            return gost.encrypt_cfb(plaintext=plaintext, iv=iv_bytes)
+
+    def show_encryption(self, ciphertext, key, key_bytes, mode, output_format, iv_bytes, nonce_bytes):
+        formatted_ciphertext = bytes(ciphertext)   # the engine returns a bytearray
         if output_format == "Base64":
             formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
         if output_format == "Hex":
@@ -0,0 +1,216 @@
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+
+S_BOX = (
+    (4, 10, 9, 2, 13, 8, 0, 14, 6, 11, 1, 12, 7, 15, 5, 3),
+    (14, 11, 4, 12, 6, 13, 15, 10, 2, 3, 8, 1, 0, 7, 5, 9),
+    (5, 8, 1, 13, 10, 3, 4, 2, 14, 15, 12, 7, 6, 0, 9, 11),
+    (7, 13, 10, 1, 0, 8, 9, 15, 14, 4, 6, 12, 11, 2, 5, 3),
+    (6, 12, 7, 1, 5, 15, 13, 8, 4, 10, 9, 14, 0, 3, 11, 2),
+    (4, 11, 10, 0, 7, 2, 1, 13, 3, 6, 8, 5, 9, 12, 15, 14),
+    (13, 11, 4, 1, 3, 15, 5, 9, 0, 10, 14, 7, 6, 8, 2, 12),
+    (1, 15, 13, 0, 5, 7, 10, 4, 9, 2, 3, 14, 6, 11, 8, 12))
+
+def _combined_tables(s_box):
+    """The classic 4x256 table trick: table k maps byte k of the round input straight to its
+    two substituted nibbles, shifted into place and rotated left by 11 bits, so the round
+    function becomes four lookups XORed together."""
+    tables = []
+    for k in range(4):
+        low, high = s_box[2 * k], s_box[2 * k + 1]
+        table = []
+        for byte in range(256):
+            value = ((high[byte >> 4] << 4) | low[byte & 0xF]) << (8 * k)
+            table.append(((value << 11) | (value >> 21)) & 0xFFFFFFFF)
+        tables.append(table)
+    return tables
+
+TABLES = _combined_tables(S_BOX)
+NP_TABLES = [np.array(table, dtype=np.uint32) for table in TABLES]
+
+def _ctr_keystream(key, nonce, start_block, blocks):
+    """Process pool worker: keystream of `blocks` counter blocks starting at nonce + start_block."""
+    return GOSTMagmaImp(key).keystream(nonce, start_block, blocks)
+
+class GOSTMagmaImp:
+    """GOST 28147-89 (Magma) with the RFC 5830 test S-box.
+
+    Blocks are (left, right) pairs of big-endian 32-bit words and the ciphertext is right || left.
+    ECB, CTR and the decrypting direction of CBC and CFB process whole batches of blocks as
+    NumPy arrays; the chained directions run block by block on the same combined tables."""
+
+    BATCH_BLOCKS = 64 * 1024
+    PARALLEL_THRESHOLD = 8 * 1024 * 1024  # CTR inputs from this size are spread over processes
+
+    def __init__(self, key: bytes):
+        """Initialize with a 256-bit (32 bytes) key."""
+        if len(key) != 32:
+            raise ValueError("Key must be 256 bits (32 bytes) long.")
+        self.key = key
+        self.subkeys = self._generate_subkeys(key)
+        self.encrypt_schedule = self.subkeys * 3 + self.subkeys[::-1]
+        self.decrypt_schedule = self.encrypt_schedule[::-1]
+
+    def _generate_subkeys(self, key: bytes):
+        """Generate 8 subkeys of 32 bits each from the 256-bit key."""
+        return [int.from_bytes(key[i * 4:(i + 1) * 4], byteorder='big') for i in range(8)]
+
+    def _rounds(self, left, right, schedule):
+        t0, t1, t2, t3 = TABLES
+        for round_key in schedule:
+            t = (right + round_key) & 0xFFFFFFFF
+            left, right = right, left ^ t0[t & 0xFF] ^ t1[(t >> 8) & 0xFF] ^ t2[(t >> 16) & 0xFF] ^ t3[t >> 24]
+        return right, left
+
+    def _rounds_np(self, left, right, schedule):
+        """Same as _rounds on uint32 arrays of many blocks."""
+        t0, t1, t2, t3 = NP_TABLES
+        for round_key in schedule:
+            t = right + np.uint32(round_key)
+            f = t0[t & 0xFF]
+            f ^= t1[(t >> 8) & 0xFF]
+            f ^= t2[(t >> 16) & 0xFF]
+            f ^= t3[t >> 24]
+            f ^= left
+            left, right = right, f
+        return right, left
+
+    def _encrypt_block(self, block: bytes):
+        """Encrypt a 64-bit block."""
+        left, right = self._rounds(int.from_bytes(block[:4], 'big'), int.from_bytes(block[4:], 'big'), self.encrypt_schedule)
+        return left.to_bytes(4, 'big') + right.to_bytes(4, 'big')
+
+    def _decrypt_block(self, block: bytes):
+        """Decrypt a 64-bit block."""
+        left, right = self._rounds(int.from_bytes(block[:4], 'big'), int.from_bytes(block[4:], 'big'), self.decrypt_schedule)
+        return left.to_bytes(4, 'big') + right.to_bytes(4, 'big')
+
+    def _process_blocks(self, data, schedule, out=None):
+        """Runs the rounds over every 8-byte block of data in NumPy batches, writing into out."""
+        if out is None:
+            out = bytearray(len(data))
+        words_in = np.frombuffer(data, dtype='>u4').reshape(-1, 2)
+        words_out = np.frombuffer(out, dtype='>u4').reshape(-1, 2)
+        for start in range(0, len(words_in), self.BATCH_BLOCKS):
+            batch = words_in[start:start + self.BATCH_BLOCKS].astype(np.uint32)
+            left, right = self._rounds_np(batch[:, 0], batch[:, 1], schedule)
+            words_out[start:start + len(batch), 0] = left
+            words_out[start:start + len(batch), 1] = right
+        return out
+
+    @staticmethod
+    def _as_bytes(data):
+        return data.encode('utf-8') if isinstance(data, str) else data
+
+    @staticmethod
+    def _xor(a, b, out=None):
+        """XORs two equally long byte strings with NumPy."""
+        if out is None:
+            out = bytearray(len(a))
+        np.bitwise_xor(np.frombuffer(a, dtype=np.uint8), np.frombuffer(b, dtype=np.uint8),
+                       out=np.frombuffer(out, dtype=np.uint8))
+        return out
+
+    def encrypt_ecb(self, plaintext: bytes):
+        """Encrypt in ECB mode (Electronic Codebook)."""
+        plaintext = self._as_bytes(plaintext)
+        if len(plaintext) % 8 != 0:
+            raise ValueError("Plaintext must be a multiple of 8 bytes.")
+        return self._process_blocks(plaintext, self.encrypt_schedule)
+
+    def decrypt_ecb(self, ciphertext: bytes):
+        """Decrypt in ECB mode."""
+        if len(ciphertext) % 8 != 0:
+            raise ValueError("Ciphertext must be a multiple of 8 bytes.")
+        return self._process_blocks(ciphertext, self.decrypt_schedule)
+
+    def encrypt_cbc(self, plaintext: bytes, iv: bytes):
+        """Encrypt in CBC mode (Cipher Block Chaining)."""
+        plaintext = self._as_bytes(plaintext)
+        if len(plaintext) % 8 != 0:
+            raise ValueError("Plaintext must be a multiple of 8 bytes.")
+        if len(iv) != 8:
+            raise ValueError("IV must be 64 bits (8 bytes).")
+
+        ciphertext = bytearray(len(plaintext))
+        previous = int.from_bytes(iv, 'big')
+        schedule = self.encrypt_schedule
+        for i in range(0, len(plaintext), 8):
+            block = int.from_bytes(plaintext[i:i + 8], 'big') ^ previous
+            left, right = self._rounds(block >> 32, block & 0xFFFFFFFF, schedule)
+            previous = (left << 32) | right
+            ciphertext[i:i + 8] = previous.to_bytes(8, 'big')
+        return ciphertext
+
+    def decrypt_cbc(self, ciphertext: bytes, iv: bytes):
+        """Decrypt in CBC mode."""
+        if len(ciphertext) % 8 != 0:
+            raise ValueError("Ciphertext must be a multiple of 8 bytes.")
+        if len(iv) != 8:
+            raise ValueError("IV must be 64 bits (8 bytes).")
+
+        plaintext = self._process_blocks(ciphertext, self.decrypt_schedule)
+        previous = np.frombuffer(iv + ciphertext[:-8], dtype=np.uint8) if ciphertext else np.empty(0, np.uint8)
+        np.bitwise_xor(np.frombuffer(plaintext, dtype=np.uint8), previous, out=np.frombuffer(plaintext, dtype=np.uint8))
+        return plaintext
+
+    def encrypt_cfb(self, plaintext: bytes, iv: bytes):
+        """Encrypt in CFB mode (Cipher Feedback)."""
+        plaintext = self._as_bytes(plaintext)
+        if len(iv) != 8:
+            raise ValueError("IV must be 64 bits (8 bytes).")
+
+        ciphertext = bytearray(len(plaintext))
+        previous = iv
+        for i in range(0, len(plaintext), 8):
+            block = plaintext[i:i + 8]
+            encrypted_iv = self._encrypt_block(previous)
+            ciphertext[i:i + len(block)] = self._xor(encrypted_iv[:len(block)], block)
+            previous = bytes(ciphertext[i:i + 8])
+        return ciphertext
+
+    def decrypt_cfb(self, ciphertext: bytes, iv: bytes):
+        """Decrypt in CFB mode."""
+        if len(iv) != 8:
+            raise ValueError("IV must be 64 bits (8 bytes).")
+
+        # every keystream block is the encryption of the previous ciphertext block
+        whole = len(ciphertext) - len(ciphertext) % 8
+        feedback = (iv + ciphertext[:whole])[:-8] if ciphertext else b''
+        if len(ciphertext) % 8:
+            feedback += (iv + ciphertext)[whole:whole + 8]
+        keystream = self._process_blocks(feedback, self.encrypt_schedule)
+        return self._xor(keystream[:len(ciphertext)], ciphertext)
+
+    def keystream(self, nonce: bytes, start_block, blocks):
+        """Encryptions of the 64-bit big-endian counters nonce + start_block ... nonce + start_block + blocks - 1."""
+        first = int.from_bytes(nonce, 'big') + start_block
+        counters = np.arange(blocks, dtype=np.uint64) + np.uint64(first & 0xFFFFFFFFFFFFFFFF)
+        return self._process_blocks(counters.astype('>u8').tobytes(), self.encrypt_schedule)
+
+    def encrypt_ctr(self, plaintext: bytes, nonce: bytes, workers=None):
+        """Encrypt in CTR mode (Counter Mode). Inputs of PARALLEL_THRESHOLD bytes or more
+        have their keystream generated on `workers` processes (all CPUs by default)."""
+        plaintext = self._as_bytes(plaintext)
+        if len(nonce) != 8:
+            raise ValueError("Nonce must be 64 bits (8 bytes).")
+
+        blocks = (len(plaintext) + 7) // 8
+        workers = workers or os.cpu_count() or 1
+        if len(plaintext) < self.PARALLEL_THRESHOLD or workers == 1:
+            keystream = self.keystream(nonce, 0, blocks)
+        else:
+            per_worker = -(-blocks // workers)
+            keystream = bytearray(blocks * 8)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                segments = pool.map(_ctr_keystream, [self.key] * workers, [nonce] * workers,
+                                    range(0, blocks, per_worker),
+                                    [min(per_worker, blocks - start) for start in range(0, blocks, per_worker)])
+                for start, segment in zip(range(0, blocks, per_worker), segments):
+                    keystream[start * 8:start * 8 + len(segment)] = segment
+        return self._xor(memoryview(keystream)[:len(plaintext)], plaintext)
+
+    def decrypt_ctr(self, ciphertext: bytes, nonce: bytes, workers=None):
+        """Decrypt in CTR mode (Counter Mode)."""
+        return self.encrypt_ctr(ciphertext, nonce, workers)  # CTR decryption is the same as encryption
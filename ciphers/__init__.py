@@ -1,22 +1,31 @@
-from .caesar_cipher         import CaesarCipherWindow
-from .rot13                 import ROT13Window
-from .rot13_bruteforce      import ROT13BFWindow
-from .rot47                 import ROT47Window
-from .rot47_bruteforce      import ROT47BFWindow
-from .enigma_machine        import EnigmaMachineWindow
-from .vigenere              import VigenereDecryptionWindow, VigenereEncryptionWindow
-from .simple_substitution   import SimpleSubWindow
-from .bacon_cipher          import BaconCipherWindow
-from .GOST_magma            import GOSTMagmaWindow
-from .rabbit                import RabbitStreamCipherWindow
-from .tea                   import TEAWindow
-from .xtea                  import XTEAWindow
-from .xxtea                 import XXTEAWindow
-from .chacha20              import ChaCha20Window
-from .chacha20_poly1305     import ChaCha20Poly1305Window
-from .sm4_block_cipher      import SM4BlockCipherDecryptWindow, SM4BlockCipherEncryptWindow
-from .bifid_cipher          import BifidCipherWindow
-from .affine_cipher         import AffineCipherEncWindow, AffineCipherDecWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "CaesarCipherWindow":          ".caesar_cipher",
+    "ROT13Window":                 ".rot13",
+    "ROT13BFWindow":               ".rot13_bruteforce",
+    "ROT47Window":                 ".rot47",
+    "ROT47BFWindow":               ".rot47_bruteforce",
+    "EnigmaMachineWindow":         ".enigma_machine",
+    "VigenereDecryptionWindow":    ".vigenere",
+    "VigenereEncryptionWindow":    ".vigenere",
+    "SimpleSubWindow":             ".simple_substitution",
+    "BaconCipherWindow":           ".bacon_cipher",
+    "GOSTMagmaWindow":             ".GOST_magma",
+    "RabbitStreamCipherWindow":    ".rabbit",
+    "TEAWindow":                   ".tea",
+    "XTEAWindow":                  ".xtea",
+    "XXTEAWindow":                 ".xxtea",
+    "ChaCha20Window":              ".chacha20",
+    "ChaCha20Poly1305Window":      ".chacha20_poly1305",
+    "SM4BlockCipherDecryptWindow": ".sm4_block_cipher",
+    "SM4BlockCipherEncryptWindow": ".sm4_block_cipher",
+    "BifidCipherWindow":           ".bifid_cipher",
+    "AffineCipherEncWindow":       ".affine_cipher",
+    "AffineCipherDecWindow":       ".affine_cipher",
+}
 
 __all__ = ["CaesarCipherWindow", "ROT13Window", 
            "ROT13BFWindow", "ROT47Window", "ROT47BFWindow", "EnigmaMachineWindow",
@@ -24,4 +33,11 @@ __all__ = ["CaesarCipherWindow", "ROT13Window",
            "BaconCipherWindow", "GOSTMagmaWindow", "RabbitStreamCipherWindow", "TEAWindow", "XTEAWindow",
            "XXTEAWindow", "ChaCha20Window", "ChaCha20Poly1305Window", "SM4BlockCipherEncryptWindow",
            "SM4BlockCipherDecryptWindow", "BifidCipherWindow", "AffineCipherEncWindow",
-           "AffineCipherDecWindow"]
\ No newline at end of file
+           "AffineCipherDecWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from .shift_cipher_core             import caesar
 
 # Implementation
 class Caesar_CipherImp:
@@ -10,10 +11,7 @@ class Caesar_CipherImp:
         self.shift = shift
 
     def caesar_cipher_enc_dec(self, text, shift):
-        return ''.join(
-            chr((ord(char) - 65 + shift) % 26 + 65) if char.isupper() else 
-            chr((ord(char) - 97 + shift) % 26 + 97) if char.islower() else char
-            for char in text)
+        return caesar(text, shift)
     
 
 class CaesarCipherWindow(QWidget):
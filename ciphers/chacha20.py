@@ -3,6 +3,7 @@ from PyQt6.QtCore                   import Qt
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from Crypto.Cipher                  import ChaCha20
 from binascii                       import hexlify
 import base64, os
@@ -118,8 +119,8 @@ class ChaCha20Window(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_chacha20)
-        encrypt_button.setGeometry(300, 260, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_chacha20)
+        self.encrypt_button.setGeometry(300, 260, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 340, 680, 100)
@@ -163,8 +164,15 @@ class ChaCha20Window(QWidget):
         output_format = self.output_format_options.currentText()
 
         chacha = ChaCha20Imp(key=key_bytes, nonce=nonce_bytes)
-        ciphertext = chacha.encrypt(plaintext=plaintext_bytes)
-
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            chacha.encrypt, plaintext=plaintext_bytes,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_bytes, nonce, nonce_bytes, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    def show_encryption(self, ciphertext, key, key_bytes, nonce, nonce_bytes, output_format):
         formatted_ciphertext = ciphertext
         if output_format == "Base64":
             formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
@@ -4,6 +4,7 @@ from PyQt6.QtWidgets                                import QWidget, QLabel, QTex
 from DefaultStyles.button_style                     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style                 import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style                 import DefaultQLineEditStyle 
+from jobs                                           import job_runner, show_job_error
 import os, base64
 
 # Implementation
@@ -98,8 +99,8 @@ class ChaCha20Poly1305Window(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_chachapoly)
-        encrypt_button.setGeometry(300, 260, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_chachapoly)
+        self.encrypt_button.setGeometry(300, 260, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 380, 680, 100)
@@ -143,8 +144,16 @@ class ChaCha20Poly1305Window(QWidget):
         associated_data = None
 
         chachapoly = ChaCha20Poly1305Imp(key=key_bytes, nonce=nonce_bytes)
-        nonce, ciphertext = chachapoly.encrypt(plaintext=plaintext_bytes, associated_data=associated_data)
-
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            chachapoly.encrypt, plaintext=plaintext_bytes, associated_data=associated_data,
+            owner=self,
+            on_result=lambda result: self.show_encryption(result, key, key_bytes, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    def show_encryption(self, result, key, key_bytes, output_format):
+        nonce, ciphertext = result
         formatted_ciphertext = ciphertext
         if output_format == "Base64":
             formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
@@ -0,0 +1,133 @@
+from functools import lru_cache
+import numpy as np
+import argparse, os, re, sys
+
+QUADGRAM_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "english_quadgrams.txt")
+QUADGRAM_SIZE = 26 ** 4
+PLACE_VALUES = np.array([26 ** 3, 26 ** 2, 26, 1], dtype=np.int64)
+
+# Relative letter frequencies of English text in percent (Lewand, Cryptological Mathematics)
+LETTER_FREQUENCIES = {
+    'A': 8.167, 'B': 1.492, 'C': 2.782, 'D': 4.253, 'E': 12.702, 'F': 2.228, 'G': 2.015,
+    'H': 6.094, 'I': 6.966, 'J': 0.153, 'K': 0.772, 'L': 4.025, 'M': 2.406, 'N': 6.749,
+    'O': 7.507, 'P': 1.929, 'Q': 0.095, 'R': 5.987, 'S': 6.327, 'T': 9.056, 'U': 2.758,
+    'V': 0.978, 'W': 2.360, 'X': 0.150, 'Y': 1.974, 'Z': 0.074}
+LETTER_PROBABILITIES = np.array(list(LETTER_FREQUENCIES.values())) / sum(LETTER_FREQUENCIES.values())
+
+_UPPER = np.full(256, 255, dtype=np.uint8)
+_UPPER[np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)] = np.arange(26)
+_UPPER[np.frombuffer(b"abcdefghijklmnopqrstuvwxyz", dtype=np.uint8)] = np.arange(26)
+
+# english_scores() terms: log10 likelihood ratios of English against random printable characters;
+# quadgrams count against random_quadgram_score(), what the table gives a random quadgram
+SYMBOL_PENALTY = -1.0       # printable characters other than letters, space and COMMON_PUNCTUATION are rare in English
+MIXED_CASE_PENALTY = -4.0   # and so are case changes inside a word but for a leading capital
+COMMON_PUNCTUATION = ".,'\"!?"  # about as frequent in English as any character in random text
+CHARACTER_SCORES = np.zeros(256)
+CHARACTER_SCORES[33:127] = SYMBOL_PENALTY
+CHARACTER_SCORES[list(COMMON_PUNCTUATION.encode())] = 0.0
+CHARACTER_SCORES[65:91] = CHARACTER_SCORES[97:123] = np.log10(LETTER_PROBABILITIES * 26)
+
+def letter_indices(text):
+    """The letters A-Z of text, either case, as a uint8 array of 0-25; everything else is dropped."""
+    values = _UPPER[np.frombuffer(text.encode("latin-1", "replace"), dtype=np.uint8)]
+    return values[values < 26]
+
+def quadgram_indices(letters):
+    """Index into the flat 26^4 table of every quadgram of a letter index array."""
+    letters = np.asarray(letters, dtype=np.int64)
+    if len(letters) < 4:
+        return np.zeros(0, dtype=np.int64)
+    return np.lib.stride_tricks.sliding_window_view(letters, 4) @ PLACE_VALUES
+
+def count_quadgrams(texts):
+    """Flat 26^4 array of quadgram counts over an iterable of texts."""
+    counts = np.zeros(QUADGRAM_SIZE, dtype=np.int64)
+    for text in texts:
+        counts += np.bincount(quadgram_indices(letter_indices(text)), minlength=QUADGRAM_SIZE)
+    return counts
+
+@lru_cache(maxsize=None)
+def quadgram_table(path=QUADGRAM_FILE):
+    """log10 probabilities of all quadgrams as a flat float64 array indexed by
+    a*26^3 + b*26^2 + c*26 + d. Unseen quadgrams get log10(0.01 / total)."""
+    counts = np.zeros(QUADGRAM_SIZE)
+    with open(path, encoding="ascii") as f:
+        for line in f:
+            quadgram, count = line.split()
+            counts[letter_indices(quadgram) @ PLACE_VALUES] = int(count)
+    total = counts.sum()
+    table = np.full(QUADGRAM_SIZE, np.log10(0.01 / total))
+    seen = counts > 0
+    table[seen] = np.log10(counts[seen] / total)
+    return table
+
+@lru_cache(maxsize=None)
+def random_quadgram_score(path=QUADGRAM_FILE):
+    """Mean of quadgram_table(), the expected score of a quadgram of random letters. The table
+    holds overlapping quadgram probabilities rather than conditional ones, so English quadgrams
+    average below the uniform log10(26^-4) and only this measured baseline tells them apart."""
+    return float(quadgram_table(path).mean())
+
+def quadgram_score(text):
+    """Quadgram log-likelihood of the letters of text; higher is more English-like."""
+    return float(quadgram_table()[quadgram_indices(letter_indices(text))].sum())
+
+def quadgram_fitness(text):
+    """quadgram_score() per quadgram, comparable between texts of different lengths. English
+    scores about -4.2 and random letters about -8.2; texts under 4 letters score -inf."""
+    quadgrams = quadgram_indices(letter_indices(text))
+    return float(quadgram_table()[quadgrams].mean()) if len(quadgrams) else float("-inf")
+
+def english_scores(rows):
+    """english_score() of every row of a 2-D uint8 array of latin-1 character codes, such as the
+    candidate decryptions of one ciphertext, in one pass. The letters of each row are packed to
+    its front (stable argsort), so the quadgrams run across words and symbols as in the table."""
+    rows = np.atleast_2d(rows)
+    letters = _UPPER[rows]
+    is_letter = letters < 26
+    counts = is_letter.sum(axis=1)
+    scores = CHARACTER_SCORES[rows].sum(axis=1)
+    upper, lower = (rows >= 65) & (rows <= 90), (rows >= 97) & (rows <= 122)
+    mixed_case = (lower[:, :-1] & upper[:, 1:]).sum(axis=1) + (upper[:, :-2] & upper[:, 1:-1] & lower[:, 2:]).sum(axis=1)
+    scores += MIXED_CASE_PENALTY * mixed_case
+    if rows.shape[1] >= 4:
+        packed = np.take_along_axis(letters, np.argsort(~is_letter, axis=1, kind="stable"), axis=1)
+        quadgrams = np.lib.stride_tricks.sliding_window_view(packed.astype(np.int64), 4, axis=1) @ PLACE_VALUES
+        valid = np.arange(quadgrams.shape[1])[None, :] < (counts - 3)[:, None]
+        scores += np.where(valid, quadgram_table()[np.where(valid, quadgrams, 0)] - random_quadgram_score(), 0).sum(axis=1)
+    return scores
+
+def english_score(text):
+    """log10 likelihood ratio of text being English rather than random printable characters:
+    the letter frequencies and quadgram probabilities of its letters, the latter against
+    random_quadgram_score(), less SYMBOL_PENALTY for every other printable character but space and
+    COMMON_PUNCTUATION and MIXED_CASE_PENALTY for "aB" and "ABc" (case is otherwise free: all-caps
+    text is English too). Positive for English, growing with its length, and far lower for
+    gibberish; used to rank candidate decryptions of one ciphertext."""
+    return float(english_scores(np.frombuffer(text.encode("latin-1", "replace"), dtype=np.uint8))[0])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ciphers.english_ngrams",
+                                     description=f"Rebuilds {os.path.basename(QUADGRAM_FILE)} from plain text files.")
+    parser.add_argument("corpus", nargs="+", help="English text files")
+    parser.add_argument("-o", "--output", default=QUADGRAM_FILE)
+    args = parser.parse_args(argv)
+
+    def texts():
+        for path in args.corpus:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                # words only: no numbers, markup or identifiers glued together
+                yield " ".join(re.findall(r"\b[A-Za-z]+\b", f.read()))
+    counts = count_quadgrams(texts())
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    with open(args.output, "w", encoding="ascii") as f:
+        for index in np.argsort(-counts, kind="stable"):
+            if not counts[index]:
+                break
+            quadgram = "".join(alphabet[index // place % 26] for place in PLACE_VALUES)
+            f.write(f"{quadgram} {counts[index]}\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
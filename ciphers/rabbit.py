@@ -1,82 +1,12 @@
-from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from PyQt6.QtCore                   import Qt
 from binascii                       import hexlify
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
-import struct, base64, os
-
-# Implementation
-class RabbitStreamCipherImp:
-
-    def __init__(self, key):
-        # Initial state variables (X, A, G)
-        self.X = [0] * 8
-        self.A = [0] * 8
-        self.G = [0] * 8
-        self.C = [0] * 8
-        self.Carry = 0
-        self.key_setup(key)
-
-    def _rotate_left(self, x, bits, size=32):
-        """Left rotation of `x` by `bits` in a word of `size` bits."""
-        return ((x << bits) & ((1 << size) - 1)) | (x >> (size - bits))
-
-    def key_setup(self, key):
-        """Sets up the key and initializes internal state."""
-        key = struct.unpack("<LLLL", key)
-        for i in range(4):
-            self.X[i] = key[i]
-            self.X[i + 4] = key[(i + 1) % 4]
-            self.A[i] = key[(i + 3) % 4]
-            self.A[i + 4] = key[i]
-
-        self.C = [(self.A[i] ^ self.X[(i + 3) % 8]) for i in range(8)]
-        self.Carry = 0
-        self.cycle()
-        self.cycle()
-
-    def cycle(self):
-        """Performs one full cycle of the Rabbit cipher's state update function."""
-        for i in range(8):
-            self.C[i] = (self.C[i] + self.A[i] + self.Carry) & 0xFFFFFFFF
-            self.Carry = (self.C[i] < self.A[i] + self.Carry)
-
-        for i in range(8):
-            self.G[i] = (self.X[i] + self.C[i]) & 0xFFFFFFFF
-            self.G[i] = (self.G[i] * self.G[i]) & 0xFFFFFFFF
-            self.G[i] ^= self.G[i] >> 16
-
-        self.X[0] = (self.G[0] + self._rotate_left(self.G[7], 16) + self._rotate_left(self.G[6], 16)) & 0xFFFFFFFF
-        self.X[1] = (self.G[1] + self._rotate_left(self.G[0], 8) + self.G[7]) & 0xFFFFFFFF
-        self.X[2] = (self.G[2] + self._rotate_left(self.G[1], 16) + self.G[0]) & 0xFFFFFFFF
-        self.X[3] = (self.G[3] + self._rotate_left(self.G[2], 8) + self.G[1]) & 0xFFFFFFFF
-        self.X[4] = (self.G[4] + self._rotate_left(self.G[3], 16) + self._rotate_left(self.G[2], 16)) & 0xFFFFFFFF
-        self.X[5] = (self.G[5] + self._rotate_left(self.G[4], 8) + self.G[3]) & 0xFFFFFFFF
-        self.X[6] = (self.G[6] + self._rotate_left(self.G[5], 16) + self.G[4]) & 0xFFFFFFFF
-        self.X[7] = (self.G[7] + self._rotate_left(self.G[6], 8) + self.G[5]) & 0xFFFFFFFF
-
-    def generate_keystream_block(self):
-        """Generates a 128-bit block of keystream."""
-        self.cycle()
-        keystream = [0] * 8
-        keystream[0] = (self.X[0] ^ (self.X[5] >> 16) ^ (self.X[3] << 16)) & 0xFFFFFFFF
-        keystream[1] = (self.X[2] ^ (self.X[7] >> 16) ^ (self.X[5] << 16)) & 0xFFFFFFFF
-        keystream[2] = (self.X[4] ^ (self.X[1] >> 16) ^ (self.X[7] << 16)) & 0xFFFFFFFF
-        keystream[3] = (self.X[6] ^ (self.X[3] >> 16) ^ (self.X[1] << 16)) & 0xFFFFFFFF
-        # Ensure all values are within the 32-bit unsigned integer range
-        return struct.pack("<LLLL", *[k & 0xFFFFFFFF for k in keystream[:4]])
-
-    def encrypt(self, plaintext):
-        """Encrypts or decrypts the plaintext by XORing with the keystream."""
-        ciphertext = bytearray(plaintext)
-        for i in range(0, len(ciphertext), 16):
-            keystream_block = self.generate_keystream_block()
-            for j in range(16):
-                if i + j < len(ciphertext):
-                    ciphertext[i + j] ^= keystream_block[j]
-        return bytes(ciphertext)
-
+from jobs                           import job_runner, show_job_error
+from .rabbit_core                   import RabbitStreamCipherImp
+import base64, os
 
 class RabbitStreamCipherWindow(QWidget):
 
@@ -120,6 +50,15 @@ class RabbitStreamCipherWindow(QWidget):
             placeholder_text="Key must be 16 bytes.")
         self.key_input.setGeometry(10, 160, 320, 50)
 
+        # IV
+        iv_input_label = QLabel("Give IV (optional).\nFiles always get a random IV:", parent=self)
+        iv_input_label.setGeometry(370, 110, 300, 50)
+        self.iv_input = DefaultQLineEditStyle(
+            parent=self,
+            max_length=8,
+            placeholder_text="IV must be 8 bytes.")
+        self.iv_input.setGeometry(370, 160, 320, 50)
+
         output_format_label = QLabel("Output format:", parent=self)
         output_format_label.setGeometry(150, 210, 120, 50)
         output_format_items = ['Base64', 'Hex', 'Raw']
@@ -129,6 +68,12 @@ class RabbitStreamCipherWindow(QWidget):
         encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_rabbit)
         encrypt_button.setGeometry(300, 260, 100, 50)
 
+        self.encrypt_file_button = DefaultButtonStyle("Encrypt File", parent=self, command=self.call_rabbit_file_encryption)
+        self.encrypt_file_button.setGeometry(420, 260, 130, 50)
+
+        self.decrypt_file_button = DefaultButtonStyle("Decrypt File", parent=self, command=self.call_rabbit_file_decryption)
+        self.decrypt_file_button.setGeometry(560, 260, 130, 50)
+
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 380, 680, 100)
         self.encrypted_text_label.setReadOnly(True)
@@ -139,48 +84,139 @@ class RabbitStreamCipherWindow(QWidget):
         self.key_label.setReadOnly(True)
         self.key_label.hide()
 
+        self.iv_label = QTextEdit(parent=self)
+        self.iv_label.setGeometry(10, 590, 680, 50)
+        self.iv_label.setReadOnly(True)
+        self.iv_label.hide()
+
         # About button setup
         self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 650, 50, 50))
         self.aboutButton.update_theme(self.theme_mode)
         
     def call_rabbit(self):
-        plaintext = self.plaintext_input.text()
-        plaintext_bytes = plaintext.encode('utf-8')
-        key = self.key_input.text()
-        output_format = self.output_format_options.currentText()
-
+        try:
+            plaintext_bytes = self.plaintext_input.text().encode('utf-8')
+            key = self.key_input.text()
+            key_bytes = self.key_bytes(key, random_if_empty=True)
+            iv = self.iv_input.text().encode('utf-8') or None
+            if iv is not None and len(iv) != RabbitStreamCipherImp.IV_SIZE:
+                raise ValueError("IV must be 8 bytes long")
+            output_format = self.output_format_options.currentText()
+
+            rabbit = RabbitStreamCipherImp(key=key_bytes, iv=iv)
+            ciphertext = rabbit.encrypt(plaintext_bytes)
+
+            formatted_ciphertext = ciphertext
+            if output_format == "Base64":
+                formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
+            if output_format == "Hex":
+                formatted_ciphertext = hexlify(ciphertext).decode('utf-8')
+
+            self.encrypted_text_label.clear()
+            self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(formatted_ciphertext)}")
+            self.encrypted_text_label.show()
+            self.show_key(key, key_bytes, iv)
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def key_bytes(key, random_if_empty):
         if key == "":
-            key_bytes = os.urandom(16)
-        else:
-            if len(key) == 16:
-                key_bytes = key.encode('utf-8')
-            else:
-                raise ValueError("Give Key with 16 bytes")
-
-        rabbit = RabbitStreamCipherImp(key=key_bytes)
-        ciphertext = rabbit.encrypt(plaintext=plaintext_bytes)
-
-        formatted_ciphertext = ciphertext
-        if output_format == "Base64":
-            formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
-        if output_format == "Hex":
-            formatted_ciphertext = hexlify(ciphertext).decode('utf-8')
+            if random_if_empty:
+                return os.urandom(16)
+            raise ValueError("Please enter the key used for encryption.")
+        key_bytes = key.encode('utf-8')
+        if len(key_bytes) != RabbitStreamCipherImp.KEY_SIZE:
+            raise ValueError("Give Key with 16 bytes")
+        return key_bytes
+
+    def call_rabbit_file_encryption(self):
+        try:
+            key = self.key_input.text()
+            # a random key is fine for a one-off text, but the file could never be decrypted again
+            if not key:
+                raise ValueError("Please enter a key for file encryption. The same key is needed to decrypt the file.")
+            key_bytes = self.key_bytes(key, random_if_empty=False)
+
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File to Encrypt')
+            if not input_path:
+                return
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Encrypted File', input_path + '.rabbit')
+            if not output_path:
+                return
+
+            rabbit = RabbitStreamCipherImp(key=key_bytes)
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, rabbit.encrypt_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Encrypting", percent),
+                on_result=lambda path: self.show_file_result("Encrypted file", path, rabbit, key, key_bytes),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_rabbit_file_decryption(self):
+        try:
+            key = self.key_input.text()
+            key_bytes = self.key_bytes(key, random_if_empty=False)
+
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File to Decrypt')
+            if not input_path:
+                return
+            default_output = input_path[:-len('.rabbit')] if input_path.endswith('.rabbit') else input_path + '.dec'
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Decrypted File', default_output)
+            if not output_path:
+                return
+
+            rabbit = RabbitStreamCipherImp(key=key_bytes)
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, rabbit.decrypt_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Decrypting", percent),
+                on_result=lambda path: self.show_file_result("Decrypted file", path, rabbit, key, key_bytes),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_file_job(method, input_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return method(input_path, output_path, progress_callback=progress)
+
+    def set_file_buttons_enabled(self, enabled):
+        self.encrypt_file_button.setEnabled(enabled)
+        self.decrypt_file_button.setEnabled(enabled)
+
+    def show_file_progress(self, action, percent):
+        self.encrypted_text_label.setHtml(f"<b>{action}...</b> {percent}%")
+        self.encrypted_text_label.show()
 
+    def show_file_result(self, title, path, rabbit, key, key_bytes):
         self.encrypted_text_label.clear()
-        self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(formatted_ciphertext)}")
+        self.encrypted_text_label.setHtml(f"<b>{title}:</b><br>{path}")
         self.encrypted_text_label.show()
+        self.show_key(key, key_bytes, rabbit.get_iv())
 
-        if key == "":
-            self.key_label.clear()
-            self.key_label.setHtml(f"<b>Random Key:</b><br>{str(key_bytes)}")
-            self.key_label.show()
+    def show_key(self, key, key_bytes, iv):
+        self.key_label.clear()
+        self.key_label.setHtml(f"<b>Random Key:</b><br>{str(key_bytes)}" if key == "" else f"<b>Key:</b><br>{str(key)}")
+        self.key_label.show()
+
+        if iv is not None:
+            self.iv_label.clear()
+            self.iv_label.setHtml(f"<b>IV:</b> {iv.hex()}")
+            self.iv_label.show()
         else:
-            self.key_label.clear()
-            self.key_label.setHtml(f"<b>Key:</b><br>{str(key)}")
-            self.key_label.show()
-
-'''
-# Decrypt back to plaintext
-decrypted = cipher.encrypt(ciphertext)  # XORing twice with the keystream decrypts
-print("Decrypted:", decrypted)
-'''
\ No newline at end of file
+            self.iv_label.hide()
@@ -0,0 +1,194 @@
+import os, struct
+
+MASK = 0xFFFFFFFF
+A = (0x4D34D34D, 0xD34D34D3, 0x34D34D34, 0x4D34D34D, 0xD34D34D3, 0x34D34D34, 0x4D34D34D, 0xD34D34D3)
+
+def _rotl(x, n):
+    return ((x << n) | (x >> (32 - n))) & MASK
+
+def _next_state(x, c, carry):
+    """One iteration of the counter and next-state functions (RFC 4503, 2.5 and 2.6) on tuples."""
+    counters = []
+    for i in range(8):
+        carry += c[i] + A[i]
+        counters.append(carry & MASK)
+        carry >>= 32
+    g = []
+    for i in range(8):
+        t = (x[i] + counters[i]) & MASK
+        t *= t
+        g.append((t ^ (t >> 32)) & MASK)
+    x = ((g[0] + _rotl(g[7], 16) + _rotl(g[6], 16)) & MASK, (g[1] + _rotl(g[0], 8) + g[7]) & MASK,
+         (g[2] + _rotl(g[1], 16) + _rotl(g[0], 16)) & MASK, (g[3] + _rotl(g[2], 8) + g[1]) & MASK,
+         (g[4] + _rotl(g[3], 16) + _rotl(g[2], 16)) & MASK, (g[5] + _rotl(g[4], 8) + g[3]) & MASK,
+         (g[6] + _rotl(g[5], 16) + _rotl(g[4], 16)) & MASK, (g[7] + _rotl(g[6], 8) + g[5]) & MASK)
+    return x, tuple(counters), carry
+
+class RabbitStreamCipherImp:
+    """Rabbit stream cipher as specified in RFC 4503, with the optional 64-bit IV.
+
+    Keys, IVs and the keystream use the byte order of the RFC test vectors. The keystream
+    is produced BATCH_BLOCKS 16-byte blocks at a time by one unrolled loop over local
+    variables and XORed onto the data as whole integers. The cipher is a continuous
+    stream: consecutive encrypt() calls continue where the previous one stopped."""
+
+    BATCH_BLOCKS = 4096
+    KEY_SIZE = 16
+    IV_SIZE = 8
+
+    def __init__(self, key, iv=None):
+        if len(key) != self.KEY_SIZE:
+            raise ValueError("Key must be 16 bytes.")
+        self.key_setup(key)
+        self.set_iv(iv)
+
+    def key_setup(self, key):
+        """Key setup scheme (RFC 4503, 2.3). The resulting master state is kept for set_iv()."""
+        k = struct.unpack('<8H', key[::-1])  # the RFC writes keys most significant byte first
+        x = tuple((k[(j + 1) % 8] << 16 | k[j]) if j % 2 == 0 else (k[(j + 5) % 8] << 16 | k[(j + 4) % 8])
+                  for j in range(8))
+        c = tuple((k[(j + 4) % 8] << 16 | k[(j + 5) % 8]) if j % 2 == 0 else (k[j] << 16 | k[(j + 1) % 8])
+                  for j in range(8))
+        carry = 0
+        for _ in range(4):
+            x, c, carry = _next_state(x, c, carry)
+        c = tuple(c[j] ^ x[(j + 4) % 8] for j in range(8))
+        self.master = (x, c, carry)
+
+    def set_iv(self, iv=None):
+        """IV setup scheme (RFC 4503, 2.4), starting a new stream from the master state.
+        Without an IV the stream runs directly from the master state."""
+        x, c, carry = self.master
+        self.iv = iv
+        if iv is not None:
+            if len(iv) != self.IV_SIZE:
+                raise ValueError("IV must be 8 bytes.")
+            high, low = struct.unpack('>II', iv)  # most significant byte first, like the key
+            i0, i2 = low, high
+            i1 = (i2 & 0xFFFF0000) | (i0 >> 16)
+            i3 = ((i2 << 16) | (i0 & 0xFFFF)) & MASK
+            c = tuple(c[j] ^ (i0, i1, i2, i3)[j % 4] for j in range(8))
+            for _ in range(4):
+                x, c, carry = _next_state(x, c, carry)
+        self.X, self.C, self.Carry = list(x), list(c), carry
+        self._leftover = b''
+
+    def keystream_blocks(self, blocks):
+        """Returns `blocks` 16-byte keystream blocks and advances the state."""
+        x0, x1, x2, x3, x4, x5, x6, x7 = self.X
+        c0, c1, c2, c3, c4, c5, c6, c7 = self.C
+        carry = self.Carry
+        words = [0] * (4 * blocks)
+        for i in range(0, 4 * blocks, 4):
+            carry += c0 + 0x4D34D34D; c0 = carry & MASK; carry >>= 32
+            carry += c1 + 0xD34D34D3; c1 = carry & MASK; carry >>= 32
+            carry += c2 + 0x34D34D34; c2 = carry & MASK; carry >>= 32
+            carry += c3 + 0x4D34D34D; c3 = carry & MASK; carry >>= 32
+            carry += c4 + 0xD34D34D3; c4 = carry & MASK; carry >>= 32
+            carry += c5 + 0x34D34D34; c5 = carry & MASK; carry >>= 32
+            carry += c6 + 0x4D34D34D; c6 = carry & MASK; carry >>= 32
+            carry += c7 + 0xD34D34D3; c7 = carry & MASK; carry >>= 32
+
+            t = (x0 + c0) & MASK; t *= t; g0 = (t ^ (t >> 32)) & MASK
+            t = (x1 + c1) & MASK; t *= t; g1 = (t ^ (t >> 32)) & MASK
+            t = (x2 + c2) & MASK; t *= t; g2 = (t ^ (t >> 32)) & MASK
+            t = (x3 + c3) & MASK; t *= t; g3 = (t ^ (t >> 32)) & MASK
+            t = (x4 + c4) & MASK; t *= t; g4 = (t ^ (t >> 32)) & MASK
+            t = (x5 + c5) & MASK; t *= t; g5 = (t ^ (t >> 32)) & MASK
+            t = (x6 + c6) & MASK; t *= t; g6 = (t ^ (t >> 32)) & MASK
+            t = (x7 + c7) & MASK; t *= t; g7 = (t ^ (t >> 32)) & MASK
+
+            # rotations by 16 of g0, g2, g4, g6 are used twice
+            r0 = ((g0 << 16) | (g0 >> 16)) & MASK
+            r1 = ((g1 << 16) | (g1 >> 16)) & MASK
+            r2 = ((g2 << 16) | (g2 >> 16)) & MASK
+            r3 = ((g3 << 16) | (g3 >> 16)) & MASK
+            r4 = ((g4 << 16) | (g4 >> 16)) & MASK
+            r5 = ((g5 << 16) | (g5 >> 16)) & MASK
+            r6 = ((g6 << 16) | (g6 >> 16)) & MASK
+            r7 = ((g7 << 16) | (g7 >> 16)) & MASK
+            x0 = (g0 + r7 + r6) & MASK
+            x1 = (g1 + (((g0 << 8) | (g0 >> 24)) & MASK) + g7) & MASK
+            x2 = (g2 + r1 + r0) & MASK
+            x3 = (g3 + (((g2 << 8) | (g2 >> 24)) & MASK) + g1) & MASK
+            x4 = (g4 + r3 + r2) & MASK
+            x5 = (g5 + (((g4 << 8) | (g4 >> 24)) & MASK) + g3) & MASK
+            x6 = (g6 + r5 + r4) & MASK
+            x7 = (g7 + (((g6 << 8) | (g6 >> 24)) & MASK) + g5) & MASK
+
+            # extraction scheme (RFC 4503, 2.7); S[127..0] is output most significant word first
+            words[i + 3] = x0 ^ (x5 >> 16) ^ ((x3 << 16) & MASK)
+            words[i + 2] = x2 ^ (x7 >> 16) ^ ((x5 << 16) & MASK)
+            words[i + 1] = x4 ^ (x1 >> 16) ^ ((x7 << 16) & MASK)
+            words[i] = x6 ^ (x3 >> 16) ^ ((x1 << 16) & MASK)
+
+        self.X = [x0, x1, x2, x3, x4, x5, x6, x7]
+        self.C = [c0, c1, c2, c3, c4, c5, c6, c7]
+        self.Carry = carry
+        return struct.pack(f'>{len(words)}I', *words)
+
+    def generate_keystream_block(self):
+        """Generates a 128-bit block of keystream."""
+        return self.keystream_blocks(1)
+
+    def keystream(self, length):
+        """Returns the next `length` keystream bytes, continuing the stream across calls."""
+        out = bytearray(self._leftover[:length])
+        self._leftover = self._leftover[length:]
+        while len(out) < length:
+            blocks = min(self.BATCH_BLOCKS, -(-(length - len(out)) // 16))
+            batch = self.keystream_blocks(blocks)
+            need = length - len(out)
+            out += batch[:need]
+            self._leftover = batch[need:]
+        return bytes(out)
+
+    @staticmethod
+    def xor(data, keystream):
+        """XORs two equally long byte strings as whole integers."""
+        n = len(data)
+        return (int.from_bytes(data, 'little') ^ int.from_bytes(keystream, 'little')).to_bytes(n, 'little')
+
+    def encrypt(self, plaintext):
+        """Encrypts or decrypts the plaintext by XORing with the keystream."""
+        out = bytearray()
+        for start in range(0, len(plaintext), self.BATCH_BLOCKS * 16):
+            chunk = plaintext[start:start + self.BATCH_BLOCKS * 16]
+            out += self.xor(chunk, self.keystream(len(chunk)))
+        return bytes(out)
+
+    decrypt = encrypt
+
+    def encrypt_file(self, input_path, output_path, chunk_size=1024 * 1024, progress_callback=None):
+        """Streams input_path to output_path as IV || ciphertext with a fresh random IV.
+        progress_callback(bytes_done, total) is called after every chunk."""
+        self.set_iv(os.urandom(self.IV_SIZE))
+        with open(output_path, 'wb') as dst:
+            dst.write(self.iv)
+            self._stream(input_path, dst, 0, chunk_size, progress_callback)
+        return output_path
+
+    def decrypt_file(self, input_path, output_path, chunk_size=1024 * 1024, progress_callback=None):
+        """Reverses encrypt_file(); the IV is read from the first 8 bytes of input_path."""
+        with open(input_path, 'rb') as src:
+            iv = src.read(self.IV_SIZE)
+        if len(iv) != self.IV_SIZE:
+            raise ValueError("The file is not a Rabbit encrypted file.")
+        self.set_iv(iv)
+        with open(output_path, 'wb') as dst:
+            self._stream(input_path, dst, self.IV_SIZE, chunk_size, progress_callback)
+        return output_path
+
+    def _stream(self, input_path, dst, offset, chunk_size, progress_callback):
+        total = os.path.getsize(input_path) - offset
+        done = 0
+        with open(input_path, 'rb') as src:
+            src.seek(offset)
+            while chunk := src.read(chunk_size):
+                dst.write(self.encrypt(chunk))
+                done += len(chunk)
+                if progress_callback:
+                    progress_callback(done, total)
+
+    def get_iv(self):
+        return self.iv
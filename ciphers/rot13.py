@@ -1,21 +1,11 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from .shift_cipher_core             import rot13
+import html
 
 class ROT13Window(QWidget):
 
-    TABLE1 = {'A' : 1, 'B' : 2, 'C' : 3, 'D' : 4, 'E' : 5,
-        'F' : 6, 'G' : 7, 'H' : 8, 'I' : 9, 'J' : 10,
-        'K' : 11, 'L' : 12, 'M' : 13, 'N' : 14, 'O' : 15,
-        'P' : 16, 'Q' : 17, 'R' : 18, 'S' : 19, 'T' : 20,
-        'U' : 21, 'V' : 22, 'W' : 23, 'X' : 24, 'Y' : 25, 'Z' : 26}
-    
-    TABLE2 = {0 : 'Z', 1 : 'A', 2 : 'B', 3 : 'C', 4 : 'D', 5 : 'E',
-        6 : 'F', 7 : 'G', 8 : 'H', 9 : 'I', 10 : 'J',
-        11 : 'K', 12 : 'L', 13 : 'M', 14 : 'N', 15 : 'O',
-        16 : 'P', 17 : 'Q', 18 : 'R', 19 : 'S', 20 : 'T',
-        21 : 'U', 22 : 'V', 23 : 'W', 24 : 'X', 25 : 'Y'}
-
     def __init__(self, theme_mode):
         super().__init__()
         self.theme_mode = theme_mode
@@ -27,7 +17,8 @@ class ROT13Window(QWidget):
         "If you go past 'Z'm you wrap around to the beginning of the alphabet. "
         "This means: A becomes N, B becomes O, C becomes P ... and so on until "   
         "N becomes A, and so forth. ROT13 is a symmetric cipher, meaning "
-        "applying it twice brings you back to the original text. <br><br>"
+        "applying it twice brings you back to the original text. "
+        "Letters keep their case, and digits, punctuation and spaces are left as they are. <br><br>"
         "Useful links: <br>"
         "<a href=https://en.wikipedia.org/wiki/ROT13>Wikipedia</a><br>"
         "<a href=https://www.geeksforgeeks.org/rot13-cipher>Geeks for Geeks</a>")
@@ -61,7 +52,7 @@ class ROT13Window(QWidget):
             encrypted_input = self.rot13_encryption(input)
 
             self.encrypted_text_label.clear()
-            self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(encrypted_input)}")
+            self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{html.escape(encrypted_input)}")
             self.encrypted_text_label.show()
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
@@ -69,12 +60,4 @@ class ROT13Window(QWidget):
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
     def rot13_encryption(self, message):
-        cipher = ''
-        shift = 13
-        for letter in message:
-            if(letter != ' '):
-                num = (self.TABLE1[letter.upper()] + shift) % 26
-                cipher += self.TABLE2[num]
-            else:
-                cipher += ' '
-        return cipher
+        return rot13(message)
@@ -1,6 +1,9 @@
-from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
-from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
+from .shift_cipher_core             import caesar, crack, crack_file
+import html
 
 class ROT13BFWindow(QWidget):
 
@@ -13,15 +16,19 @@ class ROT13BFWindow(QWidget):
         "ROT13 is a simple letter substitution cipher that replaces "
         "each letter in the alphabet with the letter 13 positions after it. "
         "If you go past 'Z'm you wrap around to the beginning of the alphabet. "
-        "This means: A becomes N, B becomes O, C becomes P ... and so on until "   
+        "This means: A becomes N, B becomes O, C becomes P ... and so on until "
         "N becomes A, and so forth. ROT13 is a symmetric cipher, meaning "
         "applying it twice brings you back to the original text. <br><br>"
+        "The brute force tries all 26 shifts of the Caesar cipher, ROT13 being shift 13, and ranks "
+        "the results by how English they look: the log-likelihood of their letters and quadgrams "
+        "(groups of four letters) against random text. <b>Crack File</b> does this for every line of "
+        "a text file on its own and saves the best shift and plaintext of each line. <br><br>"
         "Useful links: <br>"
         "<a href=https://en.wikipedia.org/wiki/ROT13>Wikipedia</a><br>"
         "<a href=https://www.geeksforgeeks.org/rot13-cipher>Geeks for Geeks</a>")
 
         self.setWindowTitle("ROT13 Brute Force")
-        self.setFixedSize(700, 400)
+        self.setFixedSize(700, 600)
 
         # Ciphertext
         ciphertext_label = QLabel("Give ciphertext:", parent=self)
@@ -30,15 +37,18 @@ class ROT13BFWindow(QWidget):
         self.ciphertext_input.setGeometry(10, 60, 680, 50)
 
         bf_button = DefaultButtonStyle("Submit", parent=self, command=self.call_bf)
-        bf_button.setGeometry(300, 160, 100, 50)
+        bf_button.setGeometry(220, 160, 120, 50)
+
+        self.crack_file_button = DefaultButtonStyle("Crack File", parent=self, command=self.call_crack_file)
+        self.crack_file_button.setGeometry(360, 160, 120, 50)
 
         self.decrypted_text_label = QTextEdit(parent=self)
-        self.decrypted_text_label.setGeometry(10, 220, 680, 100)
+        self.decrypted_text_label.setGeometry(10, 220, 680, 300)
         self.decrypted_text_label.setReadOnly(True)
         self.decrypted_text_label.hide()
 
         # About button setup
-        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 350, 50, 50))
+        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 550, 50, 50))
         self.aboutButton.update_theme(self.theme_mode)
 
     def call_bf(self):
@@ -46,30 +56,55 @@ class ROT13BFWindow(QWidget):
             if not self.ciphertext_input.text():
                 raise ValueError('Please enter ciphertext.')
             ciphertext = self.ciphertext_input.text()
-            decrypted_input = self.brute_force_rot13(ciphertext)
+            candidates = self.brute_force_rot13(ciphertext)
 
             self.decrypted_text_label.clear()
-            self.decrypted_text_label.setHtml(f"<b>ROT13 Brute Force:</b><br>{str(decrypted_input)}")
+            self.decrypted_text_label.setHtml(
+                "<b>ROT13 Brute Force</b> (most English-like first):<br>"
+                "<table cellpadding='4'><tr><th>Shift</th><th>Score</th><th>Plaintext</th></tr>"
+                + "".join(f"<tr><td>{c.shift}</td><td>{c.score:.1f}</td><td>{html.escape(c.plaintext)}</td></tr>" for c in candidates)
+                + "</table>")
             self.decrypted_text_label.show()
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
-    def caesar_cipher(self, text, shift):
-        result = ""
+    def call_crack_file(self):
+        try:
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File with One Ciphertext per Line', '', 'Text Files (*.txt);;All Files (*)')
+            if not input_path:
+                return
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Cracked Lines', input_path + '.cracked.txt')
+            if not output_path:
+                return
+
+            self.crack_file_button.setEnabled(False)
+            self.decrypted_text_label.setHtml("<b>Cracking...</b>")
+            self.decrypted_text_label.show()
+            job_runner().submit(
+                self.run_crack_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda progress: self.decrypted_text_label.setHtml("<b>Cracking...</b> {}/{} lines".format(*progress)),
+                on_result=lambda count: self.decrypted_text_label.setHtml(
+                    f"<b>Cracked {count} lines:</b><br>{html.escape(output_path)}<br><br>Each line holds the shift and the plaintext, separated by a tab."),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.crack_file_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
 
-        for char in text:
-            if char.isupper():
-                result += chr((ord(char) - 65 + shift) % 26 + 65)
-            elif char.islower():
-                result += chr((ord(char) - 97 + shift) % 26 + 97)
-            else:
-                result += char
+    @staticmethod
+    def run_crack_file(input_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress((done, total))
+        return crack_file(input_path, output_path, "caesar", progress_callback=progress)
 
-        return result
+    def caesar_cipher(self, text, shift):
+        return caesar(text, shift)
 
     def brute_force_rot13(self, text):
-        for shift in range(1, 14):
-            decrypted_text = self.caesar_cipher(text, shift)
-        return decrypted_text
+        """All 26 Caesar shifts of text as ShiftCandidate(shift, plaintext, score), best first."""
+        return crack(text, "caesar")
@@ -1,6 +1,8 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from .shift_cipher_core             import rot47
+import html
 
 class ROT47Window(QWidget):
 
@@ -53,7 +55,7 @@ class ROT47Window(QWidget):
             encrypted_input = self.rot47_encryption(input)
 
             self.encrypted_text_label.clear()
-            self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{str(encrypted_input)}")
+            self.encrypted_text_label.setHtml(f"<b>Ciphertext:</b><br>{html.escape(encrypted_input)}")
             self.encrypted_text_label.show()
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
@@ -61,11 +63,4 @@ class ROT47Window(QWidget):
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
     def rot47_encryption(self, s):
-        x = []
-        for i in range(len(s)):
-            j = ord(s[i])
-            if j >= 33 and j <= 126:
-                x.append(chr(33 + ((j + 14) % 94)))
-            else:
-                x.append(s[i])
-        return ''.join(x)
+        return rot47(s)
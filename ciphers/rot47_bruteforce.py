@@ -1,6 +1,9 @@
-from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
+from .shift_cipher_core             import crack, crack_file, shift_text
+import html
 
 class ROT47BFWindow(QWidget):
 
@@ -18,8 +21,12 @@ class ROT47BFWindow(QWidget):
         "ASCII characters 33 to 126 are shifted by 47 positions. <br>  "
         "If the shifted position exceeds 126, it wraps around back to 33. "
         "Applying ROT47 twice returns the original text, as it's a symmetric transformation. "
-        " "
-        ""
+        "<br><br>"
+        "The brute force tries all 94 shifts and ranks the results by how English they look: the "
+        "log-likelihood of their letters and quadgrams (groups of four letters) against random text, "
+        "less a penalty for symbols and for mixed case inside words. Text without punctuation can "
+        "read as English both in lower and in upper case, so check the first few results. "
+        "<b>Crack File</b> cracks every line of a text file on its own. "
         "<br><br>"
         "Useful links: <br>"
         "<a href=https://en.wikipedia.org/wiki/ROT13#Variants>Wikipedia</a><br>")
@@ -34,7 +41,10 @@ class ROT47BFWindow(QWidget):
         self.ciphertext_input.setGeometry(10, 60, 680, 50)
 
         bf_button = DefaultButtonStyle("Submit", parent=self, command=self.call_bf)
-        bf_button.setGeometry(300, 160, 100, 50)
+        bf_button.setGeometry(220, 160, 120, 50)
+
+        self.crack_file_button = DefaultButtonStyle("Crack File", parent=self, command=self.call_crack_file)
+        self.crack_file_button.setGeometry(360, 160, 120, 50)
 
         self.decrypted_text_label = QTextEdit(parent=self)
         self.decrypted_text_label.setGeometry(10, 220, 680, 300)
@@ -50,32 +60,56 @@ class ROT47BFWindow(QWidget):
             if not self.ciphertext_input.text():
                 raise ValueError('Please enter ciphertext.')
             ciphertext_input = self.ciphertext_input.text()
-            decrypted_input = self.brute_force_rot47(ciphertext_input)
+            candidates = self.brute_force_rot47(ciphertext_input)
 
             self.decrypted_text_label.clear()
-            self.decrypted_text_label.setHtml(f"<b>ROT47 Brute Force:</b><br>{str(decrypted_input)}")
+            self.decrypted_text_label.setHtml(
+                "<b>ROT47 Brute Force</b> (most English-like first):<br>"
+                "<table cellpadding='4'><tr><th>Shift</th><th>Score</th><th>Plaintext</th></tr>"
+                + "".join(f"<tr><td>{c.shift}</td><td>{c.score:.1f}</td><td>{html.escape(c.plaintext)}</td></tr>" for c in candidates)
+                + "</table>")
+            self.decrypted_text_label.show()
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_crack_file(self):
+        try:
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File with One Ciphertext per Line', '', 'Text Files (*.txt);;All Files (*)')
+            if not input_path:
+                return
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Cracked Lines', input_path + '.cracked.txt')
+            if not output_path:
+                return
+
+            self.crack_file_button.setEnabled(False)
+            self.decrypted_text_label.setHtml("<b>Cracking...</b>")
             self.decrypted_text_label.show()
+            job_runner().submit(
+                self.run_crack_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda progress: self.decrypted_text_label.setHtml("<b>Cracking...</b> {}/{} lines".format(*progress)),
+                on_result=lambda count: self.decrypted_text_label.setHtml(
+                    f"<b>Cracked {count} lines:</b><br>{html.escape(output_path)}<br><br>Each line holds the shift and the plaintext, separated by a tab."),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.crack_file_button.setEnabled(True))
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
-    
+
+    @staticmethod
+    def run_crack_file(input_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress((done, total))
+        return crack_file(input_path, output_path, "rot47", progress_callback=progress)
+
     def rot47(self, text, shift):
-        result = []
-    
-        for char in text:
-            ascii_val = ord(char)
-            # Only rotate characters within the printable ASCII range (33 to 126)
-            if 33 <= ascii_val <= 126:
-                rotated = 33 + (ascii_val - 33 + shift) % 94
-                result.append(chr(rotated))
-            else:
-                result.append(char)  # Non-rotatable characters are kept the same
-
-        return ''.join(result)
+        # Only characters within the printable ASCII range (33 to 126) are rotated
+        return shift_text(text, shift, "rot47")
 
     def brute_force_rot47(self, text):
-        decrypted_text = ""
-        for shift in range(1, 94):  # Try all possible shifts in the range (1 to 93)
-            decrypted_text += self.rot47(text, shift) + "\n"
-        return decrypted_text
+        """All 94 shifts of text as ShiftCandidate(shift, plaintext, score), best first."""
+        return crack(text, "rot47")
@@ -0,0 +1,177 @@
+from collections        import namedtuple
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .english_ngrams    import english_scores
+import numpy as np
+import argparse, os, string, sys
+
+# ROT47 rotates the 94 printable ASCII characters "!" to "~"; space and everything else are kept
+ROT47_ALPHABET = "".join(chr(code) for code in range(33, 127))
+LINES_PER_TASK = 512
+SCORE_SAMPLE = 5000         # characters scored per candidate; plenty to rank shifts of long texts
+
+def _rotations(*alphabets):
+    """str.translate tables shifting every alphabet by 0..len-1 places at once."""
+    size = len(alphabets[0])
+    return [str.maketrans("".join(alphabets), "".join(a[shift:] + a[:shift] for a in alphabets)) for shift in range(size)]
+
+def _byte_tables(tables):
+    """The translate tables as one (shifts, 256) uint8 array, to shift latin-1 codes with numpy."""
+    byte_tables = np.tile(np.arange(256, dtype=np.uint8), (len(tables), 1))
+    for shift, table in enumerate(tables):
+        byte_tables[shift, list(table)] = list(table.values())
+    return byte_tables
+
+# CIPHERS[name] = (alphabet size, translate table of every shift, the same as byte tables), built once at import
+CIPHERS = {}
+for _name, _tables in (("caesar", _rotations(string.ascii_uppercase, string.ascii_lowercase)),
+                       ("rot47", _rotations(ROT47_ALPHABET))):
+    CIPHERS[_name] = (len(_tables), _tables, _byte_tables(_tables))
+ShiftCandidate = namedtuple("ShiftCandidate", "shift plaintext score")
+
+# ordinary sentences whose encryptions must crack back to them as the best candidate (--check)
+RANKING_CHECKS = (
+    "Hello world", "Hello, World!", "Cryptography is fun!", "attack at dawn", "We will attack at dawn",
+    "The quick brown fox jumps over the lazy dog.", "Meet me at the train station at noon.",
+    "Please send the report by Friday.", "I love programming in Python.", "Where are you going tonight?",
+    "The password is hidden under the mat.", "Good morning, how are you?", "This is a secret message.",
+    "Do not open the door.", "The weather is nice today.", "Can you keep a secret?", "Buy milk, eggs and bread.",
+    "She sells sea shells by the sea shore.", "To be or not to be, that is the question.", "Knowledge is power.",
+    "Open sesame", "Call me tomorrow at 5 pm.", "Keep calm and carry on", "It's raining cats and dogs.",
+    "Thanks a lot!", "See you later.")
+
+def shift_text(text, shift, cipher="caesar"):
+    """Shifts text by `shift` places of the cipher's alphabet with one str.translate call;
+    negative shifts decrypt. Characters outside the alphabet are kept."""
+    size, tables, _ = _cipher(cipher)
+    return text.translate(tables[shift % size])
+
+def caesar(text, shift):
+    return shift_text(text, shift, "caesar")
+
+def rot13(text):
+    return shift_text(text, 13, "caesar")
+
+def rot47(text, shift=47):
+    return shift_text(text, shift, "rot47")
+
+def _cipher(cipher):
+    if cipher not in CIPHERS:
+        raise ValueError(f"Unknown cipher {cipher!r}, expected one of: {', '.join(CIPHERS)}.")
+    return CIPHERS[cipher]
+
+def crack(ciphertext, cipher="caesar", candidates=None):
+    """
+    Brute force a Caesar (ROT13 included) or ROT47 ciphertext: decrypt it with every shift,
+    one str.translate call per precomputed table, and rank the results by english_score().
+    Args:
+        ciphertext (str): The text to break.
+        cipher (str): "caesar" or "rot47".
+        candidates (int): The number of results, all shifts if None.
+    Returns:
+        list: ShiftCandidate(shift, plaintext, score) tuples, most English-like first; shift is
+        the one the text was encrypted with."""
+    size, tables, byte_tables = _cipher(cipher)
+    # row s of the byte tables decrypts shift -s; all candidates are scored as one array
+    values = np.frombuffer(ciphertext[:SCORE_SAMPLE].encode("latin-1", "replace"), dtype=np.uint8)
+    scores = english_scores(byte_tables[-np.arange(size) % size][:, values]).tolist()
+    plaintexts = [ciphertext.translate(tables[-shift % size]) for shift in range(size)]
+    ranked = sorted(range(size), key=lambda shift: -scores[shift])[:candidates]
+    return [ShiftCandidate(shift, plaintexts[shift], scores[shift]) for shift in ranked]
+
+def _crack_lines(lines, cipher):
+    """Best candidate of every line; empty lines come back unchanged with shift 0."""
+    return [crack(line, cipher, 1)[0] if line.strip() else ShiftCandidate(0, line, 0.0) for line in lines]
+
+def crack_lines(lines, cipher="caesar", workers=None, progress_callback=None):
+    """
+    Crack every line on its own, each possibly with a different shift, spreading blocks of
+    LINES_PER_TASK lines over a process pool.
+    Args:
+        lines (list): The ciphertext lines.
+        cipher (str): "caesar" or "rot47".
+        workers (int): The number of processes, os.cpu_count() if None.
+        progress_callback (callable): Called with (lines_done, total) as blocks finish.
+    Returns:
+        list: The best ShiftCandidate of every line, in input order."""
+    _cipher(cipher)
+    blocks = [lines[start:start + LINES_PER_TASK] for start in range(0, len(lines), LINES_PER_TASK)]
+    results, done = [None] * len(blocks), 0
+    workers = min(workers or os.cpu_count() or 1, len(blocks))
+
+    if workers <= 1:
+        for i, block in enumerate(blocks):
+            results[i] = _crack_lines(block, cipher)
+            done += len(block)
+            if progress_callback:
+                progress_callback(done, len(lines))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            pending = {pool.submit(_crack_lines, block, cipher): i for i, block in enumerate(blocks)}
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i = pending.pop(future)
+                    results[i] = future.result()
+                    done += len(blocks[i])
+                if progress_callback:
+                    progress_callback(done, len(lines))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    return [candidate for block in results for candidate in block]
+
+def check_ranking(sentences=RANKING_CHECKS):
+    """Encrypts every sentence with ROT13 and ROT47 and cracks it again. Returns the failures as
+    (cipher, sentence, best candidate) tuples; empty if every sentence ranks first."""
+    failures = []
+    for cipher, shift in (("caesar", 13), ("rot47", 47)):
+        for sentence in sentences:
+            best = crack(shift_text(sentence, shift, cipher), cipher, 1)[0].plaintext
+            if best != sentence:
+                failures.append((cipher, sentence, best))
+    return failures
+
+def crack_file(input_path, output_path, cipher="caesar", workers=None, progress_callback=None):
+    """Cracks every line of a UTF-8 text file with crack_lines() and writes "shift<TAB>plaintext"
+    per line to output_path. Returns the number of lines."""
+    with open(input_path, encoding="utf-8", newline="") as f:
+        lines = f.read().splitlines()
+    results = crack_lines(lines, cipher, workers, progress_callback)
+    with open(output_path, "w", encoding="utf-8") as f:
+        for candidate in results:
+            f.write(f"{candidate.shift}\t{candidate.plaintext}\n")
+    return len(results)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ciphers.shift_cipher_core",
+                                     description="Brute forces Caesar/ROT13 and ROT47 ciphertexts.")
+    parser.add_argument("file", nargs="?", help="ciphertext file (default: standard input)")
+    parser.add_argument("--cipher", choices=list(CIPHERS), default="caesar")
+    parser.add_argument("--candidates", type=int, default=5)
+    parser.add_argument("--lines", metavar="OUTPUT", help="crack every line of the file on its own and write them to OUTPUT")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--check", action="store_true", help="check the ranking of RANKING_CHECKS and exit")
+    args = parser.parse_args(argv)
+    if args.check:
+        failures = check_ranking()
+        for cipher, sentence, best in failures:
+            print(f"{cipher}: {sentence!r} ranked {best!r} first")
+        print(f"{len(RANKING_CHECKS) * 2 - len(failures)}/{len(RANKING_CHECKS) * 2} sentences ranked first")
+        return 1 if failures else 0
+    if args.lines:
+        if not args.file:
+            parser.error("--lines needs an input file")
+        count = crack_file(args.file, args.lines, args.cipher, args.workers)
+        print(f"{count} lines written to {args.lines}")
+        return 0
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            ciphertext = f.read()
+    else:
+        ciphertext = sys.stdin.read()
+    for candidate in crack(ciphertext, args.cipher, args.candidates):
+        print(f"shift {candidate.shift:2d} (score {candidate.score:8.1f}): {candidate.plaintext[:80]!r}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
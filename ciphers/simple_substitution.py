@@ -1,5 +1,11 @@
-from PyQt6.QtWidgets        import QApplication, QMainWindow, QPushButton, QWidget, QVBoxLayout
-
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtCore                   import Qt
+from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from DefaultStyles.qtextedit_style  import DefaultQTextEditStyle
+from jobs                           import job_runner, show_job_error
+from .simple_substitution_core      import ALPHABET, SubstitutionSolver, encrypt, decrypt
+import html, random
 
 class SimpleSubWindow(QWidget):
 
@@ -7,9 +13,118 @@ class SimpleSubWindow(QWidget):
         super().__init__()
         self.theme_mode = theme_mode
 
+        msgbox_title = "About Simple Substitution"
+        msgbox_txt = (
+            "The <b>simple substitution cipher</b> replaces every letter of the alphabet by another one, "
+            "given by a key that is a permutation of the 26 letters. With 26! (about 4 * 10^26) keys it cannot be "
+            "brute forced, but it keeps the letter statistics of the language.<br><br>"
+            "<b>Solve</b> breaks it without the key: starting from random keys, pairs of letters of the key are "
+            "swapped as long as the text becomes more English-like, measured by the log probabilities of its "
+            "quadgrams (groups of four letters). The search is restarted many times in parallel processes and the "
+            "best key is kept. A few hundred letters of ciphertext are usually enough; rare letters such as J, Q, X "
+            "and Z may still be mixed up in short texts.<br><br>"
+            "Useful links: <br>"
+            "<a href=https://en.wikipedia.org/wiki/Substitution_cipher>Wikipedia</a><br>"
+            "<a href=http://practicalcryptography.com/cryptanalysis/stochastic-searching/cryptanalysis-simple-substitution-cipher/>"
+            "Practical Cryptography: Cryptanalysis of the simple substitution cipher</a>")
+
         self.setWindowTitle("Simple Substitution")
-        self.setGeometry(150, 150, 200, 150)
+        self.setFixedSize(700, 700)
+
+        # text input
+        text_input_label = QLabel("Enter text:", parent=self)
+        text_input_label.setGeometry(300, 10, 300, 50)
+        self.text_input = DefaultQTextEditStyle(parent=self)
+        self.text_input.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        self.text_input.setGeometry(10, 60, 680, 150)
+
+        # key input
+        key_label = QLabel("Key (26 letters, empty for a random key):", parent=self)
+        key_label.setGeometry(10, 220, 400, 50)
+        self.key_input = DefaultQLineEditStyle(parent=self, max_length=26)
+        self.key_input.setGeometry(10, 270, 680, 50)
+
+        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_encryption)
+        encrypt_button.setGeometry(10, 340, 130, 50)
+
+        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_decryption)
+        decrypt_button.setGeometry(160, 340, 130, 50)
+
+        self.solve_button = DefaultButtonStyle("Solve", parent=self, bold=True, command=self.call_solver)
+        self.solve_button.setGeometry(560, 340, 130, 50)
+
+        self.result_label = QTextEdit(parent=self)
+        self.result_label.setGeometry(10, 410, 680, 220)
+        self.result_label.setReadOnly(True)
+        self.result_label.hide()
+
+        # About button setup
+        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 650, 50, 50))
+        self.aboutButton.update_theme(self.theme_mode)
+
+    def call_encryption(self):
+        try:
+            text = self.text_input.toPlainText()
+            if not text:
+                raise ValueError('Please enter text.')
+            key = self.key_input.text() or "".join(random.SystemRandom().sample(ALPHABET, 26))
+            self.show_result("Ciphertext", encrypt(text, key), key)
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_decryption(self):
+        try:
+            text = self.text_input.toPlainText()
+            if not text:
+                raise ValueError('Please enter text.')
+            if not self.key_input.text():
+                raise ValueError('Please enter the key, or use Solve to find it.')
+            key = self.key_input.text()
+            self.show_result("Plaintext", decrypt(text, key), key)
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_solver(self):
+        try:
+            text = self.text_input.toPlainText()
+            if not text:
+                raise ValueError('Please enter ciphertext.')
+            solver = SubstitutionSolver()
+
+            self.result_label.clear()
+            self.result_label.setHtml("<b>Solving...</b>")
+            self.result_label.show()
+            self.solve_button.setEnabled(False)
+            job_runner().submit(
+                self.run_solver, solver, text, pass_job=True,
+                owner=self,
+                on_progress=lambda progress: self.result_label.setHtml("<b>Solving...</b> {}/{} restarts".format(*progress)),
+                on_result=self.show_solution,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.solve_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_solver(solver, text, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress((done, total))
+        return solver.solve(text, progress_callback=progress)
+
+    def show_solution(self, solution):
+        key, plaintext, fitness = solution
+        self.show_result("Plaintext", plaintext, key, f"<br><b>Fitness:</b> {fitness:.3f} per quadgram (English is about -4.5)")
 
-        layout = QVBoxLayout()
-        layout.addWidget(QPushButton("Hello from the new window!"))
-        self.setLayout(layout)
\ No newline at end of file
+    def show_result(self, title, text, key, extra=""):
+        self.result_label.clear()
+        self.result_label.setHtml(
+            f"<b>{title}:</b><br>{html.escape(text)}<br><br>"
+            f"<b>Key:</b><br><tt>{ALPHABET}<br>{key.upper()}</tt>{extra}")
+        self.result_label.show()
@@ -0,0 +1,170 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from .english_ngrams    import LETTER_FREQUENCIES, PLACE_VALUES, letter_indices, quadgram_table
+import numpy as np
+import argparse, os, secrets, string, sys
+
+ALPHABET = string.ascii_uppercase
+ENGLISH_ORDER = "".join(sorted(LETTER_FREQUENCIES, key=LETTER_FREQUENCIES.get, reverse=True))
+RESTARTS_PER_TASK = 4
+
+def check_key(key):
+    """Upper-cased key after checking it is a permutation of the 26 letters."""
+    key = key.upper()
+    if sorted(key) != list(ALPHABET):
+        raise ValueError("Key must contain each of the 26 letters exactly once.")
+    return key
+
+def encrypt(plaintext, key):
+    """Replaces every letter A-Z by the letter at its place in key, keeping case and other characters."""
+    key = check_key(key)
+    return plaintext.translate(str.maketrans(ALPHABET + ALPHABET.lower(), key + key.lower()))
+
+def decrypt(ciphertext, key):
+    key = check_key(key)
+    return ciphertext.translate(str.maketrans(key + key.lower(), ALPHABET + ALPHABET.lower()))
+
+def frequency_key(letters):
+    """Key that maps the most common ciphertext letters to the most common English ones."""
+    counts = np.bincount(letters, minlength=26)
+    by_count = sorted(range(26), key=lambda i: -counts[i])
+    key = [""] * 26
+    for cipher, plain in zip(by_count, ENGLISH_ORDER):
+        key[ALPHABET.index(plain)] = ALPHABET[cipher]
+    return "".join(key)
+
+class _Climber:
+    """Hill climbing over decryption keys of one ciphertext, scored by quadgram log-likelihood.
+
+    A key is held as plain[c], the plaintext letter of ciphertext letter c. Swapping the plaintext
+    letters of c1 and c2 only changes the quadgrams that contain c1 or c2, so those positions are
+    precomputed for every pair and a swap is scored by re-reading just them. Pairs with one letter
+    absent from the ciphertext still matter: they bring unused plaintext letters in."""
+
+    def __init__(self, letters):
+        self.table = quadgram_table()
+        self.quads = np.lib.stride_tricks.sliding_window_view(np.asarray(letters, dtype=np.int64), 4)
+        present = np.zeros(26, dtype=bool)
+        present[np.asarray(letters)] = True
+        contains = [np.flatnonzero((self.quads == c).any(axis=1)) for c in range(26)]
+        self.pairs = []
+        for c1 in range(26):
+            for c2 in range(c1 + 1, 26):
+                if present[c1] or present[c2]:
+                    positions = np.union1d(contains[c1], contains[c2])
+                    self.pairs.append((c1, c2, positions, self.quads[positions]))
+
+    def climb(self, plain, rng):
+        """Swaps pairs in random order until a whole pass improves nothing; returns (score, plain)."""
+        scores = self.table[plain[self.quads] @ PLACE_VALUES]
+        table, improved = self.table, True
+        while improved:
+            improved = False
+            for i in rng.permutation(len(self.pairs)):
+                c1, c2, positions, quads = self.pairs[i]
+                plain[c1], plain[c2] = plain[c2], plain[c1]
+                new = table[plain[quads] @ PLACE_VALUES]
+                if new.sum() > scores[positions].sum() + 1e-9:
+                    scores[positions] = new
+                    improved = True
+                else:
+                    plain[c1], plain[c2] = plain[c2], plain[c1]
+        return float(scores.sum()), plain
+
+def _search(letters, restarts, seed, start_key=None):
+    """Best (score, plain) of `restarts` climbs: random keys alternate with small perturbations
+    of the best key so far, which escapes the local optima a fresh start would take long to leave."""
+    climber, rng = _Climber(letters), np.random.default_rng(seed)
+    best_score, best = float("-inf"), None
+    for restart in range(restarts):
+        if restart == 0 and start_key is not None:
+            plain = np.array([ALPHABET.index(p) for p in decrypt(ALPHABET, start_key)], dtype=np.int64)
+        elif best is not None and restart % 2:
+            plain = best.copy()
+            for _ in range(rng.integers(2, 6)):
+                c1, c2 = rng.choice(26, size=2, replace=False)
+                plain[c1], plain[c2] = plain[c2], plain[c1]
+        else:
+            plain = rng.permutation(26).astype(np.int64)
+        score, plain = climber.climb(plain, rng)
+        if score > best_score:
+            best_score, best = score, plain.copy()
+    return best_score, best.tolist()
+
+class SubstitutionSolver:
+    """Recovers the key of a monoalphabetic substitution cipher from ciphertext alone, by hill
+    climbing on quadgram statistics with random restarts spread over a process pool.
+
+    A few hundred letters of English are usually enough; the result is the best key found, which
+    for short texts may still be off by a few rarely used letters."""
+
+    def __init__(self, restarts=48, workers=None, seed=None):
+        if restarts < 1:
+            raise ValueError("At least one restart is needed.")
+        self.restarts = restarts
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed if seed is not None else secrets.randbits(64)
+
+    def solve(self, ciphertext, progress_callback=None):
+        """Returns (key, plaintext, fitness), fitness being the mean log10 quadgram probability.
+        progress_callback(restarts_done, total) is called as batches of restarts finish."""
+        letters = letter_indices(ciphertext)
+        if len(letters) < 4:
+            raise ValueError("Ciphertext must contain at least 4 letters.")
+        start_key = frequency_key(letters)
+        batches = [min(RESTARTS_PER_TASK, self.restarts - start) for start in range(0, self.restarts, RESTARTS_PER_TASK)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(batches))
+        results, done = [], 0
+        workers = min(self.workers, len(batches))
+
+        if workers == 1:
+            for i, (batch, seed) in enumerate(zip(batches, seeds)):
+                results.append(_search(letters, batch, seed, start_key if i == 0 else None))
+                done += batch
+                if progress_callback:
+                    progress_callback(done, self.restarts)
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                pending = {pool.submit(_search, letters, batch, seed, start_key if i == 0 else None): batch
+                           for i, (batch, seed) in enumerate(zip(batches, seeds))}
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        results.append(future.result())
+                        done += pending.pop(future)
+                    if progress_callback:
+                        progress_callback(done, self.restarts)
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        score, plain = max(results, key=lambda result: result[0])
+        # plain[c] is the plaintext letter of ciphertext letter c; the key is the inverse
+        key = [""] * 26
+        for cipher, letter in enumerate(plain):
+            key[letter] = ALPHABET[cipher]
+        key = "".join(key)
+        return key, decrypt(ciphertext, key), score / (len(letters) - 3)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ciphers.simple_substitution_core",
+                                     description="Solves a monoalphabetic substitution cipher.")
+    parser.add_argument("file", nargs="?", help="ciphertext file (default: standard input)")
+    parser.add_argument("--restarts", type=int, default=48)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            ciphertext = f.read()
+    else:
+        ciphertext = sys.stdin.read()
+    try:
+        key, plaintext, fitness = SubstitutionSolver(args.restarts, args.workers, args.seed).solve(ciphertext)
+    except ValueError as ve:
+        parser.error(str(ve))
+    print(f"Key: {key}  (fitness {fitness:.3f})")
+    print(plaintext)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
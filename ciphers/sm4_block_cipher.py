@@ -3,6 +3,7 @@ from PyQt6.QtCore                   import Qt
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
+from jobs                           import job_runner, show_job_error
 from gmssl.sm4                      import CryptSM4, SM4_ENCRYPT, SM4_DECRYPT
 from os                             import urandom
 from base64                         import b64encode
@@ -77,8 +78,8 @@ class SM4BlockCipherEncryptWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=['Base64', 'Hex', 'Raw'])
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_sm4encrypt)
-        encrypt_button.setGeometry(280, 240, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_sm4encrypt)
+        self.encrypt_button.setGeometry(280, 240, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 350, 680, 100)
@@ -116,14 +117,27 @@ class SM4BlockCipherEncryptWindow(QWidget):
         key_bytes = key.encode('utf-8') if key else urandom(16)
         iv_bytes = iv.encode('utf-8') if iv else urandom(16)
 
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.encrypt, key_bytes, iv_bytes, plaintext_bytes, mode,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_bytes, iv_bytes, mode, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    @staticmethod
+    def encrypt(key_bytes, iv_bytes, plaintext_bytes, mode):
         sm4 = CryptSM4()
         sm4.set_key(key_bytes, mode=SM4_ENCRYPT)
 
         if mode == "ECB":
-            ciphertext = sm4.crypt_ecb(plaintext_bytes)
+            return sm4.crypt_ecb(plaintext_bytes)
+        return sm4.crypt_cbc(iv_bytes, plaintext_bytes)
+
+    def show_encryption(self, ciphertext, key, key_bytes, iv_bytes, mode, output_format):
+        if mode == "ECB":
             self.iv_label.hide()
         else:
-            ciphertext = sm4.crypt_cbc(iv_bytes, plaintext_bytes)
             if self.iv_input.text():
                 self.iv_label.clear()
                 self.iv_label.setHtml(f"<b>IV:</b><br>{str(iv_bytes)}")
@@ -5,6 +5,7 @@ from os                             import urandom
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 import base64
 
 # Implementation
@@ -99,8 +100,8 @@ class TEAWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_tea)
-        encrypt_button.setGeometry(300, 260, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_tea)
+        self.encrypt_button.setGeometry(300, 260, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 380, 680, 100)
@@ -131,8 +132,15 @@ class TEAWindow(QWidget):
                 raise ValueError("Give Key with 16 bytes")
             
         tea = TEAImp(key=key_bytes)
-        ciphertext = tea.encrypt(block=plaintext_bytes)
-
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            tea.encrypt, block=plaintext_bytes,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_bytes, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    def show_encryption(self, ciphertext, key, key_bytes, output_format):
         formatted_ciphertext = ciphertext
         if output_format == "Base64":
             formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
@@ -1,70 +1,12 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-from binascii                       import hexlify
-from base64                         import b64encode
-
-class VigenereCipher:
-
-    def __init__(self, key: str):
-        """
-        Initialize the Vigenere Cipher with a key.
-        Args:
-            key (str): The cipher key (only alphabetic characters are allowed)."""
-        self.key = key.upper()
-
-    def __repeat_key(self, text: str) -> str:
-        """
-        Repeat the key to match the length of the text.
-        Args:
-            text (str): The text to encode or decode.
-        Returns:
-            str: The repeated key."""
-        repeated_key = (self.key * (len(text) // len(self.key) + 1))[:len(text)]
-        return repeated_key
-
-    def __shift_character(self, char: str, key_char: str, encrypt: bool = True) -> str:
-        """
-        Shift a character using the Vigenere Cipher method.
-        Args:
-            char (str): The character to shift.
-            key_char (str): The key character to determine the shift.
-            encrypt (bool): True for encryption, False for decryption.
-        Returns:
-            str: The shifted character."""
-        if char.isalpha():
-            shift = ord(key_char) - ord('A')
-            if not encrypt:
-                shift = -shift
-            base = ord('A') if char.isupper() else ord('a')
-            return chr((ord(char) - base + shift) % 26 + base)
-        return char
-
-    def encrypt(self, plaintext: str) -> str:
-        """
-        Encrypt the plaintext using the Vigenere Cipher.
-        Args:
-            plaintext (str): The text to encrypt.
-        Returns:
-            str: The encrypted text."""
-        plaintext = plaintext.upper()
-        key = self.__repeat_key(plaintext)
-        return ''.join(self.__shift_character(p, k) if p.isalpha() else p 
-                       for p, k in zip(plaintext, key))
-
-    def decrypt(self, ciphertext: str) -> str:
-        """
-        Decrypt the ciphertext using the Vigenere Cipher.
-        
-        Args:
-        ciphertext (str): The text to decrypt.
-        
-        Returns:
-        str: The decrypted text."""
-        ciphertext = ciphertext.upper()
-        key = self.__repeat_key(ciphertext)
-        return ''.join(self.__shift_character(c, k, encrypt=False) if c.isalpha() else c 
-                       for c, k in zip(ciphertext, key))
+from jobs                           import job_runner, show_job_error
+from .vigenere_core                 import VigenereCipher
+import html
+
+KEY_ADVANCES = ["Every character", "Letters only"]
 
 class VigenereEncryptionWindow(QWidget):
 
@@ -93,6 +35,12 @@ class VigenereEncryptionWindow(QWidget):
         encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.encrypt)
         encrypt_button.setGeometry(520, 130, 100, 50)
 
+        # Key alignment
+        key_advances_label = QLabel("Key advances on:", parent=self)
+        key_advances_label.setGeometry(10, 200, 150, 50)
+        self.key_advances_input = DefaultQComboBoxStyle(parent=self, items=KEY_ADVANCES)
+        self.key_advances_input.setGeometry(160, 200, 200, 50)
+
         self.ciphertext_label = QTextEdit(parent=self)
         self.ciphertext_label.setGeometry(10, 380, 680, 100)
         self.ciphertext_label.setReadOnly(True)
@@ -107,11 +55,11 @@ class VigenereEncryptionWindow(QWidget):
                     for char in key:
                         if not char.isalpha():
                             raise ValueError('Key must contain only alphabetic characters.')
-                    v = VigenereCipher(key)
+                    v = VigenereCipher(key, skip_non_letters=self.key_advances_input.currentText() == "Letters only")
                     ciphertext = v.encrypt(plaintext)
 
                     self.ciphertext_label.clear()
-                    self.ciphertext_label.setHtml(f"<b>Ciphertext (Raw):</b><br>{str(ciphertext)}")
+                    self.ciphertext_label.setHtml(f"<b>Ciphertext (Raw):</b><br>{html.escape(ciphertext)}")
                     self.ciphertext_label.show()
                 else:
                     raise ValueError('Please enter a key.')
@@ -130,11 +78,104 @@ class VigenereDecryptionWindow(QWidget):
         super().__init__()
         self.theme_mode = theme_mode
 
+        msgbox_title = "About Vigenere Decryption"
+        msgbox_txt = (
+            "The Vigenere cipher shifts every letter by the letter of a repeated key. Knowing the key, "
+            "decryption shifts the letters back.<br><br>"
+            "<b>Crack</b> finds the key from the ciphertext alone:<br>"
+            "- The key length: the ciphertext is split into columns, one per key letter. For the right key "
+            "length every column is a Caesar cipher, so its <b>index of coincidence</b> (the chance that two "
+            "letters are equal) is that of English. <b>Kasiski examination</b> adds the distances between "
+            "repeated trigrams, which are multiples of the key length.<br>"
+            "- The key letters: the shift of each column whose letter counts are closest to English by the "
+            "<b>chi-square</b> statistic, refined by quadgram statistics.<br>"
+            "The candidates are ranked by how English-like their decryption is. Both key alignments are tried: "
+            "advancing on every character, as the encryption tool does, and on letters only.<br><br>"
+            "Useful links: <br>"
+            "<a href=https://en.wikipedia.org/wiki/Vigen%C3%A8re_cipher>Wikipedia</a><br>"
+            "<a href=https://en.wikipedia.org/wiki/Kasiski_examination>Kasiski examination</a>")
+
         self.setWindowTitle("Vigenere Cipher Decryption")
         self.setFixedSize(700, 700)
-'''DECRYPT
 
-decrypted = cipher.decrypt(encrypted)
-print(f"Decrypted: {decrypted}")
+        # Ciphertext
+        ciphertext_label = QLabel("Enter ciphertext:", parent=self)
+        ciphertext_label.setGeometry(300, 10, 150, 50)
+        self.ciphertext_input = DefaultQLineEditStyle(parent=self)
+        self.ciphertext_input.setGeometry(10, 60, 680, 50)
+
+        # Key
+        key_label = QLabel("Enter key:", parent=self)
+        key_label.setGeometry(10, 130, 500, 50)
+        self.key_input = DefaultQLineEditStyle(parent=self)
+        self.key_input.setGeometry(90, 130, 400, 50)
+
+        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, command=self.decrypt)
+        decrypt_button.setGeometry(520, 130, 100, 50)
+
+        # Key alignment
+        key_advances_label = QLabel("Key advances on:", parent=self)
+        key_advances_label.setGeometry(10, 200, 150, 50)
+        self.key_advances_input = DefaultQComboBoxStyle(parent=self, items=KEY_ADVANCES)
+        self.key_advances_input.setGeometry(160, 200, 200, 50)
+
+        self.crack_button = DefaultButtonStyle("Crack", parent=self, bold=True, command=self.crack)
+        self.crack_button.setGeometry(520, 200, 100, 50)
+
+        self.plaintext_label = QTextEdit(parent=self)
+        self.plaintext_label.setGeometry(10, 280, 680, 350)
+        self.plaintext_label.setReadOnly(True)
+        self.plaintext_label.hide()
+
+        # About button setup
+        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 650, 50, 50))
+        self.aboutButton.update_theme(self.theme_mode)
+
+    def decrypt(self):
+        try:
+            if not self.ciphertext_input.text():
+                raise ValueError('Please enter a ciphertext')
+            if not self.key_input.text():
+                raise ValueError('Please enter a key, or use Crack to find it.')
+            v = VigenereCipher(self.key_input.text(), skip_non_letters=self.key_advances_input.currentText() == "Letters only")
+            plaintext = v.decrypt(self.ciphertext_input.text())
+
+            self.plaintext_label.clear()
+            self.plaintext_label.setHtml(f"<b>Plaintext:</b><br>{html.escape(plaintext)}")
+            self.plaintext_label.show()
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def crack(self):
+        try:
+            if not self.ciphertext_input.text():
+                raise ValueError('Please enter a ciphertext')
+            self.plaintext_label.clear()
+            self.plaintext_label.setHtml("<b>Cracking...</b>")
+            self.plaintext_label.show()
+
+            self.crack_button.setEnabled(False)
+            job_runner().submit(
+                VigenereCipher.crack, self.ciphertext_input.text(),
+                owner=self,
+                on_result=self.show_candidates,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.crack_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
 
-'''
\ No newline at end of file
+    def show_candidates(self, candidates):
+        best = candidates[0]
+        self.key_input.setText(best.key)
+        self.key_advances_input.setCurrentText(KEY_ADVANCES[best.skip_non_letters])
+        rows = "".join(
+            f"<b>{html.escape(candidate.key)}</b> ({KEY_ADVANCES[candidate.skip_non_letters].lower()}, "
+            f"fitness {candidate.fitness:.2f}):<br>{html.escape(candidate.plaintext[:300])}<br><br>"
+            for candidate in candidates)
+        self.plaintext_label.clear()
+        self.plaintext_label.setHtml(f"<b>Candidates:</b><br>{rows}")
+        self.plaintext_label.show()
@@ -0,0 +1,226 @@
+from collections     import namedtuple
+from .english_ngrams import LETTER_PROBABILITIES, quadgram_indices, quadgram_table
+import numpy as np
+import argparse, re, string, sys
+
+ALPHABET = string.ascii_uppercase
+MAX_KEY_LENGTH = 100
+ANALYSIS_SAMPLE = 20000     # characters used to find key lengths; plenty for the statistics
+REFINE_SAMPLE = 3000        # characters used to refine and rank keys
+ENGLISH_IC = float((LETTER_PROBABILITIES ** 2).sum())    # about 0.066; random letters give 1/26
+VigenereCandidate = namedtuple("VigenereCandidate", "key plaintext fitness skip_non_letters")
+
+def _shift_tables(key, encrypt):
+    """One str.translate table per key letter, shifting A-Z by that letter."""
+    tables = []
+    for key_char in key:
+        shift = ALPHABET.index(key_char) if encrypt else -ALPHABET.index(key_char)
+        tables.append(str.maketrans(ALPHABET, ALPHABET[shift % 26:] + ALPHABET[:shift % 26]))
+    return tables
+
+def _translate_columns(text, tables):
+    """Translates text[i::len(tables)] with tables[i] and interleaves the columns back."""
+    chars = [""] * len(text)
+    for i, table in enumerate(tables):
+        chars[i::len(tables)] = text[i::len(tables)].translate(table)
+    return "".join(chars)
+
+class VigenereCipher:
+
+    def __init__(self, key: str, skip_non_letters: bool = False):
+        """
+        Initialize the Vigenere Cipher with a key.
+        Args:
+            key (str): The cipher key (only alphabetic characters are allowed).
+            skip_non_letters (bool): Advance the key on letters only, as most Vigenere tools do,
+                instead of on every character."""
+        self.key = key.upper()
+        if not self.key or any(char not in ALPHABET for char in self.key):
+            raise ValueError('Key must contain only the letters A-Z.')
+        self.skip_non_letters = skip_non_letters
+
+    def __apply(self, text: str, encrypt: bool) -> str:
+        """
+        Shift the letters of text by the key, a whole column of key positions per str.translate call.
+        Args:
+            text (str): The text to encode or decode.
+            encrypt (bool): True for encryption, False for decryption.
+        Returns:
+            str: The shifted text in upper case; characters other than A-Z are kept."""
+        text = text.upper()
+        tables = _shift_tables(self.key, encrypt)
+        if not self.skip_non_letters:
+            return _translate_columns(text, tables)
+        # shift the letters as one run, then put the other characters back between them
+        pieces = re.split(r"([^A-Z]+)", text)
+        letters = iter(_translate_columns("".join(pieces[0::2]), tables))
+        return "".join(piece if i % 2 else "".join(next(letters) for _ in piece) for i, piece in enumerate(pieces))
+
+    def encrypt(self, plaintext: str) -> str:
+        """
+        Encrypt the plaintext using the Vigenere Cipher.
+        Args:
+            plaintext (str): The text to encrypt.
+        Returns:
+            str: The encrypted text."""
+        return self.__apply(plaintext, encrypt=True)
+
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        Decrypt the ciphertext using the Vigenere Cipher.
+
+        Args:
+        ciphertext (str): The text to decrypt.
+
+        Returns:
+        str: The decrypted text."""
+        return self.__apply(ciphertext, encrypt=False)
+
+    # The analysis works on a stream of letter values 0-25 in which 26 marks a character that
+    # takes a key position without being a letter, for keys that advance on every character.
+
+    @staticmethod
+    def __column_counts(stream, key_length):
+        """(key_length, 26) letter counts of the columns of the stream, all in one bincount."""
+        columns = np.arange(len(stream), dtype=np.intp) % key_length
+        return np.bincount(columns * 27 + stream, minlength=27 * key_length).reshape(key_length, 27)[:, :26]
+
+    @classmethod
+    def coincidence_indices(cls, stream, max_key_length=MAX_KEY_LENGTH):
+        """Index of coincidence of the columns for every key length 1..max_key_length, as an array
+        indexed by key length (index 0 unused): the chance that two letters of the same column are
+        equal. It is close to English for the true key length and its multiples."""
+        ics = np.zeros(max_key_length + 1)
+        letters = int((stream < 26).sum())
+        for length in range(1, min(max_key_length, letters // 2) + 1):
+            counts = cls.__column_counts(stream, length)
+            sizes = counts.sum(axis=1)
+            ics[length] = (counts * (counts - 1)).sum() / max((sizes * (sizes - 1)).sum(), 1)
+        return ics
+
+    @staticmethod
+    def kasiski_scores(stream, max_key_length=MAX_KEY_LENGTH):
+        """Kasiski examination: for every key length, the share of the distances between repeated
+        trigrams that it divides."""
+        scores = np.zeros(max_key_length + 1)
+        if len(stream) < 6:
+            return scores
+        values = stream.astype(np.int64)
+        trigrams = values[:-2] * 729 + values[1:-1] * 27 + values[2:]
+        # trigrams with a non-letter get distinct negative values, so they never repeat
+        invalid = np.flatnonzero((values[:-2] == 26) | (values[1:-1] == 26) | (values[2:] == 26))
+        trigrams[invalid] = -1 - invalid
+        order = np.argsort(trigrams, kind="stable")
+        repeated = trigrams[order[1:]] == trigrams[order[:-1]]
+        distances = (order[1:] - order[:-1])[repeated]
+        if len(distances):
+            lengths = np.arange(2, max_key_length + 1)
+            scores[2:] = (distances[:, None] % lengths == 0).mean(axis=0)
+        return scores
+
+    @classmethod
+    def column_key(cls, stream, key_length):
+        """Most likely key of a given length: for every column, the shift whose decryption has the
+        smallest chi-square distance from English letter frequencies, for all 26 shifts at once."""
+        counts = cls.__column_counts(stream, key_length)
+        # shifted[l, s, k]: count of plaintext letter k in column l if the key letter is s
+        shifted = counts[:, (np.arange(26)[:, None] + np.arange(26)[None, :]) % 26]
+        expected = counts.sum(axis=1)[:, None, None] * LETTER_PROBABILITIES[None, None, :]
+        chi_square = ((shifted - expected) ** 2 / np.maximum(expected, 1e-9)).sum(axis=2)
+        return "".join(ALPHABET[s] for s in chi_square.argmin(axis=1))
+
+    @classmethod
+    def crack(cls, ciphertext: str, max_key_length: int = MAX_KEY_LENGTH, candidates: int = 5):
+        """
+        Recover the key of a Vigenere ciphertext without knowing it.
+        Likely key lengths are found by the index of coincidence of the columns and by Kasiski
+        examination, the key letters of each by chi-square against English letter frequencies,
+        and the decryptions are ranked by quadgram fitness. The key may advance on every character
+        (as encrypt() does) or on letters only; both alignments are tried when they differ.
+        Args:
+            ciphertext (str): The text to break.
+            max_key_length (int): The longest key length tried.
+            candidates (int): The number of results.
+        Returns:
+            list: VigenereCandidate(key, plaintext, fitness, skip_non_letters) tuples, best first."""
+        # the text is converted to a uint8 array once, both streams come from it
+        values = np.frombuffer(ciphertext.upper().encode("latin-1", "replace"), dtype=np.uint8)
+        stream = np.where((values >= 65) & (values <= 90), values - 65, 26).astype(np.intp)
+        streams = {True: stream[stream < 26]}
+        if len(streams[True]) < 2:
+            raise ValueError("Ciphertext must contain at least 2 letters.")
+        if len(streams[True]) != len(stream):
+            streams[False] = stream
+
+        results = {}
+        for skip_non_letters, stream in streams.items():
+            sample = stream[:ANALYSIS_SAMPLE]
+            scores = cls.coincidence_indices(sample, max_key_length) / ENGLISH_IC + cls.kasiski_scores(sample, max_key_length)
+            # multiples of the true length score as well, and short texts can favour a multiple;
+            # the divisors of the best lengths are tried too and repeated keys fold back below
+            best = (np.argsort(-scores[1:]) + 1)[:max(candidates, 6)].tolist()
+            lengths = sorted({d for length in best for d in range(1, length + 1) if length % d == 0})
+            for length in lengths:
+                key, fitness = cls.__refine(stream[:REFINE_SAMPLE], cls.column_key(stream, length))
+                key = cls.__primitive(key)
+                # a single letter key shifts the same way in both alignments
+                results.setdefault((key, skip_non_letters or len(key) == 1), fitness)
+        ranked = sorted(results.items(), key=lambda item: -item[1])[:candidates]
+        return [VigenereCandidate(key, cls(key, skip_non_letters).decrypt(ciphertext), fitness, skip_non_letters)
+                for (key, skip_non_letters), fitness in ranked]
+
+    @staticmethod
+    def __refine(stream, key):
+        """Improves a key letter by letter on quadgram log-likelihood, which tells the right shift
+        apart where a short column leaves the chi-square test undecided. Returns the key and the
+        mean log10 quadgram probability of its decryption of the stream."""
+        shifts = np.array([ALPHABET.index(char) for char in key], dtype=np.intp)
+        letters = stream < 26
+        ciphertext, positions = stream[letters], (np.arange(len(stream)) % len(key))[letters]
+        if len(ciphertext) < 4:
+            return key, float("-inf")
+        table = quadgram_table()
+        def score():
+            return table[quadgram_indices((ciphertext - shifts[positions]) % 26)].sum()
+        best = score()
+        for position in range(len(key)):
+            for shift in range(26):
+                previous, shifts[position] = shifts[position], shift
+                candidate = score()
+                if candidate > best:
+                    best = candidate
+                else:
+                    shifts[position] = previous
+        return "".join(ALPHABET[shift] for shift in shifts), float(best) / (len(ciphertext) - 3)
+
+    @staticmethod
+    def __primitive(key):
+        """The shortest key that repeats to key, as found for multiples of the true key length."""
+        for length in range(1, len(key)):
+            if len(key) % length == 0 and key[:length] * (len(key) // length) == key:
+                return key[:length]
+        return key
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ciphers.vigenere_core",
+                                     description="Breaks a Vigenere ciphertext without the key.")
+    parser.add_argument("file", nargs="?", help="ciphertext file (default: standard input)")
+    parser.add_argument("--max-key-length", type=int, default=MAX_KEY_LENGTH)
+    parser.add_argument("--candidates", type=int, default=5)
+    args = parser.parse_args(argv)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            ciphertext = f.read()
+    else:
+        ciphertext = sys.stdin.read()
+    try:
+        results = VigenereCipher.crack(ciphertext, args.max_key_length, args.candidates)
+    except ValueError as ve:
+        parser.error(str(ve))
+    for candidate in results:
+        alignment = "letters only" if candidate.skip_non_letters else "every character"
+        print(f"{candidate.key} ({alignment}, fitness {candidate.fitness:.3f}): {candidate.plaintext[:80]!r}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from binascii                       import hexlify
 from os                             import urandom
 import base64
@@ -113,8 +114,8 @@ class XTEAWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_xtea)
-        encrypt_button.setGeometry(300, 260, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_xtea)
+        self.encrypt_button.setGeometry(300, 260, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 380, 680, 100)
@@ -145,8 +146,15 @@ class XTEAWindow(QWidget):
                 raise ValueError("Give Key with 16 bytes")
             
         xtea = XTEAImp(key=key_bytes)
-        ciphertext = xtea.encrypt(plaintext=plaintext_bytes)
-
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            xtea.encrypt, plaintext=plaintext_bytes,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_bytes, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    def show_encryption(self, ciphertext, key, key_bytes, output_format):
         formatted_ciphertext = ciphertext
         if output_format == "Base64":
             formatted_ciphertext = base64.b64encode(ciphertext).decode('utf-8')
@@ -1,14 +1,44 @@
-from .converters    import (TexttoOctalWindow, OctaltoTextWindow, TexttoBinaryWindow, BinarytoTextWindow,
-                            TexttoASCIIWindow, ASCIItoTextWindow, DecimaltoBinaryWindow, BinarytoDecimalWindow)
-from .converters2   import (CodepointConverterWindow, TexttoHexWindow, HextoTextWindow, DecimalToRadixWindow, RadixToDecimalWindow,
-                            DecimalToBCDWindow, BCDToDecimalWindow, CharToHTMLEntityWindow, HTMLEntityToCharWindow)
-from .converters3   import (PEMtoDERWindow, DERtoPEMWindow, ToUnixTimestampWindow, FromUnixTimestampWindow,
-                                ToNatoAlphabet, FromNatoAlphabet)
-from .converters4 import HexdumpWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "TexttoOctalWindow":        ".converters",
+    "OctaltoTextWindow":        ".converters",
+    "TexttoBinaryWindow":       ".converters",
+    "BinarytoTextWindow":       ".converters",
+    "TexttoASCIIWindow":        ".converters",
+    "ASCIItoTextWindow":        ".converters",
+    "DecimaltoBinaryWindow":    ".converters",
+    "BinarytoDecimalWindow":    ".converters",
+    "CodepointConverterWindow": ".converters2",
+    "TexttoHexWindow":          ".converters2",
+    "HextoTextWindow":          ".converters2",
+    "DecimalToRadixWindow":     ".converters2",
+    "RadixToDecimalWindow":     ".converters2",
+    "DecimalToBCDWindow":       ".converters2",
+    "BCDToDecimalWindow":       ".converters2",
+    "CharToHTMLEntityWindow":   ".converters2",
+    "HTMLEntityToCharWindow":   ".converters2",
+    "PEMtoDERWindow":           ".converters3",
+    "DERtoPEMWindow":           ".converters3",
+    "ToUnixTimestampWindow":    ".converters3",
+    "FromUnixTimestampWindow":  ".converters3",
+    "ToNatoAlphabet":           ".converters3",
+    "FromNatoAlphabet":         ".converters3",
+    "HexdumpWindow":            ".converters4",
+}
 
 __all__ = ["TexttoOctalWindow", "OctaltoTextWindow", "TexttoBinaryWindow", "BinarytoTextWindow", 
            "TexttoASCIIWindow", "ASCIItoTextWindow", "DecimaltoBinaryWindow", "BinarytoDecimalWindow",
            "CodepointConverterWindow", "TexttoHexWindow", "HextoTextWindow", "DecimalToRadixWindow",
            "RadixToDecimalWindow", "DecimalToBCDWindow", "BCDToDecimalWindow", "CharToHTMLEntityWindow",
            "HTMLEntityToCharWindow", "PEMtoDERWindow", "DERtoPEMWindow", "ToUnixTimestampWindow",
-            "FromUnixTimestampWindow", "ToNatoAlphabet", "FromNatoAlphabet", "HexdumpWindow"]
\ No newline at end of file
+            "FromUnixTimestampWindow", "ToNatoAlphabet", "FromNatoAlphabet", "HexdumpWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,27 +1,33 @@
-from .mod_N                 import Mod_N
-from .kpa                   import KPA
-from .cpa                   import CPA
-from .coa                   import COA
-from .acpa                  import ACPA
-from .birthdayattack        import BirthdayAttack
-from .sca                   import SCA
-from .mitm                  import MITM
-from .diff_analysis         import DifferentialCryptanalysis
-from .bf_attack             import BruteForceAttack
-from .rka                   import RKA
-from .boomerang             import BoomerangAttack
-from .daviesattack          import DaviesAttack
-from .hndl                  import HNDL
-from .slideattack           import SlideAttack
-from .integralcryptanalysis import IntegralCryptanalysis
-from .linearcryptanalysis   import LinearCryptanalysis
-from .xslattack             import XSLattack
-from .poweranalysis         import PowerAnalysis
-from .rainbowtable          import RainbowTable
-from .blackbag              import BlackBagCryptanalysis
-from .replayattack          import ReplayAttack
-from .rubberhose            import RubberHoseCryptanalysis
-from .timinganalysis        import TimingAnalysis
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "Mod_N":                     ".mod_N",
+    "KPA":                       ".kpa",
+    "CPA":                       ".cpa",
+    "COA":                       ".coa",
+    "ACPA":                      ".acpa",
+    "BirthdayAttack":            ".birthdayattack",
+    "SCA":                       ".sca",
+    "MITM":                      ".mitm",
+    "DifferentialCryptanalysis": ".diff_analysis",
+    "BruteForceAttack":          ".bf_attack",
+    "RKA":                       ".rka",
+    "BoomerangAttack":           ".boomerang",
+    "DaviesAttack":              ".daviesattack",
+    "HNDL":                      ".hndl",
+    "SlideAttack":               ".slideattack",
+    "IntegralCryptanalysis":     ".integralcryptanalysis",
+    "LinearCryptanalysis":       ".linearcryptanalysis",
+    "XSLattack":                 ".xslattack",
+    "PowerAnalysis":             ".poweranalysis",
+    "RainbowTable":              ".rainbowtable",
+    "BlackBagCryptanalysis":     ".blackbag",
+    "ReplayAttack":              ".replayattack",
+    "RubberHoseCryptanalysis":   ".rubberhose",
+    "TimingAnalysis":            ".timinganalysis",
+}
 
 __all__ = ["Mod_N", "KPA", "CPA", "COA", "ACPA", "BirthdayAttack", "SCA", "MITM",
            "DifferentialCryptanalysis", "BruteForceAttack", "RKA", "BoomerangAttack",
@@ -29,3 +35,10 @@ __all__ = ["Mod_N", "KPA", "CPA", "COA", "ACPA", "BirthdayAttack", "SCA", "MITM"
            "LinearCryptanalysis", "XSLattack", "PowerAnalysis", "RainbowTable", 
            "BlackBagCryptanalysis", "ReplayAttack", "RubberHoseCryptanalysis", 
            "TimingAnalysis"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1 @@
+"""Headless command line interface to the playground's engines: python -m cryptology_playground --help"""
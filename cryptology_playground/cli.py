@@ -0,0 +1,163 @@
+from concurrent.futures import ProcessPoolExecutor
+from collections        import deque
+from base64             import b64encode
+import argparse, json, sys
+
+from .operations import OPERATIONS, run
+
+def encode_result(value, output_format):
+    """Makes an operation result JSON serializable; bytes become Base64 or hex text."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex() if output_format == 'hex' else b64encode(value).decode('ascii')
+    if isinstance(value, dict):
+        return {str(key): encode_result(item, output_format) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_result(item, output_format) for item in value]
+    return value
+
+def run_task(task, output_format):
+    """Worker entry point: never raises, so one bad record does not stop the batch."""
+    task_id, name, data, params = task
+    try:
+        result = run(name, data, params)
+        if output_format == 'raw' and isinstance(result, (bytes, bytearray)):
+            return {'id': task_id, 'result': bytes(result)}
+        return {'id': task_id, 'result': encode_result(result, 'base64' if output_format == 'raw' else output_format)}
+    except Exception as e:
+        return {'id': task_id, 'error': str(e) or type(e).__name__}
+
+def read_tasks(args, params):
+    """Yields (id, operation, data, params) tasks from the input files or stdin without
+    reading more than one record ahead."""
+    sources = args.inputs or ['-']
+    for source in sources:
+        stream = sys.stdin.buffer if source == '-' else open(source, 'rb')
+        try:
+            if args.ndjson:
+                for number, line in enumerate(stream, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError as e:
+                        yield (f"{source}:{number}", None, None, {'error': f"Invalid JSON: {e}"})
+                        continue
+                    yield (record.get('id', f"{source}:{number}"), record.get('op', args.operation),
+                           record.get('data'), {**params, **record.get('params', {})})
+            elif args.lines:
+                for number, line in enumerate(stream, 1):
+                    line = line.rstrip(b'\r\n')
+                    if line:
+                        yield (f"{source}:{number}", args.operation, line, params)
+            else:
+                yield (source, args.operation, stream.read(), params)
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+def check_task(task):
+    task_id, name, _, params = task
+    if name is None:
+        return {'id': task_id, 'error': params.get('error', "No operation given.")}
+    return None
+
+def results(tasks, output_format, jobs=1):
+    """Runs the tasks and yields their results in input order. With jobs > 1 they run on a
+    process pool with at most 4 * jobs tasks in flight, so results stream out while the
+    input is still being read."""
+    if jobs <= 1:
+        for task in tasks:
+            yield check_task(task) or run_task(task, output_format)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for task in tasks:
+            invalid = check_task(task)
+            pending.append(invalid if invalid else pool.submit(run_task, task, output_format))
+            while len(pending) >= 4 * jobs:
+                yield _result(pending.popleft())
+        while pending:
+            yield _result(pending.popleft())
+
+def _result(item):
+    return item if isinstance(item, dict) else item.result()
+
+def parse_params(values):
+    params = {}
+    for value in values:
+        key, separator, item = value.partition('=')
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Parameters are KEY=VALUE, got {value!r}")
+        params[key.replace('-', '_')] = item
+    return params
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m cryptology_playground',
+        description="Runs the playground's engines without the GUI. Each input file (stdin by default) is one "
+                    "input unless --lines or --ndjson is given. Results are written as one JSON object per line.",
+        epilog="Parameter values and NDJSON data prefixed with hex: or b64: are decoded to bytes. "
+               "NDJSON records look like {\"id\": 1, \"op\": \"hash\", \"data\": \"abc\", \"params\": {\"algorithm\": \"md5\"}}.")
+    parser.add_argument('operation', nargs='?', metavar='OPERATION',
+                        help="operation to run (see --list); optional with --ndjson when records name their own")
+    parser.add_argument('inputs', nargs='*', metavar='FILE', help="input files, - for stdin")
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='KEY=VALUE',
+                        help="operation parameter, can be repeated")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--lines', action='store_true', help="treat every non-empty line as a separate input")
+    mode.add_argument('--ndjson', action='store_true', help="read one JSON record per line")
+    parser.add_argument('--output-format', choices=('base64', 'hex'), default='base64',
+                        help="encoding of binary results (default base64)")
+    parser.add_argument('--raw', action='store_true',
+                        help="write bare results instead of JSON objects (binary results are written as is)")
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N', help="run inputs on N processes")
+    parser.add_argument('--list', action='store_true', help="list the operations and exit")
+    return parser
+
+def write_result(result, raw, out):
+    if not raw:
+        out.write(json.dumps(result).encode('utf-8') + b'\n')
+    elif 'error' in result:
+        sys.stderr.write(f"{result['id']}: {result['error']}\n")
+    else:
+        value = result['result']
+        out.write(value if isinstance(value, bytes) else
+                  (value if isinstance(value, str) else json.dumps(value)).encode('utf-8') + b'\n')
+    out.flush()
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list:
+        width = max(map(len, OPERATIONS))
+        for name, fn in sorted(OPERATIONS.items()):
+            print(f"{name:<{width}}  {fn.summary}")
+        return 0
+    if args.operation not in OPERATIONS:
+        if not args.ndjson:
+            parser.error(f"unknown operation {args.operation!r}, see --list" if args.operation else
+                         "an operation is required unless --ndjson records name one")
+        if args.operation is not None: # records name their operations, so this is the first input file
+            args.inputs.insert(0, args.operation)
+            args.operation = None
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    try:
+        params = parse_params(args.param)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    # --raw keeps bytes as bytes; only the JSON output needs a text encoding
+    output_format = 'raw' if args.raw else args.output_format
+    failed = False
+    try:
+        for result in results(read_tasks(args, params), output_format, args.jobs):
+            failed |= 'error' in result
+            write_result(result, args.raw, sys.stdout.buffer)
+    except OSError as e:
+        sys.stderr.write(f"{e}\n")
+        return 2
+    except KeyboardInterrupt:
+        return 130
+    return 1 if failed else 0
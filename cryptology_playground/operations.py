@@ -0,0 +1,191 @@
+from base64    import b64decode
+from importlib import import_module
+import hashlib, inspect, os
+
+# Every operation takes the input (bytes, or str when it came from a JSON record) plus its
+# parameters and returns bytes, str, bool, int, list or dict. Engines are imported inside the
+# operations so that a batch only loads what it uses, and never Qt.
+OPERATIONS = {}
+
+def operation(name, summary):
+    def register(fn):
+        fn.summary = summary
+        OPERATIONS[name] = fn
+        return fn
+    return register
+
+def engine(path):
+    """engine("symmetric.aes_core:AES_Imp") imports the module and returns the attribute."""
+    module, _, attribute = path.partition(':')
+    return getattr(import_module(module), attribute)
+
+def decode_value(value):
+    """Parameter and JSON data values prefixed with hex: or b64: are decoded to bytes."""
+    if isinstance(value, str):
+        if value.startswith('hex:'):
+            return bytes.fromhex(value[4:])
+        if value.startswith('b64:'):
+            return b64decode(value[4:])
+    return value
+
+def as_bytes(value):
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if value is None:
+        raise ValueError("Missing value.")
+    return bytes(value)
+
+def as_text(value):
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8')
+    if value is None:
+        raise ValueError("Missing value.")
+    return str(value)
+
+def as_ints(value):
+    """Accepts "1,2,3", "(1, 2, 3)" or a JSON list."""
+    if isinstance(value, (list, tuple)):
+        return [int(v) for v in value]
+    return [int(v) for v in as_text(value).strip().strip('()[]').split(',')]
+
+def _key(key, sizes):
+    key = as_bytes(key)
+    if len(key) not in sizes:
+        raise ValueError(f"Key must be {', '.join(map(str, sizes))} bytes long.")
+    return key
+
+# Symmetric ciphers
+@operation('aes-encrypt', "AES ECB/CBC, params key, mode (CBC prepends the IV)")
+def aes_encrypt(data, key=None, mode='CBC'):
+    return engine('symmetric.aes_core:AES_Imp')(mode.upper()).encrypt(as_bytes(data), _key(key, (16, 24, 32)))
+
+@operation('aes-decrypt', "AES ECB/CBC, params key, mode")
+def aes_decrypt(data, key=None, mode='CBC'):
+    aes = engine('symmetric.aes_core:AES_Imp')(mode.upper())
+    key = _key(key, (16, 24, 32))
+    if aes.mode == 'ECB':
+        return aes.decrypt_ECB(as_bytes(data), key)
+    if aes.mode == 'CBC':
+        return aes.decrypt_CBC(as_bytes(data), key)
+    raise ValueError(f"Unsupported mode: {mode}")
+
+@operation('serpent-encrypt', "Serpent ECB/CBC/CTR, params key, mode, iv (CBC/CTR prepend the IV)")
+def serpent_encrypt(data, key=None, mode='CTR', iv=None):
+    serpent = engine('symmetric.serpent_core:SerpentImp')(_key(key, (16, 24, 32)), iv and as_bytes(iv))
+    return serpent.encrypt(as_bytes(data), mode.upper())
+
+@operation('serpent-decrypt', "Serpent ECB/CBC/CTR, params key, mode")
+def serpent_decrypt(data, key=None, mode='CTR'):
+    serpent = engine('symmetric.serpent_core:SerpentImp')(_key(key, (16, 24, 32)), None)
+    return serpent.decrypt(as_bytes(data), mode.upper())
+
+@operation('gost-encrypt', "GOST Magma ECB/CBC/CFB/CTR, params key, mode, iv (IV or nonce is prepended)")
+def gost_encrypt(data, key=None, mode='CTR', iv=None):
+    gost = engine('ciphers.GOST_magma_core:GOSTMagmaImp')(_key(key, (32,)))
+    mode = mode.lower()
+    if mode == 'ecb':
+        return bytes(gost.encrypt_ecb(as_bytes(data)))
+    if mode not in ('cbc', 'cfb', 'ctr'):
+        raise ValueError(f"Unsupported mode: {mode}")
+    iv = as_bytes(iv) if iv else os.urandom(8)
+    return iv + getattr(gost, f'encrypt_{mode}')(as_bytes(data), iv)
+
+@operation('gost-decrypt', "GOST Magma ECB/CBC/CFB/CTR, params key, mode")
+def gost_decrypt(data, key=None, mode='CTR'):
+    gost = engine('ciphers.GOST_magma_core:GOSTMagmaImp')(_key(key, (32,)))
+    data, mode = as_bytes(data), mode.lower()
+    if mode == 'ecb':
+        return bytes(gost.decrypt_ecb(data))
+    if mode not in ('cbc', 'cfb', 'ctr'):
+        raise ValueError(f"Unsupported mode: {mode}")
+    return bytes(getattr(gost, f'decrypt_{mode}')(data[8:], data[:8]))
+
+# Asymmetric ciphers
+def _rsa(public_key=None, private_key=None):
+    return engine('asymmetric.rsa_core:RSAImp')(public_key=public_key, private_key=private_key)
+
+@operation('rsa-encrypt', "RSA-OAEP, param public_key (.pem path); returns Base64")
+def rsa_encrypt(data, public_key=None):
+    return _rsa(public_key=public_key).encrypt(as_text(data))
+
+@operation('rsa-decrypt', "RSA-OAEP of Base64 input, param private_key (.pem path)")
+def rsa_decrypt(data, private_key=None):
+    return _rsa(private_key=private_key).decrypt(as_text(data).strip())
+
+@operation('rsa-sign', "PKCS#1 v1.5 SHA-256 signature, param private_key (.pem path); returns Base64")
+def rsa_sign(data, private_key=None):
+    return _rsa(private_key=private_key).sign(as_text(data))
+
+@operation('rsa-verify', "Verifies param signature (Base64) of the input, param public_key (.pem path)")
+def rsa_verify(data, public_key=None, signature=None):
+    return _rsa(public_key=public_key).verify(as_text(data), as_text(signature))
+
+@operation('elgamal-keygen', "ElGamal key pair, param bits (default 2048)")
+def elgamal_keygen(data=None, bits=2048):
+    return engine('asymmetric.elgamal_core:ElGamalImp')(bit_length=int(bits)).generate_keys()
+
+@operation('elgamal-encrypt', "ElGamal, param public_key as p,g,y; returns [c1, c2]")
+def elgamal_encrypt(data, public_key=None):
+    p, g, y = as_ints(public_key)
+    elgamal = engine('asymmetric.elgamal_core:ElGamalImp')(p=p, g=g)
+    return list(elgamal.encrypt(as_text(data), (p, g, y)))
+
+@operation('elgamal-decrypt', "ElGamal of input c1,c2, params private_key, p")
+def elgamal_decrypt(data, private_key=None, p=None):
+    c1, c2 = as_ints(data)
+    elgamal = engine('asymmetric.elgamal_core:ElGamalImp')(p=int(p), g=2)
+    return elgamal.decrypt((c1, c2), int(private_key))
+
+# Hashing
+@operation('hash', "Hex digest, param algorithm: ripemd160, tiger or any hashlib name (default sha256)")
+def hash_data(data, algorithm='sha256'):
+    algorithm = algorithm.lower()
+    if algorithm == 'ripemd160':
+        return engine('hashingalgo.ripemd160_core:RIPEMD160Hash')(as_bytes(data)).hexdigest()
+    if algorithm == 'tiger':
+        return engine('hashingalgo.tiger:TigerHash')(as_bytes(data)).hexdigest()
+    try:
+        return hashlib.new(algorithm, as_bytes(data)).hexdigest()
+    except ValueError:
+        raise ValueError(f"Unknown hash algorithm: {algorithm}")
+
+@operation('hash-identify', "Candidate algorithms for a hex digest")
+def hash_identify(data):
+    return engine('hashingalgo.hash_identifier_core:Hash_Identifier')(as_text(data).strip()).identify_hash()
+
+# Other tools
+@operation('factorize', "Prime factorization of an integer; returns {prime: exponent}")
+def factorize(data):
+    try:
+        number = int(as_text(data).strip())
+    except ValueError:
+        raise ValueError("Input must be an integer.")
+    if number < 2:
+        raise ValueError("Input must be an integer greater than 1.")
+    factors = engine('othertools.intfactorization_core:IntegerFactorization')(number).factorize()
+    return {str(prime): count for prime, count in sorted(factors.items())}
+
+@operation('compress', "Huffman codes of the text; returns {bits, codes}")
+def compress(data):
+    compressor = engine('othertools.data_compression_core:DataCompression')()
+    bits = compressor.compress(as_text(data))
+    return {'bits': bits, 'codes': compressor.codes}
+
+@operation('decompress', "Decodes the bit string input with param codes (JSON object from compress)")
+def decompress(data, codes=None):
+    if not isinstance(codes, dict):
+        raise ValueError("Missing codes.")
+    compressor = engine('othertools.data_compression_core:DataCompression')()
+    compressor.reverse_codes = {code: char for char, code in codes.items()}
+    return compressor.decompress(as_text(data).strip())
+
+def run(name, data, params):
+    """Runs one operation on already decoded data and parameters."""
+    try:
+        fn = OPERATIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown operation: {name}")
+    unknown = set(params) - set(inspect.signature(fn).parameters)
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) for {name}: {', '.join(sorted(unknown))}")
+    return fn(decode_value(data), **{key: decode_value(value) for key, value in params.items()})
@@ -1,15 +1,39 @@
-from .base_enc_dec      import BASE32Window, BASE45Window, BASE58Window, BASE62Window, BASE64Window, BASE85Window, BASE92Window
-from .url_enc_dec       import URLDecodeWindow, URLEncodeWindow
-from .braille           import BrailleWindow
-from .morsecode         import MorseCodeWindow
-from .a1z26             import A1Z26EncodeWindow, A1Z26DecodeWindow
-from .utf_enc_dec       import TexttoCharcodeWindow, CharcodetoTextWindow
-from .qp                import ToQuotedPrintableWindow, FromQuotedPrintableWindow
-from.punycode           import PunycodeEncodeWindow, PunycodeDecodeWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "BASE32Window":              ".base_enc_dec",
+    "BASE45Window":              ".base_enc_dec",
+    "BASE58Window":              ".base_enc_dec",
+    "BASE62Window":              ".base_enc_dec",
+    "BASE64Window":              ".base_enc_dec",
+    "BASE85Window":              ".base_enc_dec",
+    "BASE92Window":              ".base_enc_dec",
+    "URLDecodeWindow":           ".url_enc_dec",
+    "URLEncodeWindow":           ".url_enc_dec",
+    "BrailleWindow":             ".braille",
+    "MorseCodeWindow":           ".morsecode",
+    "A1Z26EncodeWindow":         ".a1z26",
+    "A1Z26DecodeWindow":         ".a1z26",
+    "TexttoCharcodeWindow":      ".utf_enc_dec",
+    "CharcodetoTextWindow":      ".utf_enc_dec",
+    "ToQuotedPrintableWindow":   ".qp",
+    "FromQuotedPrintableWindow": ".qp",
+    "PunycodeEncodeWindow":      ".punycode",
+    "PunycodeDecodeWindow":      ".punycode",
+}
 
 __all__ = ["BASE32Window", "BASE45Window", "BASE58Window", "BASE62Window", 
            "BASE64Window", "BASE85Window", "BASE92Window","URLDecodeWindow", 
            "URLEncodeWindow", "BrailleWindow", "MorseCodeWindow", 
            "A1Z26EncodeWindow", "A1Z26DecodeWindow", "TexttoCharcodeWindow",
            "CharcodetoTextWindow", "ToQuotedPrintableWindow", "FromQuotedPrintableWindow",
-           "PunycodeEncodeWindow", "PunycodeDecodeWindow"]
\ No newline at end of file
+           "PunycodeEncodeWindow", "PunycodeDecodeWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,37 @@
-from .fernet_file_enc           import FernetFileEncWindow, FernetFileDecWindow
-from .csv_to_json               import CSVtoJSONWindow, JSONtoCSVWindow
-from .img_to_pdf                import Img2PDFWindow, PDF2ImgWindow
-from .exif_images               import ExifImageWindow
-from .zip_files                 import ZipFileWithPwdWindow
-from .zip_folders               import ZipFolderWithPwdWindow
-from .bf_pwd_protected_files    import BfPwdProtectedFilesWindow
-from .dis_exe_files             import DisassembleExeFilesWindow
-from .decompile_pyc             import DecompilePycFilesWindow
-from .json_and_msgpack          import JSONtoMsgPackWindow, MsgPacktoJSONWindow 
-from .json_and_xml              import JSONtoXMLWindow, XMLtoJSONWindow
-from .python_code_disassembler  import PyCodeDisassemblerWindow
-from .detect_file_type          import FileTypeDetectorWindow
-from .pgpencryptor              import PGPEncryptWindow
-from .pgpdecryptor              import PGPDecryptWindow
-from .decode_txt_files          import DecodeTXTFilesWindow
-from .xxd_tool                  import xxdHexDumpWindow
-from .file_metadata_extractor   import FileMetadataExtractorWindow
-from .file_hash_generator       import HashFilesWindow
-from .compare_hashes            import CompareFileHashesWindow
-from .file_steganography        import FileStegToolWindow
-from .detect_virus              import VirusDetectorWindow
-from .log_analyzer              import LogAnalyzerWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "FernetFileEncWindow":         ".fernet_file_enc",
+    "FernetFileDecWindow":         ".fernet_file_enc",
+    "CSVtoJSONWindow":             ".csv_to_json",
+    "JSONtoCSVWindow":             ".csv_to_json",
+    "Img2PDFWindow":               ".img_to_pdf",
+    "PDF2ImgWindow":               ".img_to_pdf",
+    "ExifImageWindow":             ".exif_images",
+    "ZipFileWithPwdWindow":        ".zip_files",
+    "ZipFolderWithPwdWindow":      ".zip_folders",
+    "BfPwdProtectedFilesWindow":   ".bf_pwd_protected_files",
+    "DisassembleExeFilesWindow":   ".dis_exe_files",
+    "DecompilePycFilesWindow":     ".decompile_pyc",
+    "JSONtoMsgPackWindow":         ".json_and_msgpack",
+    "MsgPacktoJSONWindow":         ".json_and_msgpack",
+    "JSONtoXMLWindow":             ".json_and_xml",
+    "XMLtoJSONWindow":             ".json_and_xml",
+    "PyCodeDisassemblerWindow":    ".python_code_disassembler",
+    "FileTypeDetectorWindow":      ".detect_file_type",
+    "PGPEncryptWindow":            ".pgpencryptor",
+    "PGPDecryptWindow":            ".pgpdecryptor",
+    "DecodeTXTFilesWindow":        ".decode_txt_files",
+    "xxdHexDumpWindow":            ".xxd_tool",
+    "FileMetadataExtractorWindow": ".file_metadata_extractor",
+    "HashFilesWindow":             ".file_hash_generator",
+    "CompareFileHashesWindow":     ".compare_hashes",
+    "FileStegToolWindow":          ".file_steganography",
+    "VirusDetectorWindow":         ".detect_virus",
+    "LogAnalyzerWindow":           ".log_analyzer",
+}
 
 __all__ = ["FernetFileEncWindow", "FernetFileDecWindow", "CSVtoJSONWindow", "JSONtoCSVWindow",
            "Img2PDFWindow", "PDF2ImgWindow", "ExifImageWindow", "ZipFileWithPwdWindow",
@@ -29,4 +40,11 @@ __all__ = ["FernetFileEncWindow", "FernetFileDecWindow", "CSVtoJSONWindow", "JSO
            "JSONtoXMLWindow", "XMLtoJSONWindow", "PyCodeDisassemblerWindow", "PGPEncryptWindow",
            "FileTypeDetectorWindow", "PGPDecryptWindow", "DecodeTXTFilesWindow", "xxdHexDumpWindow",
            "FileMetadataExtractorWindow", "HashFilesWindow", "CompareFileHashesWindow", "FileStegToolWindow",
-           "VirusDetectorWindow", "LogAnalyzerWindow"]
\ No newline at end of file
+           "VirusDetectorWindow", "LogAnalyzerWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets                import QMessageBox, QFileDialog, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
 from .file_conversion               import FileConversionWindow
-import os, time, zlib, pyzipper
+from .zip_cracker                   import ZipPasswordCracker
+from jobs                           import job_runner, show_job_error
+import os
 
 class BfPwdProtectedFilesWindow(FileConversionWindow):
 
@@ -38,8 +40,15 @@ class BfPwdProtectedFilesWindow(FileConversionWindow):
             bold=True, command=self.select_wl_file)
         select_wordlist_button.setGeometry(250, 60, 190, 50)
 
-        bf_button = DefaultButtonStyle("Brute Force", parent=self, bold=True, command=self.bf_file)
-        bf_button.setGeometry(500, 60, 130, 50)
+        self.bf_button = DefaultButtonStyle("Brute Force", parent=self, bold=True, command=self.bf_file)
+        self.bf_button.setGeometry(500, 60, 130, 50)
+
+        self.cancel_button = DefaultButtonStyle("Cancel", parent=self, bold=True, command=self.cancel_bf)
+        self.cancel_button.setGeometry(500, 120, 130, 50)
+        self.cancel_button.setEnabled(False)
+
+        self.crack_job = None
+        self.cracker = None
 
         self.selected_zipfile_label = QTextEdit(parent=self)
         self.selected_zipfile_label.setGeometry(30, 200, 300, 80)
@@ -67,6 +76,8 @@ class BfPwdProtectedFilesWindow(FileConversionWindow):
 
     def bf_file(self):
         try:
+            if self.crack_job is not None:
+                raise ValueError('A brute force run is already in progress.')
             if hasattr(self, 'selected_file'):
                 if hasattr(self, 'selected_wl_file'):
                     file_extension = os.path.splitext(self.selected_file)[1].lower()
@@ -80,33 +91,19 @@ class BfPwdProtectedFilesWindow(FileConversionWindow):
                         self.selected_wordlist_label.show()
 
                         if os.path.exists(self.selected_wl_file):
-                            start_bf = time.time()
-                            password = self.brute_force_zip(self.selected_file, self.selected_wl_file)
-                            end_bf = time.time()
-                            elapsed_time = end_bf - start_bf
-                            if password:
-                                msg_box = QMessageBox(self)
-                                msg_box.setWindowTitle('Brute Force Successful')
-                                msg_box.setText(f'File extracted at: {self.downloads_path}')
-                                msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                                open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                                msg_box.exec()
-                                if msg_box.clickedButton() == open_folder_btn:
-                                    self.open_downloads_folder()
-
-                                QMessageBox.warning(self, 'Success', f"Password found: {str(password)}")
-                                self.pwd_found.clear()
-                                self.pwd_found.setHtml(
-                                    f"<b>Password found:</b><br>{str(password)}<br>"
-                                    f"Time needed: {elapsed_time:.2f} seconds")
-                                self.pwd_found.show()
-                            else:
-                                QMessageBox.warning(self, 'Password Not Found', "No matching password was found in the wordlist.")
-                                self.pwd_found.clear()
-                                self.pwd_found.setHtml(
-                                    f"<b>Password Not found</b><br>"
-                                    f"Time passed: {elapsed_time:.2f} seconds")
-                                self.pwd_found.show()
+                            self.cracker = ZipPasswordCracker(self.selected_file, self.selected_wl_file)
+                            self.bf_button.setEnabled(False)
+                            self.cancel_button.setEnabled(True)
+                            self.pwd_found.clear()
+                            self.pwd_found.setHtml("<b>Starting workers...</b>")
+                            self.pwd_found.show()
+                            self.crack_job = job_runner().submit(
+                                self.crack, self.cracker, self.downloads_path, pass_job=True,
+                                owner=self,
+                                on_progress=self.show_progress,
+                                on_result=self.show_result,
+                                on_error=lambda e: show_job_error(self, e),
+                                on_finished=self.crack_finished)
                         else:
                             QMessageBox.warning(self, 'No Wordlist Selected', 'Please select a wordlist file.')
                     else:
@@ -120,26 +117,70 @@ class BfPwdProtectedFilesWindow(FileConversionWindow):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
-        
-    def brute_force_zip(self, zip_path, wordlist_path):
-        """Attempts to brute-force the password for the zip file using the provided wordlist.
-        Returns the password if found, else None."""
-        try:
-            with pyzipper.AESZipFile(zip_path, 'r') as zip_file:
-                # Open the wordlist with a more lenient encoding
-                with open(wordlist_path, 'r', encoding='ISO-8859-1', errors='ignore') as wordlist:
-                    for line in wordlist:
-                        password = line.strip()
-                        self.pwd_found.clear()
-                        self.pwd_found.setHtml(f"Trying password: {password}")
-                        self.pwd_found.show()
-                        try:
-                            zip_file.extractall(path=self.downloads_path, pwd=password.encode("utf-8"))
-                            return password  # Password found
-                        except (RuntimeError, zlib.error, pyzipper.BadZipFile):
-                            continue  # Ignore and try next password
-            return None  # Password not found
-        except FileNotFoundError:
-            QMessageBox.warning(self, 'File Not Found', 'The selected zip file or wordlist file could not be found.')
-        except pyzipper.BadZipFile as e:
-            QMessageBox.warning(self, 'BadZipFile', f'{e}')
+
+    @staticmethod
+    def crack(cracker, downloads_path, job):
+        """Runs as a background job. The cracker reports on the job thread, which is
+        also where a cancel request of the job is forwarded to the worker processes."""
+        def progress(attempts, rate):
+            if job.cancelled:
+                cracker.cancel()
+            job.report_progress((attempts, rate))
+
+        password = cracker.run(progress_callback=progress)
+        if password is not None:
+            cracker.extract(password, downloads_path)
+        return password
+
+    def cancel_bf(self):
+        if self.crack_job is not None:
+            self.crack_job.cancel()
+            self.cancel_button.setEnabled(False)
+
+    def crack_finished(self):
+        if self.crack_job.cancelled:
+            self.pwd_found.clear()
+            self.pwd_found.setHtml(
+                f"<b>Brute force cancelled</b><br>"
+                f"{self.cracker.attempts:,} passwords tried")
+            self.pwd_found.show()
+        self.crack_job = None
+        self.bf_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    def show_progress(self, progress):
+        attempts, rate = progress
+        self.pwd_found.setHtml(
+            f"<b>Passwords tried:</b> {attempts:,}<br>"
+            f"<b>Speed:</b> {rate:,.0f} passwords/sec")
+
+    def show_result(self, password):
+        elapsed_time = self.cracker.elapsed
+        attempts = self.cracker.attempts
+        if password is not None:
+            password = password.decode('utf-8', errors='replace')
+            self.pwd_found.clear()
+            self.pwd_found.setHtml(
+                f"<b>Password found:</b><br>{password}<br>"
+                f"Time needed: {elapsed_time:.2f} seconds ({attempts:,} passwords tried)")
+            self.pwd_found.show()
+
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle('Brute Force Successful')
+            msg_box.setText(f'Password found: {password}\nFile extracted at: {self.downloads_path}')
+            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+            open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+            msg_box.exec()
+            if msg_box.clickedButton() == open_folder_btn:
+                self.open_downloads_folder()
+        else:
+            QMessageBox.warning(self, 'Password Not Found', "No matching password was found in the wordlist.")
+            self.pwd_found.clear()
+            self.pwd_found.setHtml(
+                f"<b>Password Not found</b><br>"
+                f"Time passed: {elapsed_time:.2f} seconds ({attempts:,} passwords tried)")
+            self.pwd_found.show()
+
+    def closeEvent(self, event):
+        self.cancel_bf()
+        super().closeEvent(event)
@@ -1,6 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style import DefaultButtonStyle, DefaultAboutButtonStyle
-import os, hashlib, platform, time
+from jobs import job_runner, show_job_error
+from .multi_hasher import MultiDigestHasher, format_throughput
+import os, platform, time
 
 class CompareFileHashesWindow(QWidget):
 
@@ -40,12 +42,12 @@ class CompareFileHashesWindow(QWidget):
             command=self.select_second_file)
         select_file2_button.setGeometry(270, 30, 200, 50)
 
-        compare_button = DefaultButtonStyle(
+        self.compare_button = DefaultButtonStyle(
             'Compare Files',
             parent=self,
             bold=True,
             command=self.compare_files)
-        compare_button.setGeometry(490, 30, 150, 50)
+        self.compare_button.setGeometry(490, 30, 150, 50)
 
         self.result_display = QTextEdit(parent=self)
         self.result_display.setGeometry(10, 100, 680, 380)
@@ -70,60 +72,69 @@ class CompareFileHashesWindow(QWidget):
             self.file2 = file_path
             QMessageBox.information(self, 'File Selected', f'Second file: {file_path}')
 
-    def compute_hash(self, file_path, algo='sha256'):
-        h = hashlib.new(algo)
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
-
     def compare_files(self):
         try:
             if not hasattr(self, 'file1') or not hasattr(self, 'file2'):
                 raise ValueError("Please select both files before comparing.")
 
-            start_time = time.time()
-            hashes = {}
-
-            for algo in ['md5', 'sha1', 'sha256']:
-                hashes[algo] = {
-                    'file1': self.compute_hash(self.file1, algo),
-                    'file2': self.compute_hash(self.file2, algo)}
-
-            identical = all(
-                hashes[a]['file1'] == hashes[a]['file2']
-                for a in hashes)
-
-            elapsed = time.time() - start_time
-            result_color = "green" if identical else "red"
-            verdict = "Files are identical!" if identical else "Files differ!"
-
-            result_html = f"""
-            <h2>File Hash Comparison Report</h2>
-            <b>File 1:</b> {os.path.basename(self.file1)}<br>
-            <b>Path 1:</b> {self.file1}<br><br>
-            <b>File 2:</b> {os.path.basename(self.file2)}<br>
-            <b>Path 2:</b> {self.file2}<br>
-            <hr>
-            <b>Platform:</b> {platform.system()} {platform.release()}<br>
-            <b>Comparison Time:</b> {elapsed:.2f} seconds<br>
-            <hr>
-            <b>MD5:</b><br>
-            File 1: {hashes['md5']['file1']}<br>
-            File 2: {hashes['md5']['file2']}<br><br>
-            <b>SHA-1:</b><br>
-            File 1: {hashes['sha1']['file1']}<br>
-            File 2: {hashes['sha1']['file2']}<br><br>
-            <b>SHA-256:</b><br>
-            File 1: {hashes['sha256']['file1']}<br>
-            File 2: {hashes['sha256']['file2']}<br>
-            <hr>
-            <h3 style='color:{result_color}'>{verdict}</h3>"""
-
-            self.result_display.setHtml(result_html)
-            self.result_display.show()
+            self.compare_button.setEnabled(False)
+            job_runner().submit(
+                self.hash_files, self.file1, self.file2,
+                owner=self,
+                on_result=lambda result: self.show_comparison(*result),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.compare_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', f'An unexpected error occurred:\n{e}')
+
+    def hash_files(self, file1, file2):
+        """Runs as a background job. Each file is read once for all digests.
+        Returns (hashes, elapsed seconds, bytes per second)."""
+        start_time = time.time()
+        algorithms = ['md5', 'sha1', 'sha256']
+        hasher = MultiDigestHasher(algorithms)
+        digests1 = hasher.hash_file(file1)
+        bytes_hashed = hasher.bytes_hashed
+        digests2 = hasher.hash_file(file2)
+        bytes_hashed += hasher.bytes_hashed
+
+        hashes = {algo: {'file1': digests1[algo], 'file2': digests2[algo]} for algo in algorithms}
+        elapsed = time.time() - start_time
+        return hashes, elapsed, bytes_hashed / elapsed if elapsed else 0.0
+
+    def show_comparison(self, hashes, elapsed, throughput):
+        identical = all(
+            hashes[a]['file1'] == hashes[a]['file2']
+            for a in hashes)
+
+        result_color = "green" if identical else "red"
+        verdict = "Files are identical!" if identical else "Files differ!"
+
+        result_html = f"""
+        <h2>File Hash Comparison Report</h2>
+        <b>File 1:</b> {os.path.basename(self.file1)}<br>
+        <b>Path 1:</b> {self.file1}<br><br>
+        <b>File 2:</b> {os.path.basename(self.file2)}<br>
+        <b>Path 2:</b> {self.file2}<br>
+        <hr>
+        <b>Platform:</b> {platform.system()} {platform.release()}<br>
+        <b>Comparison Time:</b> {elapsed:.2f} seconds<br>
+        <b>Throughput:</b> {format_throughput(throughput)}<br>
+        <hr>
+        <b>MD5:</b><br>
+        File 1: {hashes['md5']['file1']}<br>
+        File 2: {hashes['md5']['file2']}<br><br>
+        <b>SHA-1:</b><br>
+        File 1: {hashes['sha1']['file1']}<br>
+        File 2: {hashes['sha1']['file2']}<br><br>
+        <b>SHA-256:</b><br>
+        File 1: {hashes['sha256']['file1']}<br>
+        File 2: {hashes['sha256']['file2']}<br>
+        <hr>
+        <h3 style='color:{result_color}'>{verdict}</h3>"""
+
+        self.result_display.setHtml(result_html)
+        self.result_display.show()
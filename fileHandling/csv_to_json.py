@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
+from jobs                           import job_runner
 from .file_conversion               import FileConversionWindow
 import pandas                       as pd
 import json, os
@@ -47,8 +48,8 @@ class CSVtoJSONWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -61,36 +62,15 @@ class CSVtoJSONWindow(FileConversionWindow):
                 file_extension = os.path.splitext(self.selected_file)[1].lower()
 
                 if file_extension == '.csv':
-                    # df: data_frame
-                    df = pd.read_csv(self.selected_file)
-                
-                    json_data = df.to_json(orient='records', indent=4)
-                
-                    base_name = os.path.basename(self.selected_file)
-                    json_file_name = os.path.splitext(base_name)[0] + '.json'
-                    json_file_path = os.path.join(self.downloads_path, json_file_name)
-                
-                    with open(json_file_path, 'w') as json_file:
-                        json_file.write(json_data)
-
-                    # Show a custom message box with a button to open the Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Conversion Successful')
-                    msg_box.setText(f'File converted and saved at: {json_file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a custom button for opening the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # If the user clicks "Open Downloads", open the Downloads folder
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-                    
-                    self.output_label.clear()
-                    self.output_label.setHtml(
-                        f"<b>{self.selected_file} converted successfully to a JSON file. JSON file created and saved at:</b> <br>{self.downloads_path}")
-                    self.output_label.show()
+                    self.convert_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_json, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: QMessageBox.critical(
+                            self, 'Conversion Failed',
+                            f'An error occurred during conversion: {str(e)}'),
+                        on_finished=lambda: self.convert_button.setEnabled(True))
                 else:
                     QMessageBox.warning(
                         self, 'Invalid File Type',
@@ -103,6 +83,41 @@ class CSVtoJSONWindow(FileConversionWindow):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
 
+    @staticmethod
+    def to_json(selected_file, downloads_path):
+        # df: data_frame
+        df = pd.read_csv(selected_file)
+
+        json_data = df.to_json(orient='records', indent=4)
+
+        base_name = os.path.basename(selected_file)
+        json_file_name = os.path.splitext(base_name)[0] + '.json'
+        json_file_path = os.path.join(downloads_path, json_file_name)
+
+        with open(json_file_path, 'w') as json_file:
+            json_file.write(json_data)
+        return json_file_path
+
+    def show_result(self, json_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {json_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(
+            f"<b>{self.selected_file} converted successfully to a JSON file. JSON file created and saved at:</b> <br>{self.downloads_path}")
+        self.output_label.show()
+
 # =================================================================================================================================
 
 class JSONtoCSVWindow(FileConversionWindow):
@@ -148,8 +163,8 @@ class JSONtoCSVWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -163,37 +178,15 @@ class JSONtoCSVWindow(FileConversionWindow):
                 file_extension = os.path.splitext(self.selected_file)[1].lower()
                 
                 if file_extension == '.json':
-                    # Load the JSON file into a DataFrame
-                    with open(self.selected_file, 'r') as json_file:
-                        data = json.load(json_file)
-                    df = pd.DataFrame(data)
-                    
-                    # Create a CSV file name based on the original JSON file name
-                    base_name = os.path.basename(self.selected_file)
-                    csv_file_name = os.path.splitext(base_name)[0] + '.csv'
-                    csv_file_path = os.path.join(self.downloads_path, csv_file_name)
-                    
-                    # Write the DataFrame to a CSV file
-                    df.to_csv(csv_file_path, index=False)
-                    
-                    # Show a custom message box with a button to open the Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Conversion Successful')
-                    msg_box.setText(f'File converted and saved at: {csv_file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a custom button for opening the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # If the user clicks "Open Downloads", open the Downloads folder
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-                    
-                    self.output_label.clear()
-                    self.output_label.setHtml(
-                        f"<b>{self.selected_file} converted successfully to a CSV file. CSV file created and saved at:</b> <br>{self.downloads_path}")
-                    self.output_label.show()
+                    self.convert_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_csv, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: QMessageBox.critical(
+                            self, 'Conversion Failed',
+                            f'An error occurred during conversion: {str(e)}'),
+                        on_finished=lambda: self.convert_button.setEnabled(True))
                 else:
                     QMessageBox.warning(
                         self, 'Invalid File Type',
@@ -205,3 +198,39 @@ class JSONtoCSVWindow(FileConversionWindow):
                     f'An error occurred during conversion: {str(e)}')
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
+
+    @staticmethod
+    def to_csv(selected_file, downloads_path):
+        # Load the JSON file into a DataFrame
+        with open(selected_file, 'r') as json_file:
+            data = json.load(json_file)
+        df = pd.DataFrame(data)
+
+        # Create a CSV file name based on the original JSON file name
+        base_name = os.path.basename(selected_file)
+        csv_file_name = os.path.splitext(base_name)[0] + '.csv'
+        csv_file_path = os.path.join(downloads_path, csv_file_name)
+
+        # Write the DataFrame to a CSV file
+        df.to_csv(csv_file_path, index=False)
+        return csv_file_path
+
+    def show_result(self, csv_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {csv_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(
+            f"<b>{self.selected_file} converted successfully to a CSV file. CSV file created and saved at:</b> <br>{self.downloads_path}")
+        self.output_label.show()
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets            import QMessageBox, QTextEdit
 from DefaultStyles.button_style import DefaultButtonStyle
 from .file_conversion           import FileConversionWindow
+from jobs                       import job_runner, show_job_error
 import os, base64
 
 class DecodeTXTFilesWindow(FileConversionWindow):
@@ -35,8 +36,8 @@ class DecodeTXTFilesWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        decode_button = DefaultButtonStyle("Decode", parent=self, bold=True, command=self.decode)
-        decode_button.setGeometry(450, 50, 100, 50)
+        self.decode_button = DefaultButtonStyle("Decode", parent=self, bold=True, command=self.decode)
+        self.decode_button.setGeometry(450, 50, 100, 50)
 
         self.b64_output_label = QTextEdit(parent=self)
         self.b64_output_label.setGeometry(10, 130, 680, 100)
@@ -57,41 +58,51 @@ class DecodeTXTFilesWindow(FileConversionWindow):
             if not os.path.isfile(self.selected_file):
                 raise ValueError('Selected file does not exist.')
             
-            # read the encoded text
-            with open(self.selected_file, 'r') as file:
-                encoded_data = file.read()
-            try:
-                b64_decoded_data = base64.b64decode(encoded_data)
-                self.b64_output_label.clear()
-                self.b64_output_label.setPlainText(f"Base64 Decoded Data:\n\n{b64_decoded_data.decode(errors='ignore')}")
-                self.b64_output_label.show()
-
-                file_name = os.path.basename(self.selected_file)
-                b64_decoded_file_path = os.path.join(self.downloads_path, f'{file_name}.b64_decoded')
-
-                with open(b64_decoded_file_path, 'wb') as decoded_file:
-                    decoded_file.write(b64_decoded_data)
-                
-            except Exception:
-                raise ValueError('The .txt file does not contain valid base64-encoded data.')
-           
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle('Operation Successful')
-            msg_box.setText(f'Decoded file saved to:\n{b64_decoded_file_path}')
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-            open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-            msg_box.exec()
-
-            if msg_box.clickedButton() == open_folder_btn:
-                self.open_downloads_folder()
-
-            self.b64_decoded_file_path_label.clear()
-            self.b64_decoded_file_path_label.setHtml(f"<b>Decoded file generated and saved at:</b><br> {b64_decoded_file_path}")
-            self.b64_decoded_file_path_label.show()
+            self.decode_button.setEnabled(False)
+            job_runner().submit(
+                self.decode_file, self.selected_file, self.downloads_path,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: show_job_error(self, e, 'Failed to Decode'),
+                on_finished=lambda: self.decode_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
-        except Exception as e:
-            QMessageBox.critical(
-                self, 'Failed to Decode',
-                f'Error: {str(e)}')
+
+    @staticmethod
+    def decode_file(selected_file, downloads_path):
+        # read the encoded text
+        with open(selected_file, 'r') as file:
+            encoded_data = file.read()
+        try:
+            b64_decoded_data = base64.b64decode(encoded_data)
+
+            file_name = os.path.basename(selected_file)
+            b64_decoded_file_path = os.path.join(downloads_path, f'{file_name}.b64_decoded')
+
+            with open(b64_decoded_file_path, 'wb') as decoded_file:
+                decoded_file.write(b64_decoded_data)
+
+        except Exception:
+            raise ValueError('The .txt file does not contain valid base64-encoded data.')
+        return b64_decoded_data, b64_decoded_file_path
+
+    def show_result(self, result):
+        b64_decoded_data, b64_decoded_file_path = result
+        self.b64_output_label.clear()
+        self.b64_output_label.setPlainText(f"Base64 Decoded Data:\n\n{b64_decoded_data.decode(errors='ignore')}")
+        self.b64_output_label.show()
+
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Operation Successful')
+        msg_box.setText(f'Decoded file saved to:\n{b64_decoded_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.b64_decoded_file_path_label.clear()
+        self.b64_decoded_file_path_label.setHtml(f"<b>Decoded file generated and saved at:</b><br> {b64_decoded_file_path}")
+        self.b64_decoded_file_path_label.show()
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from .file_conversion               import FileConversionWindow
+from jobs                           import job_runner
 from uncompyle6.main                import decompile
 import os, sys, io
 
@@ -26,8 +27,8 @@ class DecompilePycFilesWindow(FileConversionWindow):
             command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.decompile)
-        submit_button.setGeometry(450, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.decompile)
+        self.submit_button.setGeometry(450, 50, 100, 50)
 
         self.code_label = QTextEdit(parent=self)
         self.code_label.setGeometry(10, 130, 680, 500)
@@ -39,11 +40,13 @@ class DecompilePycFilesWindow(FileConversionWindow):
             try:
                 file_extension = os.path.splitext(self.selected_file)[1].lower()
                 if file_extension in ['.pyc']:
-                    source_code = self.decompile_pyc(self.selected_file)
-                    if source_code:
-                        self.code_label.clear()
-                        self.code_label.setHtml(f"<b>Decompiled code:</b><br>{source_code}")
-                        self.code_label.show()
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decompile_pyc, self.selected_file,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: QMessageBox.critical(self, 'Operation Failed', f'An error occurred: {str(e)}'),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     QMessageBox.warning(self, 'Invalid File Type', 'Please select a .pyc file.')
                     raise ValueError('Invalid file type')
@@ -54,7 +57,14 @@ class DecompilePycFilesWindow(FileConversionWindow):
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
             raise ValueError('No file selected')
     
-    def decompile_pyc(self, pyc_file_path):
+    def show_result(self, source_code):
+        if source_code:
+            self.code_label.clear()
+            self.code_label.setHtml(f"<b>Decompiled code:</b><br>{source_code}")
+            self.code_label.show()
+
+    @staticmethod
+    def decompile_pyc(pyc_file_path):
         python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
 
         with open(pyc_file_path, 'rb') as file:
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
 from .file_conversion               import FileConversionWindow
+from jobs                           import job_runner, show_job_error
 import binascii, os, puremagic
 
 class FileTypeDetectorWindow(FileConversionWindow):
@@ -36,8 +37,8 @@ class FileTypeDetectorWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.detect_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.detect_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 200)
@@ -47,18 +48,29 @@ class FileTypeDetectorWindow(FileConversionWindow):
         try:
             if hasattr(self, 'selected_file'):
                 detector = FileTypeDetector()
-                file_type_results = detector.detect(self.selected_file)
-
-                self.output_label.clear()
-                self.output_label.setHtml(f"{file_type_results}")
-                self.output_label.show()
+                self.convert_button.setEnabled(False)
+                job_runner().submit(
+                    detector.detect, self.selected_file,
+                    owner=self,
+                    on_result=self.show_result,
+                    on_error=self.show_error,
+                    on_finished=lambda: self.convert_button.setEnabled(True))
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
-        except FileNotFoundError as fnf:
-            QMessageBox.warning(self, 'File not found', str(fnf))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    def show_result(self, file_type_results):
+        self.output_label.clear()
+        self.output_label.setHtml(f"{file_type_results}")
+        self.output_label.show()
+
+    def show_error(self, error):
+        if isinstance(error, FileNotFoundError):
+            QMessageBox.warning(self, 'File not found', str(error))
+        else:
+            show_job_error(self, error)
+
 class FileTypeDetector:
 
     def detect(self, file_path):
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
 from .file_conversion               import FileConversionWindow
+from jobs                           import job_runner
 import os, yara
 
 class VirusDetectorWindow(FileConversionWindow):
@@ -23,8 +24,8 @@ class VirusDetectorWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        scan_file_button = DefaultButtonStyle("Scan", parent=self, bold=True, command=self.scan_file)
-        scan_file_button.setGeometry(450, 50, 100, 50)
+        self.scan_file_button = DefaultButtonStyle("Scan", parent=self, bold=True, command=self.scan_file)
+        self.scan_file_button.setGeometry(450, 50, 100, 50)
 
         self.result_output_label = QTextEdit(parent=self)
         self.result_output_label.setGeometry(10, 130, 680, 200)
@@ -42,17 +43,13 @@ class VirusDetectorWindow(FileConversionWindow):
             if not os.path.exists(yara_rules_path):
                 raise FileNotFoundError(f"YARA rule file not found at {yara_rules_path}")
             
-            rules = yara.compile(filepath=yara_rules_path)
-            matches = rules.match(self.selected_file)
-
-            if matches:
-                self.result_output_label.clear()
-                self.result_output_label.setPlainText("Suspicious patterns/matches detected:\n\n" + "\n".join([str(m) for m in matches]))
-                self.result_output_label.show()
-            else:
-                self.result_output_label.clear()
-                self.result_output_label.setPlainText(f"File appears to be clean.")
-                self.result_output_label.show()
+            self.scan_file_button.setEnabled(False)
+            job_runner().submit(
+                self.scan, yara_rules_path, self.selected_file,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: QMessageBox.critical(self, "Unexpected Error", f"Error scanning file: {str(e)}"),
+                on_finished=lambda: self.scan_file_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
@@ -60,3 +57,18 @@ class VirusDetectorWindow(FileConversionWindow):
             QMessageBox.warning(self, "Error", f"File not found: {self.selected_file}")
         except Exception as e:
             QMessageBox.critical(self, "Unexpected Error", f"Error scanning file: {str(e)}")
+
+    @staticmethod
+    def scan(yara_rules_path, selected_file):
+        rules = yara.compile(filepath=yara_rules_path)
+        return rules.match(selected_file)
+
+    def show_result(self, matches):
+        if matches:
+            self.result_output_label.clear()
+            self.result_output_label.setPlainText("Suspicious patterns/matches detected:\n\n" + "\n".join([str(m) for m in matches]))
+            self.result_output_label.show()
+        else:
+            self.result_output_label.clear()
+            self.result_output_label.setPlainText(f"File appears to be clean.")
+            self.result_output_label.show()
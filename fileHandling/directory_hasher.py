@@ -0,0 +1,158 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib            import Path
+from .multi_hasher      import MultiDigestHasher
+import os, json, time, sqlite3, platform
+
+DEFAULT_CACHE_PATH = Path.home() / ".cryptology_playground" / "hash_cache.sqlite3"
+
+class DigestCache:
+    """On-disk cache of file digests keyed by path and validated by (device, inode, size, mtime).
+
+    A cached entry is only reused when the file still has the same inode, size and
+    modification time, so unchanged files are skipped on re-runs."""
+
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH):
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(cache_path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS digests ("
+            "path TEXT PRIMARY KEY, dev INTEGER, inode INTEGER, size INTEGER, mtime_ns INTEGER, digests TEXT)")
+
+    def lookup(self, path, st, algorithms):
+        """Returns the cached {algorithm: hexdigest} for the file, or None if it changed or is missing an algorithm."""
+        row = self.connection.execute(
+            "SELECT dev, inode, size, mtime_ns, digests FROM digests WHERE path = ?", (path,)).fetchone()
+        if row is None or row[:4] != (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns):
+            return None
+        digests = json.loads(row[4])
+        if not all(algo in digests for algo in algorithms):
+            return None
+        return {algo: digests[algo] for algo in algorithms}
+
+    def store_many(self, entries):
+        """entries: iterable of (path, stat_result, {algorithm: hexdigest})."""
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO digests VALUES (?, ?, ?, ?, ?, ?)",
+            [(path, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, json.dumps(digests))
+             for path, st, digests in entries])
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+def walk_files(root):
+    """Yields (path, stat_result) for every regular file below root, without following symlinks."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry.path, entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+class DirectoryHasher:
+    """Hashes every file of a directory tree on a thread pool, reusing cached digests
+    of unchanged files, and writes sha256sum-compatible and JSON manifests."""
+
+    def __init__(self, root, algorithms=('sha256',), workers=None, cache=None, batch_size=1000):
+        self.root = os.path.abspath(root)
+        self.algorithms = list(algorithms)
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4) # threads, hashing is mostly I/O bound
+        self.cache = cache
+        self.batch_size = batch_size
+        self.hashed = 0
+        self.cached = 0
+        self.failed = {}
+        self.elapsed = 0.0
+
+    def _hash_one(self, path):
+        try:
+            return MultiDigestHasher(self.algorithms).hash_file(path)
+        except OSError as e:
+            return e
+
+    def hash_tree(self, progress_callback=None):
+        """Returns {relative path: {algorithm: hexdigest}} sorted by path.
+        progress_callback(files_done, files_total) is called after every batch."""
+        start_time = time.perf_counter()
+        files = list(walk_files(self.root))
+        total = len(files)
+        results = {}
+        to_hash = []
+
+        for path, st in files:
+            cached = self.cache.lookup(path, st, self.algorithms) if self.cache else None
+            if cached is not None:
+                results[path] = cached
+            else:
+                to_hash.append((path, st))
+        self.cached = len(results)
+        if progress_callback:
+            progress_callback(self.cached, total)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for start in range(0, len(to_hash), self.batch_size):
+                batch = to_hash[start:start + self.batch_size]
+                fresh = []
+                for (path, st), digests in zip(batch, pool.map(self._hash_one, [path for path, _ in batch])):
+                    if isinstance(digests, OSError):
+                        self.failed[path] = str(digests)
+                        continue
+                    results[path] = digests
+                    fresh.append((path, st, digests))
+                if self.cache:
+                    self.cache.store_many(fresh)
+                self.hashed += len(fresh)
+                if progress_callback:
+                    progress_callback(self.cached + start + len(batch), total)
+
+        self.elapsed = time.perf_counter() - start_time
+        return {os.path.relpath(path, self.root): results[path] for path in sorted(results)}
+
+    def write_manifests(self, results, output_dir, name="manifest"):
+        """Writes <name>.<algo> files in `<hexdigest>  <path>` (sha256sum -c) format and <name>.json
+        to output_dir, which is created if needed. Returns the list of written paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        written = []
+        for algo in self.algorithms:
+            manifest_path = os.path.join(output_dir, f"{name}.{algo}")
+            with open(manifest_path, 'w', encoding='utf-8', newline='\n') as f:
+                for rel_path, digests in results.items():
+                    f.write(f"{digests[algo]}  {Path(rel_path).as_posix()}\n")
+            written.append(manifest_path)
+
+        json_path = os.path.join(output_dir, f"{name}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "root": self.root,
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "platform": f"{platform.system()} {platform.release()}",
+                "algorithms": self.algorithms,
+                "files": {Path(rel_path).as_posix(): digests for rel_path, digests in results.items()},
+                "errors": self.failed}, f, indent=2)
+        written.append(json_path)
+        return written
+
+def compare_with_manifest(results, manifest_path, failed=()):
+    """Compares fresh results with a JSON manifest written by DirectoryHasher. Files that could
+    not be hashed this time (`failed`, relative paths) are errors, not missing files.
+    Returns (changed, missing, added) lists of relative paths."""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        previous = json.load(f)["files"]
+    current = {Path(rel_path).as_posix(): digests for rel_path, digests in results.items()}
+    changed = sorted(p for p in current.keys() & previous.keys()
+                     if any(current[p].get(algo) != digest for algo, digest in previous[p].items()
+                            if algo in current[p]))
+    missing = sorted(previous.keys() - current.keys() - {Path(rel_path).as_posix() for rel_path in failed})
+    added = sorted(current.keys() - previous.keys())
+    return changed, missing, added
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from .file_conversion               import FileConversionWindow
+from jobs                           import job_runner
 from capstone                       import *
 from capstone.x86                   import *
 import os, pefile, json
@@ -53,8 +54,8 @@ class DisassembleExeFilesWindow(FileConversionWindow):
             items=['.json', '.txt', '.xml'])
         self.output_format_options.setGeometry(300, 50, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.disassemble_file)
-        submit_button.setGeometry(500, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.disassemble_file)
+        self.submit_button.setGeometry(500, 50, 100, 50)
 
         self.data_label = QTextEdit(parent=self)
         self.data_label.setGeometry(10, 130, 680, 500)
@@ -72,50 +73,13 @@ class DisassembleExeFilesWindow(FileConversionWindow):
                     output_extension = output_file_format.strip('.')
                     file_path = os.path.join(self.downloads_path, f'disassembled_file.{output_extension}')
 
-                    try:
-                        # Parse the .exe file
-                        exe = pefile.PE(self.selected_file)
-                        try:
-                            result = self.fine_disassemble(exe)
-                            self.data_label.clear()
-                            formatted_result = "<br>".join(result)
-                            self.data_label.setHtml(f"<b>Data (instructions):</b><br>{formatted_result}")
-                            self.data_label.show()
-                        except Exception as disassembly_error:
-                            QMessageBox.critical(self, 'Disassembly Error', f'Error in disassembling file:\n{str(disassembly_error)}')
-                        try:    
-                            # Save disassembly in preferred format
-                            with open(file_path, 'w', encoding='utf-8') as file:
-                                if output_file_format == '.json':
-                                    json.dump(result, file, indent=4)
-                                elif output_file_format == '.txt':
-                                    file.write("\n".join(result))
-                                elif output_file_format == '.xml':
-                                    file.write("<disassembly>\n")
-                                    for line in result:
-                                        file.write(f"    <instruction>{line}</instruction>\n")
-                                    file.write("</disassembly>\n")
-                                else:
-                                    file.write("\n".join(result))  # Fallback to plain text if the format is unrecognized
-
-                        except Exception as save_error:
-                            QMessageBox.critical(self, 'Save Error', f'Failed to save file:\n{str(save_error)}')
-                    except Exception as parse_error:
-                        QMessageBox.critical(self, 'Parse Error', f'PE file parsing failed: {str(parse_error)}')
-
-                    # Show a message box to confirm file save location
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Operation Successful')
-                    msg_box.setText(f'File saved at: {file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a button to open the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # Open Downloads folder if selected
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.disassemble, self.selected_file, file_path, output_file_format,
+                        owner=self,
+                        on_result=lambda result: self.show_result(result, file_path),
+                        on_error=lambda e: QMessageBox.critical(self, 'Operation Failed', f'An error occurred: {str(e)}'),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     QMessageBox.warning(self, 'Invalid File Type', 'Please select a .exe file for conversion.')
             except Exception as e:
@@ -123,37 +87,72 @@ class DisassembleExeFilesWindow(FileConversionWindow):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
 
+    def disassemble(self, selected_file, file_path, output_file_format):
+        # Parse the .exe file
+        exe = pefile.PE(selected_file)
+        result = self.fine_disassemble(exe)
+
+        # Save disassembly in preferred format
+        with open(file_path, 'w', encoding='utf-8') as file:
+            if output_file_format == '.json':
+                json.dump(result, file, indent=4)
+            elif output_file_format == '.txt':
+                file.write("\n".join(result))
+            elif output_file_format == '.xml':
+                file.write("<disassembly>\n")
+                for line in result:
+                    file.write(f"    <instruction>{line}</instruction>\n")
+                file.write("</disassembly>\n")
+            else:
+                file.write("\n".join(result))  # Fallback to plain text if the format is unrecognized
+        return result
+
+    def show_result(self, result, file_path):
+        self.data_label.clear()
+        formatted_result = "<br>".join(result)
+        self.data_label.setHtml(f"<b>Data (instructions):</b><br>{formatted_result}")
+        self.data_label.show()
+
+        # Show a message box to confirm file save location
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Operation Successful')
+        msg_box.setText(f'File saved at: {file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a button to open the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # Open Downloads folder if selected
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
 # https://isleem.medium.com/create-your-own-disassembler-in-python-pefile-capstone-754f863b2e1c
     def fine_disassemble(self, exe):
-        try:
-            data_list = []
-            #get main code section
-            main_code = self.get_main_code_section(exe.sections, exe.OPTIONAL_HEADER.BaseOfCode)
-            #define architecutre of the machine 
-            is_64bit = exe.FILE_HEADER.Machine == 0x8664
-            md = Cs(CS_ARCH_X86, CS_MODE_64 if is_64bit else CS_MODE_32)
-            md.detail = True
-            last_address = 0
-            last_size = 0
-            #Beginning of code section
-            begin = main_code.PointerToRawData
-            #the end of the first continuous bloc of code
-            end = begin+main_code.SizeOfRawData
-            while True:
-                #parse code section and disassemble it
-                data = exe.get_memory_mapped_image()[begin:end]
-                for i in md.disasm(data, begin):
-                    data_list.append(f"{i.address:x}: {i.mnemonic} {i.op_str}")
-                    last_address = int(i.address)
-                    last_size = i.size
-                #sometimes you need to skip some bytes
-                begin = max(int(last_address),begin)+last_size+1
-                if begin >= end:
-                    return data_list
-        except ValueError as ve:
-            QMessageBox.warning(self, 'Error', str(ve))
-        except Exception as e:
-            QMessageBox.critical(self, 'Unexpeted Error', str(e))
+        data_list = []
+        #get main code section
+        main_code = self.get_main_code_section(exe.sections, exe.OPTIONAL_HEADER.BaseOfCode)
+        #define architecutre of the machine 
+        is_64bit = exe.FILE_HEADER.Machine == 0x8664
+        md = Cs(CS_ARCH_X86, CS_MODE_64 if is_64bit else CS_MODE_32)
+        md.detail = True
+        last_address = 0
+        last_size = 0
+        #Beginning of code section
+        begin = main_code.PointerToRawData
+        #the end of the first continuous bloc of code
+        end = begin+main_code.SizeOfRawData
+        while True:
+            #parse code section and disassemble it
+            data = exe.get_memory_mapped_image()[begin:end]
+            for i in md.disasm(data, begin):
+                data_list.append(f"{i.address:x}: {i.mnemonic} {i.op_str}")
+                last_address = int(i.address)
+                last_size = i.size
+            #sometimes you need to skip some bytes
+            begin = max(int(last_address),begin)+last_size+1
+            if begin >= end:
+                return data_list
     
     #the function takes two arguments, both are fetched from the exe file using
     #pefile. the first one is the list of all sections. The second one is the
@@ -4,6 +4,7 @@ from PIL                        import Image
 from PIL.ExifTags               import TAGS
 from .file_conversion           import FileConversionWindow
 from exiftool                   import ExifToolHelper
+from jobs                       import job_runner
 import os
 
 '''
@@ -49,8 +50,8 @@ class ExifImageWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        exif_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.exif_data)
-        exif_button.setGeometry(450, 50, 100, 50)
+        self.exif_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.exif_data)
+        self.exif_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -62,44 +63,63 @@ class ExifImageWindow(FileConversionWindow):
             if not hasattr(self, 'selected_file'):
                 raise ValueError('Please select a file first.')
 
-            helper = ExifToolHelper()  # Use system PATH
-            with helper as et:
-                metadata = et.get_metadata([self.selected_file])
+            self.exif_button.setEnabled(False)
+            job_runner().submit(
+                self.save_metadata, self.selected_file,
+                owner=self,
+                on_result=self.show_result,
+                on_error=self.show_error,
+                on_finished=lambda: self.exif_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
 
-                if not metadata:
-                    QMessageBox.information(self, 'No Metadata', 'No EXIF metadata found in this image.')
-                    return
+    @staticmethod
+    def save_metadata(selected_file):
+        helper = ExifToolHelper()  # Use system PATH
+        with helper as et:
+            metadata = et.get_metadata([selected_file])
 
-                metadata_file_path = os.path.join(os.path.expanduser('~'), 'Downloads', 'image_metadata.txt')
+            if not metadata:
+                return None
 
-                metadata_str = "Metadata for the selected image:\n\n"
-                for tag, value in metadata[0].items():
-                    metadata_str += f"{tag}: {value}\n"
+            metadata_file_path = os.path.join(os.path.expanduser('~'), 'Downloads', 'image_metadata.txt')
 
-                with open(metadata_file_path, 'w') as f:
-                    f.write(metadata_str)
+            metadata_str = "Metadata for the selected image:\n\n"
+            for tag, value in metadata[0].items():
+                metadata_str += f"{tag}: {value}\n"
 
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle('Operation Successful')
-                msg_box.setText(f'Metadata saved to:\n{metadata_file_path}')
-                msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                msg_box.exec()
+            with open(metadata_file_path, 'w') as f:
+                f.write(metadata_str)
+            return metadata_file_path
 
-                if msg_box.clickedButton() == open_folder_btn:
-                    self.open_downloads_folder()
+    def show_result(self, metadata_file_path):
+        if metadata_file_path is None:
+            QMessageBox.information(self, 'No Metadata', 'No EXIF metadata found in this image.')
+            return
 
-                self.output_label.clear()
-                self.output_label.setHtml(f"<b>Metadata generated and saved at:</b><br> {metadata_file_path}")
-                self.output_label.show()
-        except ValueError as ve:
-            QMessageBox.warning(self, 'Error', str(ve))
-        except FileNotFoundError:
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Operation Successful')
+        msg_box.setText(f'Metadata saved to:\n{metadata_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>Metadata generated and saved at:</b><br> {metadata_file_path}")
+        self.output_label.show()
+
+    def show_error(self, error):
+        if isinstance(error, ValueError):
+            QMessageBox.warning(self, 'Error', str(error))
+        elif isinstance(error, FileNotFoundError):
             QMessageBox.critical(
                 self, 'ExifTool Missing',
                 "ExifTool is not found. Please install it and ensure it's in your system PATH.\n"
                 "https://exiftool.org/")
-        except Exception as e:
+        else:
             QMessageBox.critical(
                 self, 'Failed to Extract Metadata',
-                f'Error: {str(e)}')
+                f'Error: {str(error)}')
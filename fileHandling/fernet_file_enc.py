@@ -2,6 +2,8 @@ from PyQt6.QtWidgets                import QWidget, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle
 from DefaultStyles.qtextedit_style  import DefaultQTextEditStyle
 from .file_conversion                import FileConversionWindow
+from .fernet_stream                 import FernetStream, decrypt_legacy_file
+from jobs                           import job_runner, show_job_error
 from cryptography.fernet            import Fernet
 import os
 
@@ -38,8 +40,8 @@ class FernetFileEncWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.encrypt_file)
-        encrypt_button.setGeometry(450, 50, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.encrypt_file)
+        self.encrypt_button.setGeometry(450, 50, 100, 50)
 
         self.selected_file_label = DefaultQTextEditStyle(parent=self)
         self.selected_file_label.setGeometry(150, 180, 350, 100)
@@ -61,7 +63,6 @@ class FernetFileEncWindow(FileConversionWindow):
             if hasattr(self, 'selected_file'):
                 self.set_selected_file_label(selected_file=self.selected_file)
                 key = Fernet.generate_key()
-                cipher = Fernet(key)
                 key_file_path = os.path.join(self.downloads_path, 'encryption_key.key')
                 with open(key_file_path, 'wb') as key_file:
                     key_file.write(key)
@@ -69,26 +70,15 @@ class FernetFileEncWindow(FileConversionWindow):
                 file_name = os.path.basename(self.selected_file)
                 encrypted_file_path = os.path.join(self.downloads_path, f'{file_name}.encrypted')
 
-                with open(self.selected_file, 'rb') as file:
-                    file_data = file.read()
-                encrypted_data = cipher.encrypt(file_data)
-
-                # Write the encrypted data to the specified path
-                with open(encrypted_file_path, 'wb') as encrypted_file:
-                    encrypted_file.write(encrypted_data)
-
-                # custom message box with a button to open the Downloads folder
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle('Encryption Successful')
-                msg_box.setText(
-                    f'Encrypted file saved at:\n {encrypted_file_path}\n\n Encryption key saved at:\n {key_file_path}')
-                msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                msg_box.exec()
-                self.set_encrypted_path_label(encrypted_file=encrypted_file_path, encryption_key=key_file_path)
-
-                if msg_box.clickedButton() == open_folder_btn:
-                    self.open_downloads_folder()
+                # Encrypted in segments on a background job, so files larger than RAM work too
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.run_encryption, FernetStream(key), self.selected_file, encrypted_file_path, pass_job=True,
+                    owner=self,
+                    on_progress=lambda percent: self.encrypted_path_label.setHtml(f"<b>Encrypting...</b> {percent}%"),
+                    on_result=lambda path: self.show_encryption_result(path, key_file_path),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 raise ValueError('Please select a file first.')
         except ValueError as ve:
@@ -96,6 +86,27 @@ class FernetFileEncWindow(FileConversionWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def run_encryption(stream, input_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return stream.encrypt_file(input_path, output_path, progress_callback=progress)
+
+    def show_encryption_result(self, encrypted_file_path, key_file_path):
+        # custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Encryption Successful')
+        msg_box.setText(
+            f'Encrypted file saved at:\n {encrypted_file_path}\n\n Encryption key saved at:\n {key_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        self.set_encrypted_path_label(encrypted_file=encrypted_file_path, encryption_key=key_file_path)
+
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
 # ===================================================================================================================================
 
 class FernetFileDecWindow(FileConversionWindow):
@@ -133,8 +144,8 @@ class FernetFileDecWindow(FileConversionWindow):
             'Select Key File', parent=self, bold=True, command=self.select_file)
         select_key_button.setGeometry(215, 60, 150, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.decrypt_file)
-        decrypt_button.setGeometry(420, 60, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.decrypt_file)
+        self.decrypt_button.setGeometry(420, 60, 100, 50)
 
         self.selected_file_label = DefaultQTextEditStyle(parent=self)
         self.selected_file_label.setGeometry(20, 150, 470, 100)
@@ -169,37 +180,56 @@ class FernetFileDecWindow(FileConversionWindow):
 
             # Read the encryption key
             with open(self.selected_key_file_path, 'rb') as key_file:
-                key = key_file.read()
-            cipher = Fernet(key)
-
-            # Read the encrypted file
-            with open(self.selected_file_path, 'rb') as encrypted_file:
-                encrypted_data = encrypted_file.read()
-
-            # Decrypt the data
-            decrypted_data = cipher.decrypt(encrypted_data)
+                key = key_file.read().strip()
 
-            # Save the decrypted file
             original_file_name = os.path.basename(self.selected_file_path).replace('.encrypted', '')
             decrypted_file_path = os.path.join(self.downloads_path, f'decrypted_{original_file_name}')
 
-            with open(decrypted_file_path, 'wb') as decrypted_file:
-                decrypted_file.write(decrypted_data)
-
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle('Decryption Successful')
-            msg_box.setText(f'File decrypted and saved at: {decrypted_file_path}')
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-            open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-            msg_box.exec()
-            
-            self.set_decrypted_path_label(decrypted_file=decrypted_file_path)
-            if msg_box.clickedButton() == open_folder_btn:
-                self.open_downloads_folder()
-            
-            self.set_decrypted_path_label(decrypted_file=decrypted_file_path)
+            if FernetStream.is_stream_file(self.selected_file_path):
+                stream = FernetStream(key)
+                start_segment = stream.resume_segment(self.selected_file_path, decrypted_file_path)
+                if start_segment and QMessageBox.question(
+                        self, 'Resume Decryption',
+                        f'{decrypted_file_path} is partially decrypted.\nResume from segment {start_segment}?'
+                        ) != QMessageBox.StandardButton.Yes:
+                    start_segment = 0
+                job_args = (self.run_decryption, stream, self.selected_file_path, decrypted_file_path, start_segment)
+            else: # files written before the segmented format are a single Fernet token
+                job_args = (self.run_legacy_decryption, key, self.selected_file_path, decrypted_file_path)
+
+            self.decrypt_button.setEnabled(False)
+            job_runner().submit(
+                *job_args, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.decrypted_path_label.setHtml(f"<b>Decrypting...</b> {percent}%"),
+                on_result=self.show_decryption_result,
+                on_error=lambda e: show_job_error(self, e, 'Unexpected Error: Decryption failed'),
+                on_finished=lambda: self.decrypt_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error: Decryption failed', str(e))
\ No newline at end of file
+            QMessageBox.critical(self, 'Unexpected Error: Decryption failed', str(e))
+
+    @staticmethod
+    def run_decryption(stream, input_path, output_path, start_segment, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return stream.decrypt_file(input_path, output_path, start_segment, progress_callback=progress)
+
+    @staticmethod
+    def run_legacy_decryption(key, input_path, output_path, job):
+        return decrypt_legacy_file(key, input_path, output_path)
+
+    def show_decryption_result(self, decrypted_file_path):
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Decryption Successful')
+        msg_box.setText(f'File decrypted and saved at: {decrypted_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        self.set_decrypted_path_label(decrypted_file=decrypted_file_path)
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
@@ -0,0 +1,175 @@
+from concurrent.futures                         import ThreadPoolExecutor
+from collections                                import deque
+from base64                                     import urlsafe_b64decode
+from cryptography.fernet                        import Fernet, InvalidToken
+from cryptography.exceptions                    import InvalidTag
+from cryptography.hazmat.primitives             import hashes
+from cryptography.hazmat.primitives.kdf.hkdf    import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import os, struct
+
+MAGIC = b'CPFS'
+VERSION = 1
+HEADER = struct.Struct('>4sBI16s')  # magic, version, segment size, salt
+TAG_SIZE = 16
+DEFAULT_SEGMENT_SIZE = 1024 * 1024
+
+class FernetStream:
+    """Encrypts files as a stream of AES-256-GCM segments keyed from a Fernet key, in constant memory.
+
+    File layout: header (magic, version, segment size, random salt) followed by segments of
+    segment_size plaintext bytes + 16 byte tag; only the last segment is shorter. The segment key
+    is HKDF-SHA256(Fernet key, salt), the nonce of segment i is i with a final-segment flag and the
+    header is the associated data, so reordered, dropped or truncated segments fail authentication.
+    Segments are independent: they are processed on a thread pool, and any single segment can be
+    decrypted on its own, which lets an interrupted decryption resume where it stopped."""
+
+    def __init__(self, key, segment_size=DEFAULT_SEGMENT_SIZE, workers=None):
+        self.fernet_key = key if isinstance(key, bytes) else key.encode('ascii')
+        try:
+            Fernet(self.fernet_key)
+        except ValueError:
+            raise ValueError("The key file does not contain a valid Fernet key.")
+        if not 0 < segment_size < 2 ** 32:
+            raise ValueError("Segment size must be between 1 byte and 4 GiB.")
+        self.segment_size = segment_size
+        self.workers = workers or min(8, os.cpu_count() or 1)
+
+    @staticmethod
+    def is_stream_file(path):
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+
+    def _cipher(self, salt):
+        key = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt,
+                   info=b'cryptology playground fernet stream v1').derive(urlsafe_b64decode(self.fernet_key))
+        return AESGCM(key)
+
+    @staticmethod
+    def _nonce(index, last):
+        return struct.pack('>3xQB', index, 1 if last else 0)
+
+    @staticmethod
+    def segment_count(plaintext_size, segment_size):
+        return max(1, -(-plaintext_size // segment_size))  # an empty file still has one (final) segment
+
+    def _map(self, fn, items):
+        """Yields fn(item) in order, keeping at most 2 * workers items in flight so memory stays bounded."""
+        if self.workers == 1:
+            for item in items:
+                yield fn(item)
+            return
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = deque()
+            for item in items:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def encrypt_file(self, input_path, output_path, progress_callback=None):
+        """Encrypts input_path into output_path. progress_callback(bytes_done, total) is called after every segment."""
+        total = os.path.getsize(input_path)
+        segments = self.segment_count(total, self.segment_size)
+        header = HEADER.pack(MAGIC, VERSION, self.segment_size, os.urandom(16))
+        cipher = self._cipher(header[-16:])
+
+        def encrypt(item):
+            index, chunk = item
+            return len(chunk), cipher.encrypt(self._nonce(index, index == segments - 1), chunk, header)
+
+        with open(input_path, 'rb') as src, open(output_path, 'wb') as dst:
+            dst.write(header)
+            chunks = ((index, src.read(self.segment_size)) for index in range(segments))
+            done = 0
+            for size, segment in self._map(encrypt, chunks):
+                dst.write(segment)
+                done += size
+                if progress_callback:
+                    progress_callback(done, total)
+        return output_path
+
+    def read_header(self, f):
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError("The file is not a streamed Fernet encrypted file.")
+        magic, version, segment_size, salt = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("The file is not a streamed Fernet encrypted file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported stream version {version}.")
+        return header, segment_size, salt
+
+    def _layout(self, input_path, f):
+        """Returns (header, cipher, segment_size, segments) of an encrypted file."""
+        header, segment_size, salt = self.read_header(f)
+        body = os.path.getsize(input_path) - HEADER.size
+        segments = -(-body // (segment_size + TAG_SIZE))
+        if segments == 0 or body - (segments - 1) * (segment_size + TAG_SIZE) < TAG_SIZE:
+            raise ValueError("The encrypted file is truncated.")
+        return header, self._cipher(salt), segment_size, segments
+
+    def _decrypt(self, cipher, header, index, last, segment):
+        try:
+            return cipher.decrypt(self._nonce(index, last), segment, header)
+        except InvalidTag:
+            raise ValueError(f"Segment {index} failed authentication: wrong key, or the file is damaged or truncated.")
+
+    def decrypt_segment(self, input_path, index):
+        """Decrypts and returns the plaintext of one segment."""
+        with open(input_path, 'rb') as f:
+            header, cipher, segment_size, segments = self._layout(input_path, f)
+            if not 0 <= index < segments:
+                raise ValueError(f"Segment index must be between 0 and {segments - 1}.")
+            f.seek(HEADER.size + index * (segment_size + TAG_SIZE))
+            return self._decrypt(cipher, header, index, index == segments - 1, f.read(segment_size + TAG_SIZE))
+
+    def decrypt_file(self, input_path, output_path, start_segment=0, progress_callback=None):
+        """Decrypts input_path into output_path. With start_segment > 0 an interrupted decryption is resumed:
+        output_path keeps its first start_segment segments and decryption continues from there."""
+        with open(input_path, 'rb') as src:
+            header, cipher, segment_size, segments = self._layout(input_path, src)
+            if not 0 <= start_segment <= segments:
+                raise ValueError(f"Start segment must be between 0 and {segments}.")
+            total = os.path.getsize(input_path) - HEADER.size - segments * TAG_SIZE
+            src.seek(HEADER.size + start_segment * (segment_size + TAG_SIZE))
+
+            def decrypt(item):
+                index, segment = item
+                return self._decrypt(cipher, header, index, index == segments - 1, segment)
+
+            with open(output_path, 'r+b' if start_segment else 'wb') as dst:
+                done = start_segment * segment_size
+                dst.seek(done)
+                dst.truncate()
+                chunks = ((index, src.read(segment_size + TAG_SIZE)) for index in range(start_segment, segments))
+                for plain in self._map(decrypt, chunks):
+                    dst.write(plain)
+                    done += len(plain)
+                    if progress_callback:
+                        progress_callback(done, total)
+        return output_path
+
+    def resume_segment(self, input_path, output_path):
+        """Index of the first segment that still has to be decrypted into a partially written output_path.
+        0 if there is nothing to resume: output_path is missing, or already as large as the plaintext."""
+        if not os.path.exists(output_path):
+            return 0
+        with open(input_path, 'rb') as f:
+            _, _, segment_size, segments = self._layout(input_path, f)
+        plaintext_size = os.path.getsize(input_path) - HEADER.size - segments * TAG_SIZE
+        done = os.path.getsize(output_path)
+        return done // segment_size if done < plaintext_size else 0
+
+def decrypt_legacy_file(key, input_path, output_path):
+    """Decrypts a file written as one Fernet token by earlier versions of the tool (needs the file in memory)."""
+    with open(input_path, 'rb') as src:
+        token = src.read()
+    try:
+        data = Fernet(key).decrypt(token)
+    except InvalidToken:
+        raise ValueError("Decryption failed: wrong key or damaged file.")
+    with open(output_path, 'wb') as dst:
+        dst.write(data)
+    return output_path
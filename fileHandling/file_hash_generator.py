@@ -1,7 +1,10 @@
 from PyQt6.QtWidgets            import QWidget, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style import DefaultButtonStyle, DefaultAboutButtonStyle
+from jobs                       import job_runner, show_job_error
+from .multi_hasher              import MultiDigestHasher, format_throughput
+from .directory_hasher          import DigestCache, DirectoryHasher, compare_with_manifest
 from pathlib                    import Path
-import os, hashlib, time, platform
+import os, hashlib, platform
 
 class HashFilesWindow(QWidget):
 
@@ -22,7 +25,10 @@ class HashFilesWindow(QWidget):
           <li><b>SHA-256</b> – Modern secure hash standard</li>
           <li><b>SHA-512</b> – High-strength variant for sensitive data</li>
         </ul>
-        <p>Use this tool to confirm that files are identical or unaltered after download, transfer, or modification.</p>"""
+        <p>Use this tool to confirm that files are identical or unaltered after download, transfer, or modification.</p>
+        <p><b>Hash Folder</b> hashes a whole directory tree with SHA-256 and writes a sha256sum-compatible 
+        manifest and a JSON manifest to Downloads. Digests are cached by inode, size and modification time, 
+        so re-running it only hashes changed files and reports what changed since the previous manifest.</p>"""
 
         self.setWindowTitle("File Hash Generator")
         self.setFixedSize(700, 600)
@@ -34,12 +40,19 @@ class HashFilesWindow(QWidget):
             command=self.select_file)
         select_file_button.setGeometry(50, 30, 250, 50)
 
-        generate_hash_button = DefaultButtonStyle(
+        self.generate_hash_button = DefaultButtonStyle(
             'Generate Hashes',
             parent=self,
             bold=True,
             command=self.generate_hashes)
-        generate_hash_button.setGeometry(340, 30, 200, 50)
+        self.generate_hash_button.setGeometry(340, 30, 200, 50)
+
+        self.hash_folder_button = DefaultButtonStyle(
+            'Hash Folder',
+            parent=self,
+            bold=True,
+            command=self.hash_folder)
+        self.hash_folder_button.setGeometry(560, 30, 130, 50)
 
         save_button = DefaultButtonStyle(
             'Save Hash Report',
@@ -70,43 +83,126 @@ class HashFilesWindow(QWidget):
                 raise ValueError("Please select a file first.")
 
             file_path = self.selected_file
-            start_time = time.time()
-
-            hashes = {
-                'MD5': self.compute_hash(file_path, 'md5'),
-                'SHA-1': self.compute_hash(file_path, 'sha1'),
-                'SHA-256': self.compute_hash(file_path, 'sha256'),
-                'SHA-512': self.compute_hash(file_path, 'sha512'),}
-
-            elapsed = time.time() - start_time
-            file_size = os.path.getsize(file_path)
-
-            result_html = f"""
-            <h2>File Hash Report</h2>
-            <b>File:</b> {os.path.basename(file_path)}<br>
-            <b>Path:</b> {file_path}<br>
-            <b>Size:</b> {file_size:,} bytes<br>
-            <b>Platform:</b> {platform.system()} {platform.release()}<br>
-            <b>Time Taken:</b> {elapsed:.2f} seconds<br><br>
-            <b>MD5:</b> {hashes['MD5']}<br>
-            <b>SHA-1:</b> {hashes['SHA-1']}<br>
-            <b>SHA-256:</b> {hashes['SHA-256']}<br>
-            <b>SHA-512:</b> {hashes['SHA-512']}<br>"""
-            self.hash_display.setHtml(result_html)
+            self.generate_hash_button.setEnabled(False)
+            self.hash_display.setHtml("<b>Hashing...</b>")
             self.hash_display.show()
+            job_runner().submit(
+                self.hash_file, file_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.hash_display.setHtml(f"<b>Hashing...</b> {percent}%"),
+                on_result=lambda result: self.show_hashes(file_path, *result),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.generate_hash_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', f'An unexpected error occurred:\n{e}')
 
-    def compute_hash(self, file_path, algo):
-        """Compute file hash using the specified algorithm."""
-        h = hashlib.new(algo)
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                h.update(chunk)
-        return h.hexdigest()
+    def hash_file(self, file_path, job):
+        """Runs as a background job, reads the file once for all digests.
+        Returns (hashes, elapsed seconds, bytes per second)."""
+        hasher = MultiDigestHasher(('md5', 'sha1', 'sha256', 'sha512'))
+        last_percent = [-1]
+        def progress(done, total):
+            job.check_cancelled()
+            percent = done * 100 // total
+            if percent != last_percent[0]:
+                last_percent[0] = percent
+                job.report_progress(percent)
+        digests = hasher.hash_file(file_path, progress_callback=progress)
+        hashes = {
+            'MD5': digests['md5'],
+            'SHA-1': digests['sha1'],
+            'SHA-256': digests['sha256'],
+            'SHA-512': digests['sha512'],}
+        return hashes, hasher.elapsed, hasher.throughput
+
+    def show_hashes(self, file_path, hashes, elapsed, throughput):
+        file_size = os.path.getsize(file_path)
+
+        result_html = f"""
+        <h2>File Hash Report</h2>
+        <b>File:</b> {os.path.basename(file_path)}<br>
+        <b>Path:</b> {file_path}<br>
+        <b>Size:</b> {file_size:,} bytes<br>
+        <b>Platform:</b> {platform.system()} {platform.release()}<br>
+        <b>Time Taken:</b> {elapsed:.2f} seconds<br>
+        <b>Throughput:</b> {format_throughput(throughput)}<br><br>
+        <b>MD5:</b> {hashes['MD5']}<br>
+        <b>SHA-1:</b> {hashes['SHA-1']}<br>
+        <b>SHA-256:</b> {hashes['SHA-256']}<br>
+        <b>SHA-512:</b> {hashes['SHA-512']}<br>"""
+        self.hash_display.setHtml(result_html)
+        self.hash_display.show()
+
+    def hash_folder(self):
+        try:
+            folder = QFileDialog.getExistingDirectory(self, 'Select a Folder to Hash')
+            if not folder:
+                return
+            self.hash_folder_button.setEnabled(False)
+            self.hash_display.setHtml("<b>Hashing folder...</b>")
+            self.hash_display.show()
+            job_runner().submit(
+                self.hash_tree, folder, pass_job=True,
+                owner=self,
+                on_progress=lambda progress: self.hash_display.setHtml(
+                    f"<b>Hashing folder...</b> {progress[0]:,} / {progress[1]:,} files"),
+                on_result=self.show_folder_report,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.hash_folder_button.setEnabled(True))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', f'An unexpected error occurred:\n{e}')
+
+    @staticmethod
+    def hash_tree(folder, job):
+        """Runs as a background job. Hashes the tree, compares it with the previous manifest
+        of the same folder (if any) and writes the new manifests."""
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress((done, total))
+
+        output_dir = str(Path.home() / "Downloads")
+        # keyed by the absolute path too: two folders both called e.g. "src" must not share manifests
+        folder = os.path.abspath(folder)
+        path_id = hashlib.sha256(os.path.normcase(folder).encode('utf-8', 'surrogateescape')).hexdigest()[:8]
+        name = f"{os.path.basename(folder)}_{path_id}_manifest"
+        previous_manifest = os.path.join(output_dir, f"{name}.json")
+
+        cache = DigestCache() # sqlite connections must stay on the thread that created them
+        try:
+            hasher = DirectoryHasher(folder, ('sha256',), cache=cache)
+            results = hasher.hash_tree(progress_callback=progress)
+        finally:
+            cache.close()
+
+        failed = [os.path.relpath(path, hasher.root) for path in hasher.failed]
+        changes = compare_with_manifest(results, previous_manifest, failed) if os.path.exists(previous_manifest) else None
+        written = hasher.write_manifests(results, output_dir, name)
+        return folder, hasher, len(results), changes, written
+
+    def show_folder_report(self, result):
+        folder, hasher, file_count, changes, written = result
+        result_html = f"""
+        <h2>Folder Hash Report</h2>
+        <b>Folder:</b> {folder}<br>
+        <b>Files:</b> {file_count:,} ({hasher.hashed:,} hashed, {hasher.cached:,} unchanged from cache)<br>
+        <b>Errors:</b> {len(hasher.failed):,}<br>
+        <b>Time Taken:</b> {hasher.elapsed:.2f} seconds<br>
+        <b>Manifests:</b><br>{'<br>'.join(written)}<br><br>"""
+        if changes is not None:
+            changed, missing, added = changes
+            result_html += (
+                f"<b>Compared with previous manifest:</b><br>"
+                f"Changed: {len(changed):,} &nbsp; Missing: {len(missing):,} &nbsp; New: {len(added):,}<br>")
+            for label, paths in (("Changed", changed), ("Missing", missing), ("New", added)):
+                for path in paths[:50]:
+                    result_html += f"{label}: {path}<br>"
+        for path, error in list(hasher.failed.items())[:50]:
+            result_html += f"Error: {os.path.relpath(path, hasher.root)}: {error}<br>"
+        self.hash_display.setHtml(result_html)
+        self.hash_display.show()
 
     def save_hash_report(self):
         try:
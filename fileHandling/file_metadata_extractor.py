@@ -1,7 +1,9 @@
 from PyQt6.QtWidgets            import QWidget, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style import DefaultButtonStyle, DefaultAboutButtonStyle
+from othertools.entropy_core   import EntropyMap
+from jobs                       import job_runner, show_job_error
 from pathlib                    import Path
-import os, mimetypes, hashlib, time, platform, stat, math, zipfile, tarfile
+import os, mimetypes, hashlib, time, platform, stat, zipfile, tarfile
 
 try:
     from PIL import Image
@@ -37,11 +39,11 @@ class FileMetadataExtractorWindow(QWidget):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(50, 30, 320, 50)
 
-        extract_button = DefaultButtonStyle(
+        self.extract_button = DefaultButtonStyle(
             'Extract Metadata',
             parent=self,
             bold=True, command=self.extract_metadata)
-        extract_button.setGeometry(400, 30, 200, 50)
+        self.extract_button.setGeometry(400, 30, 200, 50)
 
         save_button = DefaultButtonStyle(
             'Save Metadata Report',
@@ -70,56 +72,65 @@ class FileMetadataExtractorWindow(QWidget):
             if not hasattr(self, 'selected_file'):
                 raise ValueError("Please select a file first.")
 
-            file_path = self.selected_file
-            stats = os.stat(file_path)
-            mime_type, _ = mimetypes.guess_type(file_path)
-
-            metadata_sections = []
-
-            # General Info
-            general_info = f"""
-            <h2>General File Info</h2>
-            <b>Name:</b> {os.path.basename(file_path)}<br>
-            <b>Path:</b> {file_path}<br>
-            <b>Size:</b> {stats.st_size:,} bytes<br>
-            <b>Created:</b> {time.ctime(stats.st_ctime)}<br>
-            <b>Modified:</b> {time.ctime(stats.st_mtime)}<br>
-            <b>Accessed:</b> {time.ctime(stats.st_atime)}<br>
-            <b>Permissions:</b> {stat.filemode(stats.st_mode)}<br>
-            <b>Owner UID:</b> {stats.st_uid} | <b>GID:</b> {stats.st_gid}<br>
-            <b>Inode:</b> {stats.st_ino}<br>
-            <b>MIME Type:</b> {mime_type or 'Unknown'}<br>
-            <b>Platform:</b> {platform.system()} {platform.release()}<br>
-            """
-            metadata_sections.append(general_info)
-
-            # Hashes
-            sha256_hash = self.compute_hash(file_path, 'sha256')
-            md5_hash = self.compute_hash(file_path, 'md5')
-            hashes = f"""
-            <h2>Hashes & Integrity</h2>
-            <b>SHA256:</b> {sha256_hash}<br>
-            <b>MD5:</b> {md5_hash}<br>"""
-            metadata_sections.append(hashes)
-
-            # Entropy
-            entropy = self.file_entropy(file_path)
-            metadata_sections.append(f"<h2>File Entropy</h2><b>Entropy:</b> {entropy:.4f}<br>")
-
-            # Type-Specific Metadata
-            type_meta = self.get_type_specific_metadata(file_path, mime_type)
-            if type_meta:
-                metadata_sections.append(type_meta)
-
-            full_metadata = "<hr>".join(metadata_sections)
-            self.metadata_display.setHtml(full_metadata)
-            self.metadata_display.show()
+            self.extract_button.setEnabled(False)
+            job_runner().submit(
+                self.collect_metadata, self.selected_file,
+                owner=self,
+                on_result=self.show_result,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.extract_button.setEnabled(True))
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', f'An unexpected error occurred:\n{e}')
 
+    def collect_metadata(self, file_path):
+        stats = os.stat(file_path)
+        mime_type, _ = mimetypes.guess_type(file_path)
+
+        metadata_sections = []
+
+        # General Info
+        general_info = f"""
+        <h2>General File Info</h2>
+        <b>Name:</b> {os.path.basename(file_path)}<br>
+        <b>Path:</b> {file_path}<br>
+        <b>Size:</b> {stats.st_size:,} bytes<br>
+        <b>Created:</b> {time.ctime(stats.st_ctime)}<br>
+        <b>Modified:</b> {time.ctime(stats.st_mtime)}<br>
+        <b>Accessed:</b> {time.ctime(stats.st_atime)}<br>
+        <b>Permissions:</b> {stat.filemode(stats.st_mode)}<br>
+        <b>Owner UID:</b> {stats.st_uid} | <b>GID:</b> {stats.st_gid}<br>
+        <b>Inode:</b> {stats.st_ino}<br>
+        <b>MIME Type:</b> {mime_type or 'Unknown'}<br>
+        <b>Platform:</b> {platform.system()} {platform.release()}<br>
+        """
+        metadata_sections.append(general_info)
+
+        # Hashes
+        sha256_hash = self.compute_hash(file_path, 'sha256')
+        md5_hash = self.compute_hash(file_path, 'md5')
+        hashes = f"""
+        <h2>Hashes & Integrity</h2>
+        <b>SHA256:</b> {sha256_hash}<br>
+        <b>MD5:</b> {md5_hash}<br>"""
+        metadata_sections.append(hashes)
+
+        # Entropy
+        metadata_sections.append(self.entropy_section(file_path))
+
+        # Type-Specific Metadata
+        type_meta = self.get_type_specific_metadata(file_path, mime_type)
+        if type_meta:
+            metadata_sections.append(type_meta)
+
+        return "<hr>".join(metadata_sections)
+
+    def show_result(self, full_metadata):
+        self.metadata_display.setHtml(full_metadata)
+        self.metadata_display.show()
+
     def compute_hash(self, file_path, algo='sha256'):
         h = hashlib.new(algo)
         with open(file_path, 'rb') as f:
@@ -128,19 +139,22 @@ class FileMetadataExtractorWindow(QWidget):
         return h.hexdigest()
 
     def file_entropy(self, file_path):
-        with open(file_path, 'rb') as f:
-            data = f.read()
-        if not data:
-            return 0.0
-        byte_counts = [0] * 256
-        for b in data:
-            byte_counts[b] += 1
-        entropy = 0.0
-        for count in byte_counts:
-            if count:
-                p = count / len(data)
-                entropy -= p * math.log2(p)
-        return entropy
+        return EntropyMap.from_file(file_path).entropy
+
+    def entropy_section(self, file_path):
+        entropy_map = EntropyMap.from_file(file_path)
+        html = f"<h2>File Entropy</h2><b>Entropy:</b> {entropy_map.entropy:.4f}<br>"
+        if len(entropy_map.windows):
+            html += (f"<b>Window entropy ({entropy_map.window // 1024} KiB windows):</b> "
+                     f"min {entropy_map.windows.min():.4f}, max {entropy_map.windows.max():.4f}<br>")
+            regions = entropy_map.high_entropy_regions()
+            if regions:
+                html += "<b>High entropy regions (compressed, packed or encrypted data):</b><br>"
+                for start, end, mean in regions[:10]:
+                    html += f"0x{start:08x} - 0x{end:08x} ({end - start:,} bytes, {mean:.3f})<br>"
+                if len(regions) > 10:
+                    html += f"... and {len(regions) - 10} more<br>"
+        return html
 
     def get_type_specific_metadata(self, file_path, mime_type):
         """Extract additional metadata depending on file type"""
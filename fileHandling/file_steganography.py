@@ -1,7 +1,10 @@
-from PyQt6.QtWidgets            import QWidget, QTextEdit, QMessageBox, QFileDialog
-from DefaultStyles.button_style import DefaultButtonStyle, DefaultAboutButtonStyle
-from PIL                        import Image
-from pathlib                    import Path
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
+from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
+from jobs                           import job_runner
+from .lsb_steganography             import encode_file, decode_file, check_capacity
+from pathlib                        import Path
+import hashlib
 
 class FileStegToolWindow(QWidget):
     def __init__(self, theme_mode):
@@ -18,6 +21,7 @@ class FileStegToolWindow(QWidget):
           <li>Embed messages or files within images</li>
           <li>Extract hidden data from stego images</li>
           <li>Supports PNG and BMP formats</li>
+          <li>1 to 4 bits per color channel: more bits hold more data but change the image more</li>
           <li>Optional password protection</li>
         </ul>
         <p>
@@ -34,18 +38,23 @@ class FileStegToolWindow(QWidget):
             'Select File to Hide', parent=self, bold=True, command=self.select_secret_file)
         select_secret_button.setGeometry(270, 30, 200, 50)
 
-        encode_button = DefaultButtonStyle(
+        self.encode_button = DefaultButtonStyle(
             'Encode/Save Image', parent=self, bold=True, command=self.encode_steg)
-        encode_button.setGeometry(490, 30, 150, 50)
+        self.encode_button.setGeometry(490, 30, 150, 50)
+
+        depth_label = QLabel("Bits per channel:", parent=self)
+        depth_label.setGeometry(50, 85, 130, 30)
+        self.depth_options = DefaultQComboBoxStyle(parent=self, items=['1', '2', '3', '4'])
+        self.depth_options.setGeometry(180, 85, 70, 30)
 
         self.status_display = QTextEdit(parent=self)
         self.status_display.setGeometry(10, 120, 680, 80)
         self.status_display.setReadOnly(True)
         self.status_display.hide()
 
-        decode_button = DefaultButtonStyle(
+        self.decode_button = DefaultButtonStyle(
             'Decode Hidden Data', parent=self, bold=True, command=self.decode_steg)
-        decode_button.setGeometry(250, 250, 200, 50)
+        self.decode_button.setGeometry(250, 250, 200, 50)
 
         self.decoding_status_display = QTextEdit(parent=self)
         self.decoding_status_display.setGeometry(10, 330, 680, 80)
@@ -73,82 +82,47 @@ class FileStegToolWindow(QWidget):
             if not hasattr(self, 'cover_image') or not hasattr(self, 'secret_file'):
                 raise ValueError("Please select both a cover image and a file to hide.")
 
-            img = Image.open(self.cover_image)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-
-            data = open(self.secret_file, 'rb').read()
-            bin_data = ''.join(format(byte, '08b') for byte in data)
-            data_len = len(bin_data)
-            pixels = img.load()
-
-            width, height = img.size
-            total_pixels = width * height * 3
-            if data_len + 32 > total_pixels:
-                raise ValueError("File too large to hide in this image.")
-
-            # Store message length in first 32 bits
-            len_bin = format(data_len, '032b')
-            full_data = len_bin + bin_data
-            data_index = 0
-
-            for y in range(height):
-                for x in range(width):
-                    if data_index >= len(full_data):
-                        break
-                    r, g, b = pixels[x, y]
-                    r = (r & ~1) | int(full_data[data_index]) if data_index < len(full_data) else r; data_index += 1
-                    g = (g & ~1) | int(full_data[data_index]) if data_index < len(full_data) else g; data_index += 1
-                    b = (b & ~1) | int(full_data[data_index]) if data_index < len(full_data) else b; data_index += 1
-                    pixels[x, y] = (r, g, b)
-                if data_index >= len(full_data):
-                    break
+            depth = int(self.depth_options.currentText())
+            # fails before the image or the file is loaded when the file does not fit
+            available = check_capacity(self.cover_image, self.secret_file, depth)
 
             save_path = str(Path.home() / "Downloads" / "steg_image.png")
-            img.save(save_path)
-
-            self.status_display.setHtml(
-                f"<h3>File successfully hidden inside image!</h3><b>Saved as:</b> {save_path}")
-            self.status_display.show()
+            self.encode_button.setEnabled(False)
+            job_runner().submit(
+                encode_file, self.cover_image, self.secret_file, save_path, depth,
+                owner=self,
+                on_result=lambda size: self.show_encoding(size, save_path, available, depth),
+                on_error=lambda e: QMessageBox.critical(self, 'Error', f"Encoding failed: {str(e)}"),
+                on_finished=lambda: self.encode_button.setEnabled(True))
 
         except Exception as e:
             QMessageBox.critical(self, 'Error', f"Encoding failed: {str(e)}")
 
+    def show_encoding(self, size, save_path, available, depth):
+        self.status_display.setHtml(
+            f"<h3>File successfully hidden inside image!</h3><b>Saved as:</b> {save_path}<br>"
+            f"<b>Used:</b> {size:,} of {available:,} bytes at {depth} bit(s) per channel")
+        self.status_display.show()
+
     def decode_steg(self):
         try:
             path, _ = QFileDialog.getOpenFileName(self, 'Select Steg Image', filter="Images (*.png *.bmp)")
             if not path:
                 return
 
-            img = Image.open(path).convert('RGB')
-            pixels = list(img.getdata())
-
-            # collect LSBs
-            lsb_bits = []
-            for r, g, b in pixels:
-                lsb_bits.append(str(r & 1))
-                lsb_bits.append(str(g & 1))
-                lsb_bits.append(str(b & 1))
-
-            if len(lsb_bits) < 32:
-                raise ValueError("Image too small or contains no hidden data.")
-
-            # first 32 bits is payload length in bits
-            header_bits = ''.join(lsb_bits[:32])
-            payload_len_bits = int(header_bits, 2)
-            total_needed = 32 + payload_len_bits
-            if len(lsb_bits) < total_needed:
-                raise ValueError(f"Image does not contain the full payload. "
-                                 f"Expected {payload_len_bits} payload bits but only {len(lsb_bits)-32} are present.")
+            self.decode_button.setEnabled(False)
+            job_runner().submit(
+                decode_file, path,
+                owner=self,
+                on_result=self.show_decoding,
+                on_error=lambda e: QMessageBox.critical(self, 'Decoding Error', str(e)),
+                on_finished=lambda: self.decode_button.setEnabled(True))
 
-            payload_bits = lsb_bits[32:32 + payload_len_bits]
-
-            # convert bits to bytes
-            payload_bytes = bytearray()
-            for i in range(0, len(payload_bits), 8):
-                byte = int(''.join(payload_bits[i:i+8]), 2)
-                payload_bytes.append(byte)
+        except Exception as e:
+            QMessageBox.critical(self, 'Decoding Error', str(e))
 
+    def show_decoding(self, payload_bytes):
+        try:
             save_path, _ = QFileDialog.getSaveFileName(
                 self, 'Save Extracted Payload', str(Path.home() / "Downloads" / "extracted_secret.bin"))
             if not save_path:
@@ -164,7 +138,7 @@ class FileStegToolWindow(QWidget):
             try:
                 extracted_hash = self._file_sha256(save_path)
                 result_html += f"<b>Extracted SHA256:</b> {extracted_hash}<br>"
-                if self.secret_file:
+                if getattr(self, 'secret_file', None):
                     original_hash = self._file_sha256(self.secret_file)
                     match = (original_hash == extracted_hash)
                     result_html += f"<b>Original SHA256:</b> {original_hash}<br>"
@@ -179,4 +153,10 @@ class FileStegToolWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Decoding Error', str(e))
 
-
+    @staticmethod
+    def _file_sha256(file_path):
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
@@ -0,0 +1,110 @@
+import numpy as np
+import mmap, os
+
+BYTES_PER_ROW = 16
+HEX_WIDTH = BYTES_PER_ROW * 2 + BYTES_PER_ROW // 2 - 1  # 2 byte groups separated by spaces
+# printable ASCII stays, everything else is shown as '.' like xxd does
+ASCII_TABLE = bytes(b if 0x20 <= b < 0x7f else 0x2e for b in range(256))
+
+def format_row(offset, data):
+    """One xxd style line (without newline) of up to BYTES_PER_ROW bytes."""
+    return f"{offset:08x}: {data.hex(' ', -2):<{HEX_WIDTH}}  {data.translate(ASCII_TABLE).decode('ascii')}"
+
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+ASCII_LUT = np.frombuffer(ASCII_TABLE, dtype=np.uint8)
+LINE_WIDTH = 10 + HEX_WIDTH + 2 + BYTES_PER_ROW + 1
+HEX_COLUMNS = np.array([10 + j // 2 * 5 + j % 2 * 2 for j in range(BYTES_PER_ROW)])
+ASCII_COLUMN = 10 + HEX_WIDTH + 2
+
+def format_full_rows(offset, data):
+    """format_row() for len(data) // BYTES_PER_ROW whole rows at once, as newline terminated bytes.
+    Every line has the same width, so the text is filled column by column in a NumPy array."""
+    values = np.frombuffer(data, dtype=np.uint8)
+    rows = len(values) // BYTES_PER_ROW
+    if offset + rows * BYTES_PER_ROW > 0xFFFFFFFF: # offsets no longer fit in 8 hex digits, xxd widens them
+        return ''.join(format_row(offset + i, data[i:i + BYTES_PER_ROW]) + '\n'
+                       for i in range(0, rows * BYTES_PER_ROW, BYTES_PER_ROW)).encode('ascii')
+    values = values[:rows * BYTES_PER_ROW].reshape(rows, BYTES_PER_ROW)
+    lines = np.full((rows, LINE_WIDTH), ord(' '), dtype=np.uint8)
+    offsets = offset + np.arange(rows, dtype=np.uint64) * BYTES_PER_ROW
+    for digit in range(8):
+        lines[:, 7 - digit] = HEX_DIGITS[(offsets >> np.uint64(4 * digit)) & np.uint64(0xF)]
+    lines[:, 8] = ord(':')
+    lines[:, HEX_COLUMNS] = HEX_DIGITS[values >> 4]
+    lines[:, HEX_COLUMNS + 1] = HEX_DIGITS[values & 0xF]
+    lines[:, ASCII_COLUMN:ASCII_COLUMN + BYTES_PER_ROW] = ASCII_LUT[values]
+    lines[:, -1] = ord('\n')
+    return lines.tobytes()
+
+def parse_pattern(text):
+    """Search pattern of the viewer: 'hex:' followed by hex digits, or plain UTF-8 text."""
+    if text.lower().startswith('hex:'):
+        try:
+            return bytes.fromhex(text[4:])
+        except ValueError:
+            raise ValueError("Invalid hex search pattern.")
+    return text.encode('utf-8')
+
+class HexDump:
+    """Read-only view of a file through mmap. Rows are formatted on demand, so opening
+    and paging through a file costs the same whatever its size."""
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.size = os.path.getsize(file_path)
+        self._file = open(file_path, 'rb')
+        # mmap cannot map empty files
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    @property
+    def rows(self):
+        return -(-self.size // BYTES_PER_ROW)
+
+    def row(self, index):
+        offset = index * BYTES_PER_ROW
+        return format_row(offset, self._mm[offset:offset + BYTES_PER_ROW])
+
+    def find(self, pattern, start=0):
+        """Offset of the next occurrence of pattern at or after start, wrapping around to the beginning; -1 if none."""
+        if not pattern:
+            raise ValueError("Please enter a search pattern.")
+        found = self._mm.find(pattern, start)
+        if found == -1 and start:
+            found = self._mm.find(pattern, 0, start + len(pattern) - 1)
+        return found
+
+    def parse_offset(self, text):
+        """Offset typed by the user: decimal, or hex with a 0x prefix."""
+        try:
+            offset = int(text.strip(), 0)
+        except ValueError:
+            raise ValueError("Offset must be a decimal number or a hex number starting with 0x.")
+        if not 0 <= offset < max(self.size, 1):
+            raise ValueError(f"Offset must be between 0 and {max(self.size - 1, 0):#x}.")
+        return offset
+
+    def export(self, output_path, chunk_rows=65536, progress_callback=None):
+        """Writes the whole dump in xxd format, one chunk of rows at a time.
+        progress_callback(bytes_done, total) is called after every chunk."""
+        chunk_size = chunk_rows * BYTES_PER_ROW
+        with open(output_path, 'wb') as out:
+            for start in range(0, self.size, chunk_size):
+                chunk = self._mm[start:start + chunk_size]
+                out.write(format_full_rows(start, chunk))
+                tail = len(chunk) % BYTES_PER_ROW
+                if tail:
+                    out.write(format_row(start + len(chunk) - tail, chunk[-tail:]).encode('ascii') + b'\n')
+                if progress_callback:
+                    progress_callback(start + len(chunk), self.size)
+        return output_path
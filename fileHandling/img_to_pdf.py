@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
+from jobs                           import job_runner
 from PIL                            import Image
 from .file_conversion               import FileConversionWindow
 from pdf2image                      import convert_from_path
@@ -34,8 +35,8 @@ class Img2PDFWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -49,34 +50,13 @@ class Img2PDFWindow(FileConversionWindow):
 
                 if file_extension in ['.png', '.jpeg', '.jpg']:
 
-                    pdf_file_path = os.path.join(os.path.expanduser('~'), 'Downloads', 'pdf_converted_file.pdf')
-
-                    image = Image.open(self.selected_file)
-
-                    # PDFs don't support alpha channels
-                    if image.mode in ("RGBA", "LA"):
-                        image = image.convert("RGB")
-
-                    # Save the image as a PDF
-                    image.save(pdf_file_path, "PDF", resolution=100.0)
-
-                    # Show a custom message box with a button to open the Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Conversion Successful')
-                    msg_box.setText(f'File converted and saved at: {pdf_file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a custom button for opening the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # If the user clicks "Open Downloads", open the Downloads folder
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-                    
-                    self.output_label.clear()
-                    self.output_label.setHtml(f"<b>{file_extension} file converted to PDF. PDF file created and saved at:</b><br>{pdf_file_path}")
-                    self.output_label.show()
+                    self.convert_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_pdf, self.selected_file,
+                        owner=self,
+                        on_result=lambda pdf_file_path: self.show_result(pdf_file_path, file_extension),
+                        on_error=lambda e: QMessageBox.critical(self, 'Conversion Failed', f'An error occurred during conversion: {str(e)}'),
+                        on_finished=lambda: self.convert_button.setEnabled(True))
                 else:
                     QMessageBox.warning(
                         self, 'Invalid File Type',
@@ -89,6 +69,39 @@ class Img2PDFWindow(FileConversionWindow):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
 
+    @staticmethod
+    def to_pdf(selected_file):
+        pdf_file_path = os.path.join(os.path.expanduser('~'), 'Downloads', 'pdf_converted_file.pdf')
+
+        image = Image.open(selected_file)
+
+        # PDFs don't support alpha channels
+        if image.mode in ("RGBA", "LA"):
+            image = image.convert("RGB")
+
+        # Save the image as a PDF
+        image.save(pdf_file_path, "PDF", resolution=100.0)
+        return pdf_file_path
+
+    def show_result(self, pdf_file_path, file_extension):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {pdf_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>{file_extension} file converted to PDF. PDF file created and saved at:</b><br>{pdf_file_path}")
+        self.output_label.show()
+
 # ==================================================================================================================
 
 class PDF2ImgWindow(FileConversionWindow):
@@ -119,8 +132,8 @@ class PDF2ImgWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -133,35 +146,13 @@ class PDF2ImgWindow(FileConversionWindow):
                 file_extension = os.path.splitext(self.selected_file)[1].lower()
 
                 if file_extension == '.pdf':
-                    # Specify the output directory
-                    output_dir = os.path.join(os.path.expanduser('~'), 'Downloads', 'pdf_to_image_output')
-                    os.makedirs(output_dir, exist_ok=True)
-
-                    # Convert the PDF to images
-                    images = convert_from_path(self.selected_file)
-
-                    # Save each page as an image file
-                    for i, image in enumerate(images):
-                        image_path = os.path.join(output_dir, f'page_{i + 1}.png')
-                        image.save(image_path, 'PNG')
-
-                    # Show a custom message box with a button to open the Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Conversion Successful')
-                    msg_box.setText(f'PDF converted and images saved in: {output_dir}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a custom button for opening the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # If the user clicks "Open Downloads", open the Downloads folder
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-
-                    self.output_label.clear()
-                    self.output_label.setHtml(f"<b>{file_extension} file converted to PNG. PNG file created and saved at:</b><br>{output_dir}")
-                    self.output_label.show()
+                    self.convert_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_images, self.selected_file,
+                        owner=self,
+                        on_result=lambda output_dir: self.show_result(output_dir, file_extension),
+                        on_error=lambda e: QMessageBox.critical(self, 'Conversion Failed', f'An error occurred during conversion: {str(e)}'),
+                        on_finished=lambda: self.convert_button.setEnabled(True))
                 else:
                     QMessageBox.warning(
                         self, 'Invalid File Type',
@@ -173,3 +164,37 @@ class PDF2ImgWindow(FileConversionWindow):
                     f'An error occurred during conversion: {str(e)}')
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
+
+    @staticmethod
+    def to_images(selected_file):
+        # Specify the output directory
+        output_dir = os.path.join(os.path.expanduser('~'), 'Downloads', 'pdf_to_image_output')
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Convert the PDF to images
+        images = convert_from_path(selected_file)
+
+        # Save each page as an image file
+        for i, image in enumerate(images):
+            image_path = os.path.join(output_dir, f'page_{i + 1}.png')
+            image.save(image_path, 'PNG')
+        return output_dir
+
+    def show_result(self, output_dir, file_extension):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'PDF converted and images saved in: {output_dir}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>{file_extension} file converted to PNG. PNG file created and saved at:</b><br>{output_dir}")
+        self.output_label.show()
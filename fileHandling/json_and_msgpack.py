@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
+from jobs                           import job_runner, show_job_error
 from .file_conversion               import FileConversionWindow
 import json, os, msgpack
 
@@ -43,8 +44,8 @@ class JSONtoMsgPackWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        submit_button = DefaultButtonStyle("Submit", bold=True, parent=self, command=self.to_msg_pack)
-        submit_button.setGeometry(450, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", bold=True, parent=self, command=self.to_msg_pack)
+        self.submit_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 300)
@@ -58,40 +59,13 @@ class JSONtoMsgPackWindow(FileConversionWindow):
 
                 if file_extension == '.json':
 
-                    with open(self.selected_file, 'r') as json_file:
-                        lines = json_file.readlines()
-                        data = [json.loads(line) for line in lines if line.strip()]
-                    
-                    # Save as MessagePack file
-                    base_name = os.path.splitext(os.path.basename(self.selected_file))[0]
-                    output_file = os.path.join(self.downloads_path, f"{base_name}.msgpack")
-                    
-                    if output_file:
-                        with open(output_file, 'wb') as msgpack_file:
-                            msgpack.pack(data, msgpack_file)
-                        QMessageBox.information(
-                            self, 'Success', f'File successfully converted and saved as {output_file}')
-                        
-                        msg_box = QMessageBox(self)
-                        msg_box.setWindowTitle('Conversion Successful')
-                        msg_box.setText(f'File converted and saved at: {output_file}')
-                        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                        # Add a custom button for opening the Downloads folder
-                        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                        msg_box.exec()
-
-                        # If the user clicks "Open Downloads", open the Downloads folder
-                        if msg_box.clickedButton() == open_folder_btn:
-                            self.open_downloads_folder()
-
-                        with open(output_file, 'rb') as f:
-                            data = msgpack.unpack(f)
-                        self.output_label.clear()
-                        self.output_label.setHtml(f"<b>MessagePack contents:</b><br> {json.dumps(data, indent=4)}")
-                        self.output_label.show()
-                    else:
-                        raise ValueError('Save cancelled. File could not be saved.')
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_msgpack_file, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: show_job_error(self, e, 'Operation Failed'),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     raise ValueError('Invalid file type selected.')
             except ValueError as ve:
@@ -101,6 +75,45 @@ class JSONtoMsgPackWindow(FileConversionWindow):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
 
+    @staticmethod
+    def to_msgpack_file(selected_file, downloads_path):
+        with open(selected_file, 'r') as json_file:
+            lines = json_file.readlines()
+            data = [json.loads(line) for line in lines if line.strip()]
+
+        # Save as MessagePack file
+        base_name = os.path.splitext(os.path.basename(selected_file))[0]
+        output_file = os.path.join(downloads_path, f"{base_name}.msgpack")
+
+        with open(output_file, 'wb') as msgpack_file:
+            msgpack.pack(data, msgpack_file)
+
+        with open(output_file, 'rb') as f:
+            data = msgpack.unpack(f)
+        return output_file, data
+
+    def show_result(self, result):
+        output_file, data = result
+        QMessageBox.information(
+            self, 'Success', f'File successfully converted and saved as {output_file}')
+
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {output_file}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>MessagePack contents:</b><br> {json.dumps(data, indent=4)}")
+        self.output_label.show()
+
 # ==========================================================================================================================
 
 class MsgPacktoJSONWindow(FileConversionWindow):
@@ -142,8 +155,8 @@ class MsgPacktoJSONWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.to_json)
-        submit_button.setGeometry(450, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.to_json)
+        self.submit_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 70)
@@ -157,33 +170,13 @@ class MsgPacktoJSONWindow(FileConversionWindow):
 
                 if file_extension == '.msgpack':
 
-                    with open(self.selected_file, 'rb') as msgpack_file:
-                        data = msgpack.unpack(msgpack_file)
-
-                    base_name = os.path.splitext(os.path.basename(self.selected_file))[0]
-                    output_file = os.path.join(self.downloads_path, f"{base_name}.json")
-
-                    if output_file:
-
-                        with open(output_file, 'w') as json_file:
-                            json.dump(data, json_file, indent=4)  # Pretty-print JSON with indent
-
-                        msg_box = QMessageBox(self)
-                        msg_box.setWindowTitle('Conversion Successful')
-                        msg_box.setText(f'File converted and saved at: {self.downloads_path}')
-                        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                        # Add a custom button for opening the Downloads folder
-                        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                        msg_box.exec()
-                        # If the user clicks "Open Downloads", open the Downloads folder
-                        if msg_box.clickedButton() == open_folder_btn:
-                            self.open_downloads_folder()
-                        
-                        self.output_label.clear()
-                        self.output_label.setHtml(f"<b>JSON file generated and saved at:</b><br> {output_file}")
-                        self.output_label.show()
-                    else:
-                        raise ValueError('Save cancelled. File could not be saved.')
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_json_file, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: show_job_error(self, e, 'Operation Failed'),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     raise ValueError('Invalid file type selected.')
             except Exception as e:
@@ -192,3 +185,31 @@ class MsgPacktoJSONWindow(FileConversionWindow):
                 QMessageBox.warning(self, 'Error', str(ve))
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
+
+    @staticmethod
+    def to_json_file(selected_file, downloads_path):
+        with open(selected_file, 'rb') as msgpack_file:
+            data = msgpack.unpack(msgpack_file)
+
+        base_name = os.path.splitext(os.path.basename(selected_file))[0]
+        output_file = os.path.join(downloads_path, f"{base_name}.json")
+
+        with open(output_file, 'w') as json_file:
+            json.dump(data, json_file, indent=4)  # Pretty-print JSON with indent
+        return output_file
+
+    def show_result(self, output_file):
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {self.downloads_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>JSON file generated and saved at:</b><br> {output_file}")
+        self.output_label.show()
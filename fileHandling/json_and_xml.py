@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
+from jobs                           import job_runner, show_job_error
 from .file_conversion               import FileConversionWindow
 from xml.dom                        import minidom
 import xml.etree.ElementTree        as ET
@@ -31,8 +32,8 @@ class JSONtoXMLWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
         
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 70)
@@ -46,58 +47,13 @@ class JSONtoXMLWindow(FileConversionWindow):
 
                 if file_extension == '.json':
 
-                    # Read JSON content
-                    with open(self.selected_file, 'r') as json_file:
-                        json_data = json.load(json_file)
-
-                    # Create the root element
-                    root_name = "root"
-                    root = ET.Element(root_name)
-
-                    # Recursive conversion function
-                    def dict_to_xml(element, data):
-                        if isinstance(data, dict):
-                            for key, value in data.items():
-                                child = ET.SubElement(element, key)
-                                dict_to_xml(child, value)
-                        elif isinstance(data, list):
-                            for item in data:
-                                child = ET.SubElement(element, "item")
-                                dict_to_xml(child, item)
-                        else:
-                            element.text = str(data)
-
-                    # Convert JSON data to XML
-                    dict_to_xml(root, json_data)
-
-                    # Create a pretty XML string
-                    xml_string = ET.tostring(root, encoding='unicode')
-                    pretty_xml = minidom.parseString(xml_string).toprettyxml(indent="  ")
-
-                    xml_file_name = os.path.splitext(self.selected_file)[0] + ".xml"
-                    xml_file_path = os.path.join(self.downloads_path, xml_file_name)
-
-                    # Write to the output XML file
-                    with open(xml_file_path, 'w') as xml_file:
-                        xml_file.write(pretty_xml)
-
-                    # Show a custom message box with a button to open the Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Conversion Successful')
-                    msg_box.setText(f'File converted and saved at: {xml_file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                    # Add a custom button for opening the Downloads folder
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    # If the user clicks "Open Downloads", open the Downloads folder
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-                    
-                    self.output_label.clear()
-                    self.output_label.setHtml(f"<b>XML file created and saved at:</b><br>{xml_file_path}")
-                    self.output_label.show()
+                    self.convert_button.setEnabled(False)
+                    job_runner().submit(
+                        self.to_xml, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: show_job_error(self, e, 'Conversion Failed'),
+                        on_finished=lambda: self.convert_button.setEnabled(True))
                 else:
                     raise ValueError('Please select a JSON file.')
             except ValueError as ve:
@@ -107,6 +63,63 @@ class JSONtoXMLWindow(FileConversionWindow):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select a file first.')
 
+    @staticmethod
+    def to_xml(selected_file, downloads_path):
+        # Read JSON content
+        with open(selected_file, 'r') as json_file:
+            json_data = json.load(json_file)
+
+        # Create the root element
+        root_name = "root"
+        root = ET.Element(root_name)
+
+        # Recursive conversion function
+        def dict_to_xml(element, data):
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    child = ET.SubElement(element, key)
+                    dict_to_xml(child, value)
+            elif isinstance(data, list):
+                for item in data:
+                    child = ET.SubElement(element, "item")
+                    dict_to_xml(child, item)
+            else:
+                element.text = str(data)
+
+        # Convert JSON data to XML
+        dict_to_xml(root, json_data)
+
+        # Create a pretty XML string
+        xml_string = ET.tostring(root, encoding='unicode')
+        pretty_xml = minidom.parseString(xml_string).toprettyxml(indent="  ")
+
+        xml_file_name = os.path.splitext(selected_file)[0] + ".xml"
+        xml_file_path = os.path.join(downloads_path, xml_file_name)
+
+        # Write to the output XML file
+        with open(xml_file_path, 'w') as xml_file:
+            xml_file.write(pretty_xml)
+        return xml_file_path
+
+    def show_result(self, xml_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {xml_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>XML file created and saved at:</b><br>{xml_file_path}")
+        self.output_label.show()
+
 # =======================================================================================================================
 
 class XMLtoJSONWindow(FileConversionWindow):
@@ -135,8 +148,8 @@ class XMLtoJSONWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
-        convert_button.setGeometry(450, 50, 100, 50)
+        self.convert_button = DefaultButtonStyle("Convert", parent=self, bold=True, command=self.convert_file)
+        self.convert_button.setGeometry(450, 50, 100, 50)
         
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 70)
@@ -150,56 +163,13 @@ class XMLtoJSONWindow(FileConversionWindow):
                 if file_extension != '.xml':
                     raise ValueError('Please select a valid XML file.')
 
-                # Parse XML
-                tree = ET.parse(self.selected_file)
-                root = tree.getroot()
-    
-                # Recursive function to convert XML to dict
-                def xml_to_dict(element):
-                    result = {}
-                    children = list(element)
-    
-                    # If no children, return text
-                    if not children:
-                        return element.text.strip() if element.text else ""
-    
-                    for child in children:
-                        child_dict = xml_to_dict(child)
-                        if child.tag in result:
-                            # If tag already exists, convert to list
-                            if not isinstance(result[child.tag], list):
-                                result[child.tag] = [result[child.tag]]
-                            result[child.tag].append(child_dict)
-                        else:
-                            result[child.tag] = child_dict
-                    return result
-    
-                # Convert and serialize JSON
-                json_data = {root.tag: xml_to_dict(root)}
-                json_string = json.dumps(json_data, indent=4)
-    
-                json_file_name = os.path.splitext(os.path.basename(self.selected_file))[0] + ".json"
-                json_file_path = os.path.join(self.downloads_path, json_file_name)
-    
-                # Write to JSON file
-                with open(json_file_path, 'w') as json_file:
-                    json_file.write(json_string)
-    
-                # Show message box
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle('Conversion Successful')
-                msg_box.setText(f'File converted and saved at: {json_file_path}')
-                msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-    
-                open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                msg_box.exec()
-    
-                if msg_box.clickedButton() == open_folder_btn:
-                    self.open_downloads_folder()
-    
-                self.output_label.clear()
-                self.output_label.setHtml(f"<b>JSON file created and saved at:</b><br>{json_file_path}")
-                self.output_label.show()
+                self.convert_button.setEnabled(False)
+                job_runner().submit(
+                    self.to_json, self.selected_file, self.downloads_path,
+                    owner=self,
+                    on_result=self.show_result,
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.convert_button.setEnabled(True))
             else:
                 raise ValueError('Please select a file first.')
             
@@ -207,3 +177,58 @@ class XMLtoJSONWindow(FileConversionWindow):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpeted Error', str(e))
+
+    @staticmethod
+    def to_json(selected_file, downloads_path):
+        # Parse XML
+        tree = ET.parse(selected_file)
+        root = tree.getroot()
+
+        # Recursive function to convert XML to dict
+        def xml_to_dict(element):
+            result = {}
+            children = list(element)
+
+            # If no children, return text
+            if not children:
+                return element.text.strip() if element.text else ""
+
+            for child in children:
+                child_dict = xml_to_dict(child)
+                if child.tag in result:
+                    # If tag already exists, convert to list
+                    if not isinstance(result[child.tag], list):
+                        result[child.tag] = [result[child.tag]]
+                    result[child.tag].append(child_dict)
+                else:
+                    result[child.tag] = child_dict
+            return result
+
+        # Convert and serialize JSON
+        json_data = {root.tag: xml_to_dict(root)}
+        json_string = json.dumps(json_data, indent=4)
+
+        json_file_name = os.path.splitext(os.path.basename(selected_file))[0] + ".json"
+        json_file_path = os.path.join(downloads_path, json_file_name)
+
+        # Write to JSON file
+        with open(json_file_path, 'w') as json_file:
+            json_file.write(json_string)
+        return json_file_path
+
+    def show_result(self, json_file_path):
+        # Show message box
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File converted and saved at: {json_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>JSON file created and saved at:</b><br>{json_file_path}")
+        self.output_label.show()
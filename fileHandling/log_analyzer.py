@@ -1,9 +1,9 @@
 from PyQt6.QtWidgets                import QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
 from .file_conversion               import FileConversionWindow
-from os                             import path
-from re                             import findall as re_findall
-import matplotlib.pyplot            as plt
+from jobs                           import job_runner, show_job_error
+from .log_stats                     import analyze_file
+from matplotlib.figure              import Figure
 import tempfile
 
 class LogAnalyzerWindow(FileConversionWindow):
@@ -42,8 +42,8 @@ class LogAnalyzerWindow(FileConversionWindow):
             bold=True, command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        analyze_button = DefaultButtonStyle("Click to Analyze", parent=self, bold=True, command=self.analyze_file)
-        analyze_button.setGeometry(450, 50, 150, 50)
+        self.analyze_button = DefaultButtonStyle("Click to Analyze", parent=self, bold=True, command=self.analyze_file)
+        self.analyze_button.setGeometry(450, 50, 150, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 500)
@@ -53,11 +53,14 @@ class LogAnalyzerWindow(FileConversionWindow):
         try:
             if hasattr(self, 'selected_file'):
                 analyzer = LogAnalyzer(self.selected_file)
-                html_output = analyzer.process(self.selected_file)
-
-                self.output_label.clear()
-                self.output_label.setHtml(html_output)
-                self.output_label.show()
+                self.analyze_button.setEnabled(False)
+                job_runner().submit(
+                    self.run_analysis, analyzer, self.selected_file, pass_job=True,
+                    owner=self,
+                    on_progress=lambda percent: self.output_label.setHtml(f"<b>Analyzing...</b> {percent}%"),
+                    on_result=self.show_analysis,
+                    on_error=self.show_error,
+                    on_finished=lambda: self.analyze_button.setEnabled(True))
         except FileNotFoundError as fnf:
             QMessageBox.warning(self, 'File not found', str(fnf))
         except PermissionError as pe:
@@ -65,49 +68,39 @@ class LogAnalyzerWindow(FileConversionWindow):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def run_analysis(analyzer, file_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return analyzer.process(file_path, progress_callback=progress)
+
+    def show_analysis(self, html_output):
+        self.output_label.clear()
+        self.output_label.setHtml(html_output)
+        self.output_label.show()
+
+    def show_error(self, error):
+        if isinstance(error, FileNotFoundError):
+            QMessageBox.warning(self, 'File not found', str(error))
+        elif isinstance(error, PermissionError):
+            QMessageBox.warning(self, 'Permission Error', str(error))
+        else:
+            show_job_error(self, error)
+
 class LogAnalyzer:
 
     def __init__(self, selected_file):
         self.selected_file = selected_file
 
-    def process(self, file_path):
-        if not path.isfile(file_path):
-            raise FileNotFoundError("File does not exist!")
-
-        text = open(file_path, "r", errors="ignore").read()
-
-        levels = self.parse_log_levels(text)
-        ips = self.extract_ip_addresses(text)
-        timeline = self.extract_timestamps(text)
-
-        pie_chart_path = self.generate_log_level_pie(levels)
-        ip_chart_path = self.generate_ip_bar(ips)
-
-        return self.build_html_output(levels, ips, timeline, pie_chart_path, ip_chart_path)
-
-    def parse_log_levels(self, text):
-        patterns = {
-            "INFO": r"\bINFO\b|\bInfo\b",
-            "ERROR": r"\bERROR\b|\bError\b",
-            "WARNING": r"\bWARN\b|\bWarning\b",
-            "DEBUG": r"\bDEBUG\b"}
-        return {lvl: len(re_findall(pattern, text)) for lvl, pattern in patterns.items()}
-
-    def extract_ip_addresses(self, text):
-        ip_regex = r"\b(?:\d{1,3}\.){3}\d{1,3}\b"
-        ips = re_findall(ip_regex, text)
-        freq = {}
-        for ip in ips:
-            freq[ip] = freq.get(ip, 0) + 1
-        return freq
-
-    def extract_timestamps(self, text):
-        ts_regex = r"\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}\b"
-        ts = re_findall(ts_regex, text)
-        freq = {}
-        for t in ts:
-            freq[t] = freq.get(t, 0) + 1
-        return freq
+    def process(self, file_path, progress_callback=None):
+        # one streaming pass over newline-aligned shards of the file instead of reading it whole
+        stats = analyze_file(file_path, progress_callback=progress_callback)
+
+        pie_chart_path = self.generate_log_level_pie(stats.levels)
+        ip_chart_path = self.generate_ip_bar(stats.ips)
+
+        return self.build_html_output(stats.levels, stats.ips, stats.timestamps, pie_chart_path, ip_chart_path)
 
     def generate_log_level_pie(self, levels):
         labels = list(levels.keys())
@@ -116,31 +109,32 @@ class LogAnalyzer:
         if sum(sizes) == 0:
             return None
 
-        fig, ax = plt.subplots(figsize=(4, 4))
+        # pyplot is not thread-safe, the analysis runs as a background job
+        fig = Figure(figsize=(4, 4))
+        ax = fig.subplots()
         ax.pie(sizes, labels=labels, autopct='%1.1f%%')
         ax.set_title("Log Level Distribution")
 
         temp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        plt.savefig(temp.name, bbox_inches="tight")
-        plt.close()
+        fig.savefig(temp.name, bbox_inches="tight")
         return temp.name
 
     def generate_ip_bar(self, ips):
         if not ips:
             return None
 
-        sorted_ips = sorted(ips.items(), key=lambda x: x[1], reverse=True)[:10]
+        sorted_ips = ips.most_common(10)
         keys = [k for k, v in sorted_ips]
         values = [v for k, v in sorted_ips]
 
-        fig, ax = plt.subplots(figsize=(5, 4))
+        fig = Figure(figsize=(5, 4))
+        ax = fig.subplots()
         ax.bar(keys, values)
         ax.set_xticklabels(keys, rotation=45, ha='right')
         ax.set_title("Top IP Addresses")
 
         temp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-        plt.savefig(temp.name, bbox_inches="tight")
-        plt.close()
+        fig.savefig(temp.name, bbox_inches="tight")
         return temp.name
 
     def build_html_output(self, levels, ips, timeline, pie_path, ip_path):
@@ -156,14 +150,14 @@ class LogAnalyzer:
 
         # top ip addresses
         html += "<h3><b>Top IP Addresses:</b></h3>"
-        for ip, count in sorted(ips.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for ip, count in ips.most_common(10):
             html += f"{ip}: <b>{count}</b><br>"
 
         html += "<br><hr>"
 
         # timestamp activity 
         html += "<h3><b>Activity Timeline (Top 10):</b></h3>"
-        for ts, count in sorted(timeline.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for ts, count in timeline.most_common(10):
             html += f"{ts}: <b>{count}</b><br>"
 
         html += "<br><hr>"
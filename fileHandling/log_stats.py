@@ -0,0 +1,159 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections        import Counter
+from .zip_cracker       import split_at_newlines
+import argparse, os, re, sys, time
+
+# One pass per block of lines: timestamp, IPv4 address or log level, whichever starts first.
+LOG_PATTERN = re.compile(
+    rb"(\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}\b)"
+    rb"|(\b(?:\d{1,3}\.){3}\d{1,3}\b)"
+    rb"|\b(INFO|Info|ERROR|Error|WARN|Warning|DEBUG)\b")
+
+LEVELS = ("INFO", "ERROR", "WARNING", "DEBUG")
+LEVEL_NAMES = {b"INFO": "INFO", b"Info": "INFO", b"ERROR": "ERROR", b"Error": "ERROR",
+               b"WARN": "WARNING", b"Warning": "WARNING", b"DEBUG": "DEBUG"}
+
+SHARD_SIZE = 64 * 1024 * 1024
+READ_SIZE = 4 * 1024 * 1024
+
+class LogStats:
+    """Log level, IP address and timestamp counts of a log, mergeable across shards."""
+
+    def __init__(self):
+        self.levels = Counter({level: 0 for level in LEVELS})
+        self.ips = Counter()
+        self.timestamps = Counter()
+        self.lines = 0
+        self.bytes = 0
+
+    def add_block(self, block):
+        """Counts the matches of a block of whole lines (bytes)."""
+        self.lines += block.count(b"\n")
+        self.bytes += len(block)
+        # counting the match tuples first keeps the Python loop to the distinct values
+        for (timestamp, ip, level), count in Counter(LOG_PATTERN.findall(block)).items():
+            if timestamp:
+                self.timestamps[timestamp.decode("ascii")] += count
+            elif ip:
+                self.ips[ip.decode("ascii")] += count
+            else:
+                self.levels[LEVEL_NAMES[level]] += count
+
+    def merge(self, other):
+        self.levels.update(other.levels)
+        self.ips.update(other.ips)
+        self.timestamps.update(other.timestamps)
+        self.lines += other.lines
+        self.bytes += other.bytes
+        return self
+
+def iter_blocks(f, end, read_size=READ_SIZE):
+    """Yields blocks of whole lines from the current position of f up to byte offset end.
+    A last line without a trailing newline is yielded as well."""
+    position = f.tell()
+    rest = b""
+    while position < end:
+        data = f.read(min(read_size, end - position))
+        if not data:
+            break
+        position += len(data)
+        cut = data.rfind(b"\n") + 1
+        if cut:
+            yield rest + data[:cut]
+            rest = data[cut:]
+        else:
+            rest += data
+    if rest:
+        yield rest
+
+def analyze_range(file_path, start, end):
+    """Process pool worker: statistics of the lines in the byte range [start, end)."""
+    stats = LogStats()
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        for block in iter_blocks(f, end):
+            stats.add_block(block)
+    return stats
+
+def analyze_file(file_path, workers=None, shard_size=SHARD_SIZE, progress_callback=None):
+    """Statistics of a whole log. The file is split into newline-aligned shards that are
+    analyzed on a process pool; progress_callback(bytes_done, total) is called per shard."""
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError("File does not exist!")
+    total = os.path.getsize(file_path)
+    workers = workers or os.cpu_count() or 1
+    stats = LogStats()
+    if total <= shard_size or workers == 1:
+        with open(file_path, "rb") as f:
+            for block in iter_blocks(f, total):
+                stats.add_block(block)
+                if progress_callback:
+                    progress_callback(stats.bytes, total)
+        return stats
+
+    # more shards than workers keeps the pool busy and the progress fine-grained
+    shards = split_at_newlines(file_path, max(workers * 4, -(-total // shard_size)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_range, file_path, start, end) for start, end in shards]
+        for future in as_completed(futures):
+            stats.merge(future.result())
+            if progress_callback:
+                progress_callback(stats.bytes, total)
+    return stats
+
+def follow_file(file_path, stats=None, interval=1.0):
+    """Tails a log: yields the updated statistics every time complete new lines were appended.
+    A file that shrinks (rotated or truncated) is analyzed again from the start."""
+    stats = stats if stats is not None else LogStats()
+    position = stats.bytes
+    while True:
+        size = os.path.getsize(file_path)
+        if size < position:
+            stats, position = LogStats(), 0
+        if size > position:
+            with open(file_path, "rb") as f:
+                f.seek(position)
+                data = f.read(size - position)
+            cut = data.rfind(b"\n") + 1  # a partly written last line waits for the next poll
+            if cut:
+                stats.add_block(data[:cut])
+                position += cut
+                yield stats
+        time.sleep(interval)
+
+def format_report(stats, top=10):
+    lines = [f"{stats.lines:,} lines, {stats.bytes:,} bytes", "", "Log levels:"]
+    lines += [f"  {level:<8} {count:,}" for level, count in stats.levels.items()]
+    lines += ["", f"Top {top} IP addresses:"]
+    lines += [f"  {ip:<16} {count:,}" for ip, count in stats.ips.most_common(top)]
+    lines += ["", f"Activity timeline (top {top}):"]
+    lines += [f"  {timestamp}  {count:,}" for timestamp, count in stats.timestamps.most_common(top)]
+    return "\n".join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m fileHandling.log_stats",
+                                     description="Counts log levels, IP addresses and timestamps of a log file.")
+    parser.add_argument("log_file")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    parser.add_argument("--top", type=int, default=10, help="entries shown per table")
+    parser.add_argument("-f", "--follow", action="store_true", help="keep reading lines appended to the file")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between --follow polls")
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        sys.stderr.write(f"\r{done * 100 // total if total else 100}%")
+        sys.stderr.flush()
+
+    stats = analyze_file(args.log_file, args.jobs, progress_callback=progress if sys.stderr.isatty() else None)
+    sys.stderr.write("\r")
+    print(format_report(stats, args.top), flush=True)
+    if args.follow:
+        try:
+            for stats in follow_file(args.log_file, stats, args.interval):
+                print("\n" + format_report(stats, args.top), flush=True)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+from PIL import Image
+import numpy as np
+import os
+
+# The first 32 channel values carry a header in their lowest bit: bits 31-29 are the depth - 1,
+# bits 28-0 the payload length in bits. Depth 1 gives exactly the original format of the tool
+# (a plain 32-bit length), so older stego images still decode.
+HEADER_CHANNELS = 32
+DEPTH_SHIFT = 29
+MAX_PAYLOAD_BITS = (1 << DEPTH_SHIFT) - 1
+MAX_DEPTH = 8
+
+def _check_depth(depth):
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Bits per channel must be between 1 and {MAX_DEPTH}.")
+
+def capacity(channels, depth=1):
+    """Number of payload bytes that fit into `channels` 8-bit channel values."""
+    _check_depth(depth)
+    return min(max(channels - HEADER_CHANNELS, 0) * depth, MAX_PAYLOAD_BITS) // 8
+
+def image_capacity(image_path, depth=1):
+    """Capacity of an RGB cover image in bytes; only the image header is read."""
+    with Image.open(image_path) as img:
+        width, height = img.size
+    return capacity(width * height * 3, depth)
+
+def check_capacity(image_path, secret_path, depth=1):
+    """Raises ValueError before any pixel or payload data is loaded if the secret does not fit."""
+    available = image_capacity(image_path, depth)
+    size = os.path.getsize(secret_path)
+    if size > available:
+        raise ValueError(f"File too large to hide in this image: {size:,} bytes, "
+                         f"but the image holds {available:,} bytes at {depth} bit(s) per channel.")
+    return available
+
+def embed(pixels, data, depth=1):
+    """Returns a copy of the uint8 pixel array with data hidden in the lowest `depth` bits of its channels."""
+    _check_depth(depth)
+    flat = np.array(pixels, dtype=np.uint8, copy=True).reshape(-1)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8))
+    if len(data) > capacity(flat.size, depth):
+        raise ValueError("File too large to hide in this image.")
+
+    header = ((depth - 1) << DEPTH_SHIFT) | bits.size
+    flat[:HEADER_CHANNELS] = (flat[:HEADER_CHANNELS] & 0xFE) | np.unpackbits(
+        np.array([header], dtype='>u4').view(np.uint8))
+
+    # every channel takes the next `depth` payload bits, most significant first
+    if depth == 1:
+        values = bits
+    else:
+        bits = np.pad(bits, (0, -bits.size % depth)).reshape(-1, depth)
+        values = np.packbits(bits, axis=1).reshape(-1) >> (8 - depth)
+    body = flat[HEADER_CHANNELS:HEADER_CHANNELS + values.size]
+    body &= 0xFF ^ ((1 << depth) - 1)
+    body |= values
+    return flat.reshape(np.shape(pixels))
+
+def extract(pixels):
+    """Reads the data hidden by embed() (or by the original one bit per channel encoder)."""
+    flat = np.asarray(pixels, dtype=np.uint8).reshape(-1)
+    if flat.size < HEADER_CHANNELS:
+        raise ValueError("Image too small or contains no hidden data.")
+    header = int.from_bytes(np.packbits(flat[:HEADER_CHANNELS] & 1).tobytes(), 'big')
+    depth, length = (header >> DEPTH_SHIFT) + 1, header & MAX_PAYLOAD_BITS
+
+    channels = -(-length // depth)
+    if flat.size - HEADER_CHANNELS < channels:
+        raise ValueError(f"Image does not contain the full payload. Expected {length} payload bits "
+                         f"but only {(flat.size - HEADER_CHANNELS) * depth} are present.")
+    values = flat[HEADER_CHANNELS:HEADER_CHANNELS + channels] & ((1 << depth) - 1)
+    if depth == 1:
+        return np.packbits(values).tobytes()
+    bits = np.unpackbits(values[:, None], axis=1)[:, 8 - depth:].reshape(-1)[:length]
+    return np.packbits(bits).tobytes()
+
+def encode_file(cover_path, secret_path, output_path, depth=1):
+    """Hides the secret file in the cover image and saves the result as PNG. Returns the payload size."""
+    check_capacity(cover_path, secret_path, depth)
+    with Image.open(cover_path) as img:
+        pixels = np.asarray(img.convert('RGB'))
+    with open(secret_path, 'rb') as f:
+        data = f.read()
+    Image.fromarray(embed(pixels, data, depth), 'RGB').save(output_path, format='PNG')
+    return len(data)
+
+def decode_file(stego_path):
+    with Image.open(stego_path) as img:
+        return extract(np.asarray(img.convert('RGB')))
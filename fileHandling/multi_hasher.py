@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+import os, mmap, time, hashlib
+
+class MultiDigestHasher:
+    """Computes several digests of a file in a single pass.
+
+    The file is mapped with mmap (or read into a reusable buffer where mapping is not possible)
+    and every chunk is fed to all selected digests from the same buffer. hashlib releases the GIL
+    on large updates, so the digests of a chunk run in parallel on a small thread pool."""
+
+    def __init__(self, algorithms=('md5', 'sha1', 'sha256', 'sha512'), chunk_size=4 * 1024 * 1024):
+        self.algorithms = list(algorithms)
+        self.chunk_size = chunk_size
+        self.bytes_hashed = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """Bytes per second of the last hash_file() call."""
+        return self.bytes_hashed / self.elapsed if self.elapsed else 0.0
+
+    def hash_file(self, file_path, progress_callback=None):
+        """Returns {algorithm: hexdigest}. progress_callback(bytes_done, total) is called after every chunk."""
+        start_time = time.perf_counter()
+        hashers = [hashlib.new(algo) for algo in self.algorithms]
+        total = os.path.getsize(file_path)
+        self.bytes_hashed = 0
+
+        # small files and single digests are not worth the thread hand-off
+        pool = ThreadPoolExecutor(max_workers=len(hashers)) if len(hashers) > 1 and total > self.chunk_size else None
+
+        def feed(chunk):
+            if pool:
+                # list() waits for every digest before the buffer is reused
+                list(pool.map(lambda h: h.update(chunk), hashers))
+            else:
+                for h in hashers:
+                    h.update(chunk)
+            self.bytes_hashed += len(chunk)
+            if progress_callback:
+                progress_callback(self.bytes_hashed, total)
+
+        try:
+            with open(file_path, 'rb') as f:
+                if total <= self.chunk_size:
+                    data = f.read()
+                    if data:
+                        feed(data)
+                else:
+                    try:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (OSError, ValueError): # pipes, some network filesystems
+                        mapped = None
+
+                    if mapped is not None:
+                        with mapped, memoryview(mapped) as view:
+                            for offset in range(0, total, self.chunk_size):
+                                with view[offset:offset + self.chunk_size] as chunk:
+                                    feed(chunk)
+                    else:
+                        buffer = bytearray(self.chunk_size)
+                        with memoryview(buffer) as view:
+                            while True:
+                                n = f.readinto(buffer)
+                                if not n:
+                                    break
+                                with view[:n] as chunk:
+                                    feed(chunk)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        self.elapsed = time.perf_counter() - start_time
+        return {algo: h.hexdigest() for algo, h in zip(self.algorithms, hashers)}
+
+def format_throughput(bytes_per_second):
+    for unit in ('B/s', 'KiB/s', 'MiB/s'):
+        if bytes_per_second < 1024:
+            return f"{bytes_per_second:.1f} {unit}"
+        bytes_per_second /= 1024
+    return f"{bytes_per_second:.1f} GiB/s"
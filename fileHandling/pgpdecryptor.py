@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QWidget, QTextEdit, QMessageBox, QFileDialog, QLineEdit, QInputDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from jobs                           import job_runner
 from pathlib                        import Path
 from PyQt6.QtCore                   import QProcess
 import os, pgpy, sys, warnings
@@ -54,8 +55,8 @@ class PGPDecryptWindow(QWidget):
             bold=True, command=self.load_prv_key)
         load_prv_key_button.setGeometry(340, 30, 330, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, command=self.decrypt_file, bold=True)
-        decrypt_button.setGeometry(300, 120, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, command=self.decrypt_file, bold=True)
+        self.decrypt_button.setGeometry(300, 120, 100, 50)
 
         self.selected_file_label = QTextEdit(parent=self)
         self.selected_file_label.setGeometry(10, 190, 680, 100)
@@ -130,49 +131,13 @@ class PGPDecryptWindow(QWidget):
                             QMessageBox.critical(self, "Decryption Failed", f"Failed to unlock private key: {str(e)}")
                             return
 
-                    # Read and decrypt the encrypted file
-                    with open(self.selected_file, 'rb') as file:
-                        file_data = file.read()
-
-                    try:
-                        encrypted_message = pgpy.PGPMessage.from_blob(file_data)
-                    except Exception as e:
-                        QMessageBox.critical(self, "Invalid PGP File", f"Failed to read PGP message: {str(e)}")
-                        return
-
-                    try:
-                        decrypted_msg = private_key.decrypt(encrypted_message)
-                        decrypted_data = decrypted_msg.message
-
-                        # Convert to bytes if it's a string
-                        if isinstance(decrypted_data, str):
-                            decrypted_data = decrypted_data.encode('utf-8')
-
-                    except Exception as e:
-                        QMessageBox.critical(self, "Decryption Error", f"Failed to decrypt message: {str(e)}")
-                        return
-
-                    if not decrypted_data.strip():
-                        QMessageBox.warning(self, "Decryption Warning", "The decrypted content is empty.")
-                        return
-
-                    with open(decrypted_file_path, 'wb') as decrypted_file:
-                        decrypted_file.write(decrypted_data)
-
-                    # Show a message box with option to open Downloads folder
-                    msg_box = QMessageBox(self)
-                    msg_box.setWindowTitle('Decryption Successful')
-                    msg_box.setText(f'File decrypted and saved at:\n{decrypted_file_path}')
-                    msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                    open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                    msg_box.exec()
-
-                    if msg_box.clickedButton() == open_folder_btn:
-                        self.open_downloads_folder()
-
-                    self.decrypted_file_label.clear()
-                    self.decrypted_file_label.setHtml(f'<b>File successfully decrypted and saved at:</b><br>{decrypted_file_path}')
-                    self.decrypted_file_label.show()
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, private_key, self.selected_file, decrypted_file_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: QMessageBox.critical(self, "Decryption Error", f"Failed to decrypt message: {str(e)}"),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
 
                 except Exception as e:
                     QMessageBox.critical(self, 'An error occurred', f'An error occurred during decryption:\n{str(e)}')
@@ -181,6 +146,47 @@ class PGPDecryptWindow(QWidget):
         else:
             QMessageBox.warning(self, 'No File Selected', 'Please select an encrypted file first.')
 
+    @staticmethod
+    def decrypt(private_key, selected_file, decrypted_file_path):
+        # Read and decrypt the encrypted file
+        with open(selected_file, 'rb') as file:
+            file_data = file.read()
+
+        encrypted_message = pgpy.PGPMessage.from_blob(file_data)
+        decrypted_msg = private_key.decrypt(encrypted_message)
+        decrypted_data = decrypted_msg.message
+
+        # Convert to bytes if it's a string
+        if isinstance(decrypted_data, str):
+            decrypted_data = decrypted_data.encode('utf-8')
+
+        if not decrypted_data.strip():
+            return None
+
+        with open(decrypted_file_path, 'wb') as decrypted_file:
+            decrypted_file.write(decrypted_data)
+        return decrypted_file_path
+
+    def show_result(self, decrypted_file_path):
+        if decrypted_file_path is None:
+            QMessageBox.warning(self, "Decryption Warning", "The decrypted content is empty.")
+            return
+
+        # Show a message box with option to open Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Decryption Successful')
+        msg_box.setText(f'File decrypted and saved at:\n{decrypted_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.decrypted_file_label.clear()
+        self.decrypted_file_label.setHtml(f'<b>File successfully decrypted and saved at:</b><br>{decrypted_file_path}')
+        self.decrypted_file_label.show()
+
     def open_downloads_folder(self):
         # Open the Downloads folder using the appropriate command for the OS
         if sys.platform == 'win32':
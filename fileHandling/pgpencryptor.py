@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                import QWidget, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
+from jobs                           import job_runner
 from pathlib                        import Path
 from PyQt6.QtCore                   import QProcess
 import os, pgpy, sys, warnings
@@ -54,8 +55,8 @@ class PGPEncryptWindow(QWidget):
             bold=True, command=self.load_pbl_key)
         load_pbl_key_button.setGeometry(340, 30, 320, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.encrypt_file, bold=True)
-        encrypt_button.setGeometry(300, 120, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.encrypt_file, bold=True)
+        self.encrypt_button.setGeometry(300, 120, 100, 50)
 
         self.selected_file_label = QTextEdit(parent=self)
         self.selected_file_label.setGeometry(10, 190, 680, 100)
@@ -113,38 +114,13 @@ class PGPEncryptWindow(QWidget):
                         warnings.filterwarnings("ignore", category=UserWarning)
                         warnings.filterwarnings("ignore", category=DeprecationWarning)
 
-                        # Load public key
-                        with open(self.pbl_key_file, 'r') as key_file:
-                            key_data = key_file.read()
-                            public_key, _ = pgpy.PGPKey.from_blob(key_data)
-
-                        # Read and encrypt file
-                        with open(self.selected_file, 'rb') as file:
-                            file_data = file.read()
-                            data = pgpy.PGPMessage.new(file_data, file=True)
-                            encrypted_data = public_key.encrypt(data)
-
-                        with open(encrypted_file_path, 'w') as encrypted_file:
-                            encrypted_file.write(str(encrypted_data))
-
-                        # Show a custom message box with a button to open the Downloads folder
-                        msg_box = QMessageBox(self)
-                        msg_box.setWindowTitle('Encryption Successful')
-                        msg_box.setText(f'File encrypted and saved at: {encrypted_file_path}')
-                        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                        # Add a custom button for opening the Downloads folder
-                        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                        msg_box.exec()
-
-                        # If the user clicks "Open Downloads", open the Downloads folder
-                        if msg_box.clickedButton() == open_folder_btn:
-                            self.open_downloads_folder()
-
-                        self.encrypted_file_label.clear()
-                        self.encrypted_file_label.setHtml(f'<b>File Successfully encrypted and saved at:</b><br> {str(encrypted_file_path)}')
-                        self.encrypted_file_label.show()
-
+                        self.encrypt_button.setEnabled(False)
+                        job_runner().submit(
+                            self.encrypt, self.pbl_key_file, self.selected_file, encrypted_file_path,
+                            owner=self,
+                            on_result=self.show_result,
+                            on_error=lambda e: QMessageBox.critical(self, 'An error occured', f'An error occured during encryption: {str(e)}'),
+                            on_finished=lambda: self.encrypt_button.setEnabled(True))
                     except Exception as e:
                         QMessageBox.critical(self, 'An error occured', f'An error occured during encryption: {str(e)}')
                 else:
@@ -157,6 +133,42 @@ class PGPEncryptWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encrypt(pbl_key_file, selected_file, encrypted_file_path):
+        # Load public key
+        with open(pbl_key_file, 'r') as key_file:
+            key_data = key_file.read()
+            public_key, _ = pgpy.PGPKey.from_blob(key_data)
+
+        # Read and encrypt file
+        with open(selected_file, 'rb') as file:
+            file_data = file.read()
+            data = pgpy.PGPMessage.new(file_data, file=True)
+            encrypted_data = public_key.encrypt(data)
+
+        with open(encrypted_file_path, 'w') as encrypted_file:
+            encrypted_file.write(str(encrypted_data))
+        return encrypted_file_path
+
+    def show_result(self, encrypted_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Encryption Successful')
+        msg_box.setText(f'File encrypted and saved at: {encrypted_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.encrypted_file_label.clear()
+        self.encrypted_file_label.setHtml(f'<b>File Successfully encrypted and saved at:</b><br> {str(encrypted_file_path)}')
+        self.encrypted_file_label.show()
+
     def open_downloads_folder(self):
         # Open the Downloads folder using the appropriate command for the OS
         if sys.platform == 'win32':
@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets                    import QTextEdit, QMessageBox
 from DefaultStyles.button_style         import DefaultButtonStyle
+from jobs                               import job_runner, show_job_error
 from .file_conversion                   import FileConversionWindow
 import os, dis, io, contextlib
 
@@ -35,8 +36,8 @@ class PyCodeDisassemblerWindow(FileConversionWindow):
             command=self.select_file)
         select_file_button.setGeometry(150, 50, 230, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.handler)
-        submit_button.setGeometry(450, 50, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.handler)
+        self.submit_button.setGeometry(450, 50, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 100)
@@ -49,7 +50,13 @@ class PyCodeDisassemblerWindow(FileConversionWindow):
                 file_extension = os.path.splitext(self.selected_file)[1].lower()
 
                 if file_extension == '.py':
-                    self.disassemble_py(self.selected_file)
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.disassemble_py, self.selected_file, self.downloads_path,
+                        owner=self,
+                        on_result=self.show_result,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     raise ValueError(f'Invalid file type: {file_extension}')
             else:
@@ -57,45 +64,42 @@ class PyCodeDisassemblerWindow(FileConversionWindow):
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
 
-    def disassemble_py(self, py_path):
-        try:
-            # Read source code
-            with open(py_path, "r") as f:
-                source_code = f.read()
-
-            # Compile source code to code object
-            code_object = compile(source_code, py_path, 'exec')
-
-            output_buffer = io.StringIO()
-            with contextlib.redirect_stdout(output_buffer):
-                print(dis.code_info(code_object))
-                dis.dis(code_object)
-            disassembled_output = output_buffer.getvalue()
-
-            base_name = os.path.basename(self.selected_file)
-            output_file_name = os.path.splitext(base_name)[0] + '_disassembled.txt'
-            output_file_path = os.path.join(self.downloads_path, output_file_name)
-
-            with open(output_file_path, 'w') as json_file:
-                json_file.write(disassembled_output)
-
-            # Show a custom message box with a button to open the Downloads folder
-            msg_box = QMessageBox(self)
-            msg_box.setWindowTitle('Operation Successfull')
-            msg_box.setText(f'File disassembled and saved at: {output_file_path}')
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-            # Add a custom button for opening the Downloads folder
-            open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-            msg_box.exec()
-            # If the user clicks "Open Downloads", open the Downloads folder
-            if msg_box.clickedButton() == open_folder_btn:
-                self.open_downloads_folder()
-
-            self.output_label.clear()
-            self.output_label.setHtml(f"<b>Output file created and saved at:</b><br> {self.downloads_path}")
-            self.output_label.show()
-
-        except ValueError as ve:
-            QMessageBox.warning(self, 'Error', str(ve))
-        except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error', str(e))
+    @staticmethod
+    def disassemble_py(py_path, downloads_path):
+        # Read source code
+        with open(py_path, "r") as f:
+            source_code = f.read()
+
+        # Compile source code to code object
+        code_object = compile(source_code, py_path, 'exec')
+
+        output_buffer = io.StringIO()
+        with contextlib.redirect_stdout(output_buffer):
+            print(dis.code_info(code_object))
+            dis.dis(code_object)
+        disassembled_output = output_buffer.getvalue()
+
+        base_name = os.path.basename(py_path)
+        output_file_name = os.path.splitext(base_name)[0] + '_disassembled.txt'
+        output_file_path = os.path.join(downloads_path, output_file_name)
+
+        with open(output_file_path, 'w') as json_file:
+            json_file.write(disassembled_output)
+        return output_file_path
+
+    def show_result(self, output_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Operation Successfull')
+        msg_box.setText(f'File disassembled and saved at: {output_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>Output file created and saved at:</b><br> {self.downloads_path}")
+        self.output_label.show()
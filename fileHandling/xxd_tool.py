@@ -1,7 +1,27 @@
-from PyQt6.QtWidgets            import QMessageBox, QTextEdit, QInputDialog
-from DefaultStyles.button_style import DefaultButtonStyle
-from .file_conversion           import FileConversionWindow
-import os, subprocess
+from PyQt6.QtWidgets                import QMessageBox, QTextEdit, QListView, QAbstractItemView
+from PyQt6.QtCore                   import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui                    import QFontDatabase
+from DefaultStyles.button_style     import DefaultButtonStyle
+from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from .file_conversion               import FileConversionWindow
+from .hexdump                       import HexDump, BYTES_PER_ROW, parse_pattern
+from jobs                           import job_runner, show_job_error
+import os
+
+class HexDumpModel(QAbstractListModel):
+    """Exposes the rows of a HexDump to a view. Only the rows the view paints are formatted."""
+
+    def __init__(self, dump, parent=None):
+        super().__init__(parent)
+        self.dump = dump
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.dump.rows
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self.dump.row(index.row())
+        return None
 
 class xxdHexDumpWindow(FileConversionWindow):
 
@@ -18,9 +38,10 @@ class xxdHexDumpWindow(FileConversionWindow):
         "<b>Instructions</b> on how to use the tool:"
         "<ul>"
         "<li>Click the 'Select a file' button to choose a file you want to analyze.</li>"
-        "<li>Click the 'Generate Hex Dump' button to create a hex dump of the selected file.</li>"
-        "<li>The hex dump will be displayed in the text area below.</li>"
-        "<li>You can copy the hex dump text for further analysis or save it to a file.</li>"
+        "<li>Click the 'Generate' button to open a hex view of the selected file. Rows are read on demand, "
+        "so even very large files open instantly.</li>"
+        "<li>Jump to an offset (decimal or 0x hex) or search for text or hex bytes (e.g. <code>hex:7f454c46</code>).</li>"
+        "<li>Click 'Export .hex' to save the complete dump in xxd format to your Downloads folder.</li>"
         "</ul>"
         "<b>Example usage of xxd in a Linux terminal:</b><br>"
         "<code>xxd filename</code> - Creates a hex dump of 'filename'.<br>"
@@ -37,25 +58,45 @@ class xxdHexDumpWindow(FileConversionWindow):
 
         self.setWindowTitle("xxd Hex Dump Tool")
         self.setFixedSize(700, 500)
+        self.dump = None
 
         select_file_button = DefaultButtonStyle(
             'Select a file',
             parent=self,
             bold=True, command=self.select_file)
-        select_file_button.setGeometry(150, 50, 230, 50)
+        select_file_button.setGeometry(10, 20, 200, 50)
 
         generate_button = DefaultButtonStyle("Generate", parent=self, bold=True, command=self.execute_xxd)
-        generate_button.setGeometry(450, 50, 100, 50)
-
-        self.hex_dump_output_label = QTextEdit(parent=self)
-        self.hex_dump_output_label.setGeometry(10, 130, 680, 300)
-        self.hex_dump_output_label.setReadOnly(True)
-        self.hex_dump_output_label.hide()
+        generate_button.setGeometry(230, 20, 150, 50)
+
+        self.export_button = DefaultButtonStyle("Export .hex", parent=self, bold=True, command=self.export_hex)
+        self.export_button.setGeometry(400, 20, 150, 50)
+
+        self.offset_input = DefaultQLineEditStyle(parent=self, placeholder_text="Offset (0x1f0 or 496)")
+        self.offset_input.setGeometry(10, 80, 200, 40)
+        self.offset_input.returnPressed.connect(self.jump_to_offset)
+        go_button = DefaultButtonStyle("Go", parent=self, bold=True, command=self.jump_to_offset)
+        go_button.setGeometry(215, 80, 60, 40)
+
+        self.search_input = DefaultQLineEditStyle(parent=self, placeholder_text="Search text or hex:7f454c46")
+        self.search_input.setGeometry(290, 80, 280, 40)
+        self.search_input.returnPressed.connect(self.find_next)
+        find_button = DefaultButtonStyle("Find Next", parent=self, bold=True, command=self.find_next)
+        find_button.setGeometry(575, 80, 115, 40)
+
+        # virtualized view: uniform rows let the view lay out millions of rows without asking for them
+        self.hex_dump_view = QListView(parent=self)
+        self.hex_dump_view.setGeometry(10, 130, 680, 300)
+        self.hex_dump_view.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.hex_dump_view.setUniformItemSizes(True)
+        self.hex_dump_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.hex_dump_view.hide()
 
         self.saved_file_label = QTextEdit(parent=self)
         self.saved_file_label.setGeometry(10, 440, 580, 50)
         self.saved_file_label.setReadOnly(True)
         self.saved_file_label.hide()
+        self.last_match = -1
 
     def execute_xxd(self):
         try:
@@ -63,55 +104,114 @@ class xxdHexDumpWindow(FileConversionWindow):
                 raise ValueError('Please select a file first.')
             if not os.path.isfile(self.selected_file):
                 raise ValueError('Selected file does not exist.')
-            
-            result = subprocess.run(["xxd", self.selected_file], capture_output=True, text=True)
-            if result.returncode != 0:
-                raise Exception(f"xxd command failed: {result.stderr}")
-            hex_dump = result.stdout
-
-            modes = ['Yes', 'No']
-            mode, ok = QInputDialog.getItem(self,
-                "Save as file?",
-                "Choose an option:",
-                modes, 0, False)
-            if ok:
-                if mode == 'Yes':
-                    file_name = os.path.basename(self.selected_file)
-                    saved_file_path = os.path.join(self.downloads_path, f'{file_name}.hex')
-
-                    if saved_file_path:
-                        with open(saved_file_path, 'w') as f:
-                            f.write(hex_dump)
- 
-                        # Show a custom message box with a button to open the Downloads folder
-                        msg_box = QMessageBox(self)
-                        msg_box.setWindowTitle('Generation Successful')
-                        msg_box.setText(f'File generated and saved at: {saved_file_path}')
-                        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-
-                        # Add a custom button for opening the Downloads folder
-                        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                        msg_box.exec()
-
-                        # If the user clicks "Open Downloads", open the Downloads folder
-                        if msg_box.clickedButton() == open_folder_btn:
-                            self.open_downloads_folder()
-
-                        self.saved_file_label.clear()
-                        self.saved_file_label.setHtml(f"<b>Hex dump file saved at:</b><br>{saved_file_path}")
-                        self.saved_file_label.show()
-
-            self.hex_dump_output_label.clear()
-            self.hex_dump_output_label.setPlainText(f"Hex dump info/data:\n\n{hex_dump}")
-            self.hex_dump_output_label.show()
+
+            self.close_dump()
+            self.dump = HexDump(self.selected_file)
+            self.hex_dump_view.setModel(HexDumpModel(self.dump, self))
+            self.hex_dump_view.show()
+            self.last_match = -1
+            self.show_status(f"<b>{os.path.basename(self.selected_file)}:</b> {self.dump.size:,} bytes, {self.dump.rows:,} rows")
 
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
-        except FileNotFoundError:
-            QMessageBox.critical(
-                self, 'xxd Missing',
-                "xxd is not found. Please install it and ensure it's in your system PATH.\n")
         except Exception as e:
             QMessageBox.critical(
                 self, 'Failed to Generate Hex Dump data',
                 f'Error: {str(e)}')
+
+    def require_dump(self):
+        if self.dump is None:
+            raise ValueError('Please generate the hex dump first.')
+        return self.dump
+
+    def select_offset(self, offset):
+        index = self.hex_dump_view.model().index(offset // BYTES_PER_ROW, 0)
+        self.hex_dump_view.setCurrentIndex(index)
+        self.hex_dump_view.scrollTo(index, QAbstractItemView.ScrollHint.PositionAtCenter)
+
+    def jump_to_offset(self):
+        try:
+            dump = self.require_dump()
+            offset = dump.parse_offset(self.offset_input.text())
+            self.select_offset(offset)
+            self.show_status(f"<b>Offset:</b> {offset:#x} ({offset:,})")
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def find_next(self):
+        try:
+            dump = self.require_dump()
+            pattern = parse_pattern(self.search_input.text())
+            found = dump.find(pattern, self.last_match + 1)
+            if found == -1:
+                self.show_status(f"<b>Not found:</b> {self.search_input.text()}")
+                return
+            self.last_match = found
+            self.select_offset(found)
+            self.show_status(f"<b>Found at offset:</b> {found:#x} ({found:,})")
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def export_hex(self):
+        try:
+            dump = self.require_dump()
+            # named after the dumped file, which may differ from a newly selected one
+            file_name = os.path.basename(dump.file_path)
+            saved_file_path = os.path.join(self.downloads_path, f'{file_name}.hex')
+            self.export_button.setEnabled(False)
+            job_runner().submit(
+                self.run_export, dump.file_path, saved_file_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_status(f"<b>Exporting...</b> {percent}%"),
+                on_result=self.show_export_result,
+                on_error=lambda e: show_job_error(self, e, 'Failed to Generate Hex Dump data'),
+                on_finished=lambda: self.export_button.setEnabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_export(file_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        # the job has its own mapping, the view's stays usable meanwhile
+        with HexDump(file_path) as dump:
+            return dump.export(output_path, progress_callback=progress)
+
+    def show_export_result(self, saved_file_path):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Generation Successful')
+        msg_box.setText(f'File generated and saved at: {saved_file_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+
+        # Add a custom button for opening the Downloads folder
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+
+        # If the user clicks "Open Downloads", open the Downloads folder
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.show_status(f"<b>Hex dump file saved at:</b><br>{saved_file_path}")
+
+    def show_status(self, html):
+        self.saved_file_label.clear()
+        self.saved_file_label.setHtml(html)
+        self.saved_file_label.show()
+
+    def close_dump(self):
+        if self.dump is not None:
+            self.hex_dump_view.setModel(None)
+            self.dump.close()
+            self.dump = None
+
+    def closeEvent(self, event):
+        self.close_dump()
+        super().closeEvent(event)
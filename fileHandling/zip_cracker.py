@@ -0,0 +1,253 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import os, time, hmac, struct, hashlib, zipfile, multiprocessing, pyzipper
+
+# Local file header: signature, version, flags, method, time, date, crc, csize, usize, name len, extra len
+LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+AES_EXTRA_ID = 0x9901
+AES_METHOD = 99
+AES_SALT_LENGTHS = {1: 8, 2: 12, 3: 16}
+AES_KEY_LENGTHS = {1: 16, 2: 24, 3: 32}
+AES_AUTH_CODE_LENGTH = 10
+ZIPCRYPTO_HEADER_LENGTH = 12
+
+def _make_crc_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+CRC_TABLE = _make_crc_table()
+
+class ZipPasswordVerifier:
+    """Checks candidate passwords against the encryption header of the smallest encrypted
+    member of a zip archive, without extracting anything.
+
+    ZipCrypto members are checked through the 12-byte encryption header check byte and
+    confirmed by decrypting the member and checking its CRC. WinZip AES members are checked
+    through the 2-byte password verification value and confirmed with the HMAC-SHA1
+    authentication code."""
+
+    def __init__(self, zip_path):
+        self.zip_path = zip_path
+        with zipfile.ZipFile(zip_path) as zf:
+            encrypted = [info for info in zf.infolist() if info.flag_bits & 0x1]
+        if not encrypted:
+            raise ValueError("The selected archive is not password protected.")
+        self.info = min(encrypted, key=lambda info: info.compress_size)
+
+        with open(zip_path, 'rb') as f:
+            f.seek(self.info.header_offset)
+            header = LOCAL_HEADER.unpack(f.read(LOCAL_HEADER.size))
+            if header[0] != b"PK\x03\x04":
+                raise zipfile.BadZipFile("Bad local file header signature.")
+            mod_time, name_len, extra_len = header[4], header[9], header[10]
+            f.seek(name_len + extra_len, os.SEEK_CUR)
+            self.data_offset = f.tell()
+
+            if self.info.compress_type == AES_METHOD:
+                self.is_aes = True
+                strength = self._aes_strength(self.info.extra)
+                self.key_length = AES_KEY_LENGTHS[strength]
+                self.salt = f.read(AES_SALT_LENGTHS[strength])
+                self._derived = (None, None)   # (password, key material) of the last check()
+                self.pwd_verifier = f.read(2)
+                self.payload_offset = f.tell()
+                self.payload_length = (self.info.compress_size - len(self.salt) - 2 - AES_AUTH_CODE_LENGTH)
+                f.seek(self.payload_offset + self.payload_length)
+                self.auth_code = f.read(AES_AUTH_CODE_LENGTH)
+            else:
+                self.is_aes = False
+                self.enc_header = f.read(ZIPCRYPTO_HEADER_LENGTH)
+                # With a data descriptor (bit 3) the check byte is taken from the modification time
+                if self.info.flag_bits & 0x8:
+                    self.check_byte = (mod_time >> 8) & 0xFF
+                else:
+                    self.check_byte = (self.info.CRC >> 24) & 0xFF
+
+    @staticmethod
+    def _aes_strength(extra):
+        """Returns the AES strength (1, 2 or 3) stored in the 0x9901 extra field."""
+        pos = 0
+        while pos + 4 <= len(extra):
+            header_id, size = struct.unpack_from("<HH", extra, pos)
+            if header_id == AES_EXTRA_ID:
+                return extra[pos + 8]
+            pos += 4 + size
+        raise zipfile.BadZipFile("AES extra field not found.")
+
+    def check(self, pwd: bytes) -> bool:
+        """Fast rejection test. A True result still has to be confirmed."""
+        if self.is_aes:
+            derived = self._derive(pwd)
+            self._derived = (pwd, derived)
+            return derived[-2:] == self.pwd_verifier
+
+        crc_table = CRC_TABLE
+        k0, k1, k2 = 305419896, 591751049, 878082192
+        for c in pwd:
+            k0 = (k0 >> 8) ^ crc_table[(k0 ^ c) & 0xFF]
+            k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+            k2 = (k2 >> 8) ^ crc_table[(k2 ^ (k1 >> 24)) & 0xFF]
+        header = self.enc_header
+        for i in range(ZIPCRYPTO_HEADER_LENGTH - 1):
+            temp = (k2 | 2) & 0xFFFF
+            c = header[i] ^ (((temp * (temp ^ 1)) >> 8) & 0xFF)
+            k0 = (k0 >> 8) ^ crc_table[(k0 ^ c) & 0xFF]
+            k1 = ((k1 + (k0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+            k2 = (k2 >> 8) ^ crc_table[(k2 ^ (k1 >> 24)) & 0xFF]
+        temp = (k2 | 2) & 0xFFFF
+        return header[-1] ^ (((temp * (temp ^ 1)) >> 8) & 0xFF) == self.check_byte
+
+    def confirm(self, pwd: bytes) -> bool:
+        """Full verification of a password that passed check()."""
+        if self.is_aes:
+            # the key material of a password that just passed check() is reused
+            derived = self._derived[1] if self._derived[0] == pwd else self._derive(pwd)
+            mac = hmac.new(derived[self.key_length:2 * self.key_length], digestmod=hashlib.sha1)
+            with open(self.zip_path, 'rb') as f:
+                f.seek(self.payload_offset)
+                remaining = self.payload_length
+                while remaining > 0:
+                    chunk = f.read(min(remaining, 1 << 20))
+                    if not chunk:
+                        return False
+                    mac.update(chunk)
+                    remaining -= len(chunk)
+            return hmac.compare_digest(mac.digest()[:AES_AUTH_CODE_LENGTH], self.auth_code)
+
+        try:
+            with zipfile.ZipFile(self.zip_path) as zf:
+                with zf.open(self.info, pwd=pwd) as member:
+                    while member.read(1 << 20):
+                        pass
+            return True
+        except Exception: # a wrong key yields garbage that may fail in the decompressor in any way
+            return False
+
+    def _derive(self, pwd):
+        """WinZip AES key material: encryption key, HMAC key and 2-byte password verifier."""
+        return hashlib.pbkdf2_hmac('sha1', pwd, self.salt, 1000, 2 * self.key_length + 2)
+
+    def verify(self, pwd: bytes) -> bool:
+        return self.check(pwd) and self.confirm(pwd)
+
+# Per-process state of the pool workers
+_worker = {}
+
+def _init_worker(zip_path, counter, stop_event):
+    _worker['verifier'] = ZipPasswordVerifier(zip_path)
+    _worker['counter'] = counter
+    _worker['stop'] = stop_event
+
+def _crack_range(wordlist_path, start, end, batch_size):
+    """Tries every password in the [start, end) byte range of the wordlist."""
+    verifier, counter, stop = _worker['verifier'], _worker['counter'], _worker['stop']
+    check, confirm = verifier.check, verifier.confirm
+    tried = 0
+    with open(wordlist_path, 'rb') as f:
+        f.seek(start)
+        pos = start
+        for line in f:
+            pos += len(line)
+            pwd = line.rstrip(b"\r\n")
+            if pwd and check(pwd) and confirm(pwd):
+                stop.set()
+                return pwd
+            tried += 1
+            if tried == batch_size:
+                with counter.get_lock():
+                    counter.value += tried
+                tried = 0
+                if stop.is_set():
+                    return None
+            if pos >= end:
+                break
+    with counter.get_lock():
+        counter.value += tried
+    return None
+
+def split_at_newlines(path, parts):
+    """Splits a file into at most `parts` (start, end) byte ranges that begin on a line."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()
+            offset = f.tell()
+            if offset >= size:
+                break
+            if offset > bounds[-1]:
+                bounds.append(offset)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+class ZipPasswordCracker:
+    """Splits a wordlist across a process pool and searches it for the password of a zip archive.
+
+    progress_callback(attempts, attempts_per_second) is called at most every `interval` seconds
+    from the thread that runs run(); cancel() may be called from any thread."""
+
+    def __init__(self, zip_path, wordlist_path, workers=None, batch_size=2048, interval=0.25):
+        self.zip_path = zip_path
+        self.wordlist_path = wordlist_path
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.interval = interval
+        self.attempts = 0
+        self.elapsed = 0.0
+        self.cancelled = False
+        self._stop = multiprocessing.Event()
+        self._counter = multiprocessing.Value('Q', 0)
+
+    def cancel(self):
+        self.cancelled = True
+        self._stop.set()
+
+    def run(self, progress_callback=None):
+        """Returns the password as bytes, or None when it is not in the wordlist or the run was cancelled."""
+        ZipPasswordVerifier(self.zip_path) # fail early on unsupported/unencrypted archives
+        ranges = split_at_newlines(self.wordlist_path, self.workers * 4)
+        start_time = last_report = time.perf_counter()
+        password = None
+        with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.zip_path, self._counter, self._stop)) as pool:
+            pending = {pool.submit(_crack_range, self.wordlist_path, start, end, self.batch_size)
+                       for start, end in ranges}
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=self.interval, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        result = future.result()
+                        if result is not None:
+                            password = result
+                    if password is not None or self._stop.is_set():
+                        break
+                    if progress_callback and time.perf_counter() - last_report >= self.interval:
+                        last_report = time.perf_counter()
+                        self._report(progress_callback, start_time)
+            finally:
+                # also on a worker error or a cancel raised by progress_callback, so that the
+                # other workers stop at their next batch instead of finishing their ranges
+                self._stop.set()
+                for future in pending:
+                    future.cancel()
+        self._report(progress_callback, start_time)
+        return password
+
+    def _report(self, progress_callback, start_time):
+        self.attempts = self._counter.value
+        self.elapsed = time.perf_counter() - start_time
+        if progress_callback:
+            progress_callback(self.attempts, self.attempts / self.elapsed if self.elapsed else 0.0)
+
+    def extract(self, password: bytes, path):
+        """Extracts the archive once the password has been confirmed."""
+        with pyzipper.AESZipFile(self.zip_path, 'r') as zip_file:
+            zip_file.extractall(path=path, pwd=password)
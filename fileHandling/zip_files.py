@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QLabel, QMessageBox, QTextEdit
 from DefaultStyles.button_style     import DefaultButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 from .file_conversion               import FileConversionWindow
 import pyminizip, os, zipfile
 
@@ -44,8 +45,8 @@ class ZipFileWithPwdWindow(FileConversionWindow):
         self.pwd_input.setEchoMode(self.pwd_input.EchoMode.Password)
         self.pwd_input.setGeometry(300, 60, 200, 50)
 
-        submit_button = DefaultButtonStyle("Submit", bold=True, parent=self, command=self.zip_file)
-        submit_button.setGeometry(550, 60, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", bold=True, parent=self, command=self.zip_file)
+        self.submit_button.setGeometry(550, 60, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 70)
@@ -61,21 +62,13 @@ class ZipFileWithPwdWindow(FileConversionWindow):
                 password = self.pwd_input.text()
                 filename_only = os.path.basename(self.selected_file)
                 zipper = ZipWithPassword(f"{filename_only}.zip")
-                zipper.add_file(self.selected_file, password, compression_level=9)
-
-                # Show a custom message box with a button to open the Downloads folder
-                msg_box = QMessageBox(self)
-                msg_box.setWindowTitle('Conversion Successful')
-                msg_box.setText(f'File zipped and saved at: {self.downloads_path}')
-                msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
-                open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
-                msg_box.exec()
-                if msg_box.clickedButton() == open_folder_btn:
-                    self.open_downloads_folder()
-                
-                self.output_label.clear()
-                self.output_label.setHtml(f"<b>File successfully zipped with password and saved at:</b><br>{self.downloads_path}")
-                self.output_label.show()
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    zipper.add_file, self.selected_file, password, compression_level=9,
+                    owner=self,
+                    on_result=lambda _: self.show_result(),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
 
                 # zipper.extract_all(self.downloads_path, password)
             else:
@@ -85,3 +78,18 @@ class ZipFileWithPwdWindow(FileConversionWindow):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def show_result(self):
+        # Show a custom message box with a button to open the Downloads folder
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle('Conversion Successful')
+        msg_box.setText(f'File zipped and saved at: {self.downloads_path}')
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        open_folder_btn = msg_box.addButton('Open Downloads', QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == open_folder_btn:
+            self.open_downloads_folder()
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>File successfully zipped with password and saved at:</b><br>{self.downloads_path}")
+        self.output_label.show()
@@ -3,6 +3,7 @@ from PyQt6.QtCore                   import Qt
 from DefaultStyles.button_style     import DefaultButtonStyle
 from .file_conversion               import FileConversionWindow
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner
 from datetime                       import datetime
 import pyminizip, os, zipfile
 
@@ -53,8 +54,8 @@ class ZipFolderWithPwdWindow(FileConversionWindow):
         self.pwd_input.setEchoMode(self.pwd_input.EchoMode.Password)
         self.pwd_input.setGeometry(300, 60, 200, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.zip_folder)
-        submit_button.setGeometry(550, 60, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.zip_folder)
+        self.submit_button.setGeometry(550, 60, 100, 50)
 
         self.output_label = QTextEdit(parent=self)
         self.output_label.setGeometry(10, 130, 680, 70)
@@ -82,17 +83,25 @@ class ZipFolderWithPwdWindow(FileConversionWindow):
                 # Save zip file in Downloads as "zipped_folder.zip"
                 zip_filename = f"zipped_folder_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
                 zip_util = ZipWithPassword(zip_filename)
-                zip_util.add_folder(self.selected_folder, password)
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Folder zipped successfully and saved in Downloads folder as {zip_util.zip_filename}")
-                
-                self.output_label.clear()
-                self.output_label.setHtml(f"<b>Folder successfully zipped with password and saved at:</b><br>{zip_util.zip_filename}")
-                self.output_label.show()
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    zip_util.add_folder, self.selected_folder, password,
+                    owner=self,
+                    on_result=lambda _: self.show_result(zip_util.zip_filename),
+                    on_error=lambda e: QMessageBox.critical(self, "Unexpected Error", f"An error occurred: {str(e)}"),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
 
             except Exception as e:
                 QMessageBox.critical(self, "Unexpected Error", f"An error occurred: {str(e)}")
         else:
             QMessageBox.warning(self, 'No folder selected', 'Please select a folder')
+
+    def show_result(self, zip_filename):
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Folder zipped successfully and saved in Downloads folder as {zip_filename}")
+
+        self.output_label.clear()
+        self.output_label.setHtml(f"<b>Folder successfully zipped with password and saved at:</b><br>{zip_filename}")
+        self.output_label.show()
@@ -1,19 +1,35 @@
-from .sha                   import SHA1Window, SHA256Window, SHA512Window, SHA384Window
-from .message_digest4       import MD4Window
-from .message_digest5       import MD5Window
-from .hash_identifier       import HashIdentifierWindow
-from .blake2_hash           import BLAKE2Window
-from .blake3_hash           import BLAKE3Window
-from .ripemd160             import RIPEMD160Window
-from .whirlpoolhash         import WhirlpoolWindow
-from .bcrypt                import BcryptWindow
-from .gost_hash_function    import GOST34112012Window
-from .tiger_hash_function   import TigerHashFunctionWindow
-from .keccakhash            import KeccakHash
-from .shake                 import SHAKEWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "SHA1Window":              ".sha",
+    "SHA256Window":            ".sha",
+    "SHA512Window":            ".sha",
+    "SHA384Window":            ".sha",
+    "MD4Window":               ".message_digest4",
+    "MD5Window":               ".message_digest5",
+    "HashIdentifierWindow":    ".hash_identifier",
+    "BLAKE2Window":            ".blake2_hash",
+    "BLAKE3Window":            ".blake3_hash",
+    "RIPEMD160Window":         ".ripemd160",
+    "WhirlpoolWindow":         ".whirlpoolhash",
+    "BcryptWindow":            ".bcrypt",
+    "GOST34112012Window":      ".gost_hash_function",
+    "TigerHashFunctionWindow": ".tiger_hash_function",
+    "KeccakHash":              ".keccakhash",
+    "SHAKEWindow":             ".shake",
+}
 
 __all__ = [
     "SHA1Window", "SHA256Window", "SHA512Window", "MD4Window", "MD5Window", 
     "HashIdentifierWindow", "BLAKE2Window", "BLAKE3Window", "RIPEMD160Window",
     "SHA384Window", "WhirlpoolWindow", "BcryptWindow", "GOST34112012Window",
-    "TigerHashFunctionWindow", "KeccakHash", "SHAKEWindow"]
\ No newline at end of file
+    "TigerHashFunctionWindow", "KeccakHash", "SHAKEWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
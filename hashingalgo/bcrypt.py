@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                    import QWidget, QLabel, QTextEdit, QMess
 from DefaultStyles.qcombo_box_style     import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style     import DefaultQLineEditStyle
 from DefaultStyles.button_style         import DefaultAboutButtonStyle, DefaultButtonStyle
+from jobs                               import job_runner, show_job_error
 import bcrypt, base64
 
 class BcryptWindow(QWidget):
@@ -35,8 +36,8 @@ class BcryptWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(150, 160, 120, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_bcrypt)
-        submit_button.setGeometry(330, 160, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.call_bcrypt)
+        self.submit_button.setGeometry(330, 160, 100, 50)
 
         self.result_label = QTextEdit(parent=self)
         self.result_label.setGeometry(10, 230, 680, 100)
@@ -55,30 +56,41 @@ class BcryptWindow(QWidget):
                 # converting txt to array of bytes
                 pwd_bytes = pwd.encode('utf-8')
 
-                # generate the salt
-                salt = bcrypt.gensalt()
-
-                # hash the pwd/text
-                h = bcrypt.hashpw(pwd_bytes, salt)
-
                 output_format = self.output_format_options.currentText()
-                if output_format == "Raw":
-                    self.result_label.clear()
-                    self.result_label.setHtml(f"<b>Result (Raw):</b><br>{str(h)}")
-                    self.result_label.show()
-                elif output_format == "Base64":
-                    b64_result = base64.b64encode(h).decode()
-                    self.result_label.clear()
-                    self.result_label.setHtml(f"<b>Result (Base64):</b><br>{str(b64_result)}")
-                    self.result_label.show()
-                else:
-                    hex_result = h.hex()
-                    self.result_label.clear()
-                    self.result_label.setHtml(f"<b>Result (Hex):</b><br>{str(hex_result)}")
-                    self.result_label.show()
+                self.submit_button.setEnabled(False)
+                job_runner().submit(
+                    self.hash_password, pwd_bytes,
+                    owner=self,
+                    on_result=lambda h: self.show_result(h, output_format),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.submit_button.setEnabled(True))
             else:
                 raise ValueError('Please enter a password.')
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error', str(e))
\ No newline at end of file
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def hash_password(pwd_bytes):
+        # generate the salt
+        salt = bcrypt.gensalt()
+
+        # hash the pwd/text
+        return bcrypt.hashpw(pwd_bytes, salt)
+
+    def show_result(self, h, output_format):
+        if output_format == "Raw":
+            self.result_label.clear()
+            self.result_label.setHtml(f"<b>Result (Raw):</b><br>{str(h)}")
+            self.result_label.show()
+        elif output_format == "Base64":
+            b64_result = base64.b64encode(h).decode()
+            self.result_label.clear()
+            self.result_label.setHtml(f"<b>Result (Base64):</b><br>{str(b64_result)}")
+            self.result_label.show()
+        else:
+            hex_result = h.hex()
+            self.result_label.clear()
+            self.result_label.setHtml(f"<b>Result (Hex):</b><br>{str(hex_result)}")
+            self.result_label.show()
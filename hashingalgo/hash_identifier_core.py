@@ -0,0 +1,25 @@
+class Hash_Identifier:
+
+    HASH_ALGORITHMS = {
+        'MD2': 32, 'MD4': 32, 'MD5': 32, 'SHA-1': 40, 'SHA-224': 56, 'SHA-256': 64, 'SHA-384': 96,
+        'SHA-512': 128, 'SHA-512/224': 56, 'SHA-512/256': 64, 'SHA3-224': 56, 'SHA3-256': 64,
+        'SHA3-384': 96, 'SHA3-512': 128, 'BLAKE2s': 64, 'BLAKE2b': 128, 'RIPEMD-160': 40, 'Whirlpool': 128,
+        "CRC-8": 8, "CRC-16": 16, "CRC-32": 32, "CRC-64": 64, "BSD checksum": 16, "SYSV checksum": 16,
+        "BLAKE3": 256, "MD6": 512, "Poly1305-AES": 128, "BLAKE-512": 512, "GOST": 256, "RIPEMD": 320, 
+        "Tiger": 192,}
+
+    def __init__(self, input_hash: str = None):
+        self.input_hash = input_hash
+        self.possible_algorithms = []
+
+    def identify_hash(self) -> list:
+        hash_length = len(self.input_hash)
+        possible_algorithms = [
+            algo for algo, length in self.HASH_ALGORITHMS.items() if length == hash_length]
+        return possible_algorithms
+
+    def get_possible_algorithms(self) -> list:
+        return self.possible_algorithms
+
+    def __repr__(self) -> str:
+        return f"HashIdentifier(input_hash={self.input_hash}, possible_algorithms={self.possible_algorithms})"
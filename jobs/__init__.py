@@ -0,0 +1,3 @@
+from .job_runner import Job, JobCancelled, JobRunner, job_runner, show_job_error
+
+__all__ = ["Job", "JobCancelled", "JobRunner", "job_runner", "show_job_error"]
@@ -0,0 +1,117 @@
+from PyQt6.QtWidgets        import QMessageBox
+from PyQt6.QtCore           import QObject, QRunnable, QThreadPool, pyqtSignal
+import threading
+
+class JobCancelled(Exception):
+    """Raised inside a job function (through Job.check_cancelled) to stop it early."""
+
+class JobSignals(QObject):
+    """Signals of a Job. They are emitted from a pool thread and delivered queued on the GUI thread."""
+    progress = pyqtSignal(object)   # percentage, or any progress payload the job reports
+    result = pyqtSignal(object)     # return value of the job function
+    error = pyqtSignal(object)      # the exception raised by the job function
+    finished = pyqtSignal()         # always emitted last, also after cancel/error
+
+class Job(QRunnable):
+    """A unit of background work.
+
+    fn(*args, **kwargs) runs on the QThreadPool. With pass_job=True the job itself is
+    passed as the `job` keyword argument, so fn can call job.report_progress() and job.check_cancelled()."""
+
+    def __init__(self, fn, args=(), kwargs=None, pass_job=False):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.pass_job = pass_job
+        self.signals = JobSignals()
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, progress):
+        if not self._cancel_event.is_set():
+            self.signals.progress.emit(progress)
+
+    def run(self):
+        try:
+            kwargs = dict(self.kwargs, job=self) if self.pass_job else self.kwargs
+            result = self.fn(*self.args, **kwargs)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.error.emit(e)
+        else:
+            if not self.cancelled:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+class JobRunner(QObject):
+    """Shared job subsystem: submits Jobs to the global QThreadPool and keeps them alive until they finish."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread_pool = QThreadPool.globalInstance()
+        self._jobs = set()
+
+    def submit(self, fn, *args, on_result=None, on_error=None, on_progress=None, on_finished=None,
+               pass_job=False, owner=None, **kwargs):
+        """Runs fn(*args, **kwargs) in the background and returns the Job.
+        The on_* callbacks are connected to the job signals and run on the GUI thread. owner is
+        the widget the callbacks touch; it must stay alive while has_jobs(owner) is True."""
+        job = Job(fn, args, kwargs, pass_job=pass_job)
+        job.owner = owner
+        if on_result:
+            job.signals.result.connect(on_result)
+        if on_error:
+            job.signals.error.connect(on_error)
+        if on_progress:
+            job.signals.progress.connect(on_progress)
+        if on_finished:
+            job.signals.finished.connect(on_finished)
+        job.signals.finished.connect(lambda: self._jobs.discard(job))
+        self._jobs.add(job)
+        self.thread_pool.start(job)
+        return job
+
+    def has_jobs(self, owner):
+        """True while a job submitted for owner has not delivered its finished signal yet."""
+        return any(job.owner is owner for job in self._jobs)
+
+    def cancel_all(self):
+        for job in list(self._jobs):
+            job.cancel()
+
+    def shutdown(self):
+        """Cancels pending work and waits for the thread pool. Called when the application quits."""
+        self.cancel_all()
+        self.thread_pool.waitForDone()
+
+_runner = None
+
+def job_runner():
+    """Returns the application wide JobRunner."""
+    global _runner
+    if _runner is None:
+        _runner = JobRunner()
+    return _runner
+
+def show_job_error(parent, error, title='Unexpected Error'):
+    """Reports a job exception the way the windows report inline errors:
+    ValueError as a warning, anything else as a critical message."""
+    if isinstance(error, ValueError):
+        QMessageBox.warning(parent, 'Error', str(error))
+    else:
+        QMessageBox.critical(parent, title, str(error))
@@ -1,36 +1,43 @@
-from .xor                   import XOROperationWindow
-from .otp                   import OneTimePadWindow
-from .scrypt                import ScryptWindow
-from .prng                  import PRNGWindow
-from .circular_bit_shift    import CircularBitShiftWindow
-from .freq_analysis         import FrequencyAnalysisWindow
-from .pwd_generator         import PwdGeneratorWindow
-from .prime_num_generator   import PrimeNumGenWindow
-from .rsa_keys_generator    import RSAKeyGenWindow
-from .PBKDF2                import PBKDF2Window
-from .asn1                  import ASN1EncodeWindow, ASN1DecodeWindow
-from .intfactorization      import IntFactorizationWindow
-from .swap_endian           import SwapEndianessWindow
-from .reverse_text          import ReverseTextWindow
-from .h_mac                 import HMACWindow
-from .argon2kdf             import Argon2Window
-from .show_on_map           import ShowOnMapWindow
-from .show_on_map2          import ShowOnMap2Window
-from .eckeypair             import EllipticCurveKeyPairWindow
-from .entropy               import EntropyWindow
-from .data_differencing     import DataDifferencingWindow
-from .data_compression      import DataCompressionWindow
-from .randomness_tester     import RandomnessTesterWindow
-from .pgp_key_pair_gen      import PGPKeyPairGenerateWindow
-from .dsa_key_pair_gen      import DSAKeyPairGenerateWindow
-from .edDSA_key_pair_gen    import EdDSAKeyPairWindow
-from .lorem_ipsum_gen       import LoremIpsumGenerateWindow
-from .modcalc               import ModCalculatorWindow
-from .jwt_sign              import JWTSignWindow
-from .jwt_verify            import JWTVerifyWindow
-from .jwt_decode            import JWTDecodeWindow
-from .generateQRcode        import GenerateQRcode
-from .reverse_image_search  import ReverseImageSearchWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "XOROperationWindow":         ".xor",
+    "OneTimePadWindow":           ".otp",
+    "ScryptWindow":               ".scrypt",
+    "PRNGWindow":                 ".prng",
+    "CircularBitShiftWindow":     ".circular_bit_shift",
+    "FrequencyAnalysisWindow":    ".freq_analysis",
+    "PwdGeneratorWindow":         ".pwd_generator",
+    "PrimeNumGenWindow":          ".prime_num_generator",
+    "RSAKeyGenWindow":            ".rsa_keys_generator",
+    "PBKDF2Window":               ".PBKDF2",
+    "ASN1EncodeWindow":           ".asn1",
+    "ASN1DecodeWindow":           ".asn1",
+    "IntFactorizationWindow":     ".intfactorization",
+    "SwapEndianessWindow":        ".swap_endian",
+    "ReverseTextWindow":          ".reverse_text",
+    "HMACWindow":                 ".h_mac",
+    "Argon2Window":               ".argon2kdf",
+    "ShowOnMapWindow":            ".show_on_map",
+    "ShowOnMap2Window":           ".show_on_map2",
+    "EllipticCurveKeyPairWindow": ".eckeypair",
+    "EntropyWindow":              ".entropy",
+    "DataDifferencingWindow":     ".data_differencing",
+    "DataCompressionWindow":      ".data_compression",
+    "RandomnessTesterWindow":     ".randomness_tester",
+    "PGPKeyPairGenerateWindow":   ".pgp_key_pair_gen",
+    "DSAKeyPairGenerateWindow":   ".dsa_key_pair_gen",
+    "EdDSAKeyPairWindow":         ".edDSA_key_pair_gen",
+    "LoremIpsumGenerateWindow":   ".lorem_ipsum_gen",
+    "ModCalculatorWindow":        ".modcalc",
+    "JWTSignWindow":              ".jwt_sign",
+    "JWTVerifyWindow":            ".jwt_verify",
+    "JWTDecodeWindow":            ".jwt_decode",
+    "GenerateQRcode":             ".generateQRcode",
+    "ReverseImageSearchWindow":   ".reverse_image_search",
+}
 
 __all__ = [
     "XOROperationWindow", "OneTimePadWindow", "ScryptWindow", "PRNGWindow", 
@@ -42,4 +49,11 @@ __all__ = [
     "DataCompressionWindow", "RandomnessTesterWindow", "ShowOnMap2Window", 
     "PGPKeyPairGenerateWindow", "DSAKeyPairGenerateWindow", "EdDSAKeyPairWindow",
     "LoremIpsumGenerateWindow", "ModCalculatorWindow", "JWTSignWindow", "JWTVerifyWindow",
-    "JWTDecodeWindow", "GenerateQRcode", "ReverseImageSearchWindow"]
\ No newline at end of file
+    "JWTDecodeWindow", "GenerateQRcode", "ReverseImageSearchWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
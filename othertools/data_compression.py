@@ -1,69 +1,9 @@
-from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-from collections                    import Counter
-import heapq
-
-class DataCompression:
-    class Node:
-        def __init__(self, char, freq):
-            self.char = char
-            self.freq = freq
-            self.left = None
-            self.right = None
-
-        def __lt__(self, other):
-            return self.freq < other.freq
-
-    def __init__(self):
-        self.codes = {}
-        self.reverse_codes = {}
-
-    def _build_huffman_tree(self, frequency):
-        priority_queue = [self.Node(char, freq) for char, freq in frequency.items()]
-        heapq.heapify(priority_queue)
-
-        while len(priority_queue) > 1:
-            left = heapq.heappop(priority_queue)
-            right = heapq.heappop(priority_queue)
-            merged = self.Node(None, left.freq + right.freq)
-            merged.left = left
-            merged.right = right
-            heapq.heappush(priority_queue, merged)
-
-        return priority_queue[0]
-
-    def _build_codes(self, root, current_code=""):
-        if root is None:
-            return
-
-        if root.char is not None:
-            self.codes[root.char] = current_code
-            self.reverse_codes[current_code] = root.char
-            return
-
-        self._build_codes(root.left, current_code + "0")
-        self._build_codes(root.right, current_code + "1")
-
-    def compress(self, data):
-        frequency = Counter(data)
-        root = self._build_huffman_tree(frequency)
-        self._build_codes(root)
-
-        compressed_data = "".join(self.codes[char] for char in data)
-        return compressed_data
-
-    def decompress(self, compressed_data):
-        current_code = ""
-        decompressed_data = []
-
-        for bit in compressed_data:
-            current_code += bit
-            if current_code in self.reverse_codes:
-                decompressed_data.append(self.reverse_codes[current_code])
-                current_code = ""
-
-        return "".join(decompressed_data)
+from jobs                           import job_runner, show_job_error
+from .data_compression_core         import DataCompression, benchmark
+import os
 
 class DataCompressionWindow(QWidget):
 
@@ -76,12 +16,15 @@ class DataCompressionWindow(QWidget):
             "This tool implements a Huffman-based data compression algorithm. "
             "Using the principles of frequency-based encoding, it compresses data efficiently "
             "by assigning shorter codes to more frequent characters. "
-            "You can input any text data, and the tool will provide the compressed version. "
-            "The original data can also be decompressed back to verify correctness. "
-            "This functionality demonstrates the fundamentals of data compression in an interactive way.")
+            "You can input any text data, and the tool will provide the compressed version together with its "
+            "canonical code table: the codes are assigned in order of length, so the code lengths alone describe the table.<br><br>"
+            "Files are compressed in blocks of 1 MiB, each with its own code lengths stored in a small header "
+            "and the codes packed into bytes. Decompression looks up 15-bit prefixes in a table instead of reading "
+            "the codes bit by bit. The benchmark compares the sizes and speeds with zlib (DEFLATE), which adds "
+            "LZ77 string matching on top of Huffman coding.")
 
         self.setWindowTitle("Data compression")
-        self.setFixedSize(700, 400)
+        self.setFixedSize(700, 500)
 
         # data input
         data_input_label = QLabel("Enter data:", parent=self)
@@ -90,17 +33,26 @@ class DataCompressionWindow(QWidget):
         self.data_input.setGeometry(10, 60, 680, 50)
 
         submit_button = DefaultButtonStyle("Submit", parent=self, command=self.data_compression)
-        submit_button.setGeometry(300, 140, 100, 50)
-        
+        submit_button.setGeometry(10, 140, 100, 50)
+
+        self.compress_file_button = DefaultButtonStyle("Compress File", parent=self, command=self.call_file_compression)
+        self.compress_file_button.setGeometry(170, 140, 160, 50)
+
+        self.decompress_file_button = DefaultButtonStyle("Decompress File", parent=self, command=self.call_file_decompression)
+        self.decompress_file_button.setGeometry(350, 140, 160, 50)
+
+        self.benchmark_button = DefaultButtonStyle("Benchmark File", parent=self, command=self.call_benchmark)
+        self.benchmark_button.setGeometry(530, 140, 160, 50)
+
         self.result_label = QTextEdit(parent=self)
-        self.result_label.setGeometry(10, 230, 680, 100)
+        self.result_label.setGeometry(10, 230, 680, 200)
         self.result_label.setReadOnly(True)
         self.result_label.hide()
 
         # About button setup
-        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 350, 50, 50))
+        self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 450, 50, 50))
         self.aboutButton.update_theme(self.theme_mode)
-    
+
     def data_compression(self):
         try:
             if not self.data_input.text():
@@ -109,11 +61,121 @@ class DataCompressionWindow(QWidget):
 
             compressor = DataCompression()
             compressed = compressor.compress(data)
+            packed = len(compressor.encode(data.encode('utf-8')))
+            codes = ", ".join(f"'{char}': {code}" for char, code in sorted(compressor.codes.items(), key=lambda item: (len(item[1]), item[1])))
 
             self.result_label.clear()
-            self.result_label.setHtml(f"<b>Compressed data:</b><br>{str(compressed)}")
+            self.result_label.setHtml(
+                f"<b>Compressed data:</b><br>{str(compressed)}<br><br>"
+                f"<b>Codes:</b> {codes}<br><br>"
+                f"<b>Packed:</b> {len(compressed)} bits, {packed} bytes with header ({len(data.encode('utf-8'))} bytes of input)")
             self.result_label.show()
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_file_compression(self):
+        try:
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File to Compress')
+            if not input_path:
+                return
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Compressed File', input_path + '.huff')
+            if not output_path:
+                return
+
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, DataCompression().compress_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Compressing", percent),
+                on_result=lambda path: self.show_file_result("Compressed file", input_path, path),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_file_decompression(self):
+        try:
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File to Decompress', '', 'Huffman (*.huff);;All Files (*)')
+            if not input_path:
+                return
+            default_output = input_path[:-len('.huff')] if input_path.endswith('.huff') else input_path + '.out'
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Decompressed File', default_output)
+            if not output_path:
+                return
+
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, DataCompression().decompress_file, input_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Decompressing", percent),
+                on_result=lambda path: self.show_file_result("Decompressed file", input_path, path),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_benchmark(self):
+        try:
+            input_path, _ = QFileDialog.getOpenFileName(self, 'Select a File to Benchmark')
+            if not input_path:
+                return
+
+            self.set_file_buttons_enabled(False)
+            self.show_file_progress("Benchmarking", None)
+            job_runner().submit(
+                self.run_benchmark, input_path,
+                owner=self,
+                on_result=self.show_benchmark,
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_file_job(method, input_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return method(input_path, output_path, progress_callback=progress)
+
+    @staticmethod
+    def run_benchmark(path):
+        with open(path, 'rb') as f:
+            return benchmark(f.read())
+
+    def set_file_buttons_enabled(self, enabled):
+        self.compress_file_button.setEnabled(enabled)
+        self.decompress_file_button.setEnabled(enabled)
+        self.benchmark_button.setEnabled(enabled)
+
+    def show_file_progress(self, action, percent):
+        self.result_label.setHtml(f"<b>{action}...</b>" + (f" {percent}%" if percent is not None else ""))
+        self.result_label.show()
+
+    def show_file_result(self, title, input_path, output_path):
+        input_size, output_size = os.path.getsize(input_path), os.path.getsize(output_path)
+        self.result_label.clear()
+        self.result_label.setHtml(
+            f"<b>{title}:</b><br>{output_path}<br><br>"
+            f"{input_size} bytes &rarr; {output_size} bytes ({output_size / max(input_size, 1):.2%})")
+        self.result_label.show()
+
+    def show_benchmark(self, results):
+        rows = "".join(
+            f"<tr><td>{name}</td><td>{result['bytes']}</td><td>{result['ratio']:.2%}</td>"
+            f"<td>{result['compress MB/s']}</td><td>{result['decompress MB/s']}</td></tr>"
+            for name, result in results.items() if isinstance(result, dict))
+        self.result_label.clear()
+        self.result_label.setHtml(
+            f"<b>Benchmark on {results['input bytes']} bytes:</b><br>"
+            "<table cellpadding='4'><tr><th></th><th>Bytes</th><th>Ratio</th><th>Compress MB/s</th><th>Decompress MB/s</th></tr>"
+            f"{rows}</table>")
+        self.result_label.show()
@@ -0,0 +1,269 @@
+from collections import Counter
+import numpy as np
+import argparse, heapq, os, re, struct, sys, time, zlib
+
+MAGIC = b"CPHF"
+VERSION = 1
+MAX_CODE_LENGTH = 15                # codes fit a 2^15 entry decoding table, as in DEFLATE
+BLOCK_SIZE = 1024 * 1024
+JUMP_LEVELS = 4                     # 2^4 codes of at most 15 bits still fit a uint8 jump
+BLOCK_HEADER = struct.Struct(">II") # raw length, payload length; raw length 0 ends a stream
+
+def code_lengths(frequency, limit=None):
+    """Huffman code length of every symbol of a {symbol: count} mapping. With a limit, counts are
+    flattened until no code is longer than limit bits."""
+    frequency = {symbol: count for symbol, count in frequency.items() if count}
+    if len(frequency) <= 1:
+        return {symbol: 1 for symbol in frequency}
+    while True:
+        # heap entries carry the symbols below them, whose codes grow by one bit per merge
+        heap = [(count, i, [symbol]) for i, (symbol, count) in enumerate(frequency.items())]
+        heapq.heapify(heap)
+        lengths = dict.fromkeys(frequency, 0)
+        tiebreak = len(heap)
+        while len(heap) > 1:
+            count1, _, symbols1 = heapq.heappop(heap)
+            count2, _, symbols2 = heapq.heappop(heap)
+            for symbol in symbols1 + symbols2:
+                lengths[symbol] += 1
+            heapq.heappush(heap, (count1 + count2, tiebreak, symbols1 + symbols2))
+            tiebreak += 1
+        if limit is None or max(lengths.values()) <= limit:
+            return lengths
+        frequency = {symbol: (count >> 1) | 1 for symbol, count in frequency.items()}
+
+def canonical_codes(lengths):
+    """{symbol: (code, length)}: codes are assigned in order of (length, symbol), so the
+    lengths alone describe the whole code table."""
+    codes, code, previous = {}, 0, 0
+    for symbol, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - previous
+        codes[symbol] = (code, length)
+        code += 1
+        previous = length
+    return codes
+
+class DataCompression:
+    """Canonical Huffman coding.
+
+    compress()/decompress() work on text and '0'/'1' strings, to show the codes. encode()/decode()
+    and the file methods are the real codec over bytes: a stream of independent blocks, each with
+    a header of its code lengths (a 32 byte bitmap of the symbols present plus one nibble per
+    symbol) followed by the bit-packed codes. Decoding looks up MAX_CODE_LENGTH-bit prefixes in a
+    table instead of walking the code bit by bit."""
+
+    def __init__(self):
+        self.codes = {}
+        self.reverse_codes = {}
+
+    # Text
+
+    def compress(self, data):
+        lengths = code_lengths(Counter(data))
+        self.codes = {char: format(code, f"0{length}b") for char, (code, length) in canonical_codes(lengths).items()}
+        self.reverse_codes = {code: char for char, code in self.codes.items()}
+        return "".join(map(self.codes.__getitem__, data))
+
+    def decompress(self, compressed_data):
+        if not self.reverse_codes:
+            return ""
+        # the codes are prefix free, so the first matching alternative is the right one;
+        # the regular expression engine walks the bits in C
+        pattern = re.compile("|".join(sorted(map(re.escape, self.reverse_codes), key=len)))
+        position, decompressed_data = 0, []
+        for match in pattern.finditer(compressed_data):
+            if match.start() != position:
+                break
+            decompressed_data.append(self.reverse_codes[match.group()])
+            position = match.end()
+        if position != len(compressed_data):
+            raise ValueError("Compressed data does not match the codes.")
+        return "".join(decompressed_data)
+
+    # Bytes
+
+    @staticmethod
+    def encode_block(data):
+        """One block: header, code length table and bit-packed codes of data (bytes)."""
+        values = np.frombuffer(data, dtype=np.uint8)
+        counts = np.bincount(values, minlength=256)
+        lengths = code_lengths({symbol: int(count) for symbol, count in enumerate(counts)}, MAX_CODE_LENGTH)
+        codes = canonical_codes(lengths)
+
+        present = np.zeros(256, dtype=np.uint8)
+        present[list(codes)] = 1
+        nibbles = np.zeros(len(codes) + len(codes) % 2, dtype=np.uint8)
+        nibbles[:len(codes)] = [lengths[symbol] for symbol in sorted(codes)]
+        table = np.packbits(present).tobytes() + (nibbles[0::2] << 4 | nibbles[1::2]).tobytes()
+
+        # every code is left aligned in MAX_CODE_LENGTH bits, expanded to a bit matrix and the
+        # bits beyond its length are masked out; packbits then joins the rest row by row
+        left = np.zeros(256, dtype=np.uint16)
+        length = np.zeros(256, dtype=np.uint8)
+        for symbol, (code, bits) in codes.items():
+            left[symbol] = code << (MAX_CODE_LENGTH - bits)
+            length[symbol] = bits
+        columns = np.arange(MAX_CODE_LENGTH - 1, -1, -1, dtype=np.uint16)
+        payload = bytearray()
+        # 64 Ki symbols at a time keeps the bit matrix at 1 MiB
+        carry = np.zeros(0, dtype=np.uint8)
+        for start in range(0, len(values), 1 << 16):
+            chunk = values[start:start + (1 << 16)]
+            bit_matrix = (left[chunk][:, None] >> columns & 1).astype(np.uint8)
+            bits = np.concatenate((carry, bit_matrix[np.arange(MAX_CODE_LENGTH) < length[chunk][:, None]]))
+            whole = len(bits) // 8 * 8
+            payload += np.packbits(bits[:whole]).tobytes()
+            carry = bits[whole:]
+        payload += np.packbits(carry).tobytes()
+        return BLOCK_HEADER.pack(len(data), len(payload)) + table + bytes(payload)
+
+    @staticmethod
+    def decode_block(raw_length, table, payload):
+        """Inverse of encode_block() for the table and payload of one block."""
+        present = np.flatnonzero(np.unpackbits(np.frombuffer(table[:32], dtype=np.uint8)))
+        nibbles = np.frombuffer(table[32:], dtype=np.uint8)
+        lengths = np.stack((nibbles >> 4, nibbles & 0xF), axis=1).reshape(-1)[:len(present)]
+        codes = canonical_codes(dict(zip(present.tolist(), lengths.tolist())))
+
+        # table[prefix] = symbol and length of the code that prefix starts with
+        symbol_table = np.zeros(1 << MAX_CODE_LENGTH, dtype=np.uint8)
+        length_table = np.zeros(1 << MAX_CODE_LENGTH, dtype=np.uint8)
+        for symbol, (code, bits) in codes.items():
+            start = code << (MAX_CODE_LENGTH - bits)
+            symbol_table[start:start + (1 << (MAX_CODE_LENGTH - bits))] = symbol
+            length_table[start:start + (1 << (MAX_CODE_LENGTH - bits))] = bits
+
+        # the MAX_CODE_LENGTH-bit window starting at every bit position, cut out of the 24 bits
+        # starting at every byte
+        data = np.concatenate((np.frombuffer(payload, dtype=np.uint8), np.zeros(2, dtype=np.uint8))).astype(np.uint32)
+        words = data[:-2] << 16 | data[1:-1] << 8 | data[2:]
+        shifts = np.arange(24 - MAX_CODE_LENGTH, 24 - MAX_CODE_LENGTH - 8, -1, dtype=np.uint32)
+        windows = (words[:, None] >> shifts & ((1 << MAX_CODE_LENGTH) - 1)).astype(np.uint16).reshape(-1)
+        symbols = symbol_table[windows]
+
+        # jumps[k][p] is the number of bits taken by the 2^k codes starting at bit p; they are
+        # doubled from the code lengths, so the sequential walk only hops over 2^JUMP_LEVELS codes
+        # at a time and the positions in between are filled in level by level
+        jumps = [np.concatenate((length_table[windows], np.zeros(256, dtype=np.uint8)))]
+        index = np.arange(len(jumps[0]), dtype=np.int32)
+        for _ in range(JUMP_LEVELS):
+            jump = jumps[-1]
+            jumps.append(jump + np.take(jump, index + jump, mode='clip'))
+        top, position, positions = jumps[-1], 0, []
+        for _ in range(-(-raw_length >> JUMP_LEVELS)):
+            positions.append(position)
+            position += int(top[position]) if position < len(top) else 0
+        positions = np.array(positions, dtype=np.int64)
+        for jump in reversed(jumps[:-1]):
+            positions = np.stack((positions, positions + np.take(jump, positions, mode='clip')), axis=1).reshape(-1)
+        positions = positions[:raw_length]
+        if raw_length and positions[-1] >= len(symbols):
+            raise ValueError("Compressed data is truncated or corrupt.")
+        return symbols[positions].tobytes()
+
+    def encode(self, data, block_size=BLOCK_SIZE):
+        """Compresses bytes into a complete stream."""
+        out = bytearray(MAGIC + bytes([VERSION]))
+        for start in range(0, len(data), block_size):
+            out += self.encode_block(data[start:start + block_size])
+        return bytes(out + BLOCK_HEADER.pack(0, 0))
+
+    def decode(self, stream):
+        """Decompresses a stream made by encode() or compress_file()."""
+        return b"".join(self._iter_blocks(_BytesReader(stream)))
+
+    def _iter_blocks(self, reader):
+        if reader.read(len(MAGIC) + 1) != MAGIC + bytes([VERSION]):
+            raise ValueError("Not a Huffman compressed stream.")
+        while True:
+            header = reader.read(BLOCK_HEADER.size)
+            if len(header) != BLOCK_HEADER.size:
+                raise ValueError("Compressed data is truncated or corrupt.")
+            raw_length, payload_length = BLOCK_HEADER.unpack(header)
+            if not raw_length:
+                return
+            bitmap = reader.read(32)
+            symbols = int(np.unpackbits(np.frombuffer(bitmap, dtype=np.uint8)).sum()) if len(bitmap) == 32 else 0
+            table = bitmap + reader.read((symbols + 1) // 2)
+            payload = reader.read(payload_length)
+            if not symbols or len(payload) != payload_length:
+                raise ValueError("Compressed data is truncated or corrupt.")
+            yield self.decode_block(raw_length, table, payload)
+
+    def compress_file(self, input_path, output_path, block_size=BLOCK_SIZE, progress_callback=None):
+        """Streams input_path through encode_block() one block at a time.
+        progress_callback(bytes_done, total) is called after every block."""
+        total, done = os.path.getsize(input_path), 0
+        with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+            dst.write(MAGIC + bytes([VERSION]))
+            while block := src.read(block_size):
+                dst.write(self.encode_block(block))
+                done += len(block)
+                if progress_callback:
+                    progress_callback(done, total)
+            dst.write(BLOCK_HEADER.pack(0, 0))
+        return output_path
+
+    def decompress_file(self, input_path, output_path, progress_callback=None):
+        total = os.path.getsize(input_path)
+        with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+            for block in self._iter_blocks(src):
+                dst.write(block)
+                if progress_callback:
+                    progress_callback(src.tell(), total)
+        return output_path
+
+def benchmark(data, level=6):
+    """Sizes and speeds of this codec against zlib at the given level, on bytes data."""
+    results = {"input bytes": len(data)}
+    codec = DataCompression()
+    for name, compress, decompress in (("huffman", codec.encode, codec.decode),
+                                       (f"zlib-{level}", lambda d: zlib.compress(d, level), zlib.decompress)):
+        start = time.perf_counter()
+        packed = compress(data)
+        middle = time.perf_counter()
+        if decompress(packed) != data:
+            raise ValueError(f"{name} round trip failed.")
+        end = time.perf_counter()
+        mb = len(data) / 1e6
+        results[name] = {"bytes": len(packed), "ratio": round(len(packed) / max(len(data), 1), 4),
+                         "compress MB/s": round(mb / max(middle - start, 1e-9), 2),
+                         "decompress MB/s": round(mb / max(end - middle, 1e-9), 2)}
+    return results
+
+class _BytesReader:
+    """read() over an in-memory stream, for decode()."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def read(self, size):
+        chunk = self.data[self.position:self.position + size].tobytes()
+        self.position += len(chunk)
+        return chunk
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m othertools.data_compression_core",
+                                     description="Canonical Huffman file compression.")
+    parser.add_argument("command", choices=("compress", "decompress", "benchmark"))
+    parser.add_argument("input")
+    parser.add_argument("output", nargs="?")
+    args = parser.parse_args(argv)
+    codec = DataCompression()
+    try:
+        if args.command == "benchmark":
+            with open(args.input, "rb") as f:
+                for name, value in benchmark(f.read()).items():
+                    print(f"{name}: {value}")
+        elif args.command == "compress":
+            codec.compress_file(args.input, args.output or args.input + ".huff")
+        else:
+            default_output = args.input[:-len(".huff")] if args.input.endswith(".huff") else args.input + ".out"
+            codec.decompress_file(args.input, args.output or default_output)
+    except ValueError as ve:
+        parser.error(str(ve))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
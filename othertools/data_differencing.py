@@ -1,63 +1,9 @@
-from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QFileDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-
-class DataDifferencing:
-    """A class for implementing data differencing and reconstructing the original data.
-    
-    This supports creating a difference (delta) between two sequences and reconstructing the target
-    sequence using the source sequence and the delta."""
-
-    def create_delta(self, source, target):
-        """Create a delta (difference) between the source and target sequences.
-        Args:
-            source (bytes): The original data sequence.
-            target (bytes): The modified data sequence.
-        Returns:
-            list: A list of operations to transform the source into the target."""
-        delta = []
-        
-        # Pointer to traverse both sequences
-        source_index = 0
-        target_index = 0
-        
-        while target_index < len(target):
-            # Check if the current position matches in source and target
-            if source_index < len(source) and source[source_index] == target[target_index]:
-                # Match operation (copy from source)
-                delta.append(("COPY", source_index, 1))
-                source_index += 1
-                target_index += 1
-            else:
-                # Mismatch operation (add from target)
-                delta.append(("ADD", target[target_index]))
-                target_index += 1
-
-        # Handle any trailing source sequence (if any)
-        while source_index < len(source):
-            delta.append(("DELETE", source_index))
-            source_index += 1
-
-        return delta
-
-    def apply_delta(self, source, delta):
-        """Apply a delta to a source sequence to reconstruct the target sequence.
-        Args:
-            source (bytes): The original data sequence.
-            delta (list): The delta operations to apply.
-        Returns:
-            bytes: The reconstructed target sequence."""
-        target = []
-
-        for operation in delta:
-            if operation[0] == "COPY":
-                _, source_index, length = operation
-                target.extend(source[source_index:source_index + length])
-            elif operation[0] == "ADD":
-                _, value = operation
-                target.append(value)
-
-        return bytes(target)
+from jobs                           import job_runner, show_job_error
+from .data_differencing_core        import DataDifferencing
+import html, os
 
 class DataDifferencingWindow(QWidget):
 
@@ -74,8 +20,11 @@ class DataDifferencingWindow(QWidget):
         "- Generate a delta between a source and a target sequence.<br>"
         "- Reconstruct the target sequence from the source using the delta.<br>"
         "- Built with Python and PyQt6 for an interactive GUI.<br><br>"
-        "The underlying logic relies on comparing byte sequences to detect matching, "
-        "added, or deleted segments, enabling efficient data transformations.<br><br>"
+        "- Diff and patch files of any size, read through memory mapping.<br><br>"
+        "As in rsync, the source is cut into blocks indexed by a rolling checksum. The checksum is rolled over "
+        "every offset of the target, so blocks are found even when data was inserted, deleted or moved, and each "
+        "match is extended byte by byte. The delta is a list of COPY (source offset, length) and ADD (bytes) "
+        "operations, stored in files as a compact binary format with a checksum of the target.<br><br>"
         "Useful links:<br>"
         "<a href=https://en.wikipedia.org/wiki/Data_differencing>Wikipedia</a><br>")
 
@@ -95,7 +44,13 @@ class DataDifferencingWindow(QWidget):
         self.target_input.setGeometry(10, 170, 680, 50)
 
         submit_button = DefaultButtonStyle("Submit", parent=self, command=self.call_data_diff)
-        submit_button.setGeometry(300, 260, 100, 50)
+        submit_button.setGeometry(10, 260, 100, 50)
+
+        self.diff_files_button = DefaultButtonStyle("Create Delta File", parent=self, command=self.call_file_diff)
+        self.diff_files_button.setGeometry(310, 260, 180, 50)
+
+        self.patch_file_button = DefaultButtonStyle("Apply Delta File", parent=self, command=self.call_file_patch)
+        self.patch_file_button.setGeometry(510, 260, 180, 50)
 
         self.delta_label = QTextEdit(parent=self)
         self.delta_label.setGeometry(10, 320, 680, 100)
@@ -125,18 +80,95 @@ class DataDifferencingWindow(QWidget):
             delta = differ.create_delta(source=source, target=target)
 
             self.delta_label.clear()
-            self.delta_label.setHtml(f"<b>Delta:</b><br>{str(delta)}")
+            binary = differ.create_binary_delta(source, target)
+            self.delta_label.setHtml(
+                f"<b>Delta:</b><br>{html.escape(str(delta))}<br><br>"
+                f"<b>Binary delta:</b> {len(binary)} bytes ({len(target)} bytes of target)")
             self.delta_label.show()
 
             reconstructed = differ.apply_delta(source, delta)
 
             self.reconstructed_label.clear()
             self.reconstructed_label.setHtml(
-                f"<b>Reconstructed:</b><br>{str(reconstructed.decode('utf-8'))}")
+                f"<b>Reconstructed:</b><br>{html.escape(reconstructed.decode('utf-8'))}")
             self.reconstructed_label.show()
 
             assert reconstructed == target
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error', str(e))
\ No newline at end of file
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_file_diff(self):
+        try:
+            source_path, _ = QFileDialog.getOpenFileName(self, 'Select the Source File')
+            if not source_path:
+                return
+            target_path, _ = QFileDialog.getOpenFileName(self, 'Select the Target File')
+            if not target_path:
+                return
+            delta_path, _ = QFileDialog.getSaveFileName(self, 'Save Delta File', target_path + '.delta')
+            if not delta_path:
+                return
+
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, DataDifferencing().create_delta_file, source_path, target_path, delta_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Diffing", percent),
+                on_result=lambda path: self.show_file_result("Delta file", target_path, path),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def call_file_patch(self):
+        try:
+            source_path, _ = QFileDialog.getOpenFileName(self, 'Select the Source File')
+            if not source_path:
+                return
+            delta_path, _ = QFileDialog.getOpenFileName(self, 'Select the Delta File', '', 'Delta (*.delta);;All Files (*)')
+            if not delta_path:
+                return
+            default_output = delta_path[:-len('.delta')] if delta_path.endswith('.delta') else delta_path + '.out'
+            output_path, _ = QFileDialog.getSaveFileName(self, 'Save Reconstructed File', default_output)
+            if not output_path:
+                return
+
+            self.set_file_buttons_enabled(False)
+            job_runner().submit(
+                self.run_file_job, DataDifferencing().apply_delta_file, source_path, delta_path, output_path, pass_job=True,
+                owner=self,
+                on_progress=lambda percent: self.show_file_progress("Patching", percent),
+                on_result=lambda path: self.show_file_result("Reconstructed file", delta_path, path),
+                on_error=lambda e: show_job_error(self, e),
+                on_finished=lambda: self.set_file_buttons_enabled(True))
+        except ValueError as ve:
+            QMessageBox.warning(self, 'Error', str(ve))
+        except Exception as e:
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_file_job(method, first_path, second_path, output_path, job):
+        def progress(done, total):
+            job.check_cancelled()
+            job.report_progress(done * 100 // total if total else 100)
+        return method(first_path, second_path, output_path, progress_callback=progress)
+
+    def set_file_buttons_enabled(self, enabled):
+        self.diff_files_button.setEnabled(enabled)
+        self.patch_file_button.setEnabled(enabled)
+
+    def show_file_progress(self, action, percent):
+        self.reconstructed_label.hide()
+        self.delta_label.setHtml(f"<b>{action}...</b> {percent}%")
+        self.delta_label.show()
+
+    def show_file_result(self, title, input_path, output_path):
+        self.delta_label.clear()
+        self.delta_label.setHtml(
+            f"<b>{title}:</b><br>{output_path}<br><br>"
+            f"{os.path.getsize(input_path)} bytes in, {os.path.getsize(output_path)} bytes out")
+        self.delta_label.show()
\ No newline at end of file
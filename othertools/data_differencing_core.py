@@ -0,0 +1,313 @@
+import numpy as np
+import argparse, io, math, mmap, os, struct, sys, zlib
+
+MAGIC = b"CPDL"
+VERSION = 1
+MIN_BLOCK_SIZE = 4
+MAX_BLOCK_SIZE = 64 * 1024
+CHUNK_SIZE = 1 << 20        # target bytes hashed per numpy pass
+MAX_ADD = 1 << 20           # longer literal runs are written as several ADD instructions
+MAX_CANDIDATES = 4          # source blocks kept per weak checksum
+TRAILER = struct.Struct(">I")
+
+def choose_block_size(source_length):
+    """rsync's rule of thumb: blocks of about sqrt(source length), a power of two between
+    MIN_BLOCK_SIZE and MAX_BLOCK_SIZE, so the index has at most a few hundred thousand entries."""
+    size = 1 << max(0, math.isqrt(source_length).bit_length() - 1)
+    return min(MAX_BLOCK_SIZE, max(MIN_BLOCK_SIZE, size))
+
+def _weak(a, b):
+    """rsync's 32-bit weak checksum from its byte sum a and weighted sum b."""
+    return (a & 0xFFFF) | (b & 0xFFFF) << 16
+
+def block_checksums(data, block_size):
+    """Weak checksum of every whole block of data (a bytes-like object). The blocks are widened to
+    int64 about CHUNK_SIZE bytes at a time, so a mapped source is not copied 8 times over."""
+    values = np.frombuffer(data, dtype=np.uint8)
+    count = len(values) // block_size
+    step = max(1, CHUNK_SIZE // block_size) * block_size
+    weights = np.arange(block_size, 0, -1, dtype=np.int64)
+    checksums = np.empty(count, dtype=np.int64)
+    for start in range(0, count * block_size, step):
+        blocks = values[start:min(start + step, count * block_size)].reshape(-1, block_size).astype(np.int64)
+        checksums[start // block_size:start // block_size + len(blocks)] = _weak(blocks.sum(axis=1), blocks @ weights)
+    return checksums
+
+def rolling_checksums(data, block_size):
+    """Weak checksum of the block_size bytes starting at every offset of data, from prefix sums:
+    a(k) = S1[k+L] - S1[k] and b(k) = (L + k) * a(k) - (S2[k+L] - S2[k]), with S2 the prefix
+    sums of i * x[i]. This is the same value the rsync recurrence rolls forward byte by byte."""
+    values = np.frombuffer(data, dtype=np.uint8).astype(np.int64)
+    if len(values) < block_size:
+        return np.zeros(0, dtype=np.int64)
+    s1 = np.concatenate(([0], np.cumsum(values)))
+    s2 = np.concatenate(([0], np.cumsum(values * np.arange(len(values), dtype=np.int64))))
+    a = s1[block_size:] - s1[:-block_size]
+    b = (block_size + np.arange(len(a), dtype=np.int64)) * a - (s2[block_size:] - s2[:-block_size])
+    return _weak(a, b)
+
+def _forward_match(source, source_offset, target, target_offset, limit):
+    """Length of the common run of source and target from the given offsets, at most limit."""
+    length, step = 0, 4096
+    while length < limit:
+        n = min(step, limit - length)
+        a = source[source_offset + length:source_offset + length + n]
+        b = target[target_offset + length:target_offset + length + n]
+        if a != b:
+            return length + int(np.argmax(np.frombuffer(a, dtype=np.uint8) != np.frombuffer(b, dtype=np.uint8)))
+        length += n
+        step = min(step * 2, 1 << 20)
+    return length
+
+def _backward_match(source, source_offset, target, target_offset, limit):
+    """Length of the common run of source and target ending at the given offsets, at most limit."""
+    if limit <= 0:
+        return 0
+    a = np.frombuffer(source[source_offset - limit:source_offset], dtype=np.uint8)
+    b = np.frombuffer(target[target_offset - limit:target_offset], dtype=np.uint8)
+    mismatches = np.flatnonzero(a != b)
+    return limit - int(mismatches[-1]) - 1 if len(mismatches) else limit
+
+def _varint(n):
+    out = bytearray()
+    while n > 0x7F:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+def _read_varint(stream):
+    n = shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise ValueError("Delta is truncated.")
+        n |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return n
+        shift += 7
+
+class DataDifferencing:
+    """A class for implementing data differencing and reconstructing the original data.
+
+    This supports creating a difference (delta) between two sequences and reconstructing the target
+    sequence using the source sequence and the delta. As in rsync, the source is indexed by the weak
+    checksum of each block; the checksum rolled over every offset of the target finds the blocks
+    wherever they moved, and a match is grown byte by byte in both directions. The delta is a list
+    of ("COPY", source offset, length) and ("ADD", bytes) operations, or a compact binary stream of
+    the same operations (see write_delta) for files, which are read through mmap."""
+
+    def __init__(self, block_size=None):
+        if block_size is not None and block_size < 1:
+            raise ValueError("Block size must be at least 1 byte.")
+        self.block_size = block_size
+
+    def iter_delta(self, source, target, progress_callback=None):
+        """Yields the delta operations turning source into target (bytes-like objects, mmap
+        included). Consecutive copies are coalesced. progress_callback(bytes_done, total) is
+        called after every CHUNK_SIZE bytes of the target."""
+        block_size = self.block_size or choose_block_size(len(source))
+        index = {}
+        for block, checksum in enumerate(block_checksums(source, block_size).tolist()):
+            offsets = index.setdefault(checksum, [])
+            offset = block * block_size
+            if len(offsets) < MAX_CANDIDATES and all(source[o:o + block_size] != source[offset:offset + block_size] for o in offsets):
+                offsets.append(offset)
+        keys = np.fromiter(index, dtype=np.int64, count=len(index))
+
+        copy = None                 # pending (source offset, length)
+        literal_start = cursor = 0  # target offsets: start of the pending literal, end of the last copy
+        for chunk_start in range(0, len(target), CHUNK_SIZE):
+            chunk_end = min(chunk_start + CHUNK_SIZE, len(target))
+            if cursor < chunk_end and keys.size:
+                checksums = rolling_checksums(target[chunk_start:chunk_end + block_size - 1], block_size)
+                candidates = np.flatnonzero(np.isin(checksums, keys))
+                for position, checksum in zip((candidates + chunk_start).tolist(), checksums[candidates].tolist()):
+                    if position < cursor:
+                        continue
+                    window = target[position:position + block_size]
+                    offset = next((o for o in index[checksum] if source[o:o + block_size] == window), None)
+                    if offset is None:
+                        continue
+                    back = _backward_match(source, offset, target, position, min(offset, position - literal_start))
+                    length = back + block_size + _forward_match(source, offset + block_size, target, position + block_size,
+                                                                min(len(source) - offset, len(target) - position) - block_size)
+                    offset, position = offset - back, position - back
+                    if position > literal_start:
+                        if copy:
+                            yield ("COPY", *copy)
+                            copy = None
+                        yield from self._adds(target, literal_start, position)
+                    if copy and copy[0] + copy[1] == offset:
+                        copy = (copy[0], copy[1] + length)
+                    else:
+                        if copy:
+                            yield ("COPY", *copy)
+                        copy = (offset, length)
+                    literal_start = cursor = position + length
+            # literals are flushed as they grow, so a target unlike the source is not held in memory
+            if chunk_end - literal_start > MAX_ADD:
+                if copy:
+                    yield ("COPY", *copy)
+                    copy = None
+                yield from self._adds(target, literal_start, chunk_end)
+                literal_start = chunk_end
+            if progress_callback:
+                progress_callback(chunk_end, len(target))
+        if copy:
+            yield ("COPY", *copy)
+        yield from self._adds(target, literal_start, len(target))
+
+    @staticmethod
+    def _adds(target, start, end):
+        for offset in range(start, end, MAX_ADD):
+            yield ("ADD", bytes(target[offset:min(offset + MAX_ADD, end)]))
+
+    def create_delta(self, source, target):
+        """Create a delta (difference) between the source and target sequences.
+        Args:
+            source (bytes): The original data sequence.
+            target (bytes): The modified data sequence.
+        Returns:
+            list: A list of operations to transform the source into the target."""
+        return list(self.iter_delta(source, target))
+
+    def apply_delta(self, source, delta):
+        """Apply a delta to a source sequence to reconstruct the target sequence.
+        Args:
+            source (bytes): The original data sequence.
+            delta (list or bytes): The delta operations to apply, or a binary delta.
+        Returns:
+            bytes: The reconstructed target sequence."""
+        if isinstance(delta, (bytes, bytearray)):
+            out = io.BytesIO()
+            self.patch(source, io.BytesIO(delta), out)
+            return out.getvalue()
+        target = bytearray()
+        for operation in delta:
+            if operation[0] == "COPY":
+                _, source_index, length = operation
+                target += source[source_index:source_index + length]
+            elif operation[0] == "ADD":
+                target += operation[1]
+        return bytes(target)
+
+    # Binary delta: MAGIC, version, varint source and target lengths, then instructions
+    # varint(length << 1 | is_copy); a copy is followed by the zigzag varint distance of its source
+    # offset from the end of the previous copy, an add by its bytes. An Adler-32 of the target ends it.
+
+    def write_delta(self, source, target, stream, progress_callback=None):
+        """Writes the binary delta of source and target to a binary stream."""
+        stream.write(MAGIC + bytes([VERSION]) + _varint(len(source)) + _varint(len(target)))
+        previous = checked = 0
+        checksum = zlib.adler32(b"")
+        for operation in self.iter_delta(source, target, progress_callback):
+            if operation[0] == "COPY":
+                _, offset, length = operation
+                distance = offset - previous
+                stream.write(_varint(length << 1 | 1) + _varint(distance << 1 if distance >= 0 else (-distance << 1) - 1))
+                previous = offset + length
+            else:
+                data = operation[1]
+                stream.write(_varint(len(data) << 1) + data)
+                length = len(data)
+            # the checksum follows the operations, reading the target once more in order
+            for start in range(checked, checked + length, MAX_ADD):
+                checksum = zlib.adler32(target[start:min(start + MAX_ADD, checked + length)], checksum)
+            checked += length
+        stream.write(TRAILER.pack(checksum))
+
+    def create_binary_delta(self, source, target):
+        stream = io.BytesIO()
+        self.write_delta(source, target, stream)
+        return stream.getvalue()
+
+    @staticmethod
+    def patch(source, delta, out, progress_callback=None):
+        """Applies a binary delta read from a stream to source, writing the target to out."""
+        if delta.read(len(MAGIC) + 1) != MAGIC + bytes([VERSION]):
+            raise ValueError("Not a delta file.")
+        source_length, target_length = _read_varint(delta), _read_varint(delta)
+        if source_length != len(source):
+            raise ValueError("The delta was made for a different source.")
+        previous = done = 0
+        checksum = zlib.adler32(b"")
+        while done < target_length:
+            instruction = _read_varint(delta)
+            length = instruction >> 1
+            if instruction & 1:
+                distance = _read_varint(delta)
+                offset = previous + (distance >> 1 if not distance & 1 else -((distance + 1) >> 1))
+                if offset < 0 or offset + length > source_length:
+                    raise ValueError("Delta is corrupt.")
+                previous = offset + length
+                for start in range(offset, offset + length, MAX_ADD):
+                    data = source[start:min(start + MAX_ADD, offset + length)]
+                    checksum = zlib.adler32(data, checksum)
+                    out.write(data)
+            else:
+                data = delta.read(length)
+                if len(data) != length:
+                    raise ValueError("Delta is truncated.")
+                checksum = zlib.adler32(data, checksum)
+                out.write(data)
+            done += length
+            if progress_callback:
+                progress_callback(done, target_length)
+        trailer = delta.read(TRAILER.size)
+        if done != target_length or len(trailer) != TRAILER.size or TRAILER.unpack(trailer)[0] != checksum:
+            raise ValueError("The reconstructed data does not match the delta checksum.")
+
+    def create_delta_file(self, source_path, target_path, delta_path, progress_callback=None):
+        """Diffs two files through mmap, so they are never read into memory whole."""
+        with _mapped(source_path) as source, _mapped(target_path) as target, open(delta_path, "wb") as out:
+            self.write_delta(source, target, out, progress_callback)
+        return delta_path
+
+    def apply_delta_file(self, source_path, delta_path, output_path, progress_callback=None):
+        with _mapped(source_path) as source, open(delta_path, "rb") as delta, open(output_path, "wb") as out:
+            self.patch(source, delta, out, progress_callback)
+        return output_path
+
+class _mapped:
+    """Read-only mmap of a file; empty files, which cannot be mapped, give b""."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.path) else None
+        return self.map if self.map is not None else b""
+
+    def __exit__(self, *exc):
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m othertools.data_differencing_core",
+                                     description="Binary delta of two files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    diff = subparsers.add_parser("diff", help="write the delta turning source into target")
+    diff.add_argument("source")
+    diff.add_argument("target")
+    diff.add_argument("delta")
+    diff.add_argument("--block-size", type=int)
+    patch = subparsers.add_parser("patch", help="rebuild the target from source and delta")
+    patch.add_argument("source")
+    patch.add_argument("delta")
+    patch.add_argument("output")
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "diff":
+            DataDifferencing(args.block_size).create_delta_file(args.source, args.target, args.delta)
+            print(f"{os.path.getsize(args.target)} bytes -> {os.path.getsize(args.delta)} byte delta")
+        else:
+            DataDifferencing().apply_delta_file(args.source, args.delta, args.output)
+    except ValueError as ve:
+        parser.error(str(ve))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
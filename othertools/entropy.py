@@ -1,11 +1,10 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
-from collections                    import Counter
 from io                             import BytesIO
 from PyQt6.QtGui                    import QPixmap
+from .entropy_core                  import EntropyMap, DEFAULT_WINDOW
 import matplotlib.pyplot            as plt
-import math
 
 class EntropyCalculator:
     def __init__(self, data, encoding='utf-8'):
@@ -14,23 +13,40 @@ class EntropyCalculator:
         :param data: string input data for entropy calculation.
         :param encoding: encoding used to process data. Default is 'utf-8'."""
         self.data = data.encode(encoding) if isinstance(data, str) else data
-        self.probabilities = self._calculate_probabilities(self.data)
-
-    def _calculate_probabilities(self, data):
+        self.entropy_map = EntropyMap.from_bytes(self.data)
+        self.probabilities = self._calculate_probabilities(self.entropy_map.histogram)
+
+    @classmethod
+    def from_file(cls, file_path, window=DEFAULT_WINDOW):
+        """Calculator over a file, streamed through mmap instead of read into memory.
+
+        :param file_path: path of the file.
+        :param window: size in bytes of the windows of the entropy profile."""
+        obj = cls.__new__(cls)
+        obj.data = None
+        obj.entropy_map = EntropyMap.from_file(file_path, window)
+        obj.probabilities = obj._calculate_probabilities(obj.entropy_map.histogram)
+        return obj
+
+    def _calculate_probabilities(self, histogram):
         """Calculates the probability of each byte in the data.
         
-        :param data: byte data for entropy calculation.
+        :param histogram: counts of the 256 byte values.
         :return: dictionary with bytes as keys and their probabilities as values."""
-        counter = Counter(data)
-        total = len(data)
-        probabilities = {symbol: count / total for symbol, count in counter.items()}
-        return probabilities
+        total = histogram.sum()
+        return {symbol: int(count) / total for symbol, count in enumerate(histogram) if count}
 
     def entropy(self):
         """Calculates the entropy of the data.
         
         :return: entropy value."""
-        return -sum(p * math.log2(p) for p in self.probabilities.values())
+        return self.entropy_map.entropy
+
+    def window_profile(self):
+        """Entropy of every window of the data (4 KiB by default).
+
+        :return: NumPy array with one entropy value per window."""
+        return self.entropy_map.windows
 
     def plot_histogram(self):
         """Plots a histogram of byte frequencies and returns it as an image."""
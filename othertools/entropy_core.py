@@ -0,0 +1,104 @@
+import numpy as np
+import mmap, os
+
+DEFAULT_WINDOW = 4096
+CHUNK_WINDOWS = 1024    # most windows histogrammed per np.bincount: 2 MiB of counts
+CHUNK_SIZE = 4 << 20    # bytes of whole windows per mmap chunk, at least one window
+
+def byte_histogram(data):
+    """Counts of the 256 byte values of a bytes-like object."""
+    return np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+
+def shannon_entropy(counts):
+    """Shannon entropy in bits per byte of a byte histogram."""
+    counts = np.asarray(counts, dtype=np.float64)
+    total = counts.sum()
+    if not total:
+        return 0.0
+    p = counts[counts > 0] / total
+    return float(-(p * np.log2(p)).sum())
+
+def _c_log_c(n):
+    """Table of c * log2(c) for c = 0..n, so the entropy of a window is log2(n) - sum(table[counts]) / n."""
+    table = np.zeros(n + 1)
+    table[1:] = np.arange(1, n + 1) * np.log2(np.arange(1, n + 1))
+    return table
+
+def _profile(data, window, table):
+    """(per-window entropies, byte histogram) of data.
+
+    Up to CHUNK_WINDOWS windows are histogrammed by a single np.bincount: byte values are
+    offset by 256 * window index so each window counts into its own 256 bins. The histogram
+    of the whole block is the column sum of the window counts."""
+    values = np.frombuffer(data, dtype=np.uint8)
+    rows = len(values) // window
+    entropies = np.empty(rows + (1 if len(values) % window else 0))
+    histogram = np.zeros(256, dtype=np.int64)
+    offsets = np.arange(min(rows, CHUNK_WINDOWS), dtype=np.intp)[:, None] << 8
+    for first in range(0, rows, CHUNK_WINDOWS):
+        n = min(CHUNK_WINDOWS, rows - first)
+        index = values[first * window:(first + n) * window].reshape(n, window).astype(np.intp)
+        index += offsets[:n]
+        counts = np.bincount(index.ravel(), minlength=n * 256).reshape(n, 256)
+        entropies[first:first + n] = np.log2(window) - table[counts].sum(axis=1) / window
+        histogram += counts.sum(axis=0)
+    if len(values) % window:
+        tail = byte_histogram(values[rows * window:])
+        entropies[rows] = shannon_entropy(tail)
+        histogram += tail
+    return entropies, histogram
+
+def window_entropies(data, window=DEFAULT_WINDOW):
+    """Entropy of every `window` bytes of data (a last shorter window included), as a float array."""
+    return _profile(data, window, _c_log_c(window))[0]
+
+class EntropyMap:
+    """Global entropy, byte histogram and per-window entropy profile of a file or buffer."""
+
+    def __init__(self, histogram, windows, window=DEFAULT_WINDOW):
+        self.histogram = histogram
+        self.windows = windows
+        self.window = window
+        self.size = int(histogram.sum())
+        self.entropy = shannon_entropy(histogram)
+
+    @classmethod
+    def from_bytes(cls, data, window=DEFAULT_WINDOW):
+        windows, histogram = _profile(data, window, _c_log_c(window))
+        return cls(histogram, windows, window)
+
+    @classmethod
+    def from_file(cls, file_path, window=DEFAULT_WINDOW, progress_callback=None):
+        """Streams the file through mmap in chunks of whole windows, so memory use does not grow
+        with the file size or as the window shrinks. progress_callback(bytes_done, total) is
+        called after every chunk."""
+        if window < 1:
+            raise ValueError("Window size must be at least 1 byte.")
+        size = os.path.getsize(file_path)
+        histogram = np.zeros(256, dtype=np.int64)
+        profile = []
+        if size:
+            table = _c_log_c(window)
+            chunk_size = window * max(1, CHUNK_SIZE // window)
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for offset in range(0, size, chunk_size):
+                    chunk = memoryview(mm)[offset:offset + chunk_size]
+                    try:
+                        windows, counts = _profile(chunk, window, table)
+                    finally:
+                        chunk.release()  # mmap cannot close while views are exported
+                    histogram += counts
+                    profile.append(windows)
+                    if progress_callback:
+                        progress_callback(min(offset + chunk_size, size), size)
+        return cls(histogram, np.concatenate(profile) if profile else np.empty(0), window)
+
+    def high_entropy_regions(self, threshold=7.2, min_length=1):
+        """(start, end, mean entropy) byte ranges of consecutive windows with at least `threshold`
+        bits per byte, typical of compressed, packed or encrypted data. Runs shorter than
+        min_length windows are skipped."""
+        high = np.concatenate(([False], self.windows >= threshold, [False]))
+        edges = np.flatnonzero(high[1:] != high[:-1]).reshape(-1, 2)
+        return [(int(start * self.window), int(min(end * self.window, self.size)),
+                 float(self.windows[start:end].mean()))
+                for start, end in edges if end - start >= min_length]
@@ -38,9 +38,8 @@ class FrequencyAnalysis:
         sorted_table = sorted(frequency_table.items(), key=lambda x: x[1], reverse=True)
         print("Character | Frequency")
         print("-" * 20)
-        ft = {}
         for char, freq in sorted_table:
-            ft.append(f"{char:9} | {freq:.4f}")
+            print(f"{char:9} | {freq:.4f}")
     
     def plot_histogram(self) -> BytesIO:
         """Generate a histogram of character frequencies and return as a binary stream."""
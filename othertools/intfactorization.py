@@ -1,89 +1,12 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
+from PyQt6.QtGui                    import QRegularExpressionValidator
+from PyQt6.QtCore                   import QRegularExpression
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
-import math, random
-
-class IntegerFactorization:
-
-    def __init__(self, number: int):
-        self.number = number
-
-    def is_prime(self, n: int) -> bool:
-        """Check if a number is prime."""
-        if n <= 1:
-            return False
-        if n <= 3:
-            return True
-        if n % 2 == 0 or n % 3 == 0:
-            return False
-        i = 5
-        while i * i <= n:
-            if n % i == 0 or n % (i + 2) == 0:
-                return False
-            i += 6
-        return True
-
-    def pollards_rho(self, n: int) -> int:
-        """Pollard's Rho algorithm to find a non-trivial factor of n."""
-        if n % 2 == 0:
-            return 2
-        x = random.randint(1, n - 1)
-        y = x
-        c = random.randint(1, n - 1)
-        d = 1
-
-        def g(x):
-            return (x * x + c) % n
-
-        while d == 1:
-            x = g(x)
-            y = g(g(y))
-            d = math.gcd(abs(x - y), n)
-            if d == n:
-                return self.pollards_rho(n)
-        return d
-
-    def factorize(self) -> dict:
-        """Factorize the number into its prime factors using Pollard's Rho for larger numbers.
-        Returns a dictionary where keys are prime factors and values are their counts."""
-        n = self.number
-        factors = {}
-
-        def add_factor(factor):
-            factors[factor] = factors.get(factor, 0) + 1
-
-        # trial division for small numbers
-        while n % 2 == 0:
-            add_factor(2)
-            n //= 2
-
-        for i in range(3, 1000, 2):
-            while n % i == 0:
-                add_factor(i)
-                n //= i
-
-        # Pollard's Rho for larger factors
-        while n > 1:
-            if self.is_prime(n):
-                add_factor(n)
-                break
-
-            factor = self.pollards_rho(n)
-            while not self.is_prime(factor):
-                factor = self.pollards_rho(factor)
-
-            # Factor out the found factor
-            add_factor(factor)
-            n //= factor
-
-        return factors
-
-    def __str__(self):
-        factors = self.factorize()
-        factor_list = [f"{prime}^{count}" if count > 1 else str(prime) 
-                       for prime, count in factors.items()]
-        return f"{self.number} = {' * '.join(factor_list)}"
+from jobs                           import job_runner, show_job_error
+from .intfactorization_core         import IntegerFactorization
 
+DEFAULT_TIME_LIMIT = 300    # seconds, used when the time limit field is left empty
 
 class IntFactorizationWindow(QWidget):
 
@@ -108,6 +31,11 @@ class IntFactorizationWindow(QWidget):
             "<li><strong>Cryptography:</strong> Integer factorization is the backbone of many cryptographic systems, such as RSA encryption. The security of RSA relies on the "
             "difficulty of factoring large composite numbers, which makes breaking the encryption computationally infeasible.</li>"
             "</ul>"
+            "<p>This tool removes small factors by trial division and then runs Brent's variant of Pollard's rho, Pollard's p - 1 and "
+            "Lenstra's elliptic curve method (ECM) with growing bounds on every composite cofactor, spread over all CPU cores. "
+            "Primality is decided by the Baillie-PSW test. Factors of up to about 25 digits are usually found within minutes; "
+            f"cofactors that are still composite when the time limit (by default {DEFAULT_TIME_LIMIT} seconds) runs out or "
+            "when the search is cancelled are marked as such.</p>"
             "<h3>Useful Links:</h3>"
             "<ul>"
             "<li><a href='https://en.wikipedia.org/wiki/Integer_factorization'>Integer Factorization - Wikipedia</a></li>"
@@ -121,12 +49,16 @@ class IntFactorizationWindow(QWidget):
         # Number input
         number_input_label = QLabel("Give number:", parent=self)
         number_input_label.setGeometry(10, 20, 100, 50)
-        self.number_input = DefaultQLineEditStyle(
-            parent=self, int_validator=True, max_length=32) # max_length=32, not working ?!?!?!
+        # digits only; QIntValidator would limit the input to 32-bit numbers
+        self.number_input = DefaultQLineEditStyle(parent=self, max_length=200)
+        self.number_input.setValidator(QRegularExpressionValidator(QRegularExpression(r"\d*"), self))
         self.number_input.setGeometry(110, 20, 320, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.command)
-        submit_button.setGeometry(450, 20, 100, 50)
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, bold=True, command=self.command)
+        self.submit_button.setGeometry(450, 20, 100, 50)
+
+        self.time_limit_input = DefaultQLineEditStyle(parent=self, int_validator=True, placeholder_text=f"Time limit ({DEFAULT_TIME_LIMIT} s)")
+        self.time_limit_input.setGeometry(560, 20, 130, 50)
 
         self.result_label = QTextEdit(parent=self)
         self.result_label.setGeometry(10, 100, 680, 100)
@@ -138,24 +70,41 @@ class IntFactorizationWindow(QWidget):
         self.str_result_label.setReadOnly(True)
         self.str_result_label.hide()
 
+        self.cancel_button = DefaultButtonStyle("Cancel", parent=self, command=self.cancel_factorization)
+        self.cancel_button.setGeometry(300, 330, 100, 50)
+        self.cancel_button.setEnabled(False)
+        self.factorization = None
+        self.factorization_job = None
+
         # About button setup
         self.aboutButton = DefaultAboutButtonStyle("", parent=self, txt=msgbox_txt, title=msgbox_title, geometry=(650, 350, 50, 50))
         self.aboutButton.update_theme(self.theme_mode)
 
     def command(self):
         try:
-            if int(self.number_input.text()):
+            if self.number_input.text():
                 if int(self.number_input.text()) >= 1:
                     number = int(self.number_input.text())
-                    fact = IntegerFactorization(number=number)
+                    time_limit = int(self.time_limit_input.text()) if self.time_limit_input.text() else DEFAULT_TIME_LIMIT
+                    if time_limit < 1:
+                        raise ValueError("Time limit must be at least 1 second.")
+                    fact = IntegerFactorization(number=number, time_budget=time_limit)
 
+                    self.str_result_label.hide()
                     self.result_label.clear()
-                    self.result_label.setHtml(f"<b>Result dictionary:</b><br>{str(fact.factorize())}")
+                    self.result_label.setHtml("<b>Factorizing...</b>")
                     self.result_label.show()
 
-                    self.str_result_label.clear()
-                    self.str_result_label.setHtml(f"<b>Result str:</b><br>{str(fact)}")
-                    self.str_result_label.show()
+                    self.submit_button.setEnabled(False)
+                    self.cancel_button.setEnabled(True)
+                    self.factorization = fact
+                    self.factorization_job = job_runner().submit(
+                        self.run_factorization, fact, pass_job=True,
+                        owner=self,
+                        on_progress=self.show_progress,
+                        on_result=lambda factors: self.show_result(fact, factors),
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=self.factorization_finished)
                 else:
                     raise ValueError("Number must be greater than or equal to 1.")
             else:
@@ -163,4 +112,37 @@ class IntFactorizationWindow(QWidget):
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error', str(e))
\ No newline at end of file
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    def cancel_factorization(self):
+        # the job stops reporting, the factorization stops its runs, also those on the process pool
+        if self.factorization_job is not None:
+            self.factorization_job.cancel()
+            self.factorization.cancel()
+            self.result_label.setHtml("<b>Cancelled.</b>")
+
+    def factorization_finished(self):
+        self.factorization = self.factorization_job = None
+        self.submit_button.setEnabled(True)
+        self.cancel_button.setEnabled(False)
+
+    @staticmethod
+    def run_factorization(fact, job):
+        def progress(stage, done, total):
+            job.check_cancelled()
+            job.report_progress((stage, done, total))
+        return fact.factorize(progress_callback=progress)
+
+    def show_progress(self, progress):
+        stage, done, total = progress
+        self.result_label.setHtml(f"<b>Factorizing...</b><br>{stage}" + (f", curve {done}/{total}" if total > 1 else ""))
+
+    def show_result(self, fact, factors):
+        self.result_label.clear()
+        self.result_label.setHtml(f"<b>Result dictionary:</b><br>{str(factors)}")
+        self.result_label.show()
+
+        self.str_result_label.clear()
+        self.str_result_label.setHtml(f"<b>Result str:</b><br>{str(fact)}" + (
+            "<br>Time limit reached before all factors were found." if fact.unfactored else ""))
+        self.str_result_label.show()
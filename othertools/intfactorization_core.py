@@ -0,0 +1,418 @@
+from concurrent.futures        import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools                 import lru_cache
+from itertools                 import compress
+from .prime_num_generator_core import SMALL_PRIMES, DETERMINISTIC_BASES, DETERMINISTIC_LIMIT, miller_rabin, sieve
+import math, multiprocessing, os, random, threading, time
+
+# ECM tiers (B1, curves): with B2 = 50 * B1 each tier finds factors of about 15, 20, 25, 30,
+# 35 and 40 digits with high probability.
+ECM_TIERS = ((2000, 25), (11000, 90), (50000, 300), (250000, 700), (1000000, 1800), (3000000, 5100))
+B2_FACTOR = 50
+RHO_ITERATIONS = 1 << 16
+PM1_BOUNDS = (100000, 5000000)
+
+class FactorizationTimeout(Exception):
+    """Raised when the time budget runs out or the factorization is cancelled, also from inside
+    a rho, p - 1 or ECM run that is still going."""
+
+def _check(deadline, stop):
+    """Raises FactorizationTimeout once time.monotonic() passes deadline or stop() is true.
+    The long loops call it every few thousand steps, so a run ends soon after either."""
+    if (deadline is not None and time.monotonic() > deadline) or (stop is not None and stop()):
+        raise FactorizationTimeout()
+
+def _jacobi(a, n):
+    result = 1
+    a %= n
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def strong_lucas(n):
+    """Strong Lucas probable prime test with Selfridge's parameters (odd n, not a square)."""
+    d = 5
+    while True:
+        j = _jacobi(d, n)
+        if j == -1:
+            break
+        if j == 0 and abs(d) != n:
+            return False
+        d = -d - 2 if d > 0 else -d + 2
+    p, q = 1, (1 - d) // 4
+    k, s = n + 1, 0
+    while not k & 1:
+        k >>= 1
+        s += 1
+
+    # U_k, V_k and Q^k by the binary method, left to right
+    u, v, qk = 1, p, q % n
+    inv2 = (n + 1) // 2
+    for bit in bin(k)[3:]:
+        u, v = u * v % n, (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if bit == '1':
+            u, v = (p * u + v) * inv2 % n, (d * u + p * v) * inv2 % n
+            qk = qk * q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v = (v * v - 2 * qk) % n
+        qk = qk * qk % n
+        if v == 0:
+            return True
+    return False
+
+def is_prime(n):
+    """Exact below 3.18 * 10^23 (deterministic Miller-Rabin), Baillie-PSW above it."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES[:64]:
+        if n % p == 0:
+            return n == p
+    if n < DETERMINISTIC_LIMIT:
+        return miller_rabin(n, DETERMINISTIC_BASES)
+    return miller_rabin(n, (2,)) and math.isqrt(n) ** 2 != n and strong_lucas(n)
+
+def perfect_power(n):
+    """(root, k) with root ** k == n for the largest such k, or (n, 1)."""
+    for k in reversed(sieve(n.bit_length() + 1)):
+        root = _iroot(n, k)
+        for r in (root - 1, root, root + 1):
+            if r > 1 and r ** k == n:
+                root, e = perfect_power(r)
+                return root, e * k
+    return n, 1
+
+def _iroot(n, k):
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+@lru_cache(maxsize=8)
+def _stage1_exponent(bound):
+    """Product of the largest powers of all primes up to bound (built as a product tree)."""
+    values = [p ** int(math.log(bound, p)) for p in sieve(bound + 1)]
+    while len(values) > 1:
+        values = [values[i] * values[i + 1] if i + 1 < len(values) else values[i] for i in range(0, len(values), 2)]
+    return values[0]
+
+def primes_between(low, high, segment=1 << 20):
+    """Yields the primes in (low, high] with a segmented sieve, for stage 2 bounds up to 2^32."""
+    base = [p for p in SMALL_PRIMES if p * p <= high]
+    for start in range(low + 1, high + 1, segment):
+        end = min(start + segment, high + 1)
+        flags = bytearray([1]) * (end - start)
+        for p in base:
+            first = max(p * p, -(-start // p) * p)
+            if first < end:
+                flags[first - start::p] = bytes(len(range(first - start, end - start, p)))
+        yield from compress(range(start, end), flags)
+
+def brent_rho(n, iterations=RHO_ITERATIONS, c=None, batch=128, deadline=None, stop=None):
+    """Brent's variant of Pollard's rho: x -> x^2 + c with the gcd taken once per batch of
+    differences. Returns a factor of n, or None after the given number of iterations."""
+    c = c or random.randrange(1, n - 1)
+    y, x, g, r, q = random.randrange(n), 0, 1, 1, 1
+    done = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(batch, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = math.gcd(q, n)
+            k += batch
+            _check(deadline, stop)
+        r <<= 1
+        done += r
+        if done > iterations and g == 1:
+            return None
+    if g == n:  # the batch overshot: step through it one difference at a time
+        while True:
+            ys = (ys * ys + c) % n
+            g = math.gcd(abs(x - ys), n)
+            if g > 1:
+                break
+    return g if g != n else None
+
+def pollard_pm1(n, b1=PM1_BOUNDS[0], b2=PM1_BOUNDS[1], deadline=None, stop=None):
+    """Pollard's p - 1 with a prime by prime stage 2. Returns a factor of n or None."""
+    a = pow(2, _stage1_exponent(b1), n)
+    g = math.gcd(a - 1, n)
+    if 1 < g < n:
+        return g
+    if g == n:
+        # every prime factor was found at once: redo stage 1 one prime at a time
+        a = 2
+        for p in sieve(b1 + 1):
+            _check(deadline, stop)
+            for _ in range(int(math.log(b1, p))):
+                a = pow(a, p, n)
+                g = math.gcd(a - 1, n)
+                if 1 < g < n:
+                    return g
+                if g == n:
+                    return None
+        return None
+
+    powers = {}
+    x, previous, product = 1, 0, 1
+    for i, q in enumerate(primes_between(b1, b2)):
+        gap = q - previous
+        if gap not in powers:
+            powers[gap] = pow(a, gap, n)
+        x = x * powers[gap] % n
+        previous = q
+        product = product * (x - 1) % n
+        if i % 2048 == 2047:
+            _check(deadline, stop)
+            g = math.gcd(product, n)
+            if g > 1:
+                return g if g < n else None
+    g = math.gcd(product, n)
+    return g if 1 < g < n else None
+
+def ecm_curve(n, sigma, b1, b2=None, deadline=None, stop=None):
+    """One curve of Lenstra's elliptic curve method on a Montgomery curve with Suyama's
+    parametrization; x-only arithmetic with a Montgomery ladder in stage 1 and the standard
+    continuation in stage 2. Returns a factor of n or None."""
+    b2 = b2 or B2_FACTOR * b1
+    u, v = (sigma * sigma - 5) % n, 4 * sigma % n
+    x, z = pow(u, 3, n), pow(v, 3, n)
+    denominator = 16 * pow(u, 3, n) * v % n
+    g = math.gcd(denominator, n)
+    if g != 1:
+        return g if g < n else None
+    a24 = pow(v - u, 3, n) * (3 * u + v) * pow(denominator, -1, n) % n
+
+    def double(x, z):
+        s, d = (x + z) * (x + z) % n, (x - z) * (x - z) % n
+        t = s - d
+        return s * d % n, t * (d + a24 * t % n) % n
+
+    def ladder(k, x, z):
+        x0, z0 = x, z
+        x1, z1 = double(x, z)
+        for i, bit in enumerate(bin(k)[3:]):
+            if not i & 4095:
+                _check(deadline, stop)
+            # differential addition R0 + R1 with difference P, then doubling of R0 or R1
+            a, b = (x0 - z0) * (x1 + z1) % n, (x0 + z0) * (x1 - z1) % n
+            xa, za = z * (a + b) * (a + b) % n, x * (a - b) * (a - b) % n
+            if bit == '1':
+                s, d = (x1 + z1) * (x1 + z1) % n, (x1 - z1) * (x1 - z1) % n
+                t = s - d
+                x0, z0, x1, z1 = xa, za, s * d % n, t * (d + a24 * t % n) % n
+            else:
+                s, d = (x0 + z0) * (x0 + z0) % n, (x0 - z0) * (x0 - z0) % n
+                t = s - d
+                x0, z0, x1, z1 = s * d % n, t * (d + a24 * t % n) % n, xa, za
+        return x0, z0
+
+    x, z = ladder(_stage1_exponent(b1), x, z)
+    g = math.gcd(z, n)
+    if g != 1:
+        return g if g < n else None
+
+    # stage 2: primes q = r + 2j are found through R = rQ and the table S_j = 2jQ, since
+    # x(R) z(S_j) - x(S_j) z(R) vanishes modulo p when qQ or (r - 2j)Q is the point at infinity
+    steps = 64
+    sx, sz = [0, 0, 0], [0, 0, 0]
+    sx[1], sz[1] = double(x, z)                            # S_1 = 2Q
+    sx[2], sz[2] = double(sx[1], sz[1])                    # S_2 = 4Q
+    for j in range(3, steps + 1):                          # S_j = S_{j-1} + S_1, difference S_{j-2}
+        a, b = (sx[j - 1] - sz[j - 1]) * (sx[1] + sz[1]) % n, (sx[j - 1] + sz[j - 1]) * (sx[1] - sz[1]) % n
+        sx.append(sz[j - 2] * (a + b) * (a + b) % n)
+        sz.append(sx[j - 2] * (a - b) * (a - b) % n)
+    beta = [sx[j] * sz[j] % n for j in range(steps + 1)]
+
+    r = b1 - 1 if b1 & 1 == 0 else b1
+    rx, rz = ladder(r, x, z)
+    tx, tz = ladder(r - 2 * steps, x, z)
+    alpha = rx * rz % n
+    product = 1
+    for i, q in enumerate(primes_between(b1, b2)):
+        if not i & 4095:
+            _check(deadline, stop)
+        while q > r + 2 * steps:     # R = R + S_steps with difference T, T = R
+            a, b = (rx - rz) * (sx[steps] + sz[steps]) % n, (rx + rz) * (sx[steps] - sz[steps]) % n
+            rx, rz, tx, tz = tz * (a + b) * (a + b) % n, tx * (a - b) * (a - b) % n, rx, rz
+            r += 2 * steps
+            alpha = rx * rz % n
+        j = (q - r) >> 1
+        product = product * ((rx - sx[j]) * (rz + sz[j]) - alpha + beta[j]) % n
+    g = math.gcd(product, n)
+    return g if 1 < g < n else None
+
+# Per-process state of the pool workers
+_worker = {}
+
+def _init_worker(generation):
+    _worker['generation'] = generation
+
+def run_method(method, n, *args, deadline=None, stop=None, generation=None):
+    """One rho run, one p - 1 run or one ECM curve on n. In a pool worker, `generation` ties the
+    run to the search that submitted it: the run is abandoned as soon as the shared counter
+    moves on, i.e. once that search found a factor, ended or was cancelled."""
+    if generation is not None:
+        shared = _worker['generation']
+        stop = lambda: shared.value != generation
+    return {"rho": brent_rho, "pm1": pollard_pm1, "ecm": ecm_curve}[method](n, *args, deadline=deadline, stop=stop)
+
+def _tasks(n):
+    """(stage, done, total, task) in the order they are tried on a composite n."""
+    yield "Pollard rho", 1, 1, ("rho", n, RHO_ITERATIONS)
+    yield "Pollard p-1", 1, 1, ("pm1", n) + PM1_BOUNDS
+    for b1, curves in ECM_TIERS:
+        for curve in range(1, curves + 1):
+            yield f"ECM B1={b1}", curve, curves, ("ecm", n, random.randrange(6, n - 1), b1)
+
+class IntegerFactorization:
+    """Prime factorization by trial division, then Brent's rho, Pollard's p - 1 and ECM with
+    growing bounds on every composite cofactor. The methods run on a process pool when more
+    than one worker is available; time_budget (seconds) bounds the whole run, after which the
+    cofactors still composite are left in `unfactored`. cancel() ends it the same way."""
+
+    def __init__(self, number: int, workers=None, time_budget=None):
+        self.number = number
+        self.workers = workers or os.cpu_count() or 1
+        self.time_budget = time_budget
+        self.factors = None
+        self.unfactored = {}
+        self._cancel_event = threading.Event()
+        self._generation = None
+
+    def cancel(self):
+        """Stops a running factorize() from another thread. The runs in progress, also those on
+        the process pool, end at their next check; factorize() then returns what it found."""
+        self._cancel_event.set()
+        if self._generation is not None:
+            self._generation.value = -1
+
+    def is_prime(self, n: int) -> bool:
+        """Check if a number is prime."""
+        return is_prime(n)
+
+    def pollards_rho(self, n: int) -> int:
+        """Brent's variant of Pollard's rho; retries with a new polynomial until a factor is found."""
+        if n % 2 == 0:
+            return 2
+        while True:
+            factor = brent_rho(n, iterations=1 << 62)
+            if factor:
+                return factor
+
+    def factorize(self, progress_callback=None) -> dict:
+        """Factorize the number into its prime factors.
+        Returns a dictionary where keys are prime factors and values are their counts.
+        progress_callback(stage, done, total) is called after every rho, p - 1 or ECM run."""
+        if self.number < 1:
+            raise ValueError("Number must be greater than or equal to 1.")
+        deadline = time.monotonic() + self.time_budget if self.time_budget else None
+        factors, self.unfactored = {}, {}
+
+        def add_factor(factor, count=1):
+            factors[factor] = factors.get(factor, 0) + count
+
+        n = self.number
+        for p in SMALL_PRIMES:
+            if p * p > n:
+                break
+            while n % p == 0:
+                add_factor(p)
+                n //= p
+
+        pool = None
+        composites = [(n, 1)] if n > 1 else []
+        try:
+            while composites:
+                n, count = composites.pop()
+                if is_prime(n):
+                    add_factor(n, count)
+                    continue
+                root, k = perfect_power(n)
+                if k > 1:
+                    composites.append((root, count * k))
+                    continue
+                if self._cancel_event.is_set() or (deadline and time.monotonic() > deadline):
+                    self.unfactored[n] = self.unfactored.get(n, 0) + count
+                    continue
+                if pool is None and self.workers > 1:
+                    self._generation = multiprocessing.Value('q', 0)
+                    pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                               initargs=(self._generation,))
+                try:
+                    factor = self._find_factor(n, pool, deadline, progress_callback)
+                except FactorizationTimeout:
+                    self.unfactored[n] = self.unfactored.get(n, 0) + count
+                    continue
+                composites += [(factor, count), (n // factor, count)]
+        finally:
+            if pool is not None:
+                # runs still going in the workers stop at their next check instead of finishing
+                self._generation.value = -1
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        self.factors = dict(sorted(factors.items()))
+        return self.factors
+
+    def _find_factor(self, n, pool, deadline, progress_callback):
+        tasks = _tasks(n)
+        if pool is None:
+            for stage, done, total, task in tasks:
+                factor = run_method(*task, deadline=deadline, stop=self._cancel_event.is_set)
+                if progress_callback:
+                    progress_callback(stage, done, total)
+                if factor:
+                    return factor
+            raise FactorizationTimeout()
+
+        # runs of the searches for earlier cofactors see the counter move on and stop
+        with self._generation.get_lock():
+            self._generation.value += 1
+            generation = self._generation.value
+        pending = {}
+        try:
+            while True:
+                while len(pending) < 2 * self.workers:
+                    stage, done, total, task = next(tasks, (None,) * 4)
+                    if task is None:
+                        break
+                    pending[pool.submit(run_method, *task, deadline=deadline, generation=generation)] = (stage, done, total)
+                _check(deadline, self._cancel_event.is_set)
+                if not pending:
+                    raise FactorizationTimeout()
+                # woken up regularly to notice cancel()
+                timeout = min(max(deadline - time.monotonic(), 0), 0.25) if deadline else 0.25
+                finished, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, done, total = pending.pop(future)
+                    if progress_callback:
+                        progress_callback(stage, done, total)
+                    if future.result():
+                        return future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def __str__(self):
+        factors = self.factors if self.factors is not None else self.factorize()
+        factor_list = [f"{prime}^{count}" if count > 1 else str(prime)
+                       for prime, count in factors.items()]
+        factor_list += [f"{composite}^{count} (composite)" if count > 1 else f"{composite} (composite)"
+                        for composite, count in self.unfactored.items()]
+        return f"{self.number} = {' * '.join(factor_list)}"
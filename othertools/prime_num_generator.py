@@ -2,61 +2,13 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
-import random
-
-class PrimeGenerator:
-
-    def __init__(self):
-        pass
-
-    def is_prime(self, n, k=10):
-        """Check if a number is prime using the Miller-Rabin test."""
-        if n <= 1:
-            return False
-        if n <= 3:
-            return True
-        if n % 2 == 0:
-            return False
-
-        # Write n as d*2^r + 1
-        r, d = 0, n - 1
-        while d % 2 == 0:
-            r += 1
-            d //= 2
-
-        # Test k times
-        for _ in range(k):
-            a = random.randint(2, n - 2)
-            x = pow(a, d, n)  # Compute a^d % n
-            if x == 1 or x == n - 1:
-                continue
-
-            for _ in range(r - 1):
-                x = pow(x, 2, n)
-                if x == n - 1:
-                    break
-            else:
-                return False
-        return True
-
-    def generate_prime(self, bit_length):
-        """Generate a random prime number of the specified bit length."""
-        while True:
-            candidate = random.getrandbits(bit_length)
-            candidate |= (1 << bit_length - 1) | 1  # Ensure it has the correct bit length and is odd
-            if self.is_prime(candidate):
-                return candidate
-
-    def generate_primes(self, count, bit_length):
-        """Generate a list of prime numbers."""
-        primes = []
-        while len(primes) < count:
-            prime = self.generate_prime(bit_length)
-            primes.append(prime)
-        return primes
+from jobs                           import job_runner, show_job_error
+from .prime_num_generator_core      import PrimeGenerator
 
 class PrimeNumGenWindow(QWidget):
 
+    KINDS = {"Prime": "prime", "Safe prime": "safe", "Strong prime": "strong"}
+
     def __init__(self, theme_mode):
         super().__init__()
         self.theme_mode = theme_mode
@@ -64,7 +16,9 @@ class PrimeNumGenWindow(QWidget):
         msgbox_title = "About Prime Number Generators"
         msgbox_txt = (
         "<p>This tool allows users to generate a specified number of prime numbers, each with a defined bit length. "
-        "It uses the Miller-Rabin primality test to ensure the generated numbers are truly prime, and provides an easy-to-use "
+        "Candidates are sieved against a table of small primes and the survivors are checked with the Miller-Rabin "
+        "primality test, which is deterministic for numbers below 2^64. Safe primes (p = 2q + 1 with q prime) and strong "
+        "primes (Gordon's algorithm) can be generated too, and long lists are spread over all CPU cores. It provides an easy-to-use "
         "interface for both beginners and experts. Applications include cryptography, random key generation, and mathematical exploration.</p>"
         "<p>Simply input the number of primes you wish to generate, specify their bit length, and let the tool do the work!</p>")
 
@@ -83,8 +37,14 @@ class PrimeNumGenWindow(QWidget):
         self.length_input = DefaultQLineEditStyle(parent=self)
         self.length_input.setGeometry(240, 130, 100, 50)
 
-        submit_button = DefaultButtonStyle("Submit", parent=self, command=self.generator)
-        submit_button.setGeometry(430, 80, 100, 50)
+        # Prime kind
+        kind_label = QLabel("Kind of prime:", parent=self)
+        kind_label.setGeometry(380, 30, 120, 50)
+        self.kind_options = DefaultQComboBoxStyle(parent=self, items=list(self.KINDS))
+        self.kind_options.setGeometry(500, 30, 150, 50)
+
+        self.submit_button = DefaultButtonStyle("Submit", parent=self, command=self.generator)
+        self.submit_button.setGeometry(430, 130, 100, 50)
 
         self.primes_label = QTextEdit(parent=self)
         self.primes_label.setGeometry(10, 200, 680, 200)
@@ -101,14 +61,23 @@ class PrimeNumGenWindow(QWidget):
                 n = int(self.nums_input.text())
                 if self.length_input.text():
                     length = int(self.length_input.text())
+                    kind = self.kind_options.currentText()
 
-                    generator = PrimeGenerator()
-                    primes = generator.generate_primes(n, length) 
-
+                    generator = PrimeGenerator(self.KINDS[kind])
+                    self.primes = []
                     self.primes_label.clear()
-                    self.primes_label.setHtml(
-                        f"<b>Generated {n} primes of {length}-bit length:</b><br>{primes}")
+                    self.primes_label.setHtml(f"<b>Generating {n} {kind.lower()}s of {length}-bit length...</b>")
                     self.primes_label.show()
+
+                    # primes are appended to the text box as they arrive
+                    self.submit_button.setEnabled(False)
+                    job_runner().submit(
+                        self.run_generator, generator, n, length, pass_job=True,
+                        owner=self,
+                        on_progress=self.show_primes,
+                        on_result=lambda primes: self.show_result(primes, kind, length),
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.submit_button.setEnabled(True))
                 else:
                     raise ValueError('Please enter length.')
             else:
@@ -116,4 +85,24 @@ class PrimeNumGenWindow(QWidget):
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
-            QMessageBox.critical(self, 'Unexpected Error', str(e))
\ No newline at end of file
+            QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def run_generator(generator, count, bit_length, job):
+        def progress(new_primes, done, total):
+            job.check_cancelled()
+            job.report_progress((new_primes, done, total))
+        return generator.generate_primes(count, bit_length, progress_callback=progress)
+
+    def show_primes(self, progress):
+        new_primes, done, total = progress
+        if not self.primes:
+            self.primes_label.clear()
+        self.primes.extend(new_primes)
+        self.primes_label.append("\n".join(map(str, new_primes)))
+
+    def show_result(self, primes, kind, length):
+        self.primes_label.clear()
+        self.primes_label.setHtml(
+            f"<b>Generated {len(primes)} {kind.lower()}s of {length}-bit length:</b><br>{'<br>'.join(map(str, primes))}")
+        self.primes_label.show()
@@ -0,0 +1,238 @@
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools          import lru_cache
+from itertools          import compress
+import argparse, bisect, os, secrets, sys, time
+
+SIEVE_LIMIT = 1 << 16
+SMALL_RANGE_BITS = 20     # below this many bits all primes of the range are listed and one is picked
+WINDOW = 4096             # most candidates sieved at once; smaller numbers use smaller windows
+KINDS = ("prime", "safe", "strong")
+
+def sieve(limit):
+    """All primes below limit (sieve of Eratosthenes on a bytearray)."""
+    if limit < 3:
+        return []
+    flags = bytearray([1]) * limit
+    flags[0] = flags[1] = 0
+    for p in range(2, int(limit ** 0.5) + 1):
+        if flags[p]:
+            flags[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return list(compress(range(limit), flags))
+
+SMALL_PRIMES = sieve(SIEVE_LIMIT)
+ODD_SMALL_PRIMES = SMALL_PRIMES[1:]
+
+# Bases for which Miller-Rabin is deterministic: the first 12 primes are exact for
+# n < 3.18 * 10^23 (DETERMINISTIC_LIMIT), which covers every 64-bit integer.
+DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+DETERMINISTIC_LIMIT = 318665857834031151167461
+
+def miller_rabin(n, bases):
+    """True if odd n > 3 is a strong probable prime to all bases."""
+    d, r = n - 1, 0
+    while not d & 1:
+        d >>= 1
+        r += 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def is_prime(n, rounds=40, trial_division=True):
+    """Exact below DETERMINISTIC_LIMIT, Miller-Rabin with `rounds` random bases above it."""
+    if n < 2:
+        return False
+    if trial_division or n < SIEVE_LIMIT:
+        for p in SMALL_PRIMES[:256]:
+            if n % p == 0:
+                return n == p
+        if n < SMALL_PRIMES[255] ** 2:
+            return True
+    if n < DETERMINISTIC_LIMIT:
+        return miller_rabin(n, DETERMINISTIC_BASES)
+    # base 2 first: it rejects almost every composite before the random rounds start
+    return miller_rabin(n, [2] + [secrets.randbelow(n - 3) + 2 for _ in range(rounds)])
+
+@lru_cache(maxsize=None)
+def sieve_plan(bit_length):
+    """(odd sieving primes, window) for candidates of bit_length bits. Testing a small candidate
+    costs less than striking out a residue class, so small numbers are sieved with fewer primes
+    in smaller windows: about bit_length^2 / 16 and 4 * bit_length."""
+    limit = min(SIEVE_LIMIT, max(256, bit_length ** 2 // 16))
+    return ODD_SMALL_PRIMES[:bisect.bisect(ODD_SMALL_PRIMES, limit)], min(WINDOW, max(64, 4 * bit_length))
+
+def survivors(progressions, count, primes=ODD_SMALL_PRIMES):
+    """Indices j < count for which none of the odd primes divides start + j * step of any
+    (start, step) progression. Each prime strikes out its residue class with one slice
+    assignment. All starts must be larger than SIEVE_LIMIT."""
+    flags = bytearray([1]) * count
+    for p in primes:
+        for start, step in progressions:
+            inverse = pow(step % p, -1, p)
+            first = -start * inverse % p
+            if first < count:
+                flags[first::p] = bytes(len(range(first, count, p)))
+    return [j for j, flag in enumerate(flags) if flag]
+
+def _check_bits(bit_length, minimum=2):
+    if bit_length < minimum:
+        raise ValueError(f"Bit length must be at least {minimum}.")
+
+def _random_odd(low, high):
+    """Random odd integer in [low, high)."""
+    return (low + secrets.randbelow(high - low)) | 1
+
+@lru_cache(maxsize=None)
+def _small_range(bit_length, kind):
+    """All primes of the kind ("prime" or "safe") with bit_length bits, listed once per process."""
+    low, high = 1 << bit_length - 1, 1 << bit_length
+    primes = [p for p in sieve(high) if p >= low]
+    return tuple(primes if kind == "prime" else [p for p in primes if is_prime(p // 2)])
+
+def _pick_small(bit_length, kind):
+    choices = _small_range(bit_length, kind)
+    if not choices:
+        raise ValueError(f"There is no such prime with {bit_length} bits.")
+    return secrets.choice(choices)
+
+def generate_prime(bit_length):
+    """Random prime with exactly bit_length bits. Random windows of odd candidates are
+    sieved against the small prime table and only the survivors are tested."""
+    _check_bits(bit_length)
+    if bit_length <= SMALL_RANGE_BITS:
+        return _pick_small(bit_length, "prime")
+    primes, window = sieve_plan(bit_length)
+    low, high = 1 << bit_length - 1, 1 << bit_length
+    while True:
+        start = _random_odd(low, high - 2 * window)
+        for j in survivors([(start, 2)], window, primes):
+            if is_prime(start + 2 * j, trial_division=False):
+                return start + 2 * j
+
+def generate_safe_prime(bit_length):
+    """Random safe prime p = 2q + 1 (q prime) with exactly bit_length bits. q and p are sieved
+    together, and q is only tested fully once p passed a base 2 test."""
+    _check_bits(bit_length, 3)
+    if bit_length <= SMALL_RANGE_BITS:
+        return _pick_small(bit_length, "safe")
+    primes, window = sieve_plan(bit_length)
+    low, high = 1 << bit_length - 2, 1 << bit_length - 1
+    while True:
+        q0 = _random_odd(low, high - 2 * window)
+        for j in survivors([(q0, 2), (2 * q0 + 1, 4)], window, primes):
+            q = q0 + 2 * j
+            p = 2 * q + 1
+            if pow(2, q - 1, q) == 1 and pow(2, p - 1, p) == 1 \
+                    and is_prime(q, trial_division=False) and is_prime(p, trial_division=False):
+                return p
+
+def generate_strong_prime(bit_length):
+    """Random strong prime with exactly bit_length bits (Gordon's algorithm): p - 1 has a
+    large prime factor r, p + 1 a large prime factor s and r - 1 a large prime factor t."""
+    _check_bits(bit_length, 64)
+    half = (bit_length - 20) // 2
+    s = generate_prime(half)
+    t = generate_prime(half - 4)
+    i = secrets.randbelow(8) + 8
+    while not is_prime(2 * i * t + 1):
+        i += 1
+    r = 2 * i * t + 1
+    p0 = 2 * pow(s, r - 2, r) * s - 1   # p0 = 1 mod r and p0 = -1 mod s
+    step = 2 * r * s
+    low, high = 1 << bit_length - 1, 1 << bit_length
+    first, last = -(-(low - p0) // step), (high - 1 - p0) // step
+    primes, window = sieve_plan(bit_length)
+    while True:
+        start = p0 + (first + secrets.randbelow(max(last - first - window, 1))) * step
+        for j in survivors([(start, step)], window, primes):
+            p = start + j * step
+            if p < high and is_prime(p, trial_division=False):
+                return p
+
+GENERATORS = {"prime": generate_prime, "safe": generate_safe_prime, "strong": generate_strong_prime}
+
+def _generate_batch(kind, bit_length, count):
+    """Process pool worker."""
+    return [GENERATORS[kind](bit_length) for _ in range(count)]
+
+def iter_primes(count, bit_length, kind="prime", workers=None, batch_size=None):
+    """Yields `count` random primes of the given kind as they are found, in batches spread over
+    a process pool. Closing the generator early cancels the batches not started yet."""
+    if kind not in GENERATORS:
+        raise ValueError(f"Unknown prime kind: {kind}")
+    if count < 1:
+        raise ValueError("Number of primes must be at least 1.")
+    _check_bits(bit_length, {"prime": 2, "safe": 3, "strong": 64}[kind])
+    workers = min(workers or os.cpu_count() or 1, count)
+    if workers == 1:
+        for _ in range(count):
+            yield GENERATORS[kind](bit_length)
+        return
+
+    # small batches keep the output streaming; at most 2 batches per worker are in flight
+    batch_size = batch_size or max(1, min(64, count // (workers * 8)))
+    batches = [batch_size] * (count // batch_size) + ([count % batch_size] if count % batch_size else [])
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = set()
+        while batches or pending:
+            while batches and len(pending) < 2 * workers:
+                pending.add(pool.submit(_generate_batch, kind, bit_length, batches.pop()))
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+class PrimeGenerator:
+
+    def __init__(self, kind="prime", workers=None):
+        if kind not in GENERATORS:
+            raise ValueError(f"Unknown prime kind: {kind}")
+        self.kind = kind
+        self.workers = workers
+
+    def is_prime(self, n, k=40):
+        """Check if a number is prime (deterministic below 3.18 * 10^23, Miller-Rabin above)."""
+        return is_prime(n, k)
+
+    def generate_prime(self, bit_length):
+        """Generate a random prime number of the specified bit length."""
+        return GENERATORS[self.kind](bit_length)
+
+    def generate_primes(self, count, bit_length, progress_callback=None, interval=0.25):
+        """Generate a list of prime numbers. progress_callback(new_primes, done, count) is called
+        at most every `interval` seconds with the primes found since the last call, so long
+        lists can be shown while they grow."""
+        primes, reported, last = [], 0, time.monotonic()
+        for prime in iter_primes(count, bit_length, self.kind, self.workers):
+            primes.append(prime)
+            if progress_callback and (len(primes) == count or time.monotonic() - last >= interval):
+                progress_callback(primes[reported:], len(primes), count)
+                reported, last = len(primes), time.monotonic()
+        return primes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m othertools.prime_num_generator_core",
+                                     description="Streams random primes to stdout, one per line.")
+    parser.add_argument("count", type=int)
+    parser.add_argument("bits", type=int)
+    parser.add_argument("-k", "--kind", choices=KINDS, default="prime")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: all CPUs)")
+    args = parser.parse_args(argv)
+    try:
+        for prime in iter_primes(args.count, args.bits, args.kind, args.jobs):
+            print(prime, flush=True)
+    except ValueError as ve:
+        parser.error(str(ve))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -32,6 +32,7 @@ class AsymmetricPageUI:
         ("El Gamal", "ElGamalButton"),
         ("RSA", "RSAButton"),
         ("RSA Wiener Attack", "RSAWienerAttackButton"),
+        ("RSA Key Auditor", "RSAKeyAuditButton"),
         ("Cramer-Shoup Encryption", "CramerShoupEncButton"),
         ("Cramer-Shoup Decryption", "CramerShoupDecButton"),
         ("X509 Self Signed Certificate", "X509SelfSignedButton"),
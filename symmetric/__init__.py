@@ -1,18 +1,37 @@
-from .aes               import AESDecryptionWindow, AESEncryptionWindow
-from .des               import DESDecryptionWindow, DESEncryptionWindow
-from .rc2               import RC2DecryptionWindow, RC2EncryptionWindow
-from .tripleDES         import TripleDESEncryptionWindow, TripleDESDecryptionWindow
-from .blowfish          import BlowfishWindow
-from .serpent           import SerpentWindow
-from .twofish_cipher    import TwofishWindow
-from .camellia_cipher   import CamelliaWindow
-from .rc5               import RC5EncryptionWindow, RC5DecryptionWindow
-from .fernet_enc_dec    import FERNETWindow
-from .rc4               import RC4EncryptionWindow, RC4DecryptionWindow
+from importlib import import_module
+
+# Windows are imported from their modules on first access, so opening one tool
+# does not import every other tool of the package.
+_MODULES = {
+    "AESDecryptionWindow":       ".aes",
+    "AESEncryptionWindow":       ".aes",
+    "DESDecryptionWindow":       ".des",
+    "DESEncryptionWindow":       ".des",
+    "RC2DecryptionWindow":       ".rc2",
+    "RC2EncryptionWindow":       ".rc2",
+    "TripleDESEncryptionWindow": ".tripleDES",
+    "TripleDESDecryptionWindow": ".tripleDES",
+    "BlowfishWindow":            ".blowfish",
+    "SerpentWindow":             ".serpent",
+    "TwofishWindow":             ".twofish_cipher",
+    "CamelliaWindow":            ".camellia_cipher",
+    "RC5EncryptionWindow":       ".rc5",
+    "RC5DecryptionWindow":       ".rc5",
+    "FERNETWindow":              ".fernet_enc_dec",
+    "RC4EncryptionWindow":       ".rc4",
+    "RC4DecryptionWindow":       ".rc4",
+}
 
 __all__ = [
     "AESDecryptionWindow", "AESEncryptionWindow", "DESDecryptionWindow", 
     "DESEncryptionWindow", "RC2DecryptionWindow", "RC2EncryptionWindow", "TripleDESEncryptionWindow",
     "TripleDESDecryptionWindow", "BlowfishWindow", "SerpentWindow", "TwofishWindow",
     "CamelliaWindow", "RC5EncryptionWindow", "RC5DecryptionWindow", "FERNETWindow", "RC4EncryptionWindow", 
-    "RC4DecryptionWindow"]
\ No newline at end of file
+    "RC4DecryptionWindow"]
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(import_module(_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
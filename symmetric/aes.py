@@ -1,40 +1,10 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox, QInputDialog
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
-from Crypto.Cipher                  import AES
-from Crypto.Random                  import get_random_bytes
-from Crypto.Util.Padding            import pad, unpad
+from jobs                           import job_runner, show_job_error
 from os                             import urandom
 from base64                         import b64encode, b64decode
-
-# Implementation
-class AES_Imp:
-
-    def __init__(self, mode):
-        self.mode = mode
-    
-    def encrypt(self, plaintext, key):
-        if self.mode == "ECB":
-            cipher = AES.new(key, AES.MODE_ECB)
-            ciphertext = cipher.encrypt(pad(plaintext, AES.block_size))
-            return ciphertext
-        elif self.mode == "CBC":
-            iv = get_random_bytes(AES.block_size)
-            cipher = AES.new(key, AES.MODE_CBC, iv)
-            ciphertext = cipher.encrypt(pad(plaintext, AES.block_size))
-            encrypted_data = iv + ciphertext
-            return encrypted_data
- 
-    def decrypt_ECB(self, ciphertext, key):
-        cipher = AES.new(key, AES.MODE_ECB)
-        decrypted_data = unpad(cipher.decrypt(ciphertext), AES.block_size)
-        return decrypted_data
-
-    def decrypt_CBC(self, ciphertext, key):
-        iv = ciphertext[: AES.block_size]
-        cipher = AES.new(key, AES.MODE_CBC, iv)
-        decrypted_data = unpad(cipher.decrypt(ciphertext[AES.block_size :]), AES.block_size)
-        return decrypted_data
+from .aes_core                      import AES_Imp
 
 class AESEncryptionWindow(QWidget):
 
@@ -77,8 +47,8 @@ class AESEncryptionWindow(QWidget):
         self.plaintext_input = DefaultQLineEditStyle(parent=self)
         self.plaintext_input.setGeometry(10, 60, 680, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_aes_encryption)
-        encrypt_button.setGeometry(300, 140, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_aes_encryption)
+        self.encrypt_button.setGeometry(300, 140, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 230, 680, 100)
@@ -110,20 +80,13 @@ class AESEncryptionWindow(QWidget):
                 if ok:
                     plaintext = self.plaintext_input.text().encode('utf-8')
                     key = urandom(32)
-                    aes_enc = AES_Imp(mode=mode)
-                    
-                    ciphertext = aes_enc.encrypt(plaintext, key)
-                    QMessageBox.information(self, 'Encryption successfull', f'Plaintext encrypted in mode: {mode}')
-
-                    self.key_label.clear()
-                    self.key_label.setHtml(f"<b>Key (Base64):</b><br> {b64encode(key).decode()}")
-                    self.key_label.show()
-                    self.encrypted_text_label.clear()
-                    self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br> {b64encode(ciphertext).decode()}")
-                    self.encrypted_text_label.show()
-                    self.selected_mode_label.clear()
-                    self.selected_mode_label.setHtml(f"<b>Selected mode:</b><br> {str(mode)}")
-                    self.selected_mode_label.show()                    
+                    self.encrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.encrypt, plaintext, key, mode,
+                        owner=self,
+                        on_result=lambda ciphertext: self.show_encryption(ciphertext, key, mode),
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.encrypt_button.setEnabled(True))
                 else:
                     return
             else:
@@ -134,6 +97,24 @@ class AESEncryptionWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encrypt(plaintext, key, mode):
+        aes_enc = AES_Imp(mode=mode)
+        return aes_enc.encrypt(plaintext, key)
+
+    def show_encryption(self, ciphertext, key, mode):
+        QMessageBox.information(self, 'Encryption successfull', f'Plaintext encrypted in mode: {mode}')
+
+        self.key_label.clear()
+        self.key_label.setHtml(f"<b>Key (Base64):</b><br> {b64encode(key).decode()}")
+        self.key_label.show()
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br> {b64encode(ciphertext).decode()}")
+        self.encrypted_text_label.show()
+        self.selected_mode_label.clear()
+        self.selected_mode_label.setHtml(f"<b>Selected mode:</b><br> {str(mode)}")
+        self.selected_mode_label.show()
+
 # ============================================================================================================================================
 
 class AESDecryptionWindow(QWidget):
@@ -183,8 +164,8 @@ class AESDecryptionWindow(QWidget):
         self.key_input = DefaultQLineEditStyle(parent=self)
         self.key_input.setGeometry(10, 180, 680, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_aes_decryption)
-        decrypt_button.setGeometry(300, 270, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_aes_decryption)
+        self.decrypt_button.setGeometry(300, 270, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(10, 340, 680, 100)
@@ -205,24 +186,13 @@ class AESDecryptionWindow(QWidget):
                     ciphertext = b64decode(ciphertext_b64)
                     key = b64decode(key_b64)
 
-                    aes_dec = AES_Imp(mode=None)
-                    decrypted_msg = None
-
-                    try:
-                        decrypted_msg = aes_dec.decrypt_ECB(ciphertext, key)
-                        QMessageBox.information(self, 'Decryption successfull', 'Ciphertext decrypted successfully')
-                        self.original_msg_label.clear()
-                        self.original_msg_label.setHtml(f"<b>Original message/plaintext: (ECB mode)</b><br>{decrypted_msg.decode()}")
-                        self.original_msg_label.show()
-                    except:
-                        try:
-                            decrypted_msg = aes_dec.decrypt_CBC(ciphertext, key)
-                            QMessageBox.information(self, 'Decryption successfull', 'Ciphertext decrypted successfully')
-                            self.original_msg_label.clear()
-                            self.original_msg_label.setHtml(f"<b>Original message/plaintext (CBC mode): </b><br>{decrypted_msg.decode()}")
-                            self.original_msg_label.show()
-                        except Exception as e:
-                            raise Exception(str(e))
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, ciphertext, key,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please enter key.')
             else:
@@ -232,3 +202,22 @@ class AESDecryptionWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def decrypt(ciphertext, key):
+        aes_dec = AES_Imp(mode=None)
+        # the mode is not stored with the ciphertext, so try ECB first and fall back to CBC
+        try:
+            return 'ECB', aes_dec.decrypt_ECB(ciphertext, key).decode()
+        except:
+            return 'CBC', aes_dec.decrypt_CBC(ciphertext, key).decode()
+
+    def show_decryption(self, result):
+        mode, decrypted_msg = result
+        QMessageBox.information(self, 'Decryption successfull', 'Ciphertext decrypted successfully')
+        self.original_msg_label.clear()
+        if mode == 'ECB':
+            self.original_msg_label.setHtml(f"<b>Original message/plaintext: (ECB mode)</b><br>{decrypted_msg}")
+        else:
+            self.original_msg_label.setHtml(f"<b>Original message/plaintext (CBC mode): </b><br>{decrypted_msg}")
+        self.original_msg_label.show()
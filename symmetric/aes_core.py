@@ -0,0 +1,31 @@
+from Crypto.Cipher                  import AES
+from Crypto.Random                  import get_random_bytes
+from Crypto.Util.Padding            import pad, unpad
+
+class AES_Imp:
+
+    def __init__(self, mode):
+        self.mode = mode
+    
+    def encrypt(self, plaintext, key):
+        if self.mode == "ECB":
+            cipher = AES.new(key, AES.MODE_ECB)
+            ciphertext = cipher.encrypt(pad(plaintext, AES.block_size))
+            return ciphertext
+        elif self.mode == "CBC":
+            iv = get_random_bytes(AES.block_size)
+            cipher = AES.new(key, AES.MODE_CBC, iv)
+            ciphertext = cipher.encrypt(pad(plaintext, AES.block_size))
+            encrypted_data = iv + ciphertext
+            return encrypted_data
+ 
+    def decrypt_ECB(self, ciphertext, key):
+        cipher = AES.new(key, AES.MODE_ECB)
+        decrypted_data = unpad(cipher.decrypt(ciphertext), AES.block_size)
+        return decrypted_data
+
+    def decrypt_CBC(self, ciphertext, key):
+        iv = ciphertext[: AES.block_size]
+        cipher = AES.new(key, AES.MODE_CBC, iv)
+        decrypted_data = unpad(cipher.decrypt(ciphertext[AES.block_size :]), AES.block_size)
+        return decrypted_data
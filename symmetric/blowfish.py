@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 from base64                         import b64encode, b64decode
 from Crypto.Cipher                  import Blowfish
 from Crypto.Util.Padding            import pad, unpad
@@ -67,8 +68,8 @@ class BlowfishWindow(QWidget):
         self.key_input = DefaultQLineEditStyle(parent=self,max_length=56)
         self.key_input.setGeometry(170, 120, 50, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_blowfish_encryption)
-        encrypt_button.setGeometry(300, 150, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_blowfish_encryption)
+        self.encrypt_button.setGeometry(300, 150, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 250, 500, 100)
@@ -100,8 +101,8 @@ class BlowfishWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(600, 180, 480, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_blowfish_decryption)
-        decrypt_button.setGeometry(800, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_blowfish_decryption)
+        self.decrypt_button.setGeometry(800, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(600, 370, 480, 100)
@@ -117,12 +118,13 @@ class BlowfishWindow(QWidget):
                     key = b64decode(key_b64)
                     ciphertext = b64decode(ciphertext_b64)
 
-                    blowfish = BlowfishImp(key=key)
-                    plaintext = blowfish.decrypt_ECB(ciphertext)
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Original plaintext: </b><br>{plaintext.decode('utf-8')}")
-                    self.original_msg_label.show()
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, ciphertext, key,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste the key.')
             else:
@@ -133,6 +135,16 @@ class BlowfishWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def decrypt(ciphertext, key):
+        blowfish = BlowfishImp(key=key)
+        return blowfish.decrypt_ECB(ciphertext)
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Original plaintext: </b><br>{plaintext.decode('utf-8')}")
+        self.original_msg_label.show()
+
     def call_blowfish_encryption(self):
         try:
             if self.plaintext_input.text():
@@ -142,16 +154,13 @@ class BlowfishWindow(QWidget):
                         key_length = int(self.key_input.text())
                         key = urandom(key_length)
 
-                        blowfish = BlowfishImp(key=key)
-                        ciphertext = blowfish.encrypt_ECB(plaintext)
-
-                        self.encrypted_text_label.clear()
-                        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64): </b><br>{b64encode(ciphertext).decode()}")
-                        self.encrypted_text_label.show()
-
-                        self.key_label.clear()
-                        self.key_label.setHtml(f"<b>Key (Base64):</b><br> {b64encode(key).decode()}")
-                        self.key_label.show()
+                        self.encrypt_button.setEnabled(False)
+                        job_runner().submit(
+                            self.encrypt, plaintext, key,
+                            owner=self,
+                            on_result=lambda ciphertext: self.show_encryption(ciphertext, key),
+                            on_error=lambda e: show_job_error(self, e),
+                            on_finished=lambda: self.encrypt_button.setEnabled(True))
                     else:
                         raise ValueError('Key must be from 4 to 56 bytes.')
                 else:
@@ -163,3 +172,17 @@ class BlowfishWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def encrypt(plaintext, key):
+        blowfish = BlowfishImp(key=key)
+        return blowfish.encrypt_ECB(plaintext)
+
+    def show_encryption(self, ciphertext, key):
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64): </b><br>{b64encode(ciphertext).decode()}")
+        self.encrypted_text_label.show()
+
+        self.key_label.clear()
+        self.key_label.setHtml(f"<b>Key (Base64):</b><br> {b64encode(key).decode()}")
+        self.key_label.show()
@@ -3,6 +3,7 @@ from Crypto.Util.Padding            import pad, unpad
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from os                             import urandom
 from base64                         import b64encode, b64decode
 import des
@@ -67,8 +68,8 @@ class DESEncryptionWindow(QWidget):
             parent=self, items=["ECB"])
         self.mode_input.setGeometry(200, 160, 100, 50) 
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_des_encryption)
-        encrypt_button.setGeometry(350, 160, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_des_encryption)
+        self.encrypt_button.setGeometry(350, 160, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 280, 680, 100)
@@ -92,17 +93,13 @@ class DESEncryptionWindow(QWidget):
                 key = urandom(key_length)
                 mode = self.mode_input.currentText()
 
-                des_encryption = DES_Encryption_Imp(key, plaintext, mode)
-                ciphertext = des_encryption.ciphertext
-
-                self.encrypted_text_label.clear()
-                self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
-                self.encrypted_text_label.show()
-
-                self.generated_key_label.clear()
-                self.generated_key_label.setHtml(f"<b>Generated {key_length} byte length key (Base64):</b><br>{b64encode(key).decode()}")
-                self.generated_key_label.show()
-
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.encrypt, key, plaintext, mode,
+                    owner=self,
+                    on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_length),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 raise ValueError('Please enter plaintext.')
         except ValueError as ve:
@@ -110,6 +107,20 @@ class DESEncryptionWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encrypt(key, plaintext, mode):
+        des_encryption = DES_Encryption_Imp(key, plaintext, mode)
+        return des_encryption.ciphertext
+
+    def show_encryption(self, ciphertext, key, key_length):
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
+        self.encrypted_text_label.show()
+
+        self.generated_key_label.clear()
+        self.generated_key_label.setHtml(f"<b>Generated {key_length} byte length key (Base64):</b><br>{b64encode(key).decode()}")
+        self.generated_key_label.show()
+
 # ==========================================================================================================
 
 class DES_Decryption_Imp:
@@ -150,8 +161,8 @@ class DESDecryptionWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(10, 180, 680, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_des_decryption)
-        decrypt_button.setGeometry(300, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_des_decryption)
+        self.decrypt_button.setGeometry(300, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(10, 370, 680, 100)
@@ -172,13 +183,13 @@ class DESDecryptionWindow(QWidget):
                     key = b64decode(key_b64)
                     ciphertext = b64decode(ciphertext_b64)
 
-                    decryption = DES_Decryption_Imp(key, ciphertext)
-                    plaintext = decryption.plaintext
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
-                    self.original_msg_label.show()
-
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, key, ciphertext,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste key.')
             else:
@@ -187,3 +198,13 @@ class DESDecryptionWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def decrypt(key, ciphertext):
+        decryption = DES_Decryption_Imp(key, ciphertext)
+        return decryption.plaintext
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
+        self.original_msg_label.show()
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageBox
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from cryptography.fernet            import Fernet
 
 class FernetEncryption:
@@ -50,8 +51,8 @@ class FERNETWindow(QWidget):
         self.plaintext_input = DefaultQLineEditStyle(parent=self)
         self.plaintext_input.setGeometry(20, 60, 480, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_fernet_encryption)
-        encrypt_button.setGeometry(225, 140, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_fernet_encryption)
+        self.encrypt_button.setGeometry(225, 140, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(20, 210, 480, 100)
@@ -83,8 +84,8 @@ class FERNETWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(600, 180, 480, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_fernet_decryption)
-        decrypt_button.setGeometry(800, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_fernet_decryption)
+        self.decrypt_button.setGeometry(800, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(600, 340, 480, 100)
@@ -107,13 +108,13 @@ class FERNETWindow(QWidget):
                     key_b64 = fix_base64_padding(key_b64)
                     key_bytes = key_b64.encode('utf-8')
 
-                    decryption = FernetDecryption(key_bytes)
-                    plaintext = decryption.decrypt(ciphertext_b64)
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
-                    self.original_msg_label.show()
-
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, key_bytes, ciphertext_b64,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste key.')
             else:
@@ -123,25 +124,48 @@ class FERNETWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def decrypt(key_bytes, ciphertext_b64):
+        decryption = FernetDecryption(key_bytes)
+        return decryption.decrypt(ciphertext_b64)
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
+        self.original_msg_label.show()
+
     def call_fernet_encryption(self):
         try:
             if self.plaintext_input.text():
                 plaintext = self.plaintext_input.text()
                 key_bytes = Fernet.generate_key()
                 
-                object = FernetEncryption(key_bytes)
-                encrypted_text = object.encrypt(plaintext)
-
-                self.encrypted_text_label.clear()
-                self.encrypted_text_label.setHtml(f"<b>Encrypted text:</b><br>{encrypted_text}")
-                self.encrypted_text_label.show()
-
-                self.generated_key_label.clear()
-                self.generated_key_label.setHtml(f"<b>Generated key:</b><br>{object.get_key()}")
-                self.generated_key_label.show()
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.encrypt, key_bytes, plaintext,
+                    owner=self,
+                    on_result=self.show_encryption,
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 raise ValueError('Please enter plaintext')
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def encrypt(key_bytes, plaintext):
+        object = FernetEncryption(key_bytes)
+        encrypted_text = object.encrypt(plaintext)
+        return object, encrypted_text
+
+    def show_encryption(self, result):
+        object, encrypted_text = result
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Encrypted text:</b><br>{encrypted_text}")
+        self.encrypted_text_label.show()
+
+        self.generated_key_label.clear()
+        self.generated_key_label.setHtml(f"<b>Generated key:</b><br>{object.get_key()}")
+        self.generated_key_label.show()
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 from Cryptodome.Cipher              import ARC2
 from base64                         import b64encode, b64decode
 from os                             import urandom
@@ -62,8 +63,8 @@ class RC2EncryptionWindow(QWidget):
         self.mode_options = DefaultQComboBoxStyle(parent=self, items=modes_list)
         self.mode_options.setGeometry(180, 180, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_rc2_encryption)
-        encrypt_button.setGeometry(350, 180, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_rc2_encryption)
+        self.encrypt_button.setGeometry(350, 180, 100, 50)
 
         self.ciphertext_label = QTextEdit(parent=self)
         self.ciphertext_label.setGeometry(10, 280, 680, 100)
@@ -87,16 +88,14 @@ class RC2EncryptionWindow(QWidget):
                 key_bytes = urandom(16)
                 mode = self.mode_options.currentText()
 
-                rc2_encryption = RC2Encryption(key_bytes, 1024)
                 if mode == "ECB":
-                    ciphertext = rc2_encryption.encrypt_ECB(plaintext_bytes)
-                    self.ciphertext_label.clear()
-                    self.ciphertext_label.setHtml(f"<b>Ciphertext:</b><br>{b64encode(ciphertext).decode('utf-8')}")
-                    self.ciphertext_label.show()
-
-                    self.generated_key_label.clear()
-                    self.generated_key_label.setHtml(f"<b>Generated key:</b><br>{b64encode(key_bytes).decode('utf-8')}")
-                    self.generated_key_label.show()
+                    self.encrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.encrypt, key_bytes, plaintext_bytes,
+                        owner=self,
+                        on_result=lambda ciphertext: self.show_encryption(ciphertext, key_bytes),
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.encrypt_button.setEnabled(True))
                 else:
                     raise ValueError('The tool supports only ECB mode for now.')
             else:
@@ -106,6 +105,20 @@ class RC2EncryptionWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encrypt(key_bytes, plaintext_bytes):
+        rc2_encryption = RC2Encryption(key_bytes, 1024)
+        return rc2_encryption.encrypt_ECB(plaintext_bytes)
+
+    def show_encryption(self, ciphertext, key_bytes):
+        self.ciphertext_label.clear()
+        self.ciphertext_label.setHtml(f"<b>Ciphertext:</b><br>{b64encode(ciphertext).decode('utf-8')}")
+        self.ciphertext_label.show()
+
+        self.generated_key_label.clear()
+        self.generated_key_label.setHtml(f"<b>Generated key:</b><br>{b64encode(key_bytes).decode('utf-8')}")
+        self.generated_key_label.show()
+
 # ========================================================================================================================
 
 class RC2Decryption:
@@ -157,8 +170,8 @@ class RC2DecryptionWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(10, 180, 680, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_rc2_decryption)
-        decrypt_button.setGeometry(300, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_rc2_decryption)
+        self.decrypt_button.setGeometry(300, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(10, 370, 680, 100)
@@ -179,13 +192,13 @@ class RC2DecryptionWindow(QWidget):
                     ciphertext = b64decode(b64_ciphertext)
                     key = b64decode(b64_key)
 
-                    rc2_decryption = RC2Decryption(key, 1024)
-                    decrypted_padded = rc2_decryption.decrypt_ECB(ciphertext)
-                    plaintext = rc2_decryption.unpad(decrypted_padded).decode('utf-8')
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Decrypted Plaintext:</b><br>{plaintext}")
-                    self.original_msg_label.show()
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, key, ciphertext,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste key.')
             else:
@@ -195,3 +208,14 @@ class RC2DecryptionWindow(QWidget):
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def decrypt(key, ciphertext):
+        rc2_decryption = RC2Decryption(key, 1024)
+        decrypted_padded = rc2_decryption.decrypt_ECB(ciphertext)
+        return rc2_decryption.unpad(decrypted_padded).decode('utf-8')
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Decrypted Plaintext:</b><br>{plaintext}")
+        self.original_msg_label.show()
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle
+from jobs                           import job_runner, show_job_error
 from Crypto.Cipher                  import ARC4
 from Crypto.Hash                    import SHA256, HMAC
 from base64                         import b64encode, b64decode
@@ -50,8 +51,8 @@ class RC4EncryptionWindow(QWidget):
             parent=self, items=["8", "16", "24", "32"])
         self.key_input.setGeometry(180, 150, 100, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.rc4_encryption)
-        encrypt_button.setGeometry(350, 150, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.rc4_encryption)
+        self.encrypt_button.setGeometry(350, 150, 100, 50)
 
         self.ciphertext_label = QTextEdit(parent=self)
         self.ciphertext_label.setGeometry(10, 230, 680, 150)
@@ -75,12 +76,23 @@ class RC4EncryptionWindow(QWidget):
 
         key_bytes_length = int(self.key_input.currentText())
         key = urandom(key_bytes_length)  # Generate a random key of the selected length
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.encrypt, key, plaintext,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    @staticmethod
+    def encrypt(key, plaintext):
         nonce = urandom(16)  # Generate a random nonce
         temp_key = HMAC.new(nonce, key, SHA256).digest()  # Derive a temporary key using HMAC-SHA256
-        
+
         cipher = ARC4.new(temp_key)
-        ciphertext = nonce + cipher.encrypt(plaintext.encode("utf-8"))
+        return nonce + cipher.encrypt(plaintext.encode("utf-8"))
 
+    def show_encryption(self, ciphertext, key):
         b64_ciphertext = b64encode(ciphertext).decode()
         b64_key = b64encode(key).decode()
 
@@ -121,8 +133,8 @@ class RC4DecryptionWindow(QWidget):
         self.key_input.setGeometry(10, 160, 680, 50)
 
         # Decrypt button
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.rc4_decryption)
-        decrypt_button.setGeometry(300, 220, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.rc4_decryption)
+        self.decrypt_button.setGeometry(300, 220, 100, 50)
 
         # Output area
         self.plaintext_label = QTextEdit(parent=self)
@@ -149,21 +161,28 @@ class RC4DecryptionWindow(QWidget):
             QMessageBox.critical(self, "Decoding Error", "Invalid Base64 input.")
             return
 
-        try:
-            # Extract nonce (first 16 bytes)
-            nonce = ciphertext[:16]
-            ct = ciphertext[16:]
+        self.decrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.decrypt, key, ciphertext,
+            owner=self,
+            on_result=self.show_decryption,
+            on_error=lambda e: QMessageBox.critical(self, "Decryption Error", f"Decryption failed:\n{str(e)}"),
+            on_finished=lambda: self.decrypt_button.setEnabled(True))
 
-            # Derive same temp key
-            temp_key = HMAC.new(nonce, key, SHA256).digest()
+    @staticmethod
+    def decrypt(key, ciphertext):
+        # Extract nonce (first 16 bytes)
+        nonce = ciphertext[:16]
+        ct = ciphertext[16:]
 
-            cipher = ARC4.new(temp_key)
-            plaintext_bytes = cipher.decrypt(ct)
-            plaintext = plaintext_bytes.decode("utf-8", errors="replace")
+        # Derive same temp key
+        temp_key = HMAC.new(nonce, key, SHA256).digest()
 
-            self.plaintext_label.clear()
-            self.plaintext_label.setHtml(f"<b>Decrypted Plaintext:</b><br>{plaintext}")
-            self.plaintext_label.show()
+        cipher = ARC4.new(temp_key)
+        plaintext_bytes = cipher.decrypt(ct)
+        return plaintext_bytes.decode("utf-8", errors="replace")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Decryption Error", f"Decryption failed:\n{str(e)}")
+    def show_decryption(self, plaintext):
+        self.plaintext_label.clear()
+        self.plaintext_label.setHtml(f"<b>Decrypted Plaintext:</b><br>{plaintext}")
+        self.plaintext_label.show()
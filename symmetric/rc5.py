@@ -5,6 +5,7 @@ from random                             import randint
 from DefaultStyles.button_style         import DefaultButtonStyle
 from DefaultStyles.qcombo_box_style     import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style     import DefaultQLineEditStyle
+from jobs                               import job_runner, show_job_error
 import base64
 
 # Implementation
@@ -144,8 +145,8 @@ class RC5EncryptionWindow(QWidget):
         self.output_format_options = DefaultQComboBoxStyle(parent=self, items=output_format_items)
         self.output_format_options.setGeometry(300, 260, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_rc5_encryption)
-        encrypt_button.setGeometry(300, 330, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, command=self.call_rc5_encryption)
+        self.encrypt_button.setGeometry(300, 330, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 380, 680, 100)
@@ -164,25 +165,33 @@ class RC5EncryptionWindow(QWidget):
         key_bytes = key.encode('utf-8')
         output_format = self.output_format_options.currentText()
 
-        if key == "":
+        random_key = key == ""
+        if random_key:
             key = get_random_bytes(16)
-            
-            rc5 = RC5_EncryptionImp(key=key)
-            word1, word2 = rc5.divide_to_16bit_words(plaintext_bytes)
-            plaintext_divided = (word1, word2)
-            ciphertext = rc5.encrypt(plaintext=plaintext_divided)
-
-            self.key_label.clear()
+            key_bytes = key
+
+        self.encrypt_button.setEnabled(False)
+        job_runner().submit(
+            self.encrypt, key_bytes, plaintext_bytes,
+            owner=self,
+            on_result=lambda ciphertext: self.show_encryption(ciphertext, key, random_key, output_format),
+            on_error=lambda e: show_job_error(self, e),
+            on_finished=lambda: self.encrypt_button.setEnabled(True))
+
+    @staticmethod
+    def encrypt(key_bytes, plaintext_bytes):
+        rc5 = RC5_EncryptionImp(key=key_bytes)
+        word1, word2 = rc5.divide_to_16bit_words(plaintext_bytes)
+        plaintext_divided = (word1, word2)
+        return rc5.encrypt(plaintext=plaintext_divided)
+
+    def show_encryption(self, ciphertext, key, random_key, output_format):
+        self.key_label.clear()
+        if random_key:
             self.key_label.setHtml(f"<b>Random key:</b><br>{str(key)}")
         else:
-            rc5 = RC5_EncryptionImp(key=key_bytes)
-            word1, word2 = rc5.divide_to_16bit_words(plaintext_bytes)
-            plaintext_divided = (word1, word2)
-            ciphertext = rc5.encrypt(plaintext=plaintext_divided)
-
-            self.key_label.clear()
             self.key_label.setHtml(f"<b>Key:</b><br>{str(key)}")
-        
+
         ciphertext_bytes = ciphertext[0].to_bytes(2, byteorder='big') + ciphertext[1].to_bytes(2, byteorder='big')
         if output_format == "Base64":
             ciphertext = base64.b64encode(ciphertext_bytes).decode('utf-8')
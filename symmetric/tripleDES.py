@@ -5,6 +5,7 @@ from Crypto.Util.Padding            import pad, unpad
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from base64                         import b64encode, b64decode
 
 class TripleDESEncryption:
@@ -70,8 +71,8 @@ class TripleDESEncryptionWindow(QWidget):
         self.mode_options = DefaultQComboBoxStyle(parent=self, items=modes_list)
         self.mode_options.setGeometry(220, 160, 120, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_3des_encryption)
-        encrypt_button.setGeometry(420, 160, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_3des_encryption)
+        self.encrypt_button.setGeometry(420, 160, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 280, 680, 100)
@@ -98,17 +99,13 @@ class TripleDESEncryptionWindow(QWidget):
                 if mode != "ECB":
                     raise ValueError('Only ECB mode is implemented.')
 
-                tdesencryption = TripleDESEncryption(key, mode, plaintext_str)
-                ciphertext = tdesencryption.ciphertext
-
-                self.encrypted_text_label.clear()
-                self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
-                self.encrypted_text_label.show()
-
-                self.generated_key_label.clear()
-                self.generated_key_label.setHtml(f"<b>Generated {key_length} byte length key (Base64):</b><br>{b64encode(key).decode()}")
-                self.generated_key_label.show()
-
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.encrypt, key, mode, plaintext_str,
+                    owner=self,
+                    on_result=lambda ciphertext: self.show_encryption(ciphertext, key, key_length),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 raise ValueError('Please enter plaintext.')
         except ValueError as ve:
@@ -116,6 +113,20 @@ class TripleDESEncryptionWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def encrypt(key, mode, plaintext_str):
+        tdesencryption = TripleDESEncryption(key, mode, plaintext_str)
+        return tdesencryption.ciphertext
+
+    def show_encryption(self, ciphertext, key, key_length):
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
+        self.encrypted_text_label.show()
+
+        self.generated_key_label.clear()
+        self.generated_key_label.setHtml(f"<b>Generated {key_length} byte length key (Base64):</b><br>{b64encode(key).decode()}")
+        self.generated_key_label.show()
+
 # ===================================================================================================================================
 
 class TripleDESDecryption:
@@ -169,8 +180,8 @@ class TripleDESDecryptionWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(10, 180, 680, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_3des_decryption)
-        decrypt_button.setGeometry(300, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_3des_decryption)
+        self.decrypt_button.setGeometry(300, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(10, 370, 680, 100)
@@ -191,13 +202,13 @@ class TripleDESDecryptionWindow(QWidget):
                     key = b64decode(key_b64)
                     ciphertext = b64decode(ciphertext_b64)
 
-                    decryption = TripleDESDecryption(key, ciphertext)
-                    plaintext = decryption.plaintext
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
-                    self.original_msg_label.show()
-
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, key, ciphertext,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste key.')
             else:
@@ -207,3 +218,12 @@ class TripleDESDecryptionWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
 
+    @staticmethod
+    def decrypt(key, ciphertext):
+        decryption = TripleDESDecryption(key, ciphertext)
+        return decryption.plaintext
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
+        self.original_msg_label.show()
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets                import QWidget, QLabel, QTextEdit, QMessageB
 from DefaultStyles.button_style     import DefaultButtonStyle, DefaultAboutButtonStyle
 from DefaultStyles.qcombo_box_style import DefaultQComboBoxStyle
 from DefaultStyles.qline_edit_style import DefaultQLineEditStyle 
+from jobs                           import job_runner, show_job_error
 from twofish                        import Twofish
 from os                             import urandom
 from base64                         import b64encode, b64decode
@@ -96,8 +97,8 @@ class TwofishWindow(QWidget):
             parent=self, items=["16", "24", "32"])
         self.key_input.setGeometry(60, 160, 80, 50)
 
-        encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_twofish_encryption)
-        encrypt_button.setGeometry(300, 160, 100, 50)
+        self.encrypt_button = DefaultButtonStyle("Encrypt", parent=self, bold=True, command=self.call_twofish_encryption)
+        self.encrypt_button.setGeometry(300, 160, 100, 50)
 
         self.encrypted_text_label = QTextEdit(parent=self)
         self.encrypted_text_label.setGeometry(10, 250, 480, 100)
@@ -129,8 +130,8 @@ class TwofishWindow(QWidget):
         self.paste_key_input = DefaultQLineEditStyle(parent=self)
         self.paste_key_input.setGeometry(600, 180, 480, 50)
 
-        decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_twofish_decryption)
-        decrypt_button.setGeometry(800, 260, 100, 50)
+        self.decrypt_button = DefaultButtonStyle("Decrypt", parent=self, bold=True, command=self.call_twofish_decryption)
+        self.decrypt_button.setGeometry(800, 260, 100, 50)
 
         self.original_msg_label = QTextEdit(parent=self)
         self.original_msg_label.setGeometry(600, 340, 480, 100)
@@ -146,13 +147,13 @@ class TwofishWindow(QWidget):
                     key = b64decode(key_b64)
                     ciphertext = b64decode(ciphertext_b64)
 
-                    twofish_decryption = TwofishDecryption(key, ciphertext)
-                    plaintext = twofish_decryption.plaintext
-
-                    self.original_msg_label.clear()
-                    self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
-                    self.original_msg_label.show()
-
+                    self.decrypt_button.setEnabled(False)
+                    job_runner().submit(
+                        self.decrypt, key, ciphertext,
+                        owner=self,
+                        on_result=self.show_decryption,
+                        on_error=lambda e: show_job_error(self, e),
+                        on_finished=lambda: self.decrypt_button.setEnabled(True))
                 else:
                     raise ValueError('Please paste key.')
             else:
@@ -162,6 +163,17 @@ class TwofishWindow(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
     
+
+    @staticmethod
+    def decrypt(key, ciphertext):
+        twofish_decryption = TwofishDecryption(key, ciphertext)
+        return twofish_decryption.plaintext
+
+    def show_decryption(self, plaintext):
+        self.original_msg_label.clear()
+        self.original_msg_label.setHtml(f"<b>Decrypted text:</b><br>{plaintext}")
+        self.original_msg_label.show()
+
     def call_twofish_encryption(self):
         try:
             if self.plaintext_input.text():
@@ -169,20 +181,30 @@ class TwofishWindow(QWidget):
                 key_length = int(self.key_input.currentText())
                 key_bytes = urandom(key_length)
 
-                towfish_encryption = TwofishEncryption(key_bytes, plaintext)
-                ciphertext = towfish_encryption.ciphertext
-
-                self.encrypted_text_label.clear()
-                self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
-                self.encrypted_text_label.show()
-
-                self.generated_key_label.clear()
-                self.generated_key_label.setHtml(f"<b>Generated key of {key_length} bytes (Base64):</b><br>{b64encode(key_bytes).decode()}")
-                self.generated_key_label.show()
-
+                self.encrypt_button.setEnabled(False)
+                job_runner().submit(
+                    self.encrypt, key_bytes, plaintext,
+                    owner=self,
+                    on_result=lambda ciphertext: self.show_encryption(ciphertext, key_bytes, key_length),
+                    on_error=lambda e: show_job_error(self, e),
+                    on_finished=lambda: self.encrypt_button.setEnabled(True))
             else:
                 raise ValueError('Please enter plaintext.')    
         except ValueError as ve:
             QMessageBox.warning(self, 'Error', str(ve))
         except Exception as e:
             QMessageBox.critical(self, 'Unexpected Error', str(e))
+
+    @staticmethod
+    def encrypt(key_bytes, plaintext):
+        towfish_encryption = TwofishEncryption(key_bytes, plaintext)
+        return towfish_encryption.ciphertext
+
+    def show_encryption(self, ciphertext, key_bytes, key_length):
+        self.encrypted_text_label.clear()
+        self.encrypted_text_label.setHtml(f"<b>Ciphertext (Base64):</b><br>{b64encode(ciphertext).decode()}")
+        self.encrypted_text_label.show()
+
+        self.generated_key_label.clear()
+        self.generated_key_label.setHtml(f"<b>Generated key of {key_length} bytes (Base64):</b><br>{b64encode(key_bytes).decode()}")
+        self.generated_key_label.show()
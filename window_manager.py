@@ -0,0 +1,65 @@
+from collections                import OrderedDict
+from DefaultStyles.button_style import DefaultAboutButtonStyle
+from jobs                       import job_runner
+from window_registry            import load_window_class, create_window
+
+class WindowManager:
+    """Caches tool windows by class so that reopening a tool re-shows the existing window.
+
+    Windows are kept in least recently used order. When more than `max_windows` are alive,
+    the least recently used windows that are closed (hidden) are deleted; open windows and
+    windows whose background jobs are still running are never evicted, since the job callbacks
+    touch their widgets."""
+
+    def __init__(self, theme_mode, max_windows=12):
+        self.theme_mode = theme_mode
+        self.max_windows = max_windows
+        self.windows = OrderedDict()
+
+    def open(self, button_name):
+        """Shows and raises the window of a tool button, building it on first use."""
+        window_class = load_window_class(button_name)
+        window = self.windows.get(window_class)
+        if window is None:
+            window = self.windows[window_class] = create_window(button_name, self.theme_mode)
+        else:
+            self.windows.move_to_end(window_class)
+            if getattr(window, 'theme_mode', self.theme_mode) != self.theme_mode:
+                self.apply_theme(window, self.theme_mode)
+
+        if window.isMinimized():
+            window.showNormal()
+        else:
+            window.show()
+        window.raise_()
+        window.activateWindow()
+        self.evict()
+        return window
+
+    def evict(self):
+        idle = [window_class for window_class, window in self.windows.items()
+                if not window.isVisible() and not job_runner().has_jobs(window)]
+        while len(self.windows) > self.max_windows and idle:
+            self.windows.pop(idle.pop(0)).deleteLater()
+
+    def update_theme(self, theme_mode):
+        """Pushes a theme change to every live window."""
+        self.theme_mode = theme_mode
+        for window in self.windows.values():
+            self.apply_theme(window, theme_mode)
+
+    @staticmethod
+    def apply_theme(window, theme_mode):
+        if hasattr(window, 'update_theme'):
+            window.update_theme(theme_mode)
+            return
+        if hasattr(window, 'theme_mode'):
+            window.theme_mode = theme_mode
+        for button in window.findChildren(DefaultAboutButtonStyle):
+            button.update_theme(theme_mode)
+
+    def close_all(self):
+        for window in self.windows.values():
+            window.close()
+            window.deleteLater()
+        self.windows.clear()
@@ -0,0 +1,281 @@
+from importlib import import_module
+import os, sys, time, inspect, subprocess
+
+TOOL_PACKAGES = ("asymmetric", "symmetric", "ciphers", "hashingalgo", "encoders",
+                 "converters", "fileHandling", "othertools", "cryptanalysis")
+
+# Section button object name -> "module:ClassName" of the window it opens.
+# Nothing is imported until a button is clicked for the first time.
+TOOL_WINDOWS = {
+    # Asymmetric
+    "CSRButton":                   "asymmetric.cert_signing_request:CSRWindow",
+    "DHKeyExchangeButton":         "asymmetric.diffie_hellman:DHKeyExchangeWindow",
+    "DSAButton":                   "asymmetric.ds_algorithm:DSAWindow",
+    "ElGamalButton":               "asymmetric.elgamal:ElGamalWindow",
+    "RSAWienerAttackButton":       "asymmetric.rsa_wiener_attack:RSAWienerAttackWindow",
+    "RSAKeyAuditButton":           "asymmetric.rsa_key_audit:RSAKeyAuditWindow",
+    "RSAButton":                   "asymmetric.rsa:RSAWindow",
+    "X509SelfSignedButton":        "asymmetric.x509_self_signed:X509SelfSignedWindow",
+    "CramerShoupEncButton":        "asymmetric.cramer_shoup:CramerShoupEncryptWindow",
+    "CramerShoupDecButton":        "asymmetric.cramer_shoup:CramerShoupDecryptWindow",
+    "PaillierEncButton":           "asymmetric.paillier:PaillierEncWindow",
+    "PaillierDecButton":           "asymmetric.paillier:PaillierDecWindow",
+    "ECDSAButton":                 "asymmetric.ecdsa:ECDSAWindow",
+    "ECDHButton":                  "asymmetric.ecdh:ECDHWindow",
+    "EdDSAButton":                 "asymmetric.eddsa:EdDSAWindow",
+    "NTRUEncryptButton":           "asymmetric.ntru_encrypt:NTRUEncryptWindow",
+    "KyberKEMButton":              "asymmetric.kyber_kem:KyberKEMWindow",
+    "KyberKEMDecButton":           "asymmetric.kyber_kem:KyberKEMDecWindow",
+
+    # Symmetric
+    "AESEncButton":                "symmetric.aes:AESEncryptionWindow",
+    "AESDecButton":                "symmetric.aes:AESDecryptionWindow",
+    "DESEncButton":                "symmetric.des:DESEncryptionWindow",
+    "DESDecButton":                "symmetric.des:DESDecryptionWindow",
+    "BlowfishButton":              "symmetric.blowfish:BlowfishWindow",
+    "CamelliaButton":              "symmetric.camellia_cipher:CamelliaWindow",
+    "RC2EncButton":                "symmetric.rc2:RC2EncryptionWindow",
+    "RC2DecButton":                "symmetric.rc2:RC2DecryptionWindow",
+    "RC4EncButton":                "symmetric.rc4:RC4EncryptionWindow",
+    "RC4DecButton":                "symmetric.rc4:RC4DecryptionWindow",
+    "RC5EncButton":                "symmetric.rc5:RC5EncryptionWindow",
+    "RC5DecButton":                "symmetric.rc5:RC5DecryptionWindow",
+    "SerpentButton":               "symmetric.serpent:SerpentWindow",
+    "TripleDESEncButton":          "symmetric.tripleDES:TripleDESEncryptionWindow",
+    "TripleDESDecButton":          "symmetric.tripleDES:TripleDESDecryptionWindow",
+    "TwofishButton":               "symmetric.twofish_cipher:TwofishWindow",
+    "FERNETButton":                "symmetric.fernet_enc_dec:FERNETWindow",
+
+    # Ciphers
+    "BaconCipherButton":           "ciphers.bacon_cipher:BaconCipherWindow",
+    "CaesarCipherButton":          "ciphers.caesar_cipher:CaesarCipherWindow",
+    "ChaChaPolyButton":            "ciphers.chacha20_poly1305:ChaCha20Poly1305Window",
+    "ChaCha20Button":              "ciphers.chacha20:ChaCha20Window",
+    "EnigmaButton":                "ciphers.enigma_machine:EnigmaMachineWindow",
+    "GOSTButton":                  "ciphers.GOST_magma:GOSTMagmaWindow",
+    "RabbitButton":                "ciphers.rabbit:RabbitStreamCipherWindow",
+    "ROT13Button":                 "ciphers.rot13:ROT13Window",
+    "ROT13BFButton":               "ciphers.rot13_bruteforce:ROT13BFWindow",
+    "ROT47Button":                 "ciphers.rot47:ROT47Window",
+    "ROT47BFButton":               "ciphers.rot47_bruteforce:ROT47BFWindow",
+    "SimpleSubButton":             "ciphers.simple_substitution:SimpleSubWindow",
+    "TEAButton":                   "ciphers.tea:TEAWindow",
+    "XTEAButton":                  "ciphers.xtea:XTEAWindow",
+    "XXTEAButton":                 "ciphers.xxtea:XXTEAWindow",
+    "VigenereEncButton":           "ciphers.vigenere:VigenereEncryptionWindow",
+    "VigenereDecButton":           "ciphers.vigenere:VigenereDecryptionWindow",
+    "SM4EncryptButton":            "ciphers.sm4_block_cipher:SM4BlockCipherEncryptWindow",
+    "SM4DecryptButton":            "ciphers.sm4_block_cipher:SM4BlockCipherDecryptWindow",
+    "BifidCipherButton":           "ciphers.bifid_cipher:BifidCipherWindow",
+    "AffineCipherEncButton":       "ciphers.affine_cipher:AffineCipherEncWindow",
+    "AffineCipherDecButton":       "ciphers.affine_cipher:AffineCipherDecWindow",
+
+    # Hashing algorithms
+    "BcryptButton":                "hashingalgo.bcrypt:BcryptWindow",
+    "BLAKE2Button":                "hashingalgo.blake2_hash:BLAKE2Window",
+    "BLAKE3Button":                "hashingalgo.blake3_hash:BLAKE3Window",
+    "MD4Button":                   "hashingalgo.message_digest4:MD4Window",
+    "MD5Button":                   "hashingalgo.message_digest5:MD5Window",
+    "RIPEMD160Button":             "hashingalgo.ripemd160:RIPEMD160Window",
+    "SHA1Button":                  "hashingalgo.sha:SHA1Window",
+    "SHA256Button":                "hashingalgo.sha:SHA256Window",
+    "SHA384Button":                "hashingalgo.sha:SHA384Window",
+    "SHA512Button":                "hashingalgo.sha:SHA512Window",
+    "WhirlpoolButton":             "hashingalgo.whirlpoolhash:WhirlpoolWindow",
+    "HashIdentifier":              "hashingalgo.hash_identifier:HashIdentifierWindow",
+    "GostHfButton":                "hashingalgo.gost_hash_function:GOST34112012Window",
+    "TigerHashFunctionButton":     "hashingalgo.tiger_hash_function:TigerHashFunctionWindow",
+    "KeccakButton":                "hashingalgo.keccakhash:KeccakHash",
+    "SHAKEButton":                 "hashingalgo.shake:SHAKEWindow",
+
+    # Encoders
+    "A1Z26EncButton":              "encoders.a1z26:A1Z26EncodeWindow",
+    "A1Z26DecButton":              "encoders.a1z26:A1Z26DecodeWindow",
+    "BASE32Button":                "encoders.base_enc_dec:BASE32Window",
+    "BASE45Button":                "encoders.base_enc_dec:BASE45Window",
+    "BASE58Button":                "encoders.base_enc_dec:BASE58Window",
+    "BASE62Button":                "encoders.base_enc_dec:BASE62Window",
+    "BASE64Button":                "encoders.base_enc_dec:BASE64Window",
+    "BASE85Button":                "encoders.base_enc_dec:BASE85Window",
+    "BASE92Button":                "encoders.base_enc_dec:BASE92Window",
+    "BrailleButton":               "encoders.braille:BrailleWindow",
+    "MorseCodeButton":             "encoders.morsecode:MorseCodeWindow",
+    "URLEncButton":                "encoders.url_enc_dec:URLEncodeWindow",
+    "URLDecButton":                "encoders.url_enc_dec:URLDecodeWindow",
+    "TxttoCharcodeButton":         "encoders.utf_enc_dec:TexttoCharcodeWindow",
+    "CharcodetoTxtButton":         "encoders.utf_enc_dec:CharcodetoTextWindow",
+    "ToQPButton":                  "encoders.qp:ToQuotedPrintableWindow",
+    "FromQPButton":                "encoders.qp:FromQuotedPrintableWindow",
+    "PunycodeEncButton":           "encoders.punycode:PunycodeEncodeWindow",
+    "PunycodeDecButton":           "encoders.punycode:PunycodeDecodeWindow",
+
+    # Converters
+    "TexttoOctalButton":           "converters.converters:TexttoOctalWindow",
+    "OctaltoTextButton":           "converters.converters:OctaltoTextWindow",
+    "TxttoBinButton":              "converters.converters:TexttoBinaryWindow",
+    "BintoTxtButton":              "converters.converters:BinarytoTextWindow",
+    "TxttoASCIIButton":            "converters.converters:TexttoASCIIWindow",
+    "ASCIItoTxtButton":            "converters.converters:ASCIItoTextWindow",
+    "DecimaltoBinButton":          "converters.converters:DecimaltoBinaryWindow",
+    "BintoDecimalButton":          "converters.converters:BinarytoDecimalWindow",
+    "CodepointConverterButton":    "converters.converters2:CodepointConverterWindow",
+    "TxttoHexButton":              "converters.converters2:TexttoHexWindow",
+    "HextoTxtButton":              "converters.converters2:HextoTextWindow",
+    "DectoRadixButton":            "converters.converters2:DecimalToRadixWindow",
+    "RadixtoDecButton":            "converters.converters2:RadixToDecimalWindow",
+    "DectoBCDButton":              "converters.converters2:DecimalToBCDWindow",
+    "BCDtoDecButton":              "converters.converters2:BCDToDecimalWindow",
+    "ChartoHTMLEntityBtn":         "converters.converters2:CharToHTMLEntityWindow",
+    "HTMLEntitytoCharBtn":         "converters.converters2:HTMLEntityToCharWindow",
+    "PEMtoDERButton":              "converters.converters3:PEMtoDERWindow",
+    "DERtoPEMButton":              "converters.converters3:DERtoPEMWindow",
+    "ToUnixButton":                "converters.converters3:ToUnixTimestampWindow",
+    "FromUnixButton":              "converters.converters3:FromUnixTimestampWindow",
+    "toNATOButton":                "converters.converters3:ToNatoAlphabet",
+    "fromNATOButton":              "converters.converters3:FromNatoAlphabet",
+    "HexdumpButton":               "converters.converters4:HexdumpWindow",
+
+    # Cryptanalysis
+    "KPAButton":                   "cryptanalysis.kpa:KPA",
+    "CPAButton":                   "cryptanalysis.cpa:CPA",
+    "COAButton":                   "cryptanalysis.coa:COA",
+    "MITMButton":                  "cryptanalysis.mitm:MITM",
+    "ACPAButton":                  "cryptanalysis.acpa:ACPA",
+    "BirthdayAttackButton":        "cryptanalysis.birthdayattack:BirthdayAttack",
+    "SideChannelAButton":          "cryptanalysis.sca:SCA",
+    "BruteForceAButton":           "cryptanalysis.bf_attack:BruteForceAttack",
+    "DiffAnalysisButton":          "cryptanalysis.diff_analysis:DifferentialCryptanalysis",
+    "RelatedKeyAButton":           "cryptanalysis.rka:RKA",
+    "BoomerangAButton":            "cryptanalysis.boomerang:BoomerangAttack",
+    "DaviesAttackButton":          "cryptanalysis.daviesattack:DaviesAttack",
+    "HarvestNowDLButton":          "cryptanalysis.hndl:HNDL",
+    "IntegralCryptanalysisButton": "cryptanalysis.integralcryptanalysis:IntegralCryptanalysis",
+    "LinearCryptanalysisButton":   "cryptanalysis.linearcryptanalysis:LinearCryptanalysis",
+    "ModnCryptanalysisButton":     "cryptanalysis.mod_N:Mod_N",
+    "SlideAttackButton":           "cryptanalysis.slideattack:SlideAttack",
+    "XSLAttackButton":             "cryptanalysis.xslattack:XSLattack",
+    "RainbowTableButton":          "cryptanalysis.rainbowtable:RainbowTable",
+    "BlackBagCButton":             "cryptanalysis.blackbag:BlackBagCryptanalysis",
+    "PowerAnalysisButton":         "cryptanalysis.poweranalysis:PowerAnalysis",
+    "ReplayAttackButton":          "cryptanalysis.replayattack:ReplayAttack",
+    "RubberHoseCButton":           "cryptanalysis.rubberhose:RubberHoseCryptanalysis",
+    "TimingAnalysisButton":        "cryptanalysis.timinganalysis:TimingAnalysis",
+
+    # File handling
+    "FernetFileEncButton":         "fileHandling.fernet_file_enc:FernetFileEncWindow",
+    "FernetFileDecButton":         "fileHandling.fernet_file_enc:FernetFileDecWindow",
+    "CSVtoJSONButton":             "fileHandling.csv_to_json:CSVtoJSONWindow",
+    "JSONtoCSVButton":             "fileHandling.csv_to_json:JSONtoCSVWindow",
+    "Img2PDFButton":               "fileHandling.img_to_pdf:Img2PDFWindow",
+    "PDF2ImgButton":               "fileHandling.img_to_pdf:PDF2ImgWindow",
+    "ExifImagesButton":            "fileHandling.exif_images:ExifImageWindow",
+    "ZipFileWithPwdButton":        "fileHandling.zip_files:ZipFileWithPwdWindow",
+    "ZipFolderWithPwdButton":      "fileHandling.zip_folders:ZipFolderWithPwdWindow",
+    "BfPwdProtectedButton":        "fileHandling.bf_pwd_protected_files:BfPwdProtectedFilesWindow",
+    "DisExeFilesButton":           "fileHandling.dis_exe_files:DisassembleExeFilesWindow",
+    "DecompilePycButton":          "fileHandling.decompile_pyc:DecompilePycFilesWindow",
+    "JSONtoMsgPackButton":         "fileHandling.json_and_msgpack:JSONtoMsgPackWindow",
+    "MsgPacktoJSONButton":         "fileHandling.json_and_msgpack:MsgPacktoJSONWindow",
+    "JSONtoXMLButton":             "fileHandling.json_and_xml:JSONtoXMLWindow",
+    "XMLtoJSONBUtton":             "fileHandling.json_and_xml:XMLtoJSONWindow",
+    "PyCodeDisassemblerButton":    "fileHandling.python_code_disassembler:PyCodeDisassemblerWindow",
+    "FileTypeDetectorButton":      "fileHandling.detect_file_type:FileTypeDetectorWindow",
+    "PGPEncryptorButton":          "fileHandling.pgpencryptor:PGPEncryptWindow",
+    "PGPDecryptorButton":          "fileHandling.pgpdecryptor:PGPDecryptWindow",
+    "DecodeTxtFilesButton":        "fileHandling.decode_txt_files:DecodeTXTFilesWindow",
+    "xxdHexDumpButton":            "fileHandling.xxd_tool:xxdHexDumpWindow",
+    "FileMetadataExtractorButton": "fileHandling.file_metadata_extractor:FileMetadataExtractorWindow",
+    "HashFilesButton":             "fileHandling.file_hash_generator:HashFilesWindow",
+    "CompareFileHashesButton":     "fileHandling.compare_hashes:CompareFileHashesWindow",
+    "FileStegToolButton":          "fileHandling.file_steganography:FileStegToolWindow",
+    "VirusDetectorButton":         "fileHandling.detect_virus:VirusDetectorWindow",
+    "LogAnalyzerButton":           "fileHandling.log_analyzer:LogAnalyzerWindow",
+
+    # Other tools
+    "CircBitShiftButton":          "othertools.circular_bit_shift:CircularBitShiftWindow",
+    "FreqAnalysisButton":          "othertools.freq_analysis:FrequencyAnalysisWindow",
+    "OTPButton":                   "othertools.otp:OneTimePadWindow",
+    "PBKDF2Button":                "othertools.PBKDF2:PBKDF2Window",
+    "PrimeNumGenButton":           "othertools.prime_num_generator:PrimeNumGenWindow",
+    "PRNGButton":                  "othertools.prng:PRNGWindow",
+    "PwdGenButton":                "othertools.pwd_generator:PwdGeneratorWindow",
+    "RSAKeyGenButton":             "othertools.rsa_keys_generator:RSAKeyGenWindow",
+    "ScryptButton":                "othertools.scrypt:ScryptWindow",
+    "XORButton":                   "othertools.xor:XOROperationWindow",
+    "ASN1EncButton":               "othertools.asn1:ASN1EncodeWindow",
+    "ASN1DecButton":               "othertools.asn1:ASN1DecodeWindow",
+    "IntFactorButton":             "othertools.intfactorization:IntFactorizationWindow",
+    "SwapEndianButton":            "othertools.swap_endian:SwapEndianessWindow",
+    "ReverseTextButton":           "othertools.reverse_text:ReverseTextWindow",
+    "HMACButton":                  "othertools.h_mac:HMACWindow",
+    "Argon2Button":                "othertools.argon2kdf:Argon2Window",
+    "ShowOnMapButton":             "othertools.show_on_map:ShowOnMapWindow",
+    "ShowOnMap2Button":            "othertools.show_on_map2:ShowOnMap2Window",
+    "ECKeyPairButton":             "othertools.eckeypair:EllipticCurveKeyPairWindow",
+    "EntropyButton":               "othertools.entropy:EntropyWindow",
+    "DataDiffButton":              "othertools.data_differencing:DataDifferencingWindow",
+    "DataCompressionButton":       "othertools.data_compression:DataCompressionWindow",
+    "RandomnessTesterButton":      "othertools.randomness_tester:RandomnessTesterWindow",
+    "PGPKeyPairButton":            "othertools.pgp_key_pair_gen:PGPKeyPairGenerateWindow",
+    "DSAKeyPairGenButton":         "othertools.dsa_key_pair_gen:DSAKeyPairGenerateWindow",
+    "EdDSAKeyPairGenButton":       "othertools.edDSA_key_pair_gen:EdDSAKeyPairWindow",
+    "LoremIpsumGenButton":         "othertools.lorem_ipsum_gen:LoremIpsumGenerateWindow",
+    "ModCalcButton":               "othertools.modcalc:ModCalculatorWindow",
+    "JWTSignButton":               "othertools.jwt_sign:JWTSignWindow",
+    "JWTVerifyButton":             "othertools.jwt_verify:JWTVerifyWindow",
+    "JWTDecodeButton":             "othertools.jwt_decode:JWTDecodeWindow",
+    "QRCodeGenButton":             "othertools.generateQRcode:GenerateQRcode",
+    "ReverseImageSearchButton":    "othertools.reverse_image_search:ReverseImageSearchWindow",
+}
+
+# module -> seconds spent importing it on first open
+import_times = {}
+
+def load_window_class(button_name):
+    """Imports the module of a tool window on first use and returns the window class."""
+    module_name, class_name = TOOL_WINDOWS[button_name].split(":")
+    if module_name not in sys.modules:
+        start = time.perf_counter()
+        module = import_module(module_name)
+        import_times[module_name] = time.perf_counter() - start
+    else:
+        module = sys.modules[module_name]
+    return getattr(module, class_name)
+
+def create_window(button_name, theme_mode):
+    """Builds the tool window of a button. Windows whose constructor takes no theme argument are built without it."""
+    window_class = load_window_class(button_name)
+    try:
+        takes_theme = bool(inspect.signature(window_class).parameters)
+    except (TypeError, ValueError): # no Python level __init__
+        takes_theme = False
+    return window_class(theme_mode) if takes_theme else window_class()
+
+def profile_package_imports(packages=TOOL_PACKAGES):
+    """Returns {package: seconds} for importing every window of each package, each
+    measured in a fresh interpreter so that shared dependencies are counted per package.
+    A package that fails to import maps to its error message instead."""
+    code = ("import time, importlib\n"
+            "start = time.perf_counter()\n"
+            "package = importlib.import_module({!r})\n"
+            "for name in package.__all__: getattr(package, name)\n"
+            "print(time.perf_counter() - start)")
+    root = os.path.dirname(os.path.abspath(__file__))
+    costs = {}
+    for package in packages:
+        result = subprocess.run([sys.executable, "-c", code.format(package)], cwd=root, capture_output=True, text=True)
+        if result.returncode == 0:
+            costs[package] = float(result.stdout.strip().splitlines()[-1])
+        else:
+            lines = result.stderr.strip().splitlines()
+            costs[package] = lines[-1] if lines else f"exit code {result.returncode}"
+    return costs
+
+def format_import_report(startup_seconds, package_costs):
+    lines = [f"Main window shown after {startup_seconds * 1000:.0f} ms",
+             "Eager import cost per package (cold interpreter):"]
+    for package, cost in sorted(package_costs.items(), key=lambda item: -item[1] if isinstance(item[1], float) else 0):
+        lines.append(f"  {package:<15} {cost * 1000:8.0f} ms" if isinstance(cost, float) else f"  {package:<15} failed: {cost}")
+    total = sum(cost for cost in package_costs.values() if isinstance(cost, float))
+    lines.append(f"  {'total':<15} {total * 1000:8.0f} ms")
+    return "\n".join(lines)